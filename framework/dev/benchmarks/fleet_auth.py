@@ -0,0 +1,148 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark for authenticated Fleet API calls.
+
+Usage: python dev/benchmarks/fleet_auth.py --num-nodes 100 --duration 10
+
+Starts a Fleet API gRPC server with node authentication and a file-based
+`SqliteLinkState` holding the public keys of `--num-nodes` SuperNodes. Each node
+sends `SendNodeHeartbeat` calls in a loop from its own thread for `--duration`
+seconds. The "signature" variant reproduces the previous behavior, in which the
+SuperLink verifies the ECDSA signature of every call. The "session" variant lets
+nodes authenticate their calls with the HMAC of their session.
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from typing import Any
+
+import grpc
+
+from flwr.client.grpc_rere_client.client_interceptor import (
+    AuthenticateClientInterceptor,
+)
+from flwr.common.constant import SESSION_ID_HEADER, SESSION_MAC_HEADER
+from flwr.common.secure_aggregation.crypto.symmetric_encryption import (
+    generate_key_pairs,
+    public_key_to_bytes,
+)
+from flwr.proto.fleet_pb2_grpc import FleetStub  # pylint: disable=E0611
+from flwr.proto.heartbeat_pb2 import SendNodeHeartbeatRequest  # pylint: disable=E0611
+from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
+from flwr.server.app import _run_fleet_api_grpc_rere
+from flwr.server.superlink.fleet.grpc_rere.server_interceptor import (
+    AuthenticateServerInterceptor,
+)
+from flwr.server.superlink.linkstate import LinkStateFactory
+from flwr.supercore.ffs import FfsFactory
+from flwr.supercore.object_store import ObjectStoreFactory
+
+ADDRESS = "127.0.0.1:9099"
+
+
+class _SignatureOnlyClientInterceptor(AuthenticateClientInterceptor):
+    """Client interceptor that authenticates every call by its signature."""
+
+    def _authenticate(
+        self, client_call_details: grpc.ClientCallDetails
+    ) -> grpc.ClientCallDetails:
+        details = super()._authenticate(client_call_details)
+        metadata = [
+            (key, value)
+            for key, value in details.metadata
+            if key not in (SESSION_ID_HEADER, SESSION_MAC_HEADER)
+        ]
+        return details._replace(metadata=metadata)
+
+    def _store_session(self, call: grpc.Call) -> None:
+        """Never use a session."""
+
+
+def _run(  # pylint: disable=R0914
+    num_nodes: int, duration: float, interceptor_cls: Any
+) -> float:
+    """Return the number of authenticated calls per second."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        state_factory = LinkStateFactory(f"{tmp_dir}/state.db")
+        state = state_factory.state()
+        keys = [generate_key_pairs() for _ in range(num_nodes)]
+        state.store_node_public_keys({public_key_to_bytes(pk) for _, pk in keys})
+        node_ids = []
+        for _, pk in keys:
+            node_id = state.create_node(heartbeat_interval=3600)
+            state.set_node_public_key(node_id, public_key_to_bytes(pk))
+            node_ids.append(node_id)
+
+        server = _run_fleet_api_grpc_rere(
+            ADDRESS,
+            state_factory,
+            FfsFactory(tmp_dir),
+            ObjectStoreFactory(),
+            None,
+            [AuthenticateServerInterceptor(state_factory)],
+        )
+        num_calls = [0] * num_nodes
+        stop = threading.Event()
+
+        def supernode(idx: int) -> None:
+            channel = grpc.intercept_channel(
+                grpc.insecure_channel(ADDRESS), interceptor_cls(*keys[idx])
+            )
+            stub = FleetStub(channel)
+            req = SendNodeHeartbeatRequest(
+                node=Node(node_id=node_ids[idx]), heartbeat_interval=3600
+            )
+            while not stop.is_set():
+                stub.SendNodeHeartbeat(req)
+                num_calls[idx] += 1
+            channel.close()
+
+        threads = [
+            threading.Thread(target=supernode, args=(idx,)) for idx in range(num_nodes)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        server.stop(None)
+    return sum(num_calls) / duration
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--num-nodes", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10)
+    args = parser.parse_args()
+
+    results = {
+        "signature": _run(
+            args.num_nodes, args.duration, _SignatureOnlyClientInterceptor
+        ),
+        "session": _run(args.num_nodes, args.duration, AuthenticateClientInterceptor),
+    }
+    print(
+        f"{args.num_nodes} nodes: "
+        + ", ".join(f"{name} {rps:.0f} RPC/s" for name, rps in results.items())
+        + f", speedup {results['session'] / results['signature']:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
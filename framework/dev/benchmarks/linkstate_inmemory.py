@@ -0,0 +1,118 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark for pulling instruction messages from `InMemoryLinkState`.
+
+Usage: python dev/benchmarks/linkstate_inmemory.py --num-nodes 1000 10000
+       --num-threads 32
+
+For each number of nodes, stores one instruction message per node and lets every
+node pull it, handled concurrently by `--num-threads` threads. Afterwards, every
+node polls once more and finds its inbox empty, as is the common case between
+rounds. The "scan" variant reproduces the previous behavior, which scanned all
+stored messages under a global lock on every pull. The "inbox" variant uses the
+per-node inboxes of `InMemoryLinkState`.
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from flwr.common import ConfigRecord, Message, RecordDict, now
+from flwr.common.constant import SUPERLINK_NODE_ID
+from flwr.server.superlink.linkstate import InMemoryLinkState
+
+
+class _ScanInMemoryLinkState(InMemoryLinkState):
+    """InMemoryLinkState that scans the message store on every pull."""
+
+    def get_message_ins(self, node_id: int, limit: Optional[int]) -> list[Message]:
+        message_ins_list: list[Message] = []
+        current_time = time.time()
+        with self.message_lock:
+            for msg_ins in self.message_ins_store.values():
+                if (
+                    msg_ins.metadata.dst_node_id == node_id
+                    and msg_ins.metadata.delivered_at == ""
+                    and msg_ins.metadata.created_at + msg_ins.metadata.ttl
+                    > current_time
+                ):
+                    message_ins_list.append(msg_ins)
+                if limit and len(message_ins_list) == limit:
+                    break
+            delivered_at = now().isoformat()
+            for msg_ins in message_ins_list:
+                msg_ins.metadata.delivered_at = delivered_at
+        return message_ins_list
+
+
+def _prepare(state: InMemoryLinkState, num_nodes: int) -> list[int]:
+    """Register nodes, create a run and store one instruction per node."""
+    run_id = state.create_run(None, None, None, {}, ConfigRecord(), None)
+    node_ids = [state.create_node(3600) for _ in range(num_nodes)]
+    for node_id in node_ids:
+        msg = Message(RecordDict(), dst_node_id=node_id, message_type="query")
+        msg.metadata.__dict__["_run_id"] = run_id
+        msg.metadata.__dict__["_src_node_id"] = SUPERLINK_NODE_ID
+        msg.metadata.__dict__["_message_id"] = msg.object_id
+        state.store_message_ins(msg)
+    return node_ids
+
+
+def _run(state: InMemoryLinkState, node_ids: list[int], threads: int) -> int:
+    """Let every node pull twice, returning the number of pulled messages."""
+
+    def supernode(node_id: int) -> int:
+        return len(state.get_message_ins(node_id=node_id, limit=1))
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        num_pulled = sum(executor.map(supernode, node_ids))
+        num_pulled += sum(executor.map(supernode, node_ids))
+    return num_pulled
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--num-nodes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--num-threads", type=int, default=32)
+    args = parser.parse_args()
+
+    for num_nodes in args.num_nodes:
+        results = {}
+        for name, state_cls in [
+            ("scan", _ScanInMemoryLinkState),
+            ("inbox", InMemoryLinkState),
+        ]:
+            state = state_cls()
+            node_ids = _prepare(state, num_nodes)
+            start = time.perf_counter()
+            num_pulled = _run(state, node_ids, args.num_threads)
+            results[name] = time.perf_counter() - start
+            assert num_pulled == num_nodes
+
+        num_pulls = 2 * num_nodes
+        print(
+            f"{num_nodes} nodes: "
+            + ", ".join(
+                f"{name} {sec:.2f} s ({num_pulls / sec:.0f} pulls/s)"
+                for name, sec in results.items()
+            )
+            + f", speedup {results['scan'] / results['inbox']:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
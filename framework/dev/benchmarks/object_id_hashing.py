@@ -0,0 +1,98 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Micro-benchmark for computing the object IDs of an `ArrayRecord`.
+
+Usage: python dev/benchmarks/object_id_hashing.py --size-mb 512
+
+Measures the time needed to prepare an `ArrayRecord` for pushing, i.e., to call
+`get_all_nested_objects`, `get_object_tree` and `deflate` on every object, as done
+by the SuperNode and the Grid. The "uncached" variant drops the cached
+`ArrayChunk`s before every access to `Array.slice_array`, which reproduces the
+behavior without the chunk cache.
+"""
+
+import argparse
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import numpy as np
+
+from flwr.common import ArrayRecord
+from flwr.common.inflatable import (
+    InflatableObject,
+    get_all_nested_objects,
+    get_object_tree,
+)
+from flwr.common.record.array import Array
+
+_slice_array = Array.slice_array
+
+
+def _uncached_slice_array(self: Array) -> list[tuple[str, InflatableObject]]:
+    self.__dict__.pop("_chunks", None)
+    return _slice_array(self)
+
+
+@contextmanager
+def _no_chunk_cache() -> Iterator[None]:
+    with patch.object(Array, "slice_array", _uncached_slice_array):
+        yield
+
+
+def _prepare_for_push(record: ArrayRecord) -> float:
+    start = time.perf_counter()
+    all_objects = get_all_nested_objects(record)
+    get_object_tree(record)
+    for obj in all_objects.values():
+        obj.deflate()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--size-mb", type=int, default=512, help="Total array size")
+    parser.add_argument("--num-arrays", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    num_elements = args.size_mb * 1024 * 1024 // 4 // args.num_arrays
+    arrays = [
+        np.random.rand(num_elements).astype(np.float32) for _ in range(args.num_arrays)
+    ]
+    size_gb = sum(a.nbytes for a in arrays) / 1024**3
+
+    results = {}
+    for name, ctx in (("uncached", _no_chunk_cache), ("cached", None)):
+        timings = []
+        for _ in range(args.repeats):
+            # Fresh record, so no object ID has been computed yet
+            record = ArrayRecord(arrays)
+            if ctx is None:
+                timings.append(_prepare_for_push(record))
+            else:
+                with ctx():
+                    timings.append(_prepare_for_push(record))
+        results[name] = min(timings) / size_gb
+
+    for name, sec_per_gb in results.items():
+        print(f"{name:>8}: {sec_per_gb:.3f} s/GB")
+    print(f"speedup: {results['uncached'] / results['cached']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Micro-benchmark for traversing object trees.
+
+Usage: python dev/benchmarks/object_tree_traversal.py --num-nodes 10000 1000000
+
+Builds synthetic trees shaped like a `RecordDict` holding many `Array`s (root ->
+records -> arrays -> chunks) and measures the time needed to collect all nested
+objects, build the `ObjectTree` and iterate over it, as done before pushing a
+message. The "recursive" variant reproduces the previous implementation, which
+traversed the objects twice using recursion.
+"""
+
+import argparse
+import secrets
+import time
+from collections.abc import Iterator
+
+from flwr.common.inflatable import (
+    InflatableObject,
+    get_all_nested_objects_and_tree,
+    iterate_object_tree,
+)
+from flwr.proto.message_pb2 import ObjectTree  # pylint: disable=E0611
+
+
+class _Node(InflatableObject):
+    """Object with a precomputed object ID, so that no hashing is measured."""
+
+    def __init__(self, children: list["_Node"]) -> None:
+        self._object_id = secrets.token_hex(32)
+        self._children = {child.object_id: child for child in children}
+
+    def deflate(self) -> bytes:
+        """Not needed for the benchmark."""
+        raise NotImplementedError()
+
+    @classmethod
+    def inflate(
+        cls, object_content: bytes, children: dict[str, InflatableObject] | None = None
+    ) -> "_Node":
+        """Not needed for the benchmark."""
+        raise NotImplementedError()
+
+    @property
+    def object_id(self) -> str:
+        """Return the precomputed object ID."""
+        return self._object_id
+
+    @property
+    def children(self) -> dict[str, InflatableObject] | None:
+        """Return the children."""
+        return dict(self._children)
+
+
+def _build_tree(num_nodes: int, fanout: int = 32) -> _Node:
+    """Build a tree of (at least) `num_nodes` nodes with 3 levels below the root."""
+    num_arrays = max(num_nodes // (fanout + 1), 1)
+    arrays = [_Node([_Node([]) for _ in range(fanout)]) for _ in range(num_arrays)]
+    records = [
+        _Node(arrays[i : i + fanout * 4]) for i in range(0, num_arrays, fanout * 4)
+    ]
+    return _Node(records)
+
+
+def _get_all_nested_objects_recursive(
+    obj: InflatableObject,
+) -> dict[str, InflatableObject]:
+    ret: dict[str, InflatableObject] = {}
+    if children := obj.children:
+        for child in children.values():
+            ret.update(_get_all_nested_objects_recursive(child))
+    ret[obj.object_id] = obj
+    return ret
+
+
+def _get_object_tree_recursive(obj: InflatableObject) -> ObjectTree:
+    tree_children = []
+    if children := obj.children:
+        for child in children.values():
+            tree_children.append(_get_object_tree_recursive(child))
+    return ObjectTree(object_id=obj.object_id, children=tree_children)
+
+
+def _iterate_object_tree_recursive(tree: ObjectTree) -> Iterator[ObjectTree]:
+    for child in tree.children:
+        yield from _iterate_object_tree_recursive(child)
+    yield tree
+
+
+def _recursive(root: _Node) -> int:
+    all_objects = _get_all_nested_objects_recursive(root)
+    tree = _get_object_tree_recursive(root)
+    num_nodes = sum(1 for _ in _iterate_object_tree_recursive(tree))
+    assert num_nodes == len(all_objects)
+    return num_nodes
+
+
+def _iterative(root: _Node) -> int:
+    all_objects, tree = get_all_nested_objects_and_tree(root)
+    num_nodes = sum(1 for _ in iterate_object_tree(tree))
+    assert num_nodes == len(all_objects)
+    return num_nodes
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--num-nodes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    for num_nodes in args.num_nodes:
+        root = _build_tree(num_nodes)
+        results = {}
+        for name, func in (("recursive", _recursive), ("iterative", _iterative)):
+            timings = []
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                actual_num_nodes = func(root)
+                timings.append(time.perf_counter() - start)
+            results[name] = min(timings)
+
+        print(
+            f"{actual_num_nodes:>9} nodes: "
+            + ", ".join(f"{name} {sec:.3f} s" for name, sec in results.items())
+            + f", speedup {results['recursive'] / results['iterative']:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark for Simulation Engine backends.
+
+Usage: python dev/benchmarks/simulation_backends.py --num-supernodes 100 --num-rounds 5
+       python dev/benchmarks/simulation_backends.py --backends process,thread \
+           --num-supernodes 10000 --num-rounds 1 --num-samples 10 --num-features 10
+
+Runs a CPU-only FedAvg workload with `run_simulation`: in each round, the ServerApp
+sends the global model to all SuperNodes at once, and each SuperNode trains a
+logistic regression model with NumPy on a synthetic partition of `--num-samples`
+samples with `--num-features` features. The "ray" variant executes the `ClientApp`
+with `RayBackend`, previously the only backend. The "process" variant executes it with
+`ProcessBackend`. Both backends size their pool from `--num-cpus` CPUs and one CPU
+per `ClientApp`. The "thread" variant executes it with `ThreadBackend` in
+`--num-cpus` threads. The "ray-batched" variant lets `RayBackend` pass up to
+`--max-batch-size` Messages to an actor at once. The speedups are relative to the
+first of `--backends`.
+"""
+
+import argparse
+import time
+from typing import cast
+
+import numpy as np
+
+from flwr.client import ClientApp
+from flwr.common import ArrayRecord, Context, Message, MetricRecord, RecordDict
+from flwr.common.typing import NDArray
+from flwr.server import Grid, ServerApp
+from flwr.simulation import run_simulation
+
+
+def _train(weights: NDArray, partition_id: int, args: argparse.Namespace) -> NDArray:
+    """Train a logistic regression model on a synthetic partition."""
+    rng = np.random.default_rng(partition_id)
+    x = rng.normal(size=(args.num_samples, args.num_features))
+    y = (x.sum(axis=1) > 0).astype(np.float64)
+    for _ in range(10):
+        pred = 1 / (1 + np.exp(-x @ weights))
+        weights = weights - 0.1 * x.T @ (pred - y) / len(y)
+    return weights
+
+
+def _run(variant: str, args: argparse.Namespace) -> float:
+    """Return the duration of the simulation in seconds."""
+    backend_name, _, mode = variant.partition("-")
+    max_batch_size = args.max_batch_size if mode == "batched" else 1
+
+    client_app = ClientApp()
+
+    @client_app.train()
+    def train(message: Message, context: Context) -> Message:
+        weights = message.content.array_records["arrays"]["0"].numpy()
+        weights = _train(weights, int(context.node_config["partition-id"]), args)
+        content = RecordDict(
+            {
+                "arrays": ArrayRecord([weights]),
+                "metrics": MetricRecord({"num-examples": args.num_samples}),
+            }
+        )
+        return Message(content, reply_to=message)
+
+    server_app = ServerApp()
+
+    @server_app.main()
+    def server_main(grid: Grid, context: Context) -> None:  # pylint: disable=W0613
+        # FedAvg over all SuperNodes
+        weights = np.zeros(args.num_features)
+        node_ids = list(grid.get_node_ids())
+        while len(node_ids) < args.num_supernodes:
+            time.sleep(0.1)
+            node_ids = list(grid.get_node_ids())
+        for _ in range(args.num_rounds):
+            messages = [
+                Message(
+                    RecordDict({"arrays": ArrayRecord([weights])}),
+                    dst_node_id=node_id,
+                    message_type="train",
+                )
+                for node_id in node_ids
+            ]
+            replies = [
+                reply
+                for reply in grid.send_and_receive(messages)
+                if reply.has_content()
+            ]
+            num_examples = [
+                cast(int, reply.content.metric_records["metrics"]["num-examples"])
+                for reply in replies
+            ]
+            weights = np.average(
+                [
+                    reply.content.array_records["arrays"]["0"].numpy()
+                    for reply in replies
+                ],
+                axis=0,
+                weights=num_examples,
+            )
+
+    start = time.perf_counter()
+    run_simulation(
+        server_app=server_app,
+        client_app=client_app,
+        num_supernodes=args.num_supernodes,
+        backend_name=backend_name,
+        backend_config={
+            "client_resources": {"num_cpus": 1, "num_gpus": 0.0},
+            "init_args": {
+                "num_threads" if backend_name == "thread" else "num_cpus": args.num_cpus
+            },
+            "actor": {"max_batch_size": max_batch_size},
+        },
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--num-supernodes", type=int, default=100)
+    parser.add_argument("--num-rounds", type=int, default=5)
+    parser.add_argument("--num-samples", type=int, default=500)
+    parser.add_argument("--num-features", type=int, default=100)
+    parser.add_argument("--num-cpus", type=int, default=1)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument(
+        "--backends", type=str, default="ray,ray-batched,process,thread"
+    )
+    args = parser.parse_args()
+
+    results = {name: _run(name, args) for name in args.backends.split(",")}
+    baseline = next(iter(results.values()))
+    print(
+        f"{args.num_supernodes} supernodes, {args.num_rounds} rounds: "
+        + ", ".join(
+            f"{name} {duration:.1f} s ({baseline / duration:.1f}x)"
+            for name, duration in results.items()
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark for the broadcast of a global model to Ray actors.
+
+Usage: python dev/benchmarks/simulation_broadcast.py --num-nodes 100 --model-mb 50
+
+Sends the same `ArrayRecord` of `--model-mb` MB to `--num-nodes` nodes through
+`RayBackend`, as a ServerApp does in a simulation round. The `ClientApp` reads the
+model and replies with a single metric. The "copy" variant reproduces the previous
+behavior, in which the model is serialized into each call to an actor. The
+"broadcast" variant places the model in the object store once through the
+`BroadcastCache` of the backend.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from flwr.client import ClientApp
+from flwr.client.run_info_store import DeprecatedRunInfoStore
+from flwr.common import ArrayRecord, Context, Message, MetricRecord, RecordDict
+from flwr.common.constant import PARTITION_ID_KEY
+from flwr.server.superlink.fleet.vce.backend.raybackend import RayBackend
+
+
+def _load_app() -> ClientApp:
+    app = ClientApp()
+
+    @app.query()
+    def query(message: Message, context: Context) -> Message:  # pylint: disable=W0613
+        array = message.content.array_records["arrays"]["0"].numpy(readonly=True)
+        return Message(
+            RecordDict({"metrics": MetricRecord({"mean": float(array.mean())})}),
+            reply_to=message,
+        )
+
+    return app
+
+
+def _run(variant: str, args: argparse.Namespace) -> float:
+    """Return the duration of sending the model to all nodes in seconds."""
+    backend = RayBackend(
+        {
+            "init_args": {"num_cpus": args.num_cpus},
+            "client_resources": {"num_cpus": 1, "num_gpus": 0.0},
+        }
+    )
+    if variant == "copy":
+        backend.broadcast_cache.min_size = sys.maxsize
+    backend.build(_load_app)
+
+    contexts = []
+    for node_id in range(args.num_nodes):
+        store = DeprecatedRunInfoStore(
+            node_id=node_id, node_config={PARTITION_ID_KEY: node_id}
+        )
+        store.register_context(run_id=0)
+        contexts.append(store.retrieve_context(run_id=0))
+    # Warm up the actors
+    backend.process_message(
+        Message(
+            RecordDict({"arrays": ArrayRecord([np.zeros(1)])}),
+            dst_node_id=0,
+            message_type="query",
+        ),
+        contexts[0],
+    )
+
+    arrays = ArrayRecord([np.ones(args.model_mb * (1 << 20) // 8)])
+    start = time.perf_counter()
+    for node_id, context in enumerate(contexts):
+        message = Message(
+            RecordDict({"arrays": arrays}), dst_node_id=node_id, message_type="query"
+        )
+        backend.process_message(message, context)
+    duration = time.perf_counter() - start
+    backend.terminate()
+    return duration
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--num-nodes", type=int, default=100)
+    parser.add_argument("--model-mb", type=int, default=50)
+    parser.add_argument("--num-cpus", type=int, default=1)
+    args = parser.parse_args()
+
+    copy = _run("copy", args)
+    broadcast = _run("broadcast", args)
+    print(
+        f"{args.num_nodes} nodes, {args.model_mb} MB: copy {copy:.2f} s, "
+        f"broadcast {broadcast:.2f} s ({copy / broadcast:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
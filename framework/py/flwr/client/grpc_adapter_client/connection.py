@@ -41,6 +41,7 @@ def grpc_adapter(  # pylint: disable=R0913,too-many-positional-arguments
     authentication_keys: Optional[  # pylint: disable=unused-argument
         tuple[ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey]
     ] = None,
+    pull_timeout: float = 0.0,
 ) -> Iterator[
     tuple[
         Callable[[], Optional[Message]],
@@ -74,6 +75,9 @@ def grpc_adapter(  # pylint: disable=R0913,too-many-positional-arguments
         Flower server. Bytes won't work for the REST API.
     authentication_keys : Optional[Tuple[PrivateKey, PublicKey]] (default: None)
         Client authentication is not supported for this transport type.
+    pull_timeout : float (default: 0.0)
+        Maximum time in seconds the server may hold a `receive` call until a
+        message becomes available. If 0, `receive` returns immediately.
 
     Returns
     -------
@@ -94,5 +98,6 @@ def grpc_adapter(  # pylint: disable=R0913,too-many-positional-arguments
         root_certificates=root_certificates,
         authentication_keys=None,  # Authentication is not supported
         adapter_cls=GrpcAdapter,
+        pull_timeout=pull_timeout,
     ) as conn:
         yield conn
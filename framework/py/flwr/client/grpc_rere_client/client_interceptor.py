@@ -15,22 +15,63 @@
 """Flower client interceptor."""
 
 
-from typing import Any, Callable
+import hashlib
+import hmac
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Callable, NamedTuple, Optional
 
 import grpc
 from cryptography.hazmat.primitives.asymmetric import ec
 from google.protobuf.message import Message as GrpcMessage
 
 from flwr.common import now
-from flwr.common.constant import PUBLIC_KEY_HEADER, SIGNATURE_HEADER, TIMESTAMP_HEADER
+from flwr.common.constant import (
+    PUBLIC_KEY_HEADER,
+    SESSION_ID_HEADER,
+    SESSION_MAC_HEADER,
+    SESSION_PUBLIC_KEY_HEADER,
+    SESSION_RENEWAL_MARGIN,
+    SESSION_REQUEST_HEADER,
+    SESSION_TTL_HEADER,
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+)
 from flwr.common.secure_aggregation.crypto.symmetric_encryption import (
+    bytes_to_public_key,
+    generate_shared_key,
     public_key_to_bytes,
     sign_message,
 )
 
 
-class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type: ignore
-    """Client interceptor for client authentication."""
+class _Session(NamedTuple):
+    """Authentication session issued by the SuperLink."""
+
+    session_id: bytes
+    key: bytes
+    renew_at: float
+
+
+class AuthenticateClientInterceptor(
+    grpc.UnaryUnaryClientInterceptor,  # type: ignore
+    grpc.UnaryStreamClientInterceptor,  # type: ignore
+    grpc.StreamStreamClientInterceptor,  # type: ignore
+):
+    """Client interceptor for client authentication.
+
+    The interceptor signs a call to request a session from the SuperLink, and
+    authenticates subsequent calls with an HMAC using the session key instead of a
+    signature. A new session is requested shortly before the current one expires. If the
+    SuperLink rejects a unary call authenticated by the session, e.g., because it
+    restarted, the call is retried once with a signature, requesting a new session.
+    Streaming calls cannot be retried, so they are signed in addition to carrying the
+    session, which the SuperLink still verifies first.
+
+    The session key is derived by ECDH between the private key of the node and the
+    ephemeral public key sent by the SuperLink with the session.
+    """
 
     def __init__(
         self,
@@ -39,6 +80,8 @@ class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
     ):
         self.private_key = private_key
         self.public_key_bytes = public_key_to_bytes(public_key)
+        self.session: Optional[_Session] = None
+        self.session_lock = threading.Lock()
 
     def intercept_unary_unary(
         self,
@@ -49,7 +92,46 @@ class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
         """Flower client interceptor.
 
         Intercept unary call from client and add necessary authentication header in the
-        RPC metadata.
+        RPC metadata. Store the session if one is issued by the SuperLink.
+        """
+        details, session = self._authenticate(client_call_details)
+        call = continuation(details, request)
+        if session is not None and call.code() == grpc.StatusCode.UNAUTHENTICATED:
+            # The session is unknown to the SuperLink, retry with a signature
+            self._drop_session(session)
+            details, _ = self._authenticate(client_call_details)
+            call = continuation(details, request)
+        call.add_done_callback(self._store_session)
+        return call
+
+    def intercept_unary_stream(
+        self,
+        continuation: Callable[[Any, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: GrpcMessage,
+    ) -> grpc.Call:
+        """Intercept unary-stream call from client and add authentication header."""
+        details, _ = self._authenticate(client_call_details, sign=True)
+        return continuation(details, request)
+
+    def intercept_stream_stream(
+        self,
+        continuation: Callable[[Any, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request_iterator: Iterator[GrpcMessage],
+    ) -> grpc.Call:
+        """Intercept stream-stream call from client and add authentication header."""
+        details, _ = self._authenticate(client_call_details, sign=True)
+        return continuation(details, request_iterator)
+
+    def _authenticate(
+        self, client_call_details: grpc.ClientCallDetails, sign: bool = False
+    ) -> tuple[grpc.ClientCallDetails, Optional[_Session]]:
+        """Return call details with the authentication header in the metadata.
+
+        The call is authenticated by the current session, if any, and also signed if
+        `sign` is True. Without a valid session, the call is signed and requests a new
+        session. Return the session used, if any, along with the call details.
         """
         metadata = list(client_call_details.metadata or [])
 
@@ -60,11 +142,44 @@ class AuthenticateClientInterceptor(grpc.UnaryUnaryClientInterceptor):  # type:
         timestamp = now().isoformat()
         metadata.append((TIMESTAMP_HEADER, timestamp))
 
+        # Add the session and the MAC of the timestamp, or request a new session
+        with self.session_lock:
+            session = self.session
+        if session is not None and time.monotonic() < session.renew_at:
+            mac = hmac.digest(session.key, timestamp.encode("ascii"), hashlib.sha256)
+            metadata.append((SESSION_ID_HEADER, session.session_id))
+            metadata.append((SESSION_MAC_HEADER, mac))
+        else:
+            session = None
+            sign = True
+            metadata.append((SESSION_REQUEST_HEADER, "1"))
+
         # Sign and add the signature
-        signature = sign_message(self.private_key, timestamp.encode("ascii"))
-        metadata.append((SIGNATURE_HEADER, signature))
+        if sign:
+            signature = sign_message(self.private_key, timestamp.encode("ascii"))
+            metadata.append((SIGNATURE_HEADER, signature))
 
         # Overwrite the metadata
-        details = client_call_details._replace(metadata=metadata)
+        return client_call_details._replace(metadata=metadata), session
 
-        return continuation(details, request)
+    def _drop_session(self, session: _Session) -> None:
+        """Forget the session unless it has been replaced already."""
+        with self.session_lock:
+            if self.session is session:
+                self.session = None
+
+    def _store_session(self, call: grpc.Call) -> None:
+        """Store the session from the trailing metadata of a call, if any."""
+        metadata = dict(call.trailing_metadata() or ())
+        if SESSION_ID_HEADER not in metadata:
+            return
+        ttl = float(metadata[SESSION_TTL_HEADER])
+        with self.session_lock:
+            self.session = _Session(
+                session_id=metadata[SESSION_ID_HEADER],
+                key=generate_shared_key(
+                    self.private_key,
+                    bytes_to_public_key(metadata[SESSION_PUBLIC_KEY_HEADER]),
+                ),
+                renew_at=time.monotonic() + ttl - SESSION_RENEWAL_MARGIN,
+            )
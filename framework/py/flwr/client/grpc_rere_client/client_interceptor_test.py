@@ -15,6 +15,8 @@
 """Flower client interceptor tests."""
 
 
+import hashlib
+import hmac
 import threading
 import unittest
 from collections.abc import Sequence
@@ -28,13 +30,23 @@ from parameterized import parameterized
 
 from flwr.client.grpc_rere_client.connection import grpc_request_response
 from flwr.common import GRPC_MAX_MESSAGE_LENGTH
-from flwr.common.constant import PUBLIC_KEY_HEADER, SIGNATURE_HEADER, TIMESTAMP_HEADER
+from flwr.common.constant import (
+    PUBLIC_KEY_HEADER,
+    SESSION_ID_HEADER,
+    SESSION_MAC_HEADER,
+    SESSION_PUBLIC_KEY_HEADER,
+    SESSION_REQUEST_HEADER,
+    SESSION_TTL_HEADER,
+    SIGNATURE_HEADER,
+    TIMESTAMP_HEADER,
+)
 from flwr.common.logger import log
 from flwr.common.message import Message
 from flwr.common.record import RecordDict
 from flwr.common.retry_invoker import RetryInvoker, exponential
 from flwr.common.secure_aggregation.crypto.symmetric_encryption import (
     generate_key_pairs,
+    generate_shared_key,
     public_key_to_bytes,
     verify_signature,
 )
@@ -55,6 +67,9 @@ from flwr.proto.heartbeat_pb2 import (  # pylint: disable=E0611
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 from flwr.proto.run_pb2 import GetRunRequest, GetRunResponse  # pylint: disable=E0611
 
+# Key pair from which the mock servicer derives session keys
+_SESSION_PRIVATE_KEY, _SESSION_PUBLIC_KEY = generate_key_pairs()
+
 
 class _MockServicer:
     """Mock Servicer for Flower clients."""
@@ -65,7 +80,11 @@ class _MockServicer:
         self._received_client_metadata: Optional[
             Sequence[tuple[str, Union[str, bytes]]]
         ] = None
+        self._all_received_client_metadata: list[
+            Sequence[tuple[str, Union[str, bytes]]]
+        ] = []
         self._received_message_bytes: bytes = b""
+        self.reject_session_once = False
 
     def unary_unary(  # pylint: disable=too-many-return-statements
         self, request: GrpcMessage, context: grpc.ServicerContext
@@ -73,8 +92,29 @@ class _MockServicer:
         """Handle unary call."""
         with self._lock:
             self._received_client_metadata = context.invocation_metadata()
+            self._all_received_client_metadata.append(context.invocation_metadata())
             self._received_message_bytes = request.SerializeToString(deterministic=True)
 
+            # Reject the session, e.g., as after a restart of the SuperLink
+            if self.reject_session_once and SESSION_ID_HEADER in dict(
+                context.invocation_metadata()
+            ):
+                self.reject_session_once = False
+                context.abort(grpc.StatusCode.UNAUTHENTICATED, "Invalid session")
+
+            # Issue a session if requested
+            if SESSION_REQUEST_HEADER in dict(context.invocation_metadata()):
+                context.set_trailing_metadata(
+                    (
+                        (SESSION_ID_HEADER, b"session-id"),
+                        (
+                            SESSION_PUBLIC_KEY_HEADER,
+                            public_key_to_bytes(_SESSION_PUBLIC_KEY),
+                        ),
+                        (SESSION_TTL_HEADER, "600"),
+                    )
+                )
+
             if isinstance(request, CreateNodeRequest):
                 return CreateNodeResponse(node=Node(node_id=123))
             if isinstance(request, DeleteNodeRequest):
@@ -94,6 +134,13 @@ class _MockServicer:
         with self._lock:
             return self._received_client_metadata
 
+    def all_received_client_metadata(
+        self,
+    ) -> list[Sequence[tuple[str, Union[str, bytes]]]]:
+        """Return the client metadata of all received calls."""
+        with self._lock:
+            return list(self._all_received_client_metadata)
+
     def received_message_bytes(self) -> bytes:
         """Return received message bytes."""
         with self._lock:
@@ -229,7 +276,7 @@ class TestAuthenticateClientInterceptor(unittest.TestCase):
         [(_create_node,), (_delete_node,), (_receive,), (_send,), (_get_run,)]
     )  # type: ignore
     def test_client_auth_rpc(self, grpc_call: Callable[[Any], None]) -> None:
-        """Test client authentication during create node."""
+        """Test that the first call is signed and requests a session."""
         # Prepare
         retry_invoker = _init_retry_invoker()
 
@@ -244,8 +291,7 @@ class TestAuthenticateClientInterceptor(unittest.TestCase):
         ) as conn:
             grpc_call(conn)
 
-            received_metadata = self._servicer.received_client_metadata()
-            assert received_metadata is not None
+            received_metadata = self._servicer.all_received_client_metadata()[0]
 
             metadata_dict = dict(received_metadata)
             actual_public_key = metadata_dict[PUBLIC_KEY_HEADER]
@@ -258,10 +304,80 @@ class TestAuthenticateClientInterceptor(unittest.TestCase):
             assert isinstance(signature, bytes)
             assert isinstance(timestamp, str)
             assert actual_public_key == expected_public_key
+            assert SESSION_REQUEST_HEADER in metadata_dict
             assert verify_signature(
                 self._client_public_key, timestamp.encode("ascii"), signature
             )
 
+    def test_client_auth_rpc_with_session(self) -> None:
+        """Test that calls after the first one are authenticated by the session."""
+        # Prepare
+        retry_invoker = _init_retry_invoker()
+
+        # Execute
+        with self._connection(
+            self._address,
+            True,
+            retry_invoker,
+            GRPC_MAX_MESSAGE_LENGTH,
+            None,
+            (self._client_private_key, self._client_public_key),
+        ) as conn:
+            _receive(conn)
+
+            received_metadata = self._servicer.received_client_metadata()
+            assert received_metadata is not None
+            metadata_dict = dict(received_metadata)
+
+            # Assert
+            timestamp = metadata_dict[TIMESTAMP_HEADER]
+            assert isinstance(timestamp, str)
+            session_key = generate_shared_key(
+                _SESSION_PRIVATE_KEY, self._client_public_key
+            )
+            expected_mac = hmac.digest(
+                session_key, timestamp.encode("ascii"), hashlib.sha256
+            )
+            assert SESSION_REQUEST_HEADER not in metadata_dict
+            assert metadata_dict[SESSION_ID_HEADER] == b"session-id"
+            assert metadata_dict[SESSION_MAC_HEADER] == expected_mac
+            assert SIGNATURE_HEADER not in metadata_dict
+
+    def test_client_auth_rpc_with_rejected_session(self) -> None:
+        """Test that a call with a rejected session is retried with a signature."""
+        # Prepare
+        retry_invoker = _init_retry_invoker()
+
+        # Execute
+        with self._connection(
+            self._address,
+            True,
+            retry_invoker,
+            GRPC_MAX_MESSAGE_LENGTH,
+            None,
+            (self._client_private_key, self._client_public_key),
+        ) as conn:
+            receive, _, create_node, _, _, _ = conn
+            create_node()
+            self._servicer.reject_session_once = True
+            receive()
+            receive()
+
+            all_metadata = [
+                dict(metadata)
+                for metadata in self._servicer.all_received_client_metadata()
+            ]
+
+            # Assert: Rejected call, signed retry, call with the new session
+            assert [SIGNATURE_HEADER in metadata for metadata in all_metadata] == [
+                True,
+                False,
+                True,
+                False,
+            ]
+            assert SESSION_REQUEST_HEADER in all_metadata[2]
+            assert SESSION_ID_HEADER in all_metadata[3]
+
     def test_without_servicer(self) -> None:
         """Test client authentication without servicer."""
         # Prepare
@@ -29,14 +29,15 @@ from flwr.common.constant import HEARTBEAT_CALL_TIMEOUT, HEARTBEAT_DEFAULT_INTER
 from flwr.common.grpc import create_channel, on_channel_state_change
 from flwr.common.heartbeat import HeartbeatSender
 from flwr.common.inflatable import (
-    get_all_nested_objects,
-    get_object_tree,
+    get_all_nested_objects_and_tree,
     iterate_object_tree,
     no_object_id_recompute,
 )
 from flwr.common.inflatable_grpc_utils import (
     make_pull_object_fn_grpc,
     make_push_object_fn_grpc,
+    pull_objects_stream_grpc,
+    push_objects_stream_grpc,
 )
 from flwr.common.inflatable_utils import (
     inflate_object_from_contents,
@@ -75,6 +76,16 @@ from .client_interceptor import AuthenticateClientInterceptor
 from .grpc_adapter import GrpcAdapter
 
 
+def _raise_if_run_not_running(e: grpc.RpcError) -> None:
+    """Raise `RunNotRunningException` if a stream was denied because of the run.
+
+    Errors raised while consuming a stream bypass the retry invoker, which maps them for
+    unary calls.
+    """
+    if e.code() == grpc.StatusCode.PERMISSION_DENIED:  # pylint: disable=E1101
+        raise RunNotRunningException from e
+
+
 @contextmanager
 def grpc_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
     server_address: str,
@@ -86,6 +97,7 @@ def grpc_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
         tuple[ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey]
     ] = None,
     adapter_cls: Optional[Union[type[FleetStub], type[GrpcAdapter]]] = None,
+    pull_timeout: float = 0.0,
 ) -> Iterator[
     tuple[
         Callable[[], Optional[Message]],
@@ -128,6 +140,9 @@ def grpc_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
     adapter_cls: Optional[Union[type[FleetStub], type[GrpcAdapter]]] (default: None)
         A GrpcStub Class that can be used to send messages. By default the FleetStub
         will be used.
+    pull_timeout : float (default: 0.0)
+        Maximum time in seconds the server may hold a `receive` call until a
+        message becomes available. If 0, `receive` returns immediately.
 
     Returns
     -------
@@ -176,6 +191,11 @@ def grpc_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
 
     # Wrap stub
     _wrap_stub(stub, retry_invoker)
+
+    # Streaming RPCs are only available on the native Fleet API stub,
+    # other adapters (e.g., `grpc-adapter`) fall back to unary RPCs
+    use_object_streams = isinstance(stub, FleetStub)
+
     ###########################################################################
     # send_node_heartbeat/create_node/delete_node/receive/send/get_run functions
     ###########################################################################
@@ -253,8 +273,9 @@ def grpc_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
             log(ERROR, "Node instance missing")
             return None
 
-        # Request instructions (message) from server
-        request = PullMessagesRequest(node=node)
+        # Request instructions (message) from server, which holds the request
+        # until a message is available or the timeout expires
+        request = PullMessagesRequest(node=node, timeout=pull_timeout)
         response: PullMessagesResponse = stub.PullMessages(request=request)
 
         # Get the current Messages
@@ -275,14 +296,29 @@ def grpc_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
             msg_id = message_proto.metadata.message_id
             run_id = message_proto.metadata.run_id
             object_tree = response.message_object_trees[0]
-            all_object_contents = pull_objects(
-                [tree.object_id for tree in iterate_object_tree(object_tree)],
-                pull_object_fn=make_pull_object_fn_grpc(
-                    pull_object_grpc=stub.PullObject,
-                    node=node,
-                    run_id=run_id,
-                ),
-            )
+            object_ids = [tree.object_id for tree in iterate_object_tree(object_tree)]
+            if use_object_streams:
+                try:
+                    all_object_contents = pull_objects_stream_grpc(
+                        object_ids,
+                        pull_objects_grpc=cast(FleetStub, stub).PullObjects,
+                        get_objects_status_grpc=cast(FleetStub, stub).GetObjectsStatus,
+                        pull_object_grpc=stub.PullObject,
+                        node=node,
+                        run_id=run_id,
+                    )
+                except grpc.RpcError as e:
+                    _raise_if_run_not_running(e)
+                    raise
+            else:
+                all_object_contents = pull_objects(
+                    object_ids,
+                    pull_object_fn=make_pull_object_fn_grpc(
+                        pull_object_grpc=stub.PullObject,
+                        node=node,
+                        run_id=run_id,
+                    ),
+                )
 
             # Confirm that the message has been received
             stub.ConfirmMessageReceived(
@@ -310,8 +346,7 @@ def grpc_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
 
         with no_object_id_recompute():
             # Get all nested objects
-            all_objects = get_all_nested_objects(message)
-            object_tree = get_object_tree(message)
+            all_objects, object_tree = get_all_nested_objects_and_tree(message)
 
             # Serialize Message
             message_proto = message_to_proto(
@@ -328,15 +363,29 @@ def grpc_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
                 objs_to_push = set(
                     response.objects_to_push[message.object_id].object_ids
                 )
-                push_objects(
-                    all_objects,
-                    push_object_fn=make_push_object_fn_grpc(
-                        push_object_grpc=stub.PushObject,
-                        node=node,
-                        run_id=message.metadata.run_id,
-                    ),
-                    object_ids_to_push=objs_to_push,
-                )
+                if use_object_streams:
+                    try:
+                        push_objects_stream_grpc(
+                            all_objects,
+                            push_objects_grpc=cast(FleetStub, stub).PushObjects,
+                            push_object_grpc=stub.PushObject,
+                            node=node,
+                            run_id=message.metadata.run_id,
+                            object_ids_to_push=objs_to_push,
+                        )
+                    except grpc.RpcError as e:
+                        _raise_if_run_not_running(e)
+                        raise
+                else:
+                    push_objects(
+                        all_objects,
+                        push_object_fn=make_push_object_fn_grpc(
+                            push_object_grpc=stub.PushObject,
+                            node=node,
+                            run_id=message.metadata.run_id,
+                        ),
+                        object_ids_to_push=objs_to_push,
+                    )
                 log(DEBUG, "Pushed %s objects to servicer.", len(objs_to_push))
 
     def get_run(run_id: int) -> Run:
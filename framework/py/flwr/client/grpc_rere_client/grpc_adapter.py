@@ -16,6 +16,7 @@
 
 
 import sys
+from collections.abc import Iterator
 from logging import DEBUG
 from typing import Any, TypeVar, cast
 
@@ -52,10 +53,15 @@ from flwr.proto.heartbeat_pb2 import (  # pylint: disable=E0611
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
     ConfirmMessageReceivedRequest,
     ConfirmMessageReceivedResponse,
+    GetObjectsStatusRequest,
+    GetObjectsStatusResponse,
     PullObjectRequest,
     PullObjectResponse,
+    PullObjectsRequest,
+    PullObjectsResponse,
     PushObjectRequest,
     PushObjectResponse,
+    PushObjectsResponse,
 )
 from flwr.proto.run_pb2 import GetRunRequest, GetRunResponse  # pylint: disable=E0611
 
@@ -172,6 +178,38 @@ class GrpcAdapter:
         """."""
         return self._send_and_receive(request, PullObjectResponse, **kwargs)
 
+    def PushObjects(  # pylint: disable=C0103
+        self, request_iterator: Iterator[PushObjectRequest], **kwargs: Any
+    ) -> Iterator[PushObjectsResponse]:
+        """."""
+        # Streams are not supported by the adapter, push objects one by one
+        for request in request_iterator:
+            res = self._send_and_receive(request, PushObjectResponse, **kwargs)
+            yield PushObjectsResponse(object_id=request.object_id, stored=res.stored)
+
+    def PullObjects(  # pylint: disable=C0103
+        self, request: PullObjectsRequest, **kwargs: Any
+    ) -> Iterator[PullObjectsResponse]:
+        """."""
+        # Streams are not supported by the adapter, pull objects one by one
+        for object_id in request.object_ids:
+            req = PullObjectRequest(
+                node=request.node, run_id=request.run_id, object_id=object_id
+            )
+            res = self._send_and_receive(req, PullObjectResponse, **kwargs)
+            yield PullObjectsResponse(
+                object_id=object_id,
+                object_found=res.object_found,
+                object_available=res.object_available,
+                object_content=res.object_content,
+            )
+
+    def GetObjectsStatus(  # pylint: disable=C0103
+        self, request: GetObjectsStatusRequest, **kwargs: Any
+    ) -> GetObjectsStatusResponse:
+        """."""
+        return self._send_and_receive(request, GetObjectsStatusResponse, **kwargs)
+
     def ConfirmMessageReceived(  # pylint: disable=C0103
         self, request: ConfirmMessageReceivedRequest, **kwargs: Any
     ) -> ConfirmMessageReceivedResponse:
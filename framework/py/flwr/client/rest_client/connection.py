@@ -28,8 +28,7 @@ from flwr.common.constant import HEARTBEAT_DEFAULT_INTERVAL
 from flwr.common.exit import ExitCode, flwr_exit
 from flwr.common.heartbeat import HeartbeatSender
 from flwr.common.inflatable import (
-    get_all_nested_objects,
-    get_object_tree,
+    get_all_nested_objects_and_tree,
     iterate_object_tree,
     no_object_id_recompute,
 )
@@ -376,8 +375,7 @@ def http_request_response(  # pylint: disable=R0913,R0914,R0915,R0917
 
         with no_object_id_recompute():
             # Get all nested objects
-            all_objects = get_all_nested_objects(message)
-            object_tree = get_object_tree(message)
+            all_objects, object_tree = get_all_nested_objects_and_tree(message)
 
             # Serialize Message
             message_proto = message_to_proto(
@@ -125,6 +125,13 @@ SIGNATURE_HEADER = "flwr-signature-bin"  # Must end with "-bin" for binary data
 TIMESTAMP_HEADER = "flwr-timestamp"
 TIMESTAMP_TOLERANCE = 10  # General tolerance for timestamp verification
 SYSTEM_TIME_TOLERANCE = 5  # Allowance for system time drift
+SESSION_REQUEST_HEADER = "flwr-session-request"  # Asks the SuperLink for a session
+SESSION_ID_HEADER = "flwr-session-id-bin"  # Must end with "-bin" for binary data
+SESSION_PUBLIC_KEY_HEADER = "flwr-session-public-key-bin"  # Must end with "-bin"
+SESSION_MAC_HEADER = "flwr-session-mac-bin"  # Must end with "-bin" for binary data
+SESSION_TTL_HEADER = "flwr-session-ttl"
+SESSION_TTL = 600  # Lifetime of an authentication session in seconds
+SESSION_RENEWAL_MARGIN = 60  # Time before expiry at which a node renews its session
 
 # Constants for grpc retry
 GRPC_RETRY_MAX_DELAY = 20  # Maximum delay duration between two consecutive retries.
@@ -136,6 +143,9 @@ GC_THRESHOLD = 200_000_000  # 200 MB
 HEAD_BODY_DIVIDER = b"\x00"
 HEAD_VALUE_DIVIDER = " "
 MAX_ARRAY_CHUNK_SIZE = 20_971_520  # 20 MB
+CDC_MIN_CHUNK_SIZE = 262_144  # Min size of content-defined ArrayChunks (256 KB)
+CDC_AVG_CHUNK_SIZE = 1_048_576  # Avg size of content-defined ArrayChunks (1 MB)
+CDC_WINDOW_SIZE = 64  # Size of the rolling hash window for content-defined chunking
 
 # Constants for serialization
 INT64_MAX_VALUE = 9223372036854775807  # (1 << 63) - 1
@@ -146,10 +156,46 @@ FLWR_APP_TOKEN_LENGTH = 128  # Length of the token used
 # Constants for object pushing and pulling
 MAX_CONCURRENT_PUSHES = 8  # Default maximum number of concurrent pushes
 MAX_CONCURRENT_PULLS = 8  # Default maximum number of concurrent pulls
+MAX_CONCURRENT_DEFLATES = 4  # Default maximum number of concurrent deflates
+PUSH_MAX_BUFFERED_BYTES = 83_886_080  # Max deflated bytes held while pushing (80 MB)
 PULL_MAX_TIME = 7200  # Default maximum time to wait for pulling objects
 PULL_MAX_TRIES_PER_OBJECT = 500  # Default maximum number of tries to pull an object
 PULL_INITIAL_BACKOFF = 1  # Initial backoff time for pulling objects
 PULL_BACKOFF_CAP = 10  # Maximum backoff time for pulling objects
+OBJECT_STREAM_MAX_IN_FLIGHT_BYTES = 83_886_080  # Max unacknowledged bytes (80 MB)
+OBJECT_STREAM_MAX_RESUMES = 5  # Max number of times an interrupted stream is resumed
+OBJECT_STATUS_MAX_WAIT = 30  # Max time a `GetObjectsStatus` long-poll is held
+OBJECT_STATUS_POLL_INTERVAL = (
+    1  # Interval between checks for objects of other processes
+)
+OBJECT_STATUS_MAX_CONCURRENT_WAITS = 100  # Max `GetObjectsStatus` long-polls held
+
+# Constants for LinkState
+POSTGRES_URL_PREFIXES = ("postgresql://", "postgres://")
+POSTGRES_POOL_MIN_SIZE = 1  # Min number of pooled connections per SuperLink
+POSTGRES_POOL_MAX_SIZE = 16  # Max number of pooled connections per SuperLink
+MESSAGE_POLL_INTERVAL = 1  # Interval between checks for Messages of other processes
+RUN_STATUS_CACHE_MAX_STALENESS = 1  # Max time a cached run status is used
+NODE_HEARTBEAT_FLUSH_INTERVAL = 1  # Max time node heartbeats are buffered
+VCE_DISPATCH_SWEEP_INTERVAL = 10  # Interval between checks of all virtual nodes
+VCE_BATCH_TARGET_DURATION = 1  # Target time to process a batch of Messages
+VCE_BROADCAST_MIN_ARRAY_SIZE = 100 * 1024  # Smallest Array shared via object store
+
+# Constants for long-polling `PullMessages` of the Fleet API
+PULL_MESSAGES_MAX_WAIT = 30  # Max time a Fleet `PullMessages` long-poll is held
+PULL_MESSAGES_WAIT_INTERVAL = 1  # Interval to check if a long-poll was cancelled
+PULL_MESSAGES_LONG_POLL_TIMEOUT = 20  # Time a SuperNode waits in `PullMessages`
+FLEET_MAX_CONCURRENT_LONG_POLLS = 500  # Max long-polls held by a Fleet API server
+SUPERNODE_MIN_PULL_INTERVAL = 0.1  # Min time between pulls of an idle SuperNode
+SUPERNODE_MAX_PULL_INTERVAL = 3  # Max time between pulls of an idle SuperNode
+
+# Constants for waiting for replies
+WAIT_FOR_REPLIES_MAX_WAIT = 30  # Max time a `WaitForReplies` long-poll is held
+WAIT_FOR_REPLIES_INTERVAL = 3  # Max time a `Grid` waits between two pulls
+
+# Constants for ObjectStore
+FLWR_IN_MEMORY_OBJECT_STORE = ":flwr-in-memory-object-store:"
+OBJECT_STORE_SEGMENT_SIZE = 268_435_456  # 256 MB
 
 
 # ExecServicer constants
@@ -184,12 +230,24 @@ class SType:
     """Serialisation type."""
 
     NUMPY = "numpy.ndarray"
+    RAW_BUFFER = "raw.buffer"
 
     def __new__(cls) -> SType:
         """Prevent instantiation."""
         raise TypeError(f"{cls.__name__} cannot be instantiated.")
 
 
+class ChunkingMode:
+    """Chunking mode of Array data."""
+
+    FIXED = "fixed"
+    CONTENT_DEFINED = "content-defined"
+
+    def __new__(cls) -> ChunkingMode:
+        """Prevent instantiation."""
+        raise TypeError(f"{cls.__name__} cannot be instantiated.")
+
+
 class ErrorCode:
     """Error codes for Message's Error."""
 
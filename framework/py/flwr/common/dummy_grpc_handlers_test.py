@@ -27,6 +27,7 @@ class NoOpUnaryUnaryHandler:
 
     unary_unary = staticmethod(lambda request, context: "dummy_response")
     unary_stream = None
+    stream_stream = None
     request_deserializer = None
     response_serializer = None
 
@@ -38,6 +39,7 @@ class NoOpUnaryStreamHandler:
     unary_stream = staticmethod(
         lambda request, context: iter(["stream response 1", "stream response 2"])
     )
+    stream_stream = None
     request_deserializer = None
     response_serializer = None
 
@@ -47,6 +49,7 @@ class NoOpUnsupportedHandler:
 
     unary_unary = None
     unary_stream = None
+    stream_stream = None
     request_deserializer = None
     response_serializer = None
 
@@ -58,6 +61,7 @@ class NoOpUnaryUnaryHandlerException:
         lambda request, context: (_ for _ in ()).throw(BaseException("Test error"))
     )
     unary_stream = None
+    stream_stream = None
     request_deserializer = None
     response_serializer = None
 
@@ -93,5 +97,6 @@ class NoOpUnaryStreamHandlerException:
 
     unary_unary = None
     unary_stream = staticmethod(_noop_unary_stream_exception)
+    stream_stream = None
     request_deserializer = None
     response_serializer = None
@@ -47,6 +47,7 @@ class ExitCode:
     COMMON_ADDRESS_INVALID = 600
     COMMON_MISSING_EXTRA_REST = 601
     COMMON_TLS_NOT_SUPPORTED = 602
+    COMMON_MISSING_EXTRA_POSTGRES = 603
 
     def __new__(cls) -> ExitCode:
         """Prevent instantiation."""
@@ -100,4 +101,11 @@ To use the REST API, install `flwr` with the `rest` extra:
     `pip install "flwr[rest]"`.
 """,
     ExitCode.COMMON_TLS_NOT_SUPPORTED: "Please use the '--insecure' flag.",
+    ExitCode.COMMON_MISSING_EXTRA_POSTGRES: """
+Extra dependencies required for using a PostgreSQL database are missing.
+
+To use PostgreSQL, install `flwr` with the `postgres` extra:
+
+    `pip install "flwr[postgres]"`.
+""",
 }
@@ -153,6 +153,25 @@ def get_object_body(object_content: bytes, cls: type[T]) -> bytes:
     return _get_object_body(object_content)
 
 
+def get_object_body_view(object_content: bytes, cls: type[T]) -> memoryview:
+    """Return a zero-copy view of the object body.
+
+    Like `get_object_body`, but the returned body shares memory with
+    `object_content` instead of being copied.
+    """
+    class_name = cls.__qualname__
+    object_type = get_object_type_from_object_content(object_content)
+    if not object_type == class_name:
+        raise ValueError(
+            f"Class name ({class_name}) and object type "
+            f"({object_type}) do not match."
+        )
+
+    # Return a view of the object body
+    index = object_content.find(HEAD_BODY_DIVIDER)
+    return memoryview(object_content)[index + len(HEAD_BODY_DIVIDER) :]
+
+
 def add_header_to_object_body(object_body: bytes, obj: InflatableObject) -> bytes:
     """Add header to object content."""
     # Construct header
@@ -258,23 +277,72 @@ def get_all_nested_objects(obj: InflatableObject) -> dict[str, InflatableObject]
     Each key in the dictionary is an object ID, and the entries are ordered by post-
     order traversal, i.e., child objects appear before their respective parents.
     """
-    ret: dict[str, InflatableObject] = {}
-    if children := obj.children:
-        for child in children.values():
-            ret.update(get_all_nested_objects(child))
-
-    ret[obj.object_id] = obj
-
-    return ret
+    return _traverse_object(obj, with_tree=False)[0]
 
 
 def get_object_tree(obj: InflatableObject) -> ObjectTree:
     """Get a tree representation of the InflatableObject."""
-    tree_children = []
-    if children := obj.children:
-        for child in children.values():
-            tree_children.append(get_object_tree(child))
-    return ObjectTree(object_id=obj.object_id, children=tree_children)
+    return _traverse_object(obj, with_tree=True)[1]
+
+
+def get_all_nested_objects_and_tree(
+    obj: InflatableObject,
+) -> tuple[dict[str, InflatableObject], ObjectTree]:
+    """Get all nested objects and the object tree in a single traversal.
+
+    This is equivalent to calling `get_all_nested_objects` and `get_object_tree`,
+    but visits each object only once.
+    """
+    return _traverse_object(obj, with_tree=True)
+
+
+def _traverse_object(  # pylint: disable=R0914
+    obj: InflatableObject, with_tree: bool
+) -> tuple[dict[str, InflatableObject], ObjectTree]:
+    """Traverse the object iteratively in post-order.
+
+    Objects whose ID has already been visited are not traversed again. If
+    `with_tree` is True, their subtree is copied into the object tree instead.
+    Otherwise, the returned object tree only contains the root.
+    """
+    objects: dict[str, InflatableObject] = {}
+    trees: dict[str, ObjectTree] = {}  # Tree nodes of objects with children
+    root_id = obj.object_id
+    root_tree = ObjectTree(object_id=root_id)
+    # Stack of (object ID, object, tree node, iterator over its remaining children)
+    stack = [
+        (
+            root_id,
+            obj,
+            root_tree if with_tree else None,
+            iter((obj.children or {}).items()),
+        )
+    ]
+    while stack:
+        obj_id, node, node_tree, children = stack[-1]
+        tree_children = node_tree.children if node_tree is not None else None
+        for child_id, child in children:
+            child_tree = None
+            if tree_children is not None:
+                child_tree = tree_children.add()
+                if child_id in trees:
+                    # Subtrees of objects with the same ID are identical
+                    child_tree.CopyFrom(trees[child_id])
+                    continue
+                child_tree.object_id = child_id
+            if child_id in objects:
+                continue
+            if grandchildren := child.children:
+                stack.append((child_id, child, child_tree, iter(grandchildren.items())))
+                break
+            # Objects without children are completed right away
+            objects[child_id] = child
+        else:
+            stack.pop()
+            objects[obj_id] = node
+            if node_tree is not None:
+                trees[obj_id] = node_tree
+    return objects, root_tree
 
 
 def iterate_object_tree(
@@ -285,6 +353,16 @@ def iterate_object_tree(
     This function performs a post-order traversal of the tree, yielding the object ID of
     each node after all its children have been yielded.
     """
-    for child in tree.children:
-        yield from iterate_object_tree(child)
-    yield tree
+    # Stack of (tree node, iterator over its remaining children)
+    stack = [(tree, iter(tree.children))]
+    while stack:
+        node, children = stack[-1]
+        for child in children:
+            if grandchildren := child.children:
+                stack.append((child, iter(grandchildren)))
+                break
+            # Nodes without children are yielded right away
+            yield child
+        else:
+            stack.pop()
+            yield node
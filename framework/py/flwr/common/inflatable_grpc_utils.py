@@ -15,17 +15,46 @@
 """InflatableObject gRPC utils."""
 
 
-from typing import Callable
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from logging import DEBUG
+from typing import Callable, Optional
+
+import grpc
 
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
+    GetObjectsStatusRequest,
+    GetObjectsStatusResponse,
     PullObjectRequest,
     PullObjectResponse,
+    PullObjectsRequest,
+    PullObjectsResponse,
     PushObjectRequest,
     PushObjectResponse,
+    PushObjectsResponse,
 )
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 
-from .inflatable_utils import ObjectIdNotPreregisteredError, ObjectUnavailableError
+from .constant import (
+    MAX_CONCURRENT_DEFLATES,
+    OBJECT_STATUS_MAX_WAIT,
+    OBJECT_STREAM_MAX_IN_FLIGHT_BYTES,
+    OBJECT_STREAM_MAX_RESUMES,
+    PULL_BACKOFF_CAP,
+    PULL_INITIAL_BACKOFF,
+    PULL_MAX_TIME,
+)
+from .inflatable import InflatableObject
+from .inflatable_utils import (
+    ObjectDeflater,
+    ObjectIdNotPreregisteredError,
+    ObjectUnavailableError,
+    pull_objects,
+)
+from .logger import log
 
 
 def make_pull_object_fn_grpc(
@@ -97,3 +126,430 @@ def make_push_object_fn_grpc(
             raise ObjectIdNotPreregisteredError(object_id)
 
     return push_object_fn
+
+
+def push_objects_stream_grpc(  # pylint: disable=R0913,R0914
+    objects: dict[str, InflatableObject],
+    push_objects_grpc: Callable[
+        [Iterator[PushObjectRequest]], Iterator[PushObjectsResponse]
+    ],
+    node: Node,
+    run_id: int,
+    *,
+    push_object_grpc: Optional[
+        Callable[[PushObjectRequest], PushObjectResponse]
+    ] = None,
+    object_ids_to_push: Optional[set[str]] = None,
+    keep_objects: bool = False,
+    max_in_flight_bytes: int = OBJECT_STREAM_MAX_IN_FLIGHT_BYTES,
+    max_resumes: int = OBJECT_STREAM_MAX_RESUMES,
+    max_concurrent_deflates: int = MAX_CONCURRENT_DEFLATES,
+) -> None:
+    """Push multiple objects over a single bidirectional gRPC stream.
+
+    Objects are deflated by a pool of workers while the stream is consumed. The
+    servicer acknowledges every object, and no more than `max_in_flight_bytes` of
+    deflated content is held at any time, whether it waits to be sent or was sent
+    but not acknowledged yet. If the stream is interrupted
+    (status code `UNAVAILABLE`), a new stream is opened that only carries the
+    objects that were not acknowledged yet. If the servicer does not implement
+    streams (status code `UNIMPLEMENTED`) and `push_object_grpc` is provided, the
+    objects that were not acknowledged are pushed one by one instead.
+
+    Parameters
+    ----------
+    objects : dict[str, InflatableObject]
+        A dictionary of objects to push, where keys are object IDs and values are
+        `InflatableObject` instances.
+    push_objects_grpc : Callable[[Iterator[PushObjectRequest]], Iterator[...]]
+        The gRPC function to push a stream of objects, e.g., `FleetStub.PushObjects`.
+    node : Node
+        The node making the request.
+    run_id : int
+        The run ID for the current operation.
+    push_object_grpc : Optional[Callable[[PushObjectRequest], PushObjectResponse]]
+        The gRPC function to push a single object, e.g., `FleetStub.PushObject`,
+        used if the servicer does not implement `push_objects_grpc`.
+        (default: None)
+    object_ids_to_push : Optional[set[str]] (default: None)
+        A set of object IDs to push. If not provided, all objects will be pushed.
+    keep_objects : bool (default: False)
+        If `True`, the original objects will be kept in the `objects` dictionary
+        after pushing. If `False`, they will be removed from the dictionary to avoid
+        high memory usage.
+    max_in_flight_bytes : int (default: OBJECT_STREAM_MAX_IN_FLIGHT_BYTES)
+        The maximum number of bytes sent but not yet acknowledged by the servicer.
+    max_resumes : int (default: OBJECT_STREAM_MAX_RESUMES)
+        The maximum number of times an interrupted stream is resumed.
+    max_concurrent_deflates : int (default: MAX_CONCURRENT_DEFLATES)
+        The maximum number of concurrent deflates to perform.
+
+    Raises
+    ------
+    ObjectIdNotPreregisteredError
+        If the servicer did not store an object because it was not pre-registered.
+    """
+    if object_ids_to_push is not None:
+        # Filter objects to push only those with IDs in the set
+        objects = {k: v for k, v in objects.items() if k in object_ids_to_push}
+
+    with ObjectDeflater(
+        objects,
+        keep_objects=keep_objects,
+        max_concurrent_deflates=max_concurrent_deflates,
+        max_buffered_bytes=max_in_flight_bytes,
+    ) as deflater:
+        window = _PushWindow(deflater, max_in_flight_bytes)
+        try:
+            _push_objects_stream(window, push_objects_grpc, node, run_id, max_resumes)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNIMPLEMENTED or push_object_grpc is None:
+                raise
+            log(DEBUG, "PushObjects is not implemented, pushing objects one by one")
+            push_object_fn = make_push_object_fn_grpc(push_object_grpc, node, run_id)
+            for obj_id, content in window.drain():
+                push_object_fn(obj_id, content)
+                window.ack(obj_id)
+
+
+def _push_objects_stream(
+    window: "_PushWindow",
+    push_objects_grpc: Callable[
+        [Iterator[PushObjectRequest]], Iterator[PushObjectsResponse]
+    ],
+    node: Node,
+    run_id: int,
+    max_resumes: int,
+) -> None:
+    """Push all objects of the window, resuming interrupted streams."""
+    num_resumes = 0
+    while window.has_objects():
+        window.open()
+        responses = push_objects_grpc(window.requests(node, run_id))
+        try:
+            for response in responses:
+                if not response.stored:
+                    raise ObjectIdNotPreregisteredError(response.object_id)
+                window.ack(response.object_id)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNAVAILABLE or num_resumes >= max_resumes:
+                raise
+            num_resumes += 1
+            log(DEBUG, "PushObjects stream interrupted, resuming (%s)", num_resumes)
+        else:
+            # The stream ended without acknowledging everything that was sent
+            if (obj_id := window.first_unacked()) is not None:
+                if num_resumes >= max_resumes:
+                    raise ObjectUnavailableError(obj_id)
+                num_resumes += 1
+        finally:
+            window.close()
+            if isinstance(responses, grpc.Call):
+                responses.cancel()
+
+
+class _PushWindow:  # pylint: disable=R0902
+    """Flow control for pushing objects over a stream.
+
+    Tracks objects that were sent but not yet acknowledged, such that no more than
+    `max_in_flight_bytes` are in flight and unacknowledged objects can be resent
+    when an interrupted stream is resumed. Contents are released from the budget of
+    the deflater once they are acknowledged.
+    """
+
+    def __init__(self, deflater: ObjectDeflater, max_in_flight_bytes: int) -> None:
+        self.deflater = deflater
+        self.deflater_lock = threading.Lock()
+        self.max_in_flight_bytes = max_in_flight_bytes
+        self.unacked: dict[str, bytes] = {}
+        self.resend: deque[str] = deque()
+        self.in_flight = 0
+        self.closed = False
+        self.num_streams = 0
+        self.cond = threading.Condition()
+
+    def has_objects(self) -> bool:
+        """Return True if some objects were not acknowledged yet."""
+        return bool(self.deflater.num_remaining or self.unacked)
+
+    def first_unacked(self) -> Optional[str]:
+        """Return the ID of an object that was sent but not acknowledged."""
+        return next(iter(self.unacked), None)
+
+    def open(self) -> None:
+        """Prepare the window for a new stream."""
+        with self.cond:
+            self.resend = deque(self.unacked.keys())
+            self.in_flight = 0
+            self.closed = False
+            self.num_streams += 1
+
+    def close(self) -> None:
+        """Stop producing requests for the current stream."""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def drain(self) -> Iterator[tuple[str, bytes]]:
+        """Yield the objects that were not acknowledged yet, without flow control.
+
+        Yielded objects must be acknowledged before the next one is requested.
+        """
+        while self.unacked:
+            for obj_id, content in self.unacked.items():
+                yield obj_id, content
+                break
+        while (result := self.deflater.get()) is not None:
+            self.unacked[result[0]] = result[1]
+            self.in_flight += len(result[1])
+            yield result
+
+    def ack(self, object_id: str) -> None:
+        """Mark an object as acknowledged and release its bytes from the window."""
+        with self.cond:
+            if (content := self.unacked.pop(object_id, None)) is not None:
+                self.in_flight -= len(content)
+                self.deflater.release(len(content))
+            self.cond.notify_all()
+
+    def requests(self, node: Node, run_id: int) -> Iterator[PushObjectRequest]:
+        """Yield requests while the window allows sending more content."""
+        stream = self.num_streams
+        while True:
+            with self.cond:
+                self.cond.wait_for(
+                    lambda: self.in_flight < self.max_in_flight_bytes or self.closed
+                )
+                if self.closed:
+                    return
+                if self.resend:
+                    obj_id = self.resend.popleft()
+                    if (resent_content := self.unacked.get(obj_id)) is None:
+                        # Acknowledged in the meantime
+                        continue
+                    content = resent_content
+                    self.in_flight += len(content)
+                    resent = True
+                else:
+                    resent = False
+            if not resent:
+                # Wait outside the lock, acknowledgements can be processed meanwhile
+                with self.deflater_lock:
+                    result = self.deflater.get()
+                if result is None:
+                    return
+                obj_id, content = result
+                with self.cond:
+                    self.unacked[obj_id] = content
+                    if stream != self.num_streams:
+                        # The stream was replaced while waiting, send it on the new one
+                        self.resend.append(obj_id)
+                        return
+                    self.in_flight += len(content)
+            yield PushObjectRequest(
+                node=node, run_id=run_id, object_id=obj_id, object_content=content
+            )
+
+
+def pull_objects_stream_grpc(  # pylint: disable=R0913,R0914
+    object_ids: list[str],
+    pull_objects_grpc: Callable[[PullObjectsRequest], Iterator[PullObjectsResponse]],
+    node: Node,
+    run_id: int,
+    *,
+    get_objects_status_grpc: Optional[
+        Callable[[GetObjectsStatusRequest], GetObjectsStatusResponse]
+    ] = None,
+    pull_object_grpc: Optional[
+        Callable[[PullObjectRequest], PullObjectResponse]
+    ] = None,
+    max_time: Optional[float] = PULL_MAX_TIME,
+    initial_backoff: float = PULL_INITIAL_BACKOFF,
+    backoff_cap: float = PULL_BACKOFF_CAP,
+    max_resumes: int = OBJECT_STREAM_MAX_RESUMES,
+) -> dict[str, bytes]:
+    """Pull multiple objects over a single server-streaming gRPC call.
+
+    All requested objects are streamed back in one call. If some objects are not yet
+    available and `get_objects_status_grpc` is provided, a long-poll request waits
+    until some of them become available, and only those are pulled in the next call.
+    Otherwise, they are requested again in a new call, with exponential backoff if
+    no progress was made. If the stream is interrupted (status code `UNAVAILABLE`),
+    only the objects that were not received yet are requested again. If the servicer
+    does not implement streams (status code `UNIMPLEMENTED`) and `pull_object_grpc`
+    is provided, the objects that were not received are pulled one by one instead.
+    Likewise, if it does not implement `get_objects_status_grpc`, unavailable objects
+    are polled with exponential backoff.
+
+    Parameters
+    ----------
+    object_ids : list[str]
+        A list of object IDs to pull.
+    pull_objects_grpc : Callable[[PullObjectsRequest], Iterator[PullObjectsResponse]]
+        The gRPC function to pull a stream of objects, e.g., `FleetStub.PullObjects`.
+    node : Node
+        The node making the request.
+    run_id : int
+        The run ID for the current operation.
+    get_objects_status_grpc : Optional[Callable[[GetObjectsStatusRequest], ...]]
+        The gRPC function to get the availability of objects, e.g.,
+        `FleetStub.GetObjectsStatus`. If `None`, unavailable objects are polled
+        with exponential backoff. (default: None)
+    pull_object_grpc : Optional[Callable[[PullObjectRequest], PullObjectResponse]]
+        The gRPC function to pull a single object, e.g., `FleetStub.PullObject`,
+        used if the servicer does not implement `pull_objects_grpc`.
+        (default: None)
+    max_time : Optional[float] (default: PULL_MAX_TIME)
+        The maximum time to wait for all objects to become available. If `None`,
+        waits indefinitely.
+    initial_backoff : float (default: PULL_INITIAL_BACKOFF)
+        The initial backoff time in seconds before requesting unavailable objects
+        again.
+    backoff_cap : float (default: PULL_BACKOFF_CAP)
+        The maximum backoff time in seconds. Backoff times will not exceed this value.
+    max_resumes : int (default: OBJECT_STREAM_MAX_RESUMES)
+        The maximum number of times an interrupted stream is resumed.
+
+    Returns
+    -------
+    dict[str, bytes]
+        A dictionary where keys are object IDs and values are the pulled
+        object contents.
+
+    Raises
+    ------
+    ObjectIdNotPreregisteredError
+        If an object ID is not pre-registered.
+    ObjectUnavailableError
+        If some objects are still unavailable after `max_time`.
+    """
+    if max_time is None:
+        max_time = float("inf")
+
+    results: dict[str, bytes] = {}
+    remaining = list(dict.fromkeys(object_ids))
+    to_pull = remaining
+    delay = initial_backoff
+    num_resumes = 0
+    start = time.monotonic()
+
+    while remaining:
+        num_pulled = len(results)
+        if to_pull:
+            try:
+                num_resumes = _pull_objects_stream_round(
+                    to_pull,
+                    pull_objects_grpc,
+                    node,
+                    run_id,
+                    results,
+                    num_resumes,
+                    max_resumes,
+                )
+            except grpc.RpcError as e:
+                if (
+                    e.code() != grpc.StatusCode.UNIMPLEMENTED
+                    or pull_object_grpc is None
+                ):
+                    raise
+                log(DEBUG, "PullObjects is not implemented, pulling objects one by one")
+                remaining = [obj_id for obj_id in remaining if obj_id not in results]
+                results.update(
+                    pull_objects(
+                        remaining,
+                        make_pull_object_fn_grpc(pull_object_grpc, node, run_id),
+                        max_time=max(max_time - (time.monotonic() - start), 0),
+                        initial_backoff=initial_backoff,
+                        backoff_cap=backoff_cap,
+                    )
+                )
+                break
+
+        remaining = [obj_id for obj_id in remaining if obj_id not in results]
+        if not remaining:
+            break
+        elapsed = time.monotonic() - start
+        if get_objects_status_grpc is not None:
+            if elapsed >= max_time:
+                raise ObjectUnavailableError(remaining[0])
+            # Hold until some of the remaining objects become available
+            try:
+                to_pull = _wait_for_objects(
+                    remaining,
+                    get_objects_status_grpc,
+                    node,
+                    run_id,
+                    min(OBJECT_STATUS_MAX_WAIT, max_time - elapsed),
+                )
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                # Poll with exponential backoff instead
+                get_objects_status_grpc = None
+                to_pull = []
+            continue
+        to_pull = remaining
+        if len(results) > num_pulled:
+            # Progress was made, request the remaining objects right away
+            delay = initial_backoff
+            continue
+        if elapsed >= max_time:
+            raise ObjectUnavailableError(remaining[0])
+
+        # Apply exponential backoff with ±20% jitter
+        time.sleep(delay * (1 + random.uniform(-0.2, 0.2)))
+        delay = min(delay * 2, backoff_cap)
+
+    return results
+
+
+def _pull_objects_stream_round(  # pylint: disable=R0913,R0917
+    object_ids: list[str],
+    pull_objects_grpc: Callable[[PullObjectsRequest], Iterator[PullObjectsResponse]],
+    node: Node,
+    run_id: int,
+    results: dict[str, bytes],
+    num_resumes: int,
+    max_resumes: int,
+) -> int:
+    """Pull objects over one stream, return the updated number of resumes."""
+    responses = pull_objects_grpc(
+        PullObjectsRequest(node=node, run_id=run_id, object_ids=object_ids)
+    )
+    try:
+        for response in responses:
+            if not response.object_found:
+                raise ObjectIdNotPreregisteredError(response.object_id)
+            if response.object_available:
+                results[response.object_id] = response.object_content
+    except grpc.RpcError as e:
+        if e.code() != grpc.StatusCode.UNAVAILABLE or num_resumes >= max_resumes:
+            raise
+        num_resumes += 1
+        log(DEBUG, "PullObjects stream interrupted, resuming (%s)", num_resumes)
+    finally:
+        if isinstance(responses, grpc.Call):
+            responses.cancel()
+    return num_resumes
+
+
+def _wait_for_objects(
+    object_ids: list[str],
+    get_objects_status_grpc: Callable[
+        [GetObjectsStatusRequest], GetObjectsStatusResponse
+    ],
+    node: Node,
+    run_id: int,
+    timeout: float,
+) -> list[str]:
+    """Wait until some objects become available, return the available ones."""
+    res = get_objects_status_grpc(
+        GetObjectsStatusRequest(
+            node=node, run_id=run_id, object_ids=object_ids, timeout=timeout
+        )
+    )
+    availability = res.object_availability
+    for object_id in object_ids:
+        if object_id not in availability:
+            raise ObjectIdNotPreregisteredError(object_id)
+    return [object_id for object_id in object_ids if availability[object_id]]
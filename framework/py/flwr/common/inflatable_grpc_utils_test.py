@@ -15,31 +15,46 @@
 """Tests for InflatableObject helpers to communicate with gRPC servicers."""
 
 
+import threading
+import time
 import unittest
+from collections.abc import Iterator
 from itertools import product
-from typing import Union
+from typing import Any, Union, cast
 from unittest.mock import Mock
 
+import grpc
 import numpy as np
 from parameterized import parameterized
 
 from flwr.common import ArrayRecord, ConfigRecord, Message, MetricRecord, RecordDict
 from flwr.common.inflatable_utils import (
+    ObjectDeflater,
     ObjectIdNotPreregisteredError,
     ObjectUnavailableError,
     pull_objects,
     push_objects,
 )
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
+    GetObjectsStatusRequest,
+    GetObjectsStatusResponse,
     PullObjectRequest,
     PullObjectResponse,
+    PullObjectsRequest,
+    PullObjectsResponse,
     PushObjectRequest,
     PushObjectResponse,
+    PushObjectsResponse,
 )
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 
-from .inflatable import get_all_nested_objects
-from .inflatable_grpc_utils import make_pull_object_fn_grpc, make_push_object_fn_grpc
+from .inflatable import InflatableObject, get_all_nested_objects
+from .inflatable_grpc_utils import (
+    make_pull_object_fn_grpc,
+    make_push_object_fn_grpc,
+    pull_objects_stream_grpc,
+    push_objects_stream_grpc,
+)
 
 base_cases = [
     ({"a": ConfigRecord({"a": 123, "b": 123})},),  # Single w/o children
@@ -59,6 +74,36 @@ base_cases = [
 ]
 
 
+def _make_sized_objects(num_objects: int, size: int) -> dict[str, InflatableObject]:
+    """Create objects whose deflated content has the given size."""
+    objects: dict[str, InflatableObject] = {}
+    for i in range(num_objects):
+        obj = Mock(spec=InflatableObject)
+        obj.deflate.return_value = i.to_bytes(4, "little") * (size // 4)
+        objects[f"obj{i}"] = obj
+    return objects
+
+
+def _unavailable_error() -> grpc.RpcError:
+    """Create an RpcError raised when a stream is interrupted."""
+    grpc_exc = grpc.RpcError()
+    grpc_exc.code = lambda: grpc.StatusCode.UNAVAILABLE
+    return grpc_exc
+
+
+def _unimplemented_error() -> grpc.RpcError:
+    """Create an RpcError raised when the servicer does not implement an RPC."""
+    grpc_exc = grpc.RpcError()
+    grpc_exc.code = lambda: grpc.StatusCode.UNIMPLEMENTED
+    return grpc_exc
+
+
+def _raise_unimplemented(*_: Any) -> Iterator[Any]:
+    """Act as a stream of responses of an RPC that is not implemented."""
+    raise _unimplemented_error()
+    yield  # pylint: disable=unreachable
+
+
 class TestInflatableStubHelpers(unittest.TestCase):  # pylint: disable=R0902
     """Test helpers to push and pull InflatableObjects."""
 
@@ -122,6 +167,52 @@ class TestInflatableStubHelpers(unittest.TestCase):  # pylint: disable=R0902
         assert self.mock_stub.PushObject.call_count == expected_obj_count
         assert num_pushed_objects == expected_obj_count
 
+    def test_push_objects_respects_byte_budget(self) -> None:
+        """Test that no more deflated bytes than the budget are held while pushing."""
+        # Prepare
+        objects = _make_sized_objects(num_objects=20, size=1000)
+        lock = threading.Lock()
+        in_progress = [0, 0]  # Current and peak number of bytes being pushed
+        pushed: dict[str, bytes] = {}
+
+        def push_object_fn(object_id: str, object_content: bytes) -> None:
+            with lock:
+                in_progress[0] += len(object_content)
+                in_progress[1] = max(in_progress)
+            time.sleep(0.005)
+            with lock:
+                in_progress[0] -= len(object_content)
+                pushed[object_id] = object_content
+
+        # Execute
+        push_objects(
+            objects,
+            push_object_fn,
+            keep_objects=True,
+            max_concurrent_pushes=8,
+            max_buffered_bytes=3000,
+        )
+
+        # Assert
+        assert pushed == {k: v.deflate() for k, v in objects.items()}
+        assert 0 < in_progress[1] <= 3000
+
+    def test_push_objects_stops_on_error(self) -> None:
+        """Test that a failed push is raised and stops deflating further objects."""
+        # Prepare
+        objects = _make_sized_objects(num_objects=100, size=1000)
+        push_object_fn = Mock(side_effect=ObjectIdNotPreregisteredError("obj0"))
+
+        # Execute & Assert
+        with self.assertRaises(ObjectIdNotPreregisteredError):
+            push_objects(
+                objects,
+                push_object_fn,
+                max_concurrent_pushes=1,
+                max_buffered_bytes=1000,
+            )
+        assert push_object_fn.call_count < 100
+
     @parameterized.expand(base_cases)  # type: ignore
     def test_pull_objects_success(
         self,
@@ -219,3 +310,381 @@ class TestInflatableStubHelpers(unittest.TestCase):  # pylint: disable=R0902
                 max_tries_per_object=3,
                 initial_backoff=0.0001,  # Small backoff to trigger retries quickly
             )
+
+
+class TestObjectDeflater(unittest.TestCase):
+    """Test deflating objects with a byte budget."""
+
+    def test_budget_blocks_until_released(self) -> None:
+        """Test that contents are only handed over once they fit in the budget."""
+        # Prepare
+        objects = _make_sized_objects(num_objects=3, size=1000)
+
+        with ObjectDeflater(objects, max_buffered_bytes=2000) as deflater:
+            # Execute
+            first = deflater.get()
+            second = deflater.get()
+            waiter = threading.Thread(target=deflater.get)
+            waiter.start()
+            waiter.join(timeout=0.1)
+
+            # Assert: The third content does not fit in the budget
+            assert first is not None and second is not None
+            assert waiter.is_alive()
+
+            # Execute: Release the first content
+            deflater.release(len(first[1]))
+            waiter.join(timeout=5)
+
+            # Assert
+            assert not waiter.is_alive()
+            assert deflater.num_remaining == 0
+            assert deflater.get() is None
+        # All objects were removed after deflating
+        assert not objects
+
+    def test_oversized_content(self) -> None:
+        """Test that a content larger than the budget is handed over on its own."""
+        # Prepare
+        objects = _make_sized_objects(num_objects=2, size=1000)
+
+        # Execute
+        with ObjectDeflater(objects, keep_objects=True, max_buffered_bytes=10) as it:
+            results = []
+            for obj_id, content in it:
+                results.append(obj_id)
+                it.release(len(content))
+
+        # Assert
+        assert sorted(results) == sorted(objects)
+
+    def test_deflate_error(self) -> None:
+        """Test that errors raised while deflating are re-raised by `get`."""
+        # Prepare
+        objects = _make_sized_objects(num_objects=1, size=1000)
+        cast(Mock, objects["obj0"]).deflate.side_effect = ValueError("boom")
+
+        # Execute & Assert
+        with ObjectDeflater(objects) as deflater:
+            with self.assertRaises(ValueError):
+                deflater.get()
+
+    def test_close_wakes_up_consumer(self) -> None:
+        """Test that closing the deflater stops a blocked `get`."""
+        # Prepare
+        objects = _make_sized_objects(num_objects=2, size=1000)
+        deflater = ObjectDeflater(objects, max_buffered_bytes=1000)
+        assert deflater.get() is not None
+        results: list[object] = []
+        waiter = threading.Thread(target=lambda: results.append(deflater.get()))
+        waiter.start()
+
+        # Execute
+        deflater.close()
+        waiter.join(timeout=5)
+
+        # Assert
+        assert not waiter.is_alive()
+        assert results == [None]
+
+
+class TestInflatableStreamHelpers(unittest.TestCase):
+    """Test helpers to push and pull InflatableObjects over gRPC streams."""
+
+    def setUp(self) -> None:
+        """Initialize mock stub."""
+        self.mock_store: dict[str, bytes] = {}
+        self.mock_stub = Mock()
+        self.node = Node(node_id=456)
+        self.run_id = 1234
+        # Number of responses to send before interrupting the next stream
+        self.interrupt_after: list[int] = []
+
+        def push_objects_stream(
+            requests: Iterator[PushObjectRequest],
+        ) -> Iterator[PushObjectsResponse]:
+            interrupt_after = (
+                self.interrupt_after.pop(0) if self.interrupt_after else -1
+            )
+            for i, req in enumerate(requests):
+                if i == interrupt_after:
+                    raise _unavailable_error()
+                stored = req.object_id in self.mock_store
+                if stored:
+                    self.mock_store[req.object_id] = req.object_content
+                yield PushObjectsResponse(object_id=req.object_id, stored=stored)
+
+        def pull_objects_stream(
+            request: PullObjectsRequest,
+        ) -> Iterator[PullObjectsResponse]:
+            interrupt_after = (
+                self.interrupt_after.pop(0) if self.interrupt_after else -1
+            )
+            for i, obj_id in enumerate(request.object_ids):
+                if i == interrupt_after:
+                    raise _unavailable_error()
+                content = self.mock_store.get(obj_id, b"")
+                yield PullObjectsResponse(
+                    object_id=obj_id,
+                    object_found=obj_id in self.mock_store,
+                    object_available=content != b"",
+                    object_content=content,
+                )
+
+        self.mock_stub.PushObjects.side_effect = push_objects_stream
+        self.mock_stub.PullObjects.side_effect = pull_objects_stream
+
+    def _prepare_objects(
+        self, records: dict[str, Union[ArrayRecord, ConfigRecord, MetricRecord]]
+    ) -> dict[str, bytes]:
+        """Pre-register and push all objects of a message, return their contents."""
+        obj = Message(RecordDict(records), dst_node_id=123, message_type="query")
+        all_objects = get_all_nested_objects(obj)
+        for obj_id in all_objects:
+            self.mock_store[obj_id] = b""
+        push_objects_stream_grpc(
+            all_objects,
+            self.mock_stub.PushObjects,
+            self.node,
+            self.run_id,
+            keep_objects=True,
+        )
+        return {k: v.deflate() for k, v in all_objects.items()}
+
+    @parameterized.expand(base_cases)  # type: ignore
+    def test_push_objects_stream(
+        self, records: dict[str, Union[ArrayRecord, ConfigRecord, MetricRecord]]
+    ) -> None:
+        """Test pushing all objects over a single stream."""
+        # Execute
+        expected = self._prepare_objects(records)
+
+        # Assert
+        assert self.mock_stub.PushObjects.call_count == 1
+        assert self.mock_store == expected
+
+    def test_push_objects_stream_resumes(self) -> None:
+        """Test that an interrupted push only resends unacknowledged objects."""
+        # Prepare
+        self.interrupt_after = [1]
+
+        # Execute
+        expected = self._prepare_objects(
+            {"a": ArrayRecord([np.array([1, 2]), np.array([3, 4])])}
+        )
+
+        # Assert
+        assert self.mock_stub.PushObjects.call_count == 2
+        assert self.mock_store == expected
+
+    def test_push_objects_stream_small_budget(self) -> None:
+        """Test pushing and resuming when only one object fits in the budget."""
+        # Prepare
+        self.interrupt_after = [2]
+        objects = _make_sized_objects(num_objects=5, size=1000)
+        for obj_id in objects:
+            self.mock_store[obj_id] = b""
+
+        # Execute
+        push_objects_stream_grpc(
+            objects,
+            self.mock_stub.PushObjects,
+            self.node,
+            self.run_id,
+            keep_objects=True,
+            max_in_flight_bytes=1000,
+        )
+
+        # Assert
+        assert self.mock_stub.PushObjects.call_count == 2
+        assert self.mock_store == {k: v.deflate() for k, v in objects.items()}
+
+    def test_push_objects_stream_not_preregistered(self) -> None:
+        """Test pushing objects that were not pre-registered."""
+        # Prepare
+        obj = ConfigRecord({"a": 123})
+
+        # Execute & Assert
+        with self.assertRaises(ObjectIdNotPreregisteredError):
+            push_objects_stream_grpc(
+                {obj.object_id: obj},
+                self.mock_stub.PushObjects,
+                self.node,
+                self.run_id,
+            )
+
+    def test_pull_objects_stream(self) -> None:
+        """Test pulling all objects over a single stream."""
+        # Prepare
+        expected = self._prepare_objects(
+            {"a": ArrayRecord([np.array([1, 2]), np.array([3, 4])])}
+        )
+
+        # Execute
+        pulled = pull_objects_stream_grpc(
+            list(expected.keys()), self.mock_stub.PullObjects, self.node, self.run_id
+        )
+
+        # Assert
+        assert self.mock_stub.PullObjects.call_count == 1
+        assert pulled == expected
+
+    def test_pull_objects_stream_resumes(self) -> None:
+        """Test that an interrupted pull only requests the remaining objects."""
+        # Prepare
+        expected = self._prepare_objects(
+            {"a": ArrayRecord([np.array([1, 2]), np.array([3, 4])])}
+        )
+        self.interrupt_after = [1]
+
+        # Execute
+        pulled = pull_objects_stream_grpc(
+            list(expected.keys()), self.mock_stub.PullObjects, self.node, self.run_id
+        )
+
+        # Assert: The second stream skips the object received before interruption
+        args, _ = self.mock_stub.PullObjects.call_args
+        assert self.mock_stub.PullObjects.call_count == 2
+        assert len(args[0].object_ids) == len(expected) - 1
+        assert pulled == expected
+
+    def test_pull_objects_stream_unavailable(self) -> None:
+        """Test pulling objects that never become available."""
+        # Prepare
+        expected = self._prepare_objects({"a": ConfigRecord({"a": 123})})
+        missing = next(iter(expected))
+        self.mock_store[missing] = b""
+
+        # Execute & Assert
+        with self.assertRaises(ObjectUnavailableError):
+            pull_objects_stream_grpc(
+                list(expected.keys()),
+                self.mock_stub.PullObjects,
+                self.node,
+                self.run_id,
+                max_time=0.001,
+                initial_backoff=0.0015,
+            )
+
+    def test_pull_objects_stream_with_status(self) -> None:
+        """Test that unavailable objects are only pulled once they are available."""
+        # Prepare
+        expected = self._prepare_objects({"a": ConfigRecord({"a": 123})})
+        missing = next(iter(expected))
+        self.mock_store[missing] = b""
+
+        def get_objects_status(
+            request: GetObjectsStatusRequest,
+        ) -> GetObjectsStatusResponse:
+            # The missing object becomes available while the request is held
+            self.mock_store[missing] = expected[missing]
+            return GetObjectsStatusResponse(
+                object_availability={obj_id: True for obj_id in request.object_ids}
+            )
+
+        self.mock_stub.GetObjectsStatus.side_effect = get_objects_status
+
+        # Execute
+        pulled = pull_objects_stream_grpc(
+            list(expected.keys()),
+            self.mock_stub.PullObjects,
+            self.node,
+            self.run_id,
+            get_objects_status_grpc=self.mock_stub.GetObjectsStatus,
+        )
+
+        # Assert: The second stream only requests the object that became available
+        args, _ = self.mock_stub.PullObjects.call_args
+        assert self.mock_stub.GetObjectsStatus.call_count == 1
+        assert list(args[0].object_ids) == [missing]
+        assert pulled == expected
+
+    def test_push_objects_stream_unimplemented(self) -> None:
+        """Test falling back to unary pushes if streams are not implemented."""
+        # Prepare
+        objects = _make_sized_objects(num_objects=3, size=1000)
+        for obj_id in objects:
+            self.mock_store[obj_id] = b""
+        self.mock_stub.PushObjects.side_effect = _raise_unimplemented
+
+        def push_object(request: PushObjectRequest) -> PushObjectResponse:
+            self.mock_store[request.object_id] = request.object_content
+            return PushObjectResponse(stored=True)
+
+        self.mock_stub.PushObject.side_effect = push_object
+
+        # Execute
+        push_objects_stream_grpc(
+            objects,
+            self.mock_stub.PushObjects,
+            self.node,
+            self.run_id,
+            push_object_grpc=self.mock_stub.PushObject,
+            keep_objects=True,
+            max_in_flight_bytes=1000,
+        )
+
+        # Assert
+        assert self.mock_stub.PushObject.call_count == 3
+        assert self.mock_store == {k: v.deflate() for k, v in objects.items()}
+
+    def test_pull_objects_stream_unimplemented(self) -> None:
+        """Test falling back to unary pulls if streams are not implemented."""
+        # Prepare
+        expected = self._prepare_objects({"a": ConfigRecord({"a": 123})})
+        self.mock_stub.PullObjects.side_effect = _raise_unimplemented
+        self.mock_stub.PullObject.side_effect = lambda request: PullObjectResponse(
+            object_found=True,
+            object_available=True,
+            object_content=self.mock_store[request.object_id],
+        )
+
+        # Execute
+        pulled = pull_objects_stream_grpc(
+            list(expected.keys()),
+            self.mock_stub.PullObjects,
+            self.node,
+            self.run_id,
+            pull_object_grpc=self.mock_stub.PullObject,
+        )
+
+        # Assert
+        assert self.mock_stub.PullObject.call_count == len(expected)
+        assert pulled == expected
+
+    def test_pull_objects_stream_status_unimplemented(self) -> None:
+        """Test polling unavailable objects if GetObjectsStatus is not implemented."""
+        # Prepare
+        expected = self._prepare_objects({"a": ConfigRecord({"a": 123})})
+        missing = next(iter(expected))
+        self.mock_store[missing] = b""
+
+        def get_objects_status(
+            _request: GetObjectsStatusRequest,
+        ) -> GetObjectsStatusResponse:
+            # The missing object becomes available in the meantime
+            self.mock_store[missing] = expected[missing]
+            raise _unimplemented_error()
+
+        self.mock_stub.GetObjectsStatus.side_effect = get_objects_status
+
+        # Execute
+        pulled = pull_objects_stream_grpc(
+            list(expected.keys()),
+            self.mock_stub.PullObjects,
+            self.node,
+            self.run_id,
+            get_objects_status_grpc=self.mock_stub.GetObjectsStatus,
+            initial_backoff=0.01,
+        )
+
+        # Assert
+        assert self.mock_stub.GetObjectsStatus.call_count == 1
+        assert pulled == expected
+
+    def test_pull_objects_stream_not_preregistered(self) -> None:
+        """Test pulling objects that were not pre-registered."""
+        with self.assertRaises(ObjectIdNotPreregisteredError):
+            pull_objects_stream_grpc(
+                ["1234"], self.mock_stub.PullObjects, self.node, self.run_id
+            )
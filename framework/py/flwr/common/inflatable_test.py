@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import hashlib
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -30,16 +31,23 @@ from .inflatable import (
     _get_object_head,
     add_header_to_object_body,
     get_all_nested_objects,
+    get_all_nested_objects_and_tree,
     get_descendant_object_ids,
     get_object_body,
     get_object_children_ids_from_object_content,
     get_object_head_values_from_object_content,
     get_object_id,
+    get_object_tree,
     get_object_type_from_object_content,
     is_valid_sha256_hash,
+    iterate_object_tree,
     no_object_id_recompute,
 )
-from .inflatable_utils import validate_object_content
+from .inflatable_utils import (
+    inflatable_class_registry,
+    inflate_object_from_contents,
+    validate_object_content,
+)
 
 
 class CustomDataClass(InflatableObject):
@@ -288,6 +296,68 @@ def test_get_all_nested_object_ids() -> None:
     assert list(all_objects.keys()) == list(expected_objects.keys())
 
 
+def test_traversal_with_shared_children() -> None:
+    """Test traversing an object whose children share descendants."""
+    # Prepare
+    leaf = CustomDataClass(b"leaf")
+    child1 = CustomDataClass(b"child1", children=[leaf])
+    child2 = CustomDataClass(b"child2", children=[leaf, leaf])
+    obj = CustomDataClass(b"root", children=[child1, child2])
+
+    # Execute
+    all_objects, tree = get_all_nested_objects_and_tree(obj)
+
+    # Assert: Objects are listed once in post-order, the tree contains duplicates
+    assert list(all_objects.values()) == [leaf, child1, child2, obj]
+    assert all_objects == get_all_nested_objects(obj)
+    assert tree == get_object_tree(obj)
+    # Children are keyed by object ID, so `child2` has a single child
+    assert [node.object_id for node in iterate_object_tree(tree)] == [
+        leaf.object_id,
+        child1.object_id,
+        leaf.object_id,
+        child2.object_id,
+        obj.object_id,
+    ]
+
+
+class ChainLink(CustomDataClass):
+    """A dummy object that accepts empty children when inflated."""
+
+    @classmethod
+    def inflate(
+        cls, object_content: bytes, children: dict[str, InflatableObject] | None = None
+    ) -> CustomDataClass:
+        """Inflate the object from bytes."""
+        return super().inflate(object_content, children=children or None)
+
+
+def test_traversal_of_deep_object() -> None:
+    """Test that traversing objects deeper than the recursion limit succeeds."""
+    depth = 2 * sys.getrecursionlimit()
+    with no_object_id_recompute():
+        # Prepare: Build a chain, computing the object IDs bottom-up
+        objects = [ChainLink(b"0")]
+        _ = objects[0].object_id
+        for i in range(1, depth):
+            objects.append(ChainLink(str(i).encode(), children=[objects[-1]]))
+            _ = objects[-1].object_id
+        contents = {obj.object_id: obj.deflate() for obj in objects}
+
+        # Execute
+        all_objects, tree = get_all_nested_objects_and_tree(objects[-1])
+        tree_nodes = list(iterate_object_tree(tree))
+        with patch.dict(inflatable_class_registry, {"ChainLink": ChainLink}):
+            inflated = inflate_object_from_contents(objects[-1].object_id, contents)
+
+    # Assert
+    assert list(all_objects.values()) == objects
+    assert [node.object_id for node in tree_nodes] == list(all_objects)
+    assert isinstance(inflated, ChainLink)
+    assert inflated.data == objects[-1].data
+    assert not contents
+
+
 def test_no_object_id_recompute() -> None:
     """Test that no recompute of object ID is done."""
     # Prepare
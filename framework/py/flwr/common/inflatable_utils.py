@@ -16,20 +16,25 @@
 
 import concurrent.futures
 import os
+import queue
 import random
 import threading
 import time
-from typing import Callable, Optional
+from collections.abc import Iterator
+from types import TracebackType
+from typing import Callable, Optional, Union
 
 from .constant import (
     HEAD_BODY_DIVIDER,
     HEAD_VALUE_DIVIDER,
+    MAX_CONCURRENT_DEFLATES,
     MAX_CONCURRENT_PULLS,
     MAX_CONCURRENT_PUSHES,
     PULL_BACKOFF_CAP,
     PULL_INITIAL_BACKOFF,
     PULL_MAX_TIME,
     PULL_MAX_TRIES_PER_OBJECT,
+    PUSH_MAX_BUFFERED_BYTES,
 )
 from .inflatable import (
     InflatableObject,
@@ -77,16 +82,146 @@ def get_num_workers(max_concurrent: int) -> int:
     return min(max_concurrent, num_cores)
 
 
-def push_objects(
+class ObjectDeflater:  # pylint: disable=R0902
+    """Deflate objects concurrently while bounding the memory held by contents.
+
+    Objects are deflated by a pool of workers, in any order, as soon as the deflater
+    is created. A worker only hands over a deflated content once it fits in the byte
+    budget, i.e., no more than `max_buffered_bytes` are held by contents that were
+    retrieved with `get()` but not released with `release()` yet. A single content
+    larger than the budget is handed over when nothing else is buffered.
+
+    Parameters
+    ----------
+    objects : dict[str, InflatableObject]
+        A dictionary of objects to deflate, where keys are object IDs and values are
+        `InflatableObject` instances.
+    keep_objects : bool (default: False)
+        If `True`, the original objects will be kept in the `objects` dictionary
+        after deflating. If `False`, they will be removed from the dictionary to
+        avoid high memory usage.
+    max_concurrent_deflates : int (default: MAX_CONCURRENT_DEFLATES)
+        The maximum number of concurrent deflates to perform.
+    max_buffered_bytes : int (default: PUSH_MAX_BUFFERED_BYTES)
+        The maximum number of bytes held by deflated contents that were not
+        released yet.
+    """
+
+    def __init__(
+        self,
+        objects: dict[str, InflatableObject],
+        *,
+        keep_objects: bool = False,
+        max_concurrent_deflates: int = MAX_CONCURRENT_DEFLATES,
+        max_buffered_bytes: int = PUSH_MAX_BUFFERED_BYTES,
+    ) -> None:
+        self._objects = objects
+        self._keep_objects = keep_objects
+        self._max_buffered_bytes = max_buffered_bytes
+        self._num_remaining = len(objects)
+        self._buffered_bytes = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._results: queue.SimpleQueue[Union[tuple[str, bytes], Exception, None]] = (
+            queue.SimpleQueue()
+        )
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=get_num_workers(max_concurrent_deflates)
+        )
+        for obj_id in list(objects.keys()):
+            self._executor.submit(self._deflate, obj_id)
+
+    @property
+    def num_remaining(self) -> int:
+        """Return the number of contents that were not retrieved yet."""
+        return self._num_remaining
+
+    def _deflate(self, obj_id: str) -> None:
+        """Deflate a single object and wait until its content fits in the budget."""
+        try:
+            if self._closed:
+                return
+            content = self._objects[obj_id].deflate()
+            with self._cond:
+                if not self._keep_objects:
+                    del self._objects[obj_id]
+                self._cond.wait_for(
+                    lambda: self._closed
+                    or self._buffered_bytes == 0
+                    or self._buffered_bytes + len(content) <= self._max_buffered_bytes
+                )
+                if self._closed:
+                    return
+                self._buffered_bytes += len(content)
+            self._results.put((obj_id, content))
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._results.put(err)
+
+    def get(self) -> Optional[tuple[str, bytes]]:
+        """Return the next object ID and deflated content.
+
+        Blocks until a content is available. Returns `None` once all contents were
+        retrieved or the deflater was closed. Re-raises exceptions raised while
+        deflating an object.
+        """
+        with self._cond:
+            if self._closed or self._num_remaining == 0:
+                return None
+            self._num_remaining -= 1
+        result = self._results.get()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def release(self, num_bytes: int) -> None:
+        """Release bytes of a retrieved content from the budget."""
+        with self._cond:
+            self._buffered_bytes -= num_bytes
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Stop deflating and wake up all waiting threads."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._results.put(None)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __iter__(self) -> Iterator[tuple[str, bytes]]:
+        """Yield object IDs and deflated contents until all were retrieved."""
+        while (result := self.get()) is not None:
+            yield result
+
+    def __enter__(self) -> "ObjectDeflater":
+        """Enter the context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the deflater when exiting the context."""
+        self.close()
+
+
+def push_objects(  # pylint: disable=R0913,R0914
     objects: dict[str, InflatableObject],
     push_object_fn: Callable[[str, bytes], None],
     *,
     object_ids_to_push: Optional[set[str]] = None,
     keep_objects: bool = False,
     max_concurrent_pushes: int = MAX_CONCURRENT_PUSHES,
+    max_concurrent_deflates: int = MAX_CONCURRENT_DEFLATES,
+    max_buffered_bytes: int = PUSH_MAX_BUFFERED_BYTES,
 ) -> None:
     """Push multiple objects to the servicer.
 
+    Objects are deflated and pushed by separate pools of workers, so that
+    serialization overlaps with network I/O. Deflating is paused while more than
+    `max_buffered_bytes` of deflated content wait to be pushed or are being pushed.
+
     Parameters
     ----------
     objects : dict[str, InflatableObject]
@@ -104,25 +239,44 @@ def push_objects(
         high memory usage.
     max_concurrent_pushes : int (default: MAX_CONCURRENT_PUSHES)
         The maximum number of concurrent pushes to perform.
+    max_concurrent_deflates : int (default: MAX_CONCURRENT_DEFLATES)
+        The maximum number of concurrent deflates to perform.
+    max_buffered_bytes : int (default: PUSH_MAX_BUFFERED_BYTES)
+        The maximum number of deflated bytes held while pushing.
     """
     if object_ids_to_push is not None:
         # Filter objects to push only those with IDs in the set
         objects = {k: v for k, v in objects.items() if k in object_ids_to_push}
 
-    lock = threading.Lock()
+    failed = threading.Event()
 
-    def push(obj_id: str) -> None:
-        """Push a single object."""
-        object_content = objects[obj_id].deflate()
-        if not keep_objects:
-            with lock:
-                del objects[obj_id]
-        push_object_fn(obj_id, object_content)
+    with ObjectDeflater(
+        objects,
+        keep_objects=keep_objects,
+        max_concurrent_deflates=max_concurrent_deflates,
+        max_buffered_bytes=max_buffered_bytes,
+    ) as deflater:
 
-    # Push all objects concurrently
-    num_workers = get_num_workers(max_concurrent_pushes)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
-        list(executor.map(push, list(objects.keys())))
+        def push(obj_id: str, object_content: bytes) -> None:
+            """Push a single object and release its content from the budget."""
+            try:
+                push_object_fn(obj_id, object_content)
+            except Exception:
+                failed.set()
+                raise
+            finally:
+                deflater.release(len(object_content))
+
+        # Push objects concurrently as soon as they are deflated
+        num_workers = get_num_workers(max_concurrent_pushes)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = []
+            for obj_id, object_content in deflater:
+                futures.append(executor.submit(push, obj_id, object_content))
+                if failed.is_set():
+                    break
+            for future in futures:
+                future.result()
 
 
 def pull_objects(  # pylint: disable=too-many-arguments,too-many-locals
@@ -270,34 +424,46 @@ def inflate_object_from_contents(
         # If the object is already in the objects dictionary, return it
         return objects[object_id]
 
-    # Extract object class and object_ids of children
-    object_content = object_contents[object_id]
-    obj_type, children_obj_ids, _ = get_object_head_values_from_object_content(
-        object_content=object_contents[object_id]
-    )
-
-    # Remove the object content from the dictionary to save memory
-    if not keep_object_contents:
-        del object_contents[object_id]
-
-    # Resolve object class
-    cls_type = inflatable_class_registry[obj_type]
-
-    # Inflate all children objects
-    children: dict[str, InflatableObject] = {}
-    for child_obj_id in children_obj_ids:
-        children[child_obj_id] = inflate_object_from_contents(
-            child_obj_id,
-            object_contents,
-            keep_object_contents=keep_object_contents,
-            objects=objects,
+    def _prepare(
+        obj_id: str,
+    ) -> tuple[str, bytes, type[InflatableObject], list[str], Iterator[str]]:
+        # Extract object class and object_ids of children
+        object_content = object_contents[obj_id]
+        obj_type, children_obj_ids, _ = get_object_head_values_from_object_content(
+            object_content=object_content
+        )
+
+        # Remove the object content from the dictionary to save memory
+        if not keep_object_contents:
+            del object_contents[obj_id]
+
+        # Resolve object class
+        cls_type = inflatable_class_registry[obj_type]
+        return (
+            obj_id,
+            object_content,
+            cls_type,
+            children_obj_ids,
+            iter(children_obj_ids),
         )
 
-    # Inflate object passing its children
-    obj = cls_type.inflate(object_content, children=children)
-    del object_content  # Free memory after inflation
-    objects[object_id] = obj
-    return obj
+    # Inflate objects in post-order using an explicit stack of (object ID,
+    # object content, object class, children IDs, iterator over remaining children)
+    stack = [_prepare(object_id)]
+    while stack:
+        obj_id, object_content, cls_type, children_obj_ids, remaining = stack[-1]
+        for child_obj_id in remaining:
+            if child_obj_id not in objects:
+                stack.append(_prepare(child_obj_id))
+                break
+        else:
+            stack.pop()
+            # Inflate object passing its children
+            children = {child_id: objects[child_id] for child_id in children_obj_ids}
+            objects[obj_id] = cls_type.inflate(object_content, children=children)
+            del object_content  # Free memory after inflation
+
+    return objects[object_id]
 
 
 def validate_object_content(content: bytes) -> None:
@@ -25,7 +25,7 @@ from typing import TYPE_CHECKING, Any, cast, overload
 
 import numpy as np
 
-from ..constant import MAX_ARRAY_CHUNK_SIZE, SType
+from ..constant import MAX_ARRAY_CHUNK_SIZE, ChunkingMode, SType
 from ..inflatable import (
     InflatableObject,
     add_header_to_object_body,
@@ -34,6 +34,7 @@ from ..inflatable import (
 )
 from ..typing import NDArray
 from .arraychunk import ArrayChunk
+from .chunking import get_content_defined_boundaries
 
 if TYPE_CHECKING:
     import torch
@@ -47,6 +48,66 @@ def _raise_array_init_error() -> None:
     )
 
 
+def _numpy_view(data: bytes | bytearray | memoryview) -> NDArray | None:
+    """Return a NumPy array sharing memory with `.npy` formatted data.
+
+    Returns `None` if the data cannot be viewed without copying it (e.g., object
+    arrays or unsupported `.npy` format versions).
+    """
+    version = np.lib.format.read_magic(BytesIO(data[: np.lib.format.MAGIC_LEN]))
+    if version == (1, 0):
+        header_len_size, read_array_header = 2, np.lib.format.read_array_header_1_0
+    elif version == (2, 0):
+        header_len_size, read_array_header = 4, np.lib.format.read_array_header_2_0
+    else:
+        return None
+
+    # Parse the header (magic string, header length, and header dict)
+    header_start = np.lib.format.MAGIC_LEN + header_len_size
+    header_len = int.from_bytes(
+        data[np.lib.format.MAGIC_LEN : header_start], byteorder="little"
+    )
+    header_end = header_start + header_len
+    header = BytesIO(data[np.lib.format.MAGIC_LEN : header_end])
+    shape, fortran_order, dtype = read_array_header(header)
+    if dtype.hasobject or dtype.itemsize == 0:
+        return None
+
+    # Create the view on the data following the header
+    ndarray = np.frombuffer(
+        data, dtype=dtype, count=int(np.prod(shape)), offset=header_end
+    )
+    return cast(NDArray, ndarray.reshape(shape, order="F" if fortran_order else "C"))
+
+
+def _get_raw_buffer(ndarray: NDArray) -> memoryview:
+    """Return the raw bytes of a NumPy array as a memoryview.
+
+    C-contiguous arrays are not copied.
+    """
+    if ndarray.dtype.hasobject or ndarray.dtype.fields is not None:
+        raise TypeError(
+            f"Unsupported dtype for raw buffer serialization: '{ndarray.dtype}'"
+        )
+    ndarray = np.ascontiguousarray(ndarray)
+    return memoryview(ndarray.reshape(-1).view(np.uint8))  # type: ignore
+
+
+def _raw_buffer_view(
+    data: bytes | bytearray | memoryview, dtype: str, shape: tuple[int, ...]
+) -> NDArray:
+    """Return a NumPy array sharing memory with raw buffer data."""
+    np_dtype = np.dtype(dtype)
+    count = int(np.prod(shape))
+    if (nbytes := memoryview(data).nbytes) != count * np_dtype.itemsize:
+        raise ValueError(
+            f"Expected {count * np_dtype.itemsize} bytes for an array of dtype "
+            f"'{dtype}' and shape {shape}, but got {nbytes} bytes."
+        )
+    ndarray = np.frombuffer(data, dtype=np_dtype, count=count)
+    return cast(NDArray, ndarray.reshape(shape))
+
+
 @dataclass
 class Array(InflatableObject):
     """Array type.
@@ -114,7 +175,7 @@ class Array(InflatableObject):
     dtype: str
     shape: tuple[int, ...]
     stype: str
-    data: bytes
+    data: bytes | bytearray | memoryview
 
     @overload
     def __init__(  # noqa: E704
@@ -189,7 +250,7 @@ class Array(InflatableObject):
                 and isinstance(all_args[1], tuple)
                 and all(isinstance(i, int) for i in all_args[1])
                 and isinstance(all_args[2], str)
-                and isinstance(all_args[3], bytes)
+                and isinstance(all_args[3], (bytes, bytearray, memoryview))
             ):
                 self.dtype, self.shape, self.stype, self.data = all_args
                 return
@@ -213,11 +274,38 @@ class Array(InflatableObject):
         _raise_array_init_error()
 
     @classmethod
-    def from_numpy_ndarray(cls, ndarray: NDArray) -> Array:
-        """Create Array from NumPy ndarray."""
+    def from_numpy_ndarray(cls, ndarray: NDArray, *, stype: str = SType.NUMPY) -> Array:
+        """Create Array from NumPy ndarray.
+
+        Parameters
+        ----------
+        ndarray : NDArray
+            The NumPy array to create the Array from.
+        stype : str (default: SType.NUMPY)
+            The serialization type. ``SType.NUMPY`` stores the array in the ``.npy``
+            format. ``SType.RAW_BUFFER`` references the memory of the (C-contiguous)
+            array without copying it, so later in-place modifications of the
+            ndarray are visible in the Array. The object ID and ArrayChunks of such
+            an Array are then recomputed each time they are accessed.
+
+        Returns
+        -------
+        Array
+            The created Array.
+        """
         assert isinstance(
             ndarray, np.ndarray
         ), f"Expected NumPy ndarray, got {type(ndarray)}"
+        if stype == SType.RAW_BUFFER:
+            return Array(
+                dtype=str(ndarray.dtype),
+                shape=tuple(ndarray.shape),
+                stype=SType.RAW_BUFFER,
+                data=_get_raw_buffer(ndarray),
+            )
+        if stype != SType.NUMPY:
+            raise ValueError(f"Unsupported serialization type: '{stype}'")
+
         buffer = BytesIO()
         # WARNING: NEVER set allow_pickle to true.
         # Reason: loading pickled data can execute arbitrary code
@@ -232,8 +320,14 @@ class Array(InflatableObject):
         )
 
     @classmethod
-    def from_torch_tensor(cls, tensor: torch.Tensor) -> Array:
-        """Create Array from PyTorch tensor."""
+    def from_torch_tensor(
+        cls, tensor: torch.Tensor, *, stype: str = SType.NUMPY
+    ) -> Array:
+        """Create Array from PyTorch tensor.
+
+        See :meth:`from_numpy_ndarray` for the supported values of ``stype``. With
+        ``SType.RAW_BUFFER``, the memory of contiguous CPU tensors is not copied.
+        """
         if not (torch := sys.modules.get("torch")):
             raise RuntimeError(
                 f"PyTorch is required to use {cls.from_torch_tensor.__name__}"
@@ -242,14 +336,38 @@ class Array(InflatableObject):
         assert isinstance(
             tensor, torch.Tensor
         ), f"Expected PyTorch Tensor, got {type(tensor)}"
-        return cls.from_numpy_ndarray(tensor.detach().cpu().numpy())
+        return cls.from_numpy_ndarray(tensor.detach().cpu().numpy(), stype=stype)
+
+    def numpy(self, *, readonly: bool = False) -> NDArray:
+        """Return the array as a NumPy array.
+
+        Parameters
+        ----------
+        readonly : bool (default: False)
+            If `True`, return a read-only NumPy array that shares memory with `data`
+            instead of a copy of it. This avoids copying large arrays, but the
+            returned array must not outlive modifications to `data`.
 
-    def numpy(self) -> NDArray:
-        """Return the array as a NumPy array."""
-        if self.stype != SType.NUMPY:
+        Returns
+        -------
+        NDArray
+            The NumPy array. It is writable unless `readonly` is `True`.
+        """
+        view: NDArray | None
+        if self.stype == SType.RAW_BUFFER:
+            view = _raw_buffer_view(self.data, self.dtype, self.shape)
+        elif self.stype == SType.NUMPY:
+            view = _numpy_view(self.data)
+        else:
             raise TypeError(
                 f"Unsupported serialization type for numpy conversion: '{self.stype}'"
             )
+        if view is not None:
+            if readonly:
+                view.flags.writeable = False
+                return view
+            return view.copy()
+
         bytes_io = BytesIO(self.data)
         # WARNING: NEVER set allow_pickle to true.
         # Reason: loading pickled data can execute arbitrary code
@@ -263,15 +381,39 @@ class Array(InflatableObject):
         return dict(self.slice_array())
 
     def slice_array(self) -> list[tuple[str, InflatableObject]]:
-        """Slice Array data and construct a list of ArrayChunks."""
-        children: list[tuple[str, InflatableObject]] = []
-        # memoryview allows for zero-copy slicing
-        data_view = memoryview(self.data)
-        for start in range(0, len(data_view), MAX_ARRAY_CHUNK_SIZE):
-            end = min(start + MAX_ARRAY_CHUNK_SIZE, len(data_view))
-            ac = ArrayChunk(data_view[start:end])
-            children.append((ac.object_id, ac))
-        return children
+        """Slice Array data and construct a list of ArrayChunks.
+
+        The ArrayChunks and their object IDs are cached, so the data is only hashed
+        once until `data` or `chunking` is replaced. They are not cached if `data` is
+        a writable memoryview, as its content may change in place.
+        """
+        if (children := self.__dict__.get("_chunks")) is None:
+            children = []
+            # memoryview allows for zero-copy slicing
+            data_view = memoryview(self.data)
+            if self.chunking == ChunkingMode.CONTENT_DEFINED:
+                ends = get_content_defined_boundaries(data_view)
+            else:
+                ends = [
+                    min(start + MAX_ARRAY_CHUNK_SIZE, len(data_view))
+                    for start in range(0, len(data_view), MAX_ARRAY_CHUNK_SIZE)
+                ]
+            start = 0
+            for end in ends:
+                ac = ArrayChunk(data_view[start:end])
+                children.append((ac.object_id, ac))
+                start = end
+            if not self._is_data_mutable():
+                self.__dict__["_chunks"] = children
+        return list(children)
+
+    def _is_data_mutable(self) -> bool:
+        """Return whether `data` may change without being replaced.
+
+        This is the case of writable memoryviews, such as the buffer of the ndarray
+        referenced by a ``SType.RAW_BUFFER`` Array.
+        """
+        return isinstance(self.data, memoryview) and not self.data.readonly
 
     def deflate(self) -> bytes:
         """Deflate the Array."""
@@ -284,8 +426,8 @@ class Array(InflatableObject):
         # Let's not save the entire object_id but a mapping to those
         # that will be carried in the object head
         # (replace a long object_id with a single scalar)
-        unique_children = list(self.children.keys())
-        arraychunk_ids = [unique_children.index(ch_id) for ch_id, _ in children_list]
+        unique_children = {ch_id: i for i, ch_id in enumerate(dict(children_list))}
+        arraychunk_ids = [unique_children[ch_id] for ch_id, _ in children_list]
 
         # The deflated Array carries everything but the data
         # The `arraychunk_ids` will be used during Array inflation
@@ -302,7 +444,7 @@ class Array(InflatableObject):
         return add_header_to_object_body(object_body=obj_body, obj=self)
 
     @classmethod
-    def inflate(
+    def inflate(  # pylint: disable=too-many-locals
         cls, object_content: bytes, children: dict[str, InflatableObject] | None = None
     ) -> Array:
         """Inflate an Array from bytes.
@@ -313,17 +455,14 @@ class Array(InflatableObject):
             The deflated object content of the Array.
 
         children : Optional[dict[str, InflatableObject]] (default: None)
-            Must be ``None``. ``Array`` must have child objects.
-            Providing no children will raise a ``ValueError``.
+            Must be ``None``. ``Array`` must have child objects, unless its data is
+            empty. Providing no children will raise a ``ValueError``.
 
         Returns
         -------
         Array
             The inflated Array.
         """
-        if not children:
-            raise ValueError("`Array` objects must have children.")
-
         obj_body = get_object_body(object_content, cls)
 
         # Extract children IDs from head
@@ -335,6 +474,9 @@ class Array(InflatableObject):
 
         # Verify children ids in body match those passed for inflation
         chunk_ids_indices = cast(list[int], array_metadata["arraychunk_ids"])
+        if not children and chunk_ids_indices:
+            raise ValueError("`Array` objects must have children.")
+        children = children or {}
         # Convert indices back to IDs
         chunk_ids = [children_ids[i] for i in chunk_ids_indices]
         # Check consistency
@@ -354,12 +496,18 @@ class Array(InflatableObject):
             data=b"",
         )
 
-        # Now inject data from chunks
-        buff = bytearray()
-        for ch_id in chunk_ids:
-            buff += cast(ArrayChunk, children[ch_id]).data
-
-        array.data = bytes(buff)
+        # Now inject data from chunks into a single preallocated buffer. The buffer
+        # is assigned to the Array through a read-only view (i.e., without copying it
+        # into `bytes`), such that it cannot change without updating the object ID
+        chunks = [cast(ArrayChunk, children[ch_id]).data for ch_id in chunk_ids]
+        buff = bytearray(sum(len(chunk) for chunk in chunks))
+        with memoryview(buff) as buff_view:
+            offset = 0
+            for chunk in chunks:
+                buff_view[offset : offset + len(chunk)] = chunk
+                offset += len(chunk)
+
+        array.data = memoryview(buff).toreadonly()
         return array
 
     @property
@@ -372,6 +520,9 @@ class Array(InflatableObject):
     @property
     def is_dirty(self) -> bool:
         """Check if the object is dirty after the last deflation."""
+        if self._is_data_mutable():
+            # The content may have changed in place since the last deflation
+            return True
         if "_is_dirty" not in self.__dict__:
             self.__dict__["_is_dirty"] = True
         return cast(bool, self.__dict__["_is_dirty"])
@@ -381,9 +532,40 @@ class Array(InflatableObject):
         """Set the dirty flag."""
         self.__dict__["_is_dirty"] = value
 
+    @property
+    def chunking(self) -> str:
+        """Get the chunking mode used to slice the data into ArrayChunks.
+
+        With ``ChunkingMode.FIXED`` (default), the data is cut every
+        ``MAX_ARRAY_CHUNK_SIZE`` bytes. With ``ChunkingMode.CONTENT_DEFINED``, the
+        data is cut at positions determined by its content, so that ArrayChunks
+        shared with previously sent data can be deduplicated even if bytes were
+        inserted or removed before them.
+        """
+        return cast(str, self.__dict__.get("_chunking", ChunkingMode.FIXED))
+
+    @chunking.setter
+    def chunking(self, value: str) -> None:
+        """Set the chunking mode."""
+        if value not in (ChunkingMode.FIXED, ChunkingMode.CONTENT_DEFINED):
+            raise ValueError(f"Unsupported chunking mode: '{value}'")
+        self.__dict__["_chunking"] = value
+
     def __setattr__(self, name: str, value: Any) -> None:
         """Set attribute with special handling for dirty state."""
-        if name in ("dtype", "shape", "stype", "data"):
+        if name in ("dtype", "shape", "stype", "data", "chunking"):
             # Mark as dirty if any of the main attributes are set
             self.is_dirty = True
+            if name in ("data", "chunking"):
+                # Invalidate cached ArrayChunks
+                self.__dict__.pop("_chunks", None)
         super().__setattr__(name, value)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state for pickling, without cached ArrayChunks."""
+        state = self.__dict__.copy()
+        state.pop("_chunks", None)
+        if isinstance(self.data, memoryview):
+            # memoryviews cannot be pickled
+            state["data"] = self.data.tobytes()
+        return state
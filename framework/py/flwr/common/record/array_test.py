@@ -16,18 +16,25 @@
 
 
 import json
+import pickle
 import sys
 import unittest
 from io import BytesIO
 from types import ModuleType
 from typing import Any, cast
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import numpy as np
 from parameterized import parameterized
 
-from ..constant import MAX_ARRAY_CHUNK_SIZE, SType
-from ..inflatable import get_object_body, get_object_type_from_object_content
+from ..constant import MAX_ARRAY_CHUNK_SIZE, ChunkingMode, SType
+from ..inflatable import (
+    InflatableObject,
+    get_all_nested_objects,
+    get_object_body,
+    get_object_id,
+    get_object_type_from_object_content,
+)
 from ..typing import NDArray
 from .array import Array
 from .arraychunk import ArrayChunk
@@ -49,7 +56,7 @@ MOCK_TORCH_TENSOR.detach.return_value = MOCK_TORCH_TENSOR
 MOCK_TORCH_TENSOR.cpu.return_value = MOCK_TORCH_TENSOR
 
 
-class TestArray(unittest.TestCase):
+class TestArray(unittest.TestCase):  # pylint: disable=R0904
     """Unit tests for Array."""
 
     def setUp(self) -> None:
@@ -223,6 +230,185 @@ class TestArray(unittest.TestCase):
             ValueError, Array.inflate, arr_b, children={"123": ArrayChunk(b"")}
         )
 
+    def test_inflate_without_copying_chunks(self) -> None:
+        """Test that an inflated Array holds the concatenated chunk data."""
+        # Prepare
+        ndarray = np.random.randn(3000, 3000)
+        arr = Array(ndarray)
+        children: dict[str, InflatableObject] = {
+            ch_id: ArrayChunk.inflate(ch.deflate())
+            for ch_id, ch in arr.children.items()
+        }
+
+        # Execute
+        arr_ = Array.inflate(arr.deflate(), children=children)
+
+        # Assert
+        self.assertIsInstance(arr_.data, memoryview)
+        self.assertTrue(memoryview(arr_.data).readonly)
+        self.assertEqual(arr_.data, arr.data)
+        self.assertEqual(arr_.object_id, arr.object_id)
+        np.testing.assert_array_equal(arr_.numpy(), ndarray)
+
+    def test_inflated_array_modification(self) -> None:
+        """Test that modifying an inflated Array updates its object ID."""
+        # Prepare
+        arr = Array(np.arange(10.0))
+        children: dict[str, InflatableObject] = {
+            ch_id: ArrayChunk.inflate(ch.deflate())
+            for ch_id, ch in arr.children.items()
+        }
+        arr_ = Array.inflate(arr.deflate(), children=children)
+        object_id = arr_.object_id
+
+        # Execute
+        with self.assertRaises(TypeError):
+            arr_.data[-1] = 99  # type: ignore
+        data = bytearray(arr_.data)
+        data[-1] = 99
+        arr_.data = data
+
+        # Assert
+        self.assertNotEqual(arr_.object_id, object_id)
+        self.assertEqual(
+            arr_.object_id,
+            Array(arr.dtype, arr.shape, arr.stype, bytes(data)).object_id,
+        )
+
+    def test_array_chunk_inflate_returns_view(self) -> None:
+        """Test that an inflated ArrayChunk references the deflated content."""
+        # Prepare
+        chunk = ArrayChunk(b"chunk data")
+        content = bytearray(chunk.deflate())
+
+        # Execute
+        chunk_ = ArrayChunk.inflate(content)
+
+        # Assert
+        self.assertEqual(chunk_.data, b"chunk data")
+        content[-1:] = b"A"
+        self.assertEqual(chunk_.data, b"chunk datA")
+
+    @parameterized.expand(  # type: ignore
+        [
+            (np.random.randn(3, 4),),
+            (np.asfortranarray(np.random.randn(3, 4)),),
+            (np.array(5, dtype=np.int8),),
+            (np.zeros((0, 3), dtype=np.float32),),
+            (np.array(["a", "bc"]),),
+        ]
+    )
+    def test_numpy_readonly(self, ndarray: NDArray) -> None:
+        """Test that `numpy(readonly=True)` returns a read-only view of the data."""
+        # Prepare
+        arr = Array(
+            dtype=str(ndarray.dtype),
+            shape=ndarray.shape,
+            stype=SType.NUMPY,
+            data=bytearray(_get_buffer_from_ndarray(ndarray)),
+        )
+
+        # Execute
+        view = arr.numpy(readonly=True)
+        copy = arr.numpy()
+
+        # Assert
+        np.testing.assert_array_equal(view, ndarray)
+        np.testing.assert_array_equal(copy, ndarray)
+        self.assertEqual(view.shape, ndarray.shape)
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(copy.flags.writeable)
+        if ndarray.size > 0:
+            self.assertTrue(np.shares_memory(view, np.frombuffer(arr.data, np.uint8)))
+            self.assertFalse(np.shares_memory(copy, view))
+
+    @parameterized.expand(  # type: ignore
+        [
+            (np.random.randn(3, 4),),
+            (np.random.randn(4, 6)[::2, 1:4],),  # Non-contiguous
+            (np.asfortranarray(np.random.randn(3, 4)),),
+            (np.array(5, dtype=np.int8),),
+            (np.zeros((0, 3), dtype=np.float32),),
+            (np.arange(3).astype("datetime64[ns]"),),
+        ]
+    )
+    def test_raw_buffer_round_trip(self, ndarray: NDArray) -> None:
+        """Test creating an Array with the raw buffer serialization type."""
+        # Execute
+        arr = Array.from_numpy_ndarray(ndarray, stype=SType.RAW_BUFFER)
+        arr_ = Array.inflate(arr.deflate(), children=arr.children)
+
+        # Assert
+        self.assertEqual(arr.stype, SType.RAW_BUFFER)
+        self.assertEqual(arr.dtype, str(ndarray.dtype))
+        self.assertEqual(arr.shape, ndarray.shape)
+        self.assertEqual(bytes(arr.data), np.ascontiguousarray(ndarray).tobytes())
+        for result in (arr.numpy(), arr.numpy(readonly=True), arr_.numpy()):
+            np.testing.assert_array_equal(result, ndarray)
+            self.assertEqual(result.dtype, ndarray.dtype)
+
+    def test_raw_buffer_zero_copy(self) -> None:
+        """Test that raw buffer Arrays share memory with C-contiguous arrays."""
+        # Prepare
+        ndarray = np.random.randn(3, 4)
+
+        # Execute
+        arr = Array.from_numpy_ndarray(ndarray, stype=SType.RAW_BUFFER)
+        view = arr.numpy(readonly=True)
+        copy = arr.numpy()
+
+        # Assert
+        self.assertTrue(np.shares_memory(view, ndarray))
+        self.assertFalse(view.flags.writeable)
+        self.assertFalse(np.shares_memory(copy, ndarray))
+        self.assertTrue(copy.flags.writeable)
+
+    def test_raw_buffer_in_place_modification(self) -> None:
+        """Test that modifying the referenced ndarray updates the object IDs."""
+        # Prepare
+        ndarray = np.zeros(MAX_ARRAY_CHUNK_SIZE // 4, dtype=np.float64)
+        arr = Array.from_numpy_ndarray(ndarray, stype=SType.RAW_BUFFER)
+        old_object_id = arr.object_id
+        old_chunk_ids = list(arr.children)
+
+        # Execute
+        ndarray[:] = 5
+
+        # Assert
+        self.assertNotEqual(arr.object_id, old_object_id)
+        self.assertEqual(arr.object_id, get_object_id(arr.deflate()))
+        self.assertNotEqual(list(arr.children), old_chunk_ids)
+        for chunk_id, chunk in arr.children.items():
+            self.assertEqual(chunk_id, get_object_id(chunk.deflate()))
+
+    def test_raw_buffer_invalid(self) -> None:
+        """Test unsupported inputs for the raw buffer serialization type."""
+        # Object arrays are not supported
+        with self.assertRaises(TypeError):
+            Array.from_numpy_ndarray(np.array([{}]), stype=SType.RAW_BUFFER)
+
+        # Unknown serialization types are not supported
+        with self.assertRaises(ValueError):
+            Array.from_numpy_ndarray(np.array([1]), stype="unknown")
+
+        # Data must match dtype and shape
+        arr = Array("float32", (2, 2), SType.RAW_BUFFER, b"\x00" * 12)
+        with self.assertRaises(ValueError):
+            arr.numpy()
+
+    def test_pickle_raw_buffer(self) -> None:
+        """Test that an Array referencing an ndarray can be pickled."""
+        # Prepare
+        arr = Array.from_numpy_ndarray(np.arange(4.0), stype=SType.RAW_BUFFER)
+
+        # Execute
+        unpickled = pickle.loads(pickle.dumps(arr))
+
+        # Assert
+        self.assertEqual(unpickled, arr)
+        self.assertEqual(unpickled.object_id, arr.object_id)
+        np.testing.assert_array_equal(unpickled.numpy(), np.arange(4.0))
+
     def test_slicing_and_concatenation(self) -> None:
         """Test Array slicing."""
         arr = Array(np.random.randn(3000, 3000))
@@ -238,3 +424,76 @@ class TestArray(unittest.TestCase):
 
         # Ensure the data is identical after concatenation
         assert arr.data == buff
+
+    def test_chunk_ids_are_cached(self) -> None:
+        """Test that chunks are hashed once until the data is replaced."""
+        # Prepare
+        arr = Array(np.random.randn(3000, 3000))
+        num_chunks = len(arr.slice_array())
+        target = "flwr.common.inflatable.get_object_id"
+
+        # Execute & Assert: Reusing chunks only hashes the Array itself
+        with patch(target, wraps=get_object_id) as mock_get_object_id:
+            _ = arr.children
+            _ = arr.deflate()
+            _ = get_all_nested_objects(arr)
+        self.assertEqual(mock_get_object_id.call_count, 1)
+
+        # Execute & Assert: Replacing the data invalidates the cached chunks
+        arr.data = np.random.randn(3000, 3000).tobytes()
+        with patch(target, wraps=get_object_id) as mock_get_object_id:
+            children = arr.children
+        self.assertEqual(mock_get_object_id.call_count, num_chunks)
+        self.assertEqual(
+            list(children), [get_object_id(c.deflate()) for c in children.values()]
+        )
+
+    def test_content_defined_chunking(self) -> None:
+        """Test that content-defined chunks survive insertions into the data."""
+        # Prepare
+        data = np.random.default_rng(0).bytes(8 * 1024 * 1024)
+        arr = Array("uint8", (len(data),), "raw.buffer", data)
+        arr.chunking = ChunkingMode.CONTENT_DEFINED
+        modified = Array("uint8", (len(data) + 3,), "raw.buffer", b"new" + data)
+        modified.chunking = ChunkingMode.CONTENT_DEFINED
+
+        # Execute
+        chunk_ids = [ch_id for ch_id, _ in arr.slice_array()]
+        modified_chunk_ids = [ch_id for ch_id, _ in modified.slice_array()]
+        arr_ = Array.inflate(arr.deflate(), children=arr.children)
+
+        # Assert
+        self.assertGreater(len(chunk_ids), 1)
+        self.assertEqual(chunk_ids[1:], modified_chunk_ids[1:])
+        self.assertNotEqual(chunk_ids[0], modified_chunk_ids[0])
+        self.assertEqual(arr_.data, data)
+
+    def test_set_chunking(self) -> None:
+        """Test that changing the chunking mode invalidates the cached chunks."""
+        # Prepare
+        arr = Array(np.random.randn(3000, 3000))
+        fixed_children = arr.children
+        object_id = arr.object_id
+
+        # Execute
+        arr.chunking = ChunkingMode.CONTENT_DEFINED
+
+        # Assert
+        self.assertTrue(arr.is_dirty)
+        self.assertNotEqual(arr.children.keys(), fixed_children.keys())
+        self.assertNotEqual(arr.object_id, object_id)
+        with self.assertRaises(ValueError):
+            arr.chunking = "unknown"
+
+    def test_pickle_without_cached_chunks(self) -> None:
+        """Test that an Array with cached chunks can be pickled."""
+        # Prepare
+        arr = Array(np.array([1, 2, 3]))
+        _ = arr.object_id
+
+        # Execute
+        unpickled = pickle.loads(pickle.dumps(arr))
+
+        # Assert
+        self.assertEqual(unpickled, arr)
+        self.assertEqual(unpickled.object_id, arr.object_id)
@@ -18,8 +18,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any, cast
 
-from ..inflatable import InflatableObject, add_header_to_object_body, get_object_body
+from ..inflatable import (
+    InflatableObject,
+    add_header_to_object_body,
+    get_object_body_view,
+)
 
 
 @dataclass
@@ -58,5 +63,31 @@ class ArrayChunk(InflatableObject):
         if children:
             raise ValueError("`ArrayChunk` objects do not have children.")
 
-        obj_body = get_object_body(object_content, cls)
-        return cls(data=memoryview(obj_body))
+        # The ArrayChunk references the body in `object_content` without copying it
+        return cls(data=get_object_body_view(object_content, cls))
+
+    @property
+    def object_id(self) -> str:
+        """Get object ID."""
+        ret = super().object_id
+        self.is_dirty = False  # Reset dirty flag
+        return ret
+
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the object is dirty after the last deflation."""
+        if "_is_dirty" not in self.__dict__:
+            self.__dict__["_is_dirty"] = True
+        return cast(bool, self.__dict__["_is_dirty"])
+
+    @is_dirty.setter
+    def is_dirty(self, value: bool) -> None:
+        """Set the dirty flag."""
+        self.__dict__["_is_dirty"] = value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute with special handling for dirty state."""
+        if name == "data":
+            # Mark as dirty if the data is set
+            self.is_dirty = True
+        super().__setattr__(name, value)
@@ -48,3 +48,21 @@ def test_inflate_passing_children() -> None:
     # Inflate
     with pytest.raises(ValueError):
         ArrayChunk.inflate(ac_deflated, children={"123": ac})
+
+
+def test_object_id_is_cached() -> None:
+    """Test that the object ID is only recomputed after the data is set."""
+    # Prepare
+    ac = ArrayChunk(b"some data")
+    obj_id = ac.object_id
+
+    # Assert: The object ID is cached
+    assert not ac.is_dirty
+    assert ac.object_id == obj_id
+
+    # Execute: Replace the data
+    ac.data = memoryview(b"other data")
+
+    # Assert: The object ID is recomputed
+    assert ac.is_dirty
+    assert ac.object_id == ArrayChunk(b"other data").object_id != obj_id
@@ -26,7 +26,7 @@ from typing import TYPE_CHECKING, Any, cast, overload
 
 import numpy as np
 
-from ..constant import GC_THRESHOLD
+from ..constant import GC_THRESHOLD, SType
 from ..inflatable import InflatableObject, add_header_to_object_body, get_object_body
 from ..logger import log
 from ..typing import NDArray
@@ -51,6 +51,19 @@ def _check_key(key: str) -> None:
         raise TypeError(f"Key must be of type `str` but `{type(key)}` was passed.")
 
 
+def _to_writable_ndarray(arr: Array) -> NDArray:
+    """Return a writable NumPy array from an Array that is being discarded.
+
+    The data of the Array is reused without copying if its buffer is writable.
+    """
+    ndarray = arr.numpy(readonly=True)
+    try:
+        ndarray.flags.writeable = True
+    except ValueError:
+        ndarray = ndarray.copy()
+    return ndarray
+
+
 def _check_value(value: Array) -> None:
     if not isinstance(value, Array):
         raise TypeError(
@@ -254,6 +267,7 @@ class ArrayRecord(TypedDict[str, Array], InflatableObject):
             record[k] = Array(
                 dtype=v.dtype, shape=tuple(v.shape), stype=v.stype, data=v.data
             )
+            record[k].chunking = v.chunking
         if not keep_input:
             array_dict.clear()
         return record
@@ -264,13 +278,19 @@ class ArrayRecord(TypedDict[str, Array], InflatableObject):
         ndarrays: list[NDArray],
         *,
         keep_input: bool = True,
+        stype: str = SType.NUMPY,
     ) -> ArrayRecord:
-        """Create ArrayRecord from a list of NumPy ``ndarray``."""
+        """Create ArrayRecord from a list of NumPy ``ndarray``.
+
+        Each ndarray is converted into an :class:`Array` with the given serialization
+        type ``stype``. With ``SType.RAW_BUFFER``, C-contiguous ndarrays are
+        referenced without being copied (see :meth:`Array.from_numpy_ndarray`).
+        """
         record = ArrayRecord()
         total_serialized_bytes = 0
 
         for i in range(len(ndarrays)):  # pylint: disable=C0200
-            record[str(i)] = Array.from_numpy_ndarray(ndarrays[i])
+            record[str(i)] = Array.from_numpy_ndarray(ndarrays[i], stype=stype)
 
             if not keep_input:
                 # Remove the reference
@@ -294,8 +314,14 @@ class ArrayRecord(TypedDict[str, Array], InflatableObject):
         state_dict: OrderedDict[str, torch.Tensor],
         *,
         keep_input: bool = True,
+        stype: str = SType.NUMPY,
     ) -> ArrayRecord:
-        """Create ArrayRecord from PyTorch ``state_dict``."""
+        """Create ArrayRecord from PyTorch ``state_dict``.
+
+        Each tensor is converted into an :class:`Array` with the given serialization
+        type ``stype``. With ``SType.RAW_BUFFER``, contiguous CPU tensors are
+        referenced without being copied (see :meth:`Array.from_numpy_ndarray`).
+        """
         if "torch" not in sys.modules:
             raise RuntimeError(
                 f"PyTorch is required to use {cls.from_torch_state_dict.__name__}"
@@ -305,12 +331,16 @@ class ArrayRecord(TypedDict[str, Array], InflatableObject):
 
         for k in list(state_dict.keys()):
             v = state_dict[k] if keep_input else state_dict.pop(k)
-            record[k] = Array.from_numpy_ndarray(v.detach().cpu().numpy())
+            record[k] = Array.from_numpy_ndarray(v.detach().cpu().numpy(), stype=stype)
 
         return record
 
     def to_numpy_ndarrays(self, *, keep_input: bool = True) -> list[NDArray]:
-        """Return the ArrayRecord as a list of NumPy ``ndarray``."""
+        """Return the ArrayRecord as a list of NumPy ``ndarray``.
+
+        If ``keep_input`` is ``False``, the returned ndarrays reuse the memory of the
+        removed :class:`Array` objects where possible instead of copying it.
+        """
         if keep_input:
             return [v.numpy() for v in self.values()]
 
@@ -319,7 +349,7 @@ class ArrayRecord(TypedDict[str, Array], InflatableObject):
         total_serialized_bytes = 0
         for k in list(self.keys()):
             arr = self.pop(k)
-            ret.append(arr.numpy())
+            ret.append(_to_writable_ndarray(arr))
             total_serialized_bytes += len(arr.data)
             del arr
 
@@ -336,7 +366,11 @@ class ArrayRecord(TypedDict[str, Array], InflatableObject):
     def to_torch_state_dict(
         self, *, keep_input: bool = True
     ) -> OrderedDict[str, torch.Tensor]:
-        """Return the ArrayRecord as a PyTorch ``state_dict``."""
+        """Return the ArrayRecord as a PyTorch ``state_dict``.
+
+        If ``keep_input`` is ``False``, the returned tensors reuse the memory of the
+        removed :class:`Array` objects where possible instead of copying it.
+        """
         if not (torch := sys.modules.get("torch")):
             raise RuntimeError(
                 f"PyTorch is required to use {self.to_torch_state_dict.__name__}"
@@ -345,8 +379,10 @@ class ArrayRecord(TypedDict[str, Array], InflatableObject):
         state_dict = OrderedDict()
 
         for k in list(self.keys()):
-            arr = self[k] if keep_input else self.pop(k)
-            state_dict[k] = torch.from_numpy(arr.numpy())
+            if keep_input:
+                state_dict[k] = torch.from_numpy(self[k].numpy())
+            else:
+                state_dict[k] = torch.from_numpy(_to_writable_ndarray(self.pop(k)))
 
         return state_dict
 
@@ -92,7 +92,7 @@ class TestArrayRecord(unittest.TestCase):
             self.assertEqual(list(record.keys()), expected_keys)
             self.assertEqual(list(record.values()), mock_arrays)
             mock_from_numpy.assert_has_calls(
-                [call(arr) for arr in ndarrays], any_order=False
+                [call(arr, stype=SType.NUMPY) for arr in ndarrays], any_order=False
             )
 
     def test_from_torch_state_dict_with_torch(self) -> None:
@@ -126,7 +126,7 @@ class TestArrayRecord(unittest.TestCase):
                 tensor_mock.cpu.assert_called_once()
                 tensor_mock.numpy.assert_called_once()
             mock_from_numpy.assert_has_calls(
-                [call(arr) for arr in ndarrays], any_order=False
+                [call(arr, stype=SType.NUMPY) for arr in ndarrays], any_order=False
             )
             self.assertEqual(list(record.values()), mock_arrays)
 
@@ -156,6 +156,33 @@ class TestArrayRecord(unittest.TestCase):
         for mock_arr in mock_arrays:
             mock_arr.numpy.assert_called_once()
 
+    def test_raw_buffer_round_trip(self) -> None:
+        """Test converting NumPy arrays using the raw buffer serialization type."""
+        # Prepare
+        ndarrays: list[NDArray] = [np.random.randn(3, 4), np.arange(5, dtype=np.int32)]
+        expected = [ndarray.copy() for ndarray in ndarrays]
+
+        # Execute
+        record = ArrayRecord.from_numpy_ndarrays(ndarrays, stype=SType.RAW_BUFFER)
+        restored = ArrayRecord.inflate(
+            record.deflate(),
+            children={
+                arr.object_id: Array.inflate(arr.deflate(), children=arr.children)
+                for arr in record.values()
+            },
+        )
+        result = restored.to_numpy_ndarrays(keep_input=False)
+
+        # Assert
+        for arr, ndarray in zip(record.values(), ndarrays):
+            self.assertEqual(arr.stype, SType.RAW_BUFFER)
+            self.assertTrue(np.shares_memory(arr.numpy(readonly=True), ndarray))
+        self.assertEqual(len(restored), 0)
+        for ndarray, expected_ndarray in zip(result, expected):
+            np.testing.assert_array_equal(ndarray, expected_ndarray)
+            self.assertEqual(ndarray.dtype, expected_ndarray.dtype)
+            self.assertTrue(ndarray.flags.writeable)
+
     def test_to_state_dict_with_torch(self) -> None:
         """Test converting a ArrayRecord to a PyTorch state_dict."""
         # Prepare
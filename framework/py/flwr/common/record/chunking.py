@@ -0,0 +1,122 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Content-defined chunking of Array data."""
+
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+
+import numpy as np
+
+from ..constant import (
+    CDC_AVG_CHUNK_SIZE,
+    CDC_MIN_CHUNK_SIZE,
+    CDC_WINDOW_SIZE,
+    MAX_ARRAY_CHUNK_SIZE,
+)
+
+# Number of bytes for which rolling hashes are computed at once
+BLOCK_SIZE = 1_048_576  # 1 MB
+
+# Pseudo-random 64-bit value for each byte value, derived deterministically so that
+# all peers cut the same data at the same positions
+GEAR_TABLE = np.array(
+    [
+        int.from_bytes(hashlib.sha256(bytes([i])).digest()[:8], "little")
+        for i in range(256)
+    ],
+    dtype=np.uint64,
+)
+
+
+def _iterate_candidate_boundaries(
+    data: memoryview, avg_size: int, window_size: int
+) -> Iterator[int]:
+    """Yield candidate chunk boundaries in ascending order.
+
+    A candidate is a position at which the rolling hash of the preceding
+    `window_size` bytes matches the boundary mask.
+    """
+    mask = np.uint64(avg_size - 1)
+    for start in range(0, len(data), BLOCK_SIZE):
+        end = min(start + BLOCK_SIZE, len(data))
+        # Include the window preceding the block
+        lo = max(start - window_size, 0)
+        gears = GEAR_TABLE[np.frombuffer(data, np.uint8, count=end - lo, offset=lo)]
+        # The hash of a window is the sum of the gears of its bytes (mod 2^64),
+        # computed as the difference of two cumulative sums
+        cumsum = np.zeros(len(gears) + 1, dtype=np.uint64)
+        np.cumsum(gears, out=cumsum[1:])
+        hashes = cumsum[window_size:] - cumsum[:-window_size]
+        positions = np.flatnonzero((hashes & mask) == 0) + lo + window_size
+        yield from positions[positions > start].tolist()
+
+
+def get_content_defined_boundaries(
+    data: bytes | bytearray | memoryview,
+    min_size: int = CDC_MIN_CHUNK_SIZE,
+    avg_size: int = CDC_AVG_CHUNK_SIZE,
+    max_size: int = MAX_ARRAY_CHUNK_SIZE,
+    window_size: int = CDC_WINDOW_SIZE,
+) -> list[int]:
+    """Split data into chunks at content-defined positions.
+
+    A position is a chunk boundary if the rolling hash of the preceding
+    `window_size` bytes matches a mask. Since boundaries only depend on the
+    surrounding bytes, inserting or removing data only changes the chunks around
+    the modification instead of shifting all subsequent chunks.
+
+    Parameters
+    ----------
+    data : bytes | bytearray | memoryview
+        The data to split.
+    min_size : int (default: CDC_MIN_CHUNK_SIZE)
+        The minimum size of a chunk, except for the last one.
+    avg_size : int (default: CDC_AVG_CHUNK_SIZE)
+        The expected size of a chunk. Must be a power of two.
+    max_size : int (default: MAX_ARRAY_CHUNK_SIZE)
+        The maximum size of a chunk.
+    window_size : int (default: CDC_WINDOW_SIZE)
+        The number of bytes the rolling hash is computed over.
+
+    Returns
+    -------
+    list[int]
+        The end offsets of the chunks in ascending order. The last offset equals the
+        length of the data. The list is empty if the data is empty.
+    """
+    if avg_size & (avg_size - 1):
+        raise ValueError(f"`avg_size` must be a power of two, got {avg_size}.")
+    data = memoryview(data).cast("B")
+    boundaries: list[int] = []
+    start = 0
+    for position in _iterate_candidate_boundaries(data, avg_size, window_size):
+        # Enforce the maximum chunk size
+        while position - start > max_size:
+            start += max_size
+            boundaries.append(start)
+        # Enforce the minimum chunk size
+        if position - start >= min_size:
+            boundaries.append(position)
+            start = position
+
+    while len(data) - start > max_size:
+        start += max_size
+        boundaries.append(start)
+    if len(data) > start:
+        boundaries.append(len(data))
+    return boundaries
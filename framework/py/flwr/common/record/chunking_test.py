@@ -0,0 +1,92 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for content-defined chunking."""
+
+
+import unittest
+
+import numpy as np
+
+from .chunking import get_content_defined_boundaries
+
+MIN_SIZE = 256
+AVG_SIZE = 1024
+MAX_SIZE = 4096
+
+
+def _get_chunks(data: bytes) -> list[bytes]:
+    """Split data into chunks using small chunk sizes."""
+    boundaries = get_content_defined_boundaries(
+        data, min_size=MIN_SIZE, avg_size=AVG_SIZE, max_size=MAX_SIZE
+    )
+    starts = [0] + boundaries[:-1]
+    return [data[start:end] for start, end in zip(starts, boundaries)]
+
+
+class TestContentDefinedChunking(unittest.TestCase):
+    """Tests for `get_content_defined_boundaries`."""
+
+    def setUp(self) -> None:
+        """Create random data."""
+        self.data = np.random.default_rng(42).bytes(200_000)
+
+    def test_chunk_sizes(self) -> None:
+        """Test that chunks cover the data and respect the size limits."""
+        # Execute
+        chunks = _get_chunks(self.data)
+
+        # Assert
+        self.assertEqual(b"".join(chunks), self.data)
+        self.assertTrue(all(MIN_SIZE <= len(c) <= MAX_SIZE for c in chunks[:-1]))
+        self.assertLessEqual(len(chunks[-1]), MAX_SIZE)
+        # The average chunk size is in the order of `AVG_SIZE`
+        self.assertLess(len(chunks), 2 * len(self.data) / AVG_SIZE)
+
+    def test_boundaries_resynchronize_after_insertion(self) -> None:
+        """Test that inserting data only changes the chunks around the insertion."""
+        # Prepare
+        modified = self.data[:1000] + b"inserted bytes" + self.data[1000:]
+
+        # Execute
+        chunks = _get_chunks(self.data)
+        modified_chunks = _get_chunks(modified)
+
+        # Assert
+        shared = set(chunks) & set(modified_chunks)
+        self.assertGreaterEqual(len(shared), len(chunks) - 3)
+
+    def test_constant_data(self) -> None:
+        """Test that data without any boundary is cut at the maximum size."""
+        # Execute
+        boundaries = get_content_defined_boundaries(
+            bytes(10_000), min_size=MIN_SIZE, avg_size=AVG_SIZE, max_size=MAX_SIZE
+        )
+
+        # Assert
+        self.assertEqual(boundaries, [4096, 8192, 10_000])
+
+    def test_empty_and_small_data(self) -> None:
+        """Test splitting data shorter than the rolling hash window."""
+        self.assertEqual(get_content_defined_boundaries(b""), [])
+        self.assertEqual(get_content_defined_boundaries(b"abc"), [3])
+
+    def test_invalid_avg_size(self) -> None:
+        """Test that the average chunk size must be a power of two."""
+        with self.assertRaises(ValueError):
+            get_content_defined_boundaries(self.data, avg_size=1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -20,6 +20,7 @@ from collections.abc import Mapping
 from typing import Union, cast, get_args
 
 from . import Array, ArrayRecord, ConfigRecord, MetricRecord, RecordDict
+from .constant import SType
 from .typing import (
     Code,
     ConfigRecordValues,
@@ -50,6 +51,9 @@ def arrayrecord_to_parameters(record: ArrayRecord, keep_input: bool) -> Paramete
     might not be possible to reconstruct such data structures from `Parameters` objects
     alone. Additional information or metadata must be provided from elsewhere.
 
+    `Array`s serialized with `SType.RAW_BUFFER` are converted to the NumPy format,
+    which is the one the legacy `parameters_to_ndarrays` can decode.
+
     Parameters
     ----------
     record : ArrayRecord
@@ -66,13 +70,18 @@ def arrayrecord_to_parameters(record: ArrayRecord, keep_input: bool) -> Paramete
     parameters = Parameters(tensors=[], tensor_type="")
 
     for key in list(record.keys()):
+        array = record[key]
+        if array.stype == SType.RAW_BUFFER:
+            # Raw buffers carry no dtype or shape, so legacy code can't decode them
+            array = Array.from_numpy_ndarray(array.numpy(readonly=True))
+
         if key != EMPTY_TENSOR_KEY:
-            parameters.tensors.append(record[key].data)
+            parameters.tensors.append(bytes(array.data))
 
         if not parameters.tensor_type:
             # Setting from first array in record. Recall the warning in the docstrings
             # of this function.
-            parameters.tensor_type = record[key].stype
+            parameters.tensor_type = array.stype
 
         if not keep_input:
             del record[key]
@@ -15,14 +15,18 @@
 """RecordDict from legacy messages tests."""
 
 
+from collections import OrderedDict
 from copy import deepcopy
 from typing import Callable
 
 import numpy as np
 import pytest
 
-from .parameter import ndarrays_to_parameters
+from .constant import SType
+from .parameter import ndarrays_to_parameters, parameters_to_ndarrays
+from .record import Array, ArrayRecord
 from .recorddict_compat import (
+    arrayrecord_to_parameters,
     evaluateins_to_recorddict,
     evaluateres_to_recorddict,
     fitins_to_recorddict,
@@ -315,3 +319,23 @@ def test_get_parameters_res_to_recorddict_and_back(
     assert validate_freed_fn(
         getparameteres_res, getparameters_res_copy, getparameteres_res_
     )
+
+
+def test_arrayrecord_to_parameters_with_raw_buffer() -> None:
+    """Test Arrays of raw buffers are converted to the format of legacy code."""
+    # Prepare
+    ndarrays = get_ndarrays()
+    record = ArrayRecord(
+        OrderedDict(
+            (str(i), Array.from_numpy_ndarray(arr, stype=SType.RAW_BUFFER))
+            for i, arr in enumerate(ndarrays)
+        )
+    )
+
+    # Execute
+    parameters = arrayrecord_to_parameters(record, keep_input=True)
+
+    # Assert
+    assert parameters.tensor_type == SType.NUMPY
+    for arr, arr_ in zip(ndarrays, parameters_to_ndarrays(parameters)):
+        np.testing.assert_array_equal(arr, arr_)
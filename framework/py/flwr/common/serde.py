@@ -382,7 +382,7 @@ def array_to_proto(array: Array) -> ProtoArray:
         dtype=array.dtype,
         shape=array.shape,
         stype=array.stype,
-        data=array.data,
+        data=bytes(array.data),
     )
 
 
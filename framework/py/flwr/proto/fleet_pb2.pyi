@@ -63,17 +63,22 @@ class PullMessagesRequest(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
     NODE_FIELD_NUMBER: builtins.int
     MESSAGE_IDS_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
     @property
     def node(self) -> flwr.proto.node_pb2.Node: ...
     @property
     def message_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    timeout: builtins.float
+    """Max. seconds to wait for a message if none is available (0: don't wait)"""
+
     def __init__(self,
         *,
         node: typing.Optional[flwr.proto.node_pb2.Node] = ...,
         message_ids: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        timeout: builtins.float = ...,
         ) -> None: ...
     def HasField(self, field_name: typing_extensions.Literal["node",b"node"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing_extensions.Literal["message_ids",b"message_ids","node",b"node"]) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["message_ids",b"message_ids","node",b"node","timeout",b"timeout"]) -> None: ...
 global___PullMessagesRequest = PullMessagesRequest
 
 class PullMessagesResponse(google.protobuf.message.Message):
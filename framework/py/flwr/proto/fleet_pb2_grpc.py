@@ -63,6 +63,21 @@ class FleetStub(object):
                 request_serializer=flwr_dot_proto_dot_message__pb2.PullObjectRequest.SerializeToString,
                 response_deserializer=flwr_dot_proto_dot_message__pb2.PullObjectResponse.FromString,
                 )
+        self.PushObjects = channel.stream_stream(
+                '/flwr.proto.Fleet/PushObjects',
+                request_serializer=flwr_dot_proto_dot_message__pb2.PushObjectRequest.SerializeToString,
+                response_deserializer=flwr_dot_proto_dot_message__pb2.PushObjectsResponse.FromString,
+                )
+        self.PullObjects = channel.unary_stream(
+                '/flwr.proto.Fleet/PullObjects',
+                request_serializer=flwr_dot_proto_dot_message__pb2.PullObjectsRequest.SerializeToString,
+                response_deserializer=flwr_dot_proto_dot_message__pb2.PullObjectsResponse.FromString,
+                )
+        self.GetObjectsStatus = channel.unary_unary(
+                '/flwr.proto.Fleet/GetObjectsStatus',
+                request_serializer=flwr_dot_proto_dot_message__pb2.GetObjectsStatusRequest.SerializeToString,
+                response_deserializer=flwr_dot_proto_dot_message__pb2.GetObjectsStatusResponse.FromString,
+                )
         self.ConfirmMessageReceived = channel.unary_unary(
                 '/flwr.proto.Fleet/ConfirmMessageReceived',
                 request_serializer=flwr_dot_proto_dot_message__pb2.ConfirmMessageReceivedRequest.SerializeToString,
@@ -136,6 +151,27 @@ class FleetServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PushObjects(self, request_iterator, context):
+        """Push a stream of objects
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PullObjects(self, request, context):
+        """Pull a stream of objects
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetObjectsStatus(self, request, context):
+        """Get the availability of multiple objects
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ConfirmMessageReceived(self, request, context):
         """Confirm Message Received
         """
@@ -191,6 +227,21 @@ def add_FleetServicer_to_server(servicer, server):
                     request_deserializer=flwr_dot_proto_dot_message__pb2.PullObjectRequest.FromString,
                     response_serializer=flwr_dot_proto_dot_message__pb2.PullObjectResponse.SerializeToString,
             ),
+            'PushObjects': grpc.stream_stream_rpc_method_handler(
+                    servicer.PushObjects,
+                    request_deserializer=flwr_dot_proto_dot_message__pb2.PushObjectRequest.FromString,
+                    response_serializer=flwr_dot_proto_dot_message__pb2.PushObjectsResponse.SerializeToString,
+            ),
+            'PullObjects': grpc.unary_stream_rpc_method_handler(
+                    servicer.PullObjects,
+                    request_deserializer=flwr_dot_proto_dot_message__pb2.PullObjectsRequest.FromString,
+                    response_serializer=flwr_dot_proto_dot_message__pb2.PullObjectsResponse.SerializeToString,
+            ),
+            'GetObjectsStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetObjectsStatus,
+                    request_deserializer=flwr_dot_proto_dot_message__pb2.GetObjectsStatusRequest.FromString,
+                    response_serializer=flwr_dot_proto_dot_message__pb2.GetObjectsStatusResponse.SerializeToString,
+            ),
             'ConfirmMessageReceived': grpc.unary_unary_rpc_method_handler(
                     servicer.ConfirmMessageReceived,
                     request_deserializer=flwr_dot_proto_dot_message__pb2.ConfirmMessageReceivedRequest.FromString,
@@ -359,6 +410,57 @@ class Fleet(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def PushObjects(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/flwr.proto.Fleet/PushObjects',
+            flwr_dot_proto_dot_message__pb2.PushObjectRequest.SerializeToString,
+            flwr_dot_proto_dot_message__pb2.PushObjectsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PullObjects(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/flwr.proto.Fleet/PullObjects',
+            flwr_dot_proto_dot_message__pb2.PullObjectsRequest.SerializeToString,
+            flwr_dot_proto_dot_message__pb2.PullObjectsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetObjectsStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/flwr.proto.Fleet/GetObjectsStatus',
+            flwr_dot_proto_dot_message__pb2.GetObjectsStatusRequest.SerializeToString,
+            flwr_dot_proto_dot_message__pb2.GetObjectsStatusResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def ConfirmMessageReceived(request,
             target,
@@ -9,6 +9,7 @@ import flwr.proto.heartbeat_pb2
 import flwr.proto.message_pb2
 import flwr.proto.run_pb2
 import grpc
+import typing
 
 class FleetStub:
     def __init__(self, channel: grpc.Channel) -> None: ...
@@ -59,6 +60,21 @@ class FleetStub:
         flwr.proto.message_pb2.PullObjectResponse]
     """Pull Object"""
 
+    PushObjects: grpc.StreamStreamMultiCallable[
+        flwr.proto.message_pb2.PushObjectRequest,
+        flwr.proto.message_pb2.PushObjectsResponse]
+    """Push a stream of objects"""
+
+    PullObjects: grpc.UnaryStreamMultiCallable[
+        flwr.proto.message_pb2.PullObjectsRequest,
+        flwr.proto.message_pb2.PullObjectsResponse]
+    """Pull a stream of objects"""
+
+    GetObjectsStatus: grpc.UnaryUnaryMultiCallable[
+        flwr.proto.message_pb2.GetObjectsStatusRequest,
+        flwr.proto.message_pb2.GetObjectsStatusResponse]
+    """Get the availability of multiple objects"""
+
     ConfirmMessageReceived: grpc.UnaryUnaryMultiCallable[
         flwr.proto.message_pb2.ConfirmMessageReceivedRequest,
         flwr.proto.message_pb2.ConfirmMessageReceivedResponse]
@@ -136,6 +152,30 @@ class FleetServicer(metaclass=abc.ABCMeta):
         """Pull Object"""
         pass
 
+    @abc.abstractmethod
+    def PushObjects(self,
+        request_iterator: typing.Iterator[flwr.proto.message_pb2.PushObjectRequest],
+        context: grpc.ServicerContext,
+    ) -> typing.Iterator[flwr.proto.message_pb2.PushObjectsResponse]:
+        """Push a stream of objects"""
+        pass
+
+    @abc.abstractmethod
+    def PullObjects(self,
+        request: flwr.proto.message_pb2.PullObjectsRequest,
+        context: grpc.ServicerContext,
+    ) -> typing.Iterator[flwr.proto.message_pb2.PullObjectsResponse]:
+        """Pull a stream of objects"""
+        pass
+
+    @abc.abstractmethod
+    def GetObjectsStatus(self,
+        request: flwr.proto.message_pb2.GetObjectsStatusRequest,
+        context: grpc.ServicerContext,
+    ) -> flwr.proto.message_pb2.GetObjectsStatusResponse:
+        """Get the availability of multiple objects"""
+        pass
+
     @abc.abstractmethod
     def ConfirmMessageReceived(self,
         request: flwr.proto.message_pb2.ConfirmMessageReceivedRequest,
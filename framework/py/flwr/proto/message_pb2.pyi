@@ -226,6 +226,119 @@ class PullObjectResponse(google.protobuf.message.Message):
     def ClearField(self, field_name: typing_extensions.Literal["object_available",b"object_available","object_content",b"object_content","object_found",b"object_found"]) -> None: ...
 global___PullObjectResponse = PullObjectResponse
 
+class PushObjectsResponse(google.protobuf.message.Message):
+    """PushObjects messages
+    The stream of `PushObjectRequest`s is acknowledged object by object, so an
+    interrupted transfer can be resumed with the unacknowledged objects only
+    """
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    OBJECT_ID_FIELD_NUMBER: builtins.int
+    STORED_FIELD_NUMBER: builtins.int
+    object_id: typing.Text
+    stored: builtins.bool
+    def __init__(self,
+        *,
+        object_id: typing.Text = ...,
+        stored: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["object_id",b"object_id","stored",b"stored"]) -> None: ...
+global___PushObjectsResponse = PushObjectsResponse
+
+class PullObjectsRequest(google.protobuf.message.Message):
+    """PullObjects messages"""
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    NODE_FIELD_NUMBER: builtins.int
+    RUN_ID_FIELD_NUMBER: builtins.int
+    OBJECT_IDS_FIELD_NUMBER: builtins.int
+    @property
+    def node(self) -> flwr.proto.node_pb2.Node: ...
+    run_id: builtins.int
+    @property
+    def object_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    def __init__(self,
+        *,
+        node: typing.Optional[flwr.proto.node_pb2.Node] = ...,
+        run_id: builtins.int = ...,
+        object_ids: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["node",b"node"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["node",b"node","object_ids",b"object_ids","run_id",b"run_id"]) -> None: ...
+global___PullObjectsRequest = PullObjectsRequest
+
+class PullObjectsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    OBJECT_ID_FIELD_NUMBER: builtins.int
+    OBJECT_FOUND_FIELD_NUMBER: builtins.int
+    OBJECT_AVAILABLE_FIELD_NUMBER: builtins.int
+    OBJECT_CONTENT_FIELD_NUMBER: builtins.int
+    object_id: typing.Text
+    object_found: builtins.bool
+    object_available: builtins.bool
+    object_content: builtins.bytes
+    def __init__(self,
+        *,
+        object_id: typing.Text = ...,
+        object_found: builtins.bool = ...,
+        object_available: builtins.bool = ...,
+        object_content: builtins.bytes = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["object_available",b"object_available","object_content",b"object_content","object_found",b"object_found","object_id",b"object_id"]) -> None: ...
+global___PullObjectsResponse = PullObjectsResponse
+
+class GetObjectsStatusRequest(google.protobuf.message.Message):
+    """GetObjectsStatus messages
+    If `timeout` is positive, the request is held until at least one of the
+    requested objects that was unavailable becomes available, or until the
+    timeout (in seconds) expires
+    """
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    NODE_FIELD_NUMBER: builtins.int
+    RUN_ID_FIELD_NUMBER: builtins.int
+    OBJECT_IDS_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    @property
+    def node(self) -> flwr.proto.node_pb2.Node: ...
+    run_id: builtins.int
+    @property
+    def object_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    timeout: builtins.float
+    def __init__(self,
+        *,
+        node: typing.Optional[flwr.proto.node_pb2.Node] = ...,
+        run_id: builtins.int = ...,
+        object_ids: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        timeout: builtins.float = ...,
+        ) -> None: ...
+    def HasField(self, field_name: typing_extensions.Literal["node",b"node"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing_extensions.Literal["node",b"node","object_ids",b"object_ids","run_id",b"run_id","timeout",b"timeout"]) -> None: ...
+global___GetObjectsStatusRequest = GetObjectsStatusRequest
+
+class GetObjectsStatusResponse(google.protobuf.message.Message):
+    """Objects that are not pre-registered are omitted from `object_availability`"""
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    class ObjectAvailabilityEntry(google.protobuf.message.Message):
+        DESCRIPTOR: google.protobuf.descriptor.Descriptor
+        KEY_FIELD_NUMBER: builtins.int
+        VALUE_FIELD_NUMBER: builtins.int
+        key: typing.Text
+        value: builtins.bool
+        def __init__(self,
+            *,
+            key: typing.Text = ...,
+            value: builtins.bool = ...,
+            ) -> None: ...
+        def ClearField(self, field_name: typing_extensions.Literal["key",b"key","value",b"value"]) -> None: ...
+
+    OBJECT_AVAILABILITY_FIELD_NUMBER: builtins.int
+    @property
+    def object_availability(self) -> google.protobuf.internal.containers.ScalarMap[typing.Text, builtins.bool]: ...
+    def __init__(self,
+        *,
+        object_availability: typing.Optional[typing.Mapping[typing.Text, builtins.bool]] = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["object_availability",b"object_availability"]) -> None: ...
+global___GetObjectsStatusResponse = GetObjectsStatusResponse
+
 class ConfirmMessageReceivedRequest(google.protobuf.message.Message):
     """ConfirmMessageReceived messages"""
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -35,3 +35,33 @@ class GetNodesResponse(google.protobuf.message.Message):
         ) -> None: ...
     def ClearField(self, field_name: typing_extensions.Literal["nodes",b"nodes"]) -> None: ...
 global___GetNodesResponse = GetNodesResponse
+
+class WaitForRepliesRequest(google.protobuf.message.Message):
+    """WaitForReplies messages"""
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    RUN_ID_FIELD_NUMBER: builtins.int
+    MESSAGE_IDS_FIELD_NUMBER: builtins.int
+    TIMEOUT_FIELD_NUMBER: builtins.int
+    run_id: builtins.int
+    @property
+    def message_ids(self) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[typing.Text]: ...
+    timeout: builtins.float
+    def __init__(self,
+        *,
+        run_id: builtins.int = ...,
+        message_ids: typing.Optional[typing.Iterable[typing.Text]] = ...,
+        timeout: builtins.float = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["message_ids",b"message_ids","run_id",b"run_id","timeout",b"timeout"]) -> None: ...
+global___WaitForRepliesRequest = WaitForRepliesRequest
+
+class WaitForRepliesResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+    REPLIES_AVAILABLE_FIELD_NUMBER: builtins.int
+    replies_available: builtins.bool
+    def __init__(self,
+        *,
+        replies_available: builtins.bool = ...,
+        ) -> None: ...
+    def ClearField(self, field_name: typing_extensions.Literal["replies_available",b"replies_available"]) -> None: ...
+global___WaitForRepliesResponse = WaitForRepliesResponse
@@ -35,6 +35,11 @@ class ServerAppIoStub(object):
                 request_serializer=flwr_dot_proto_dot_appio__pb2.PullAppMessagesRequest.SerializeToString,
                 response_deserializer=flwr_dot_proto_dot_appio__pb2.PullAppMessagesResponse.FromString,
                 )
+        self.WaitForReplies = channel.unary_unary(
+                '/flwr.proto.ServerAppIo/WaitForReplies',
+                request_serializer=flwr_dot_proto_dot_serverappio__pb2.WaitForRepliesRequest.SerializeToString,
+                response_deserializer=flwr_dot_proto_dot_serverappio__pb2.WaitForRepliesResponse.FromString,
+                )
         self.GetRun = channel.unary_unary(
                 '/flwr.proto.ServerAppIo/GetRun',
                 request_serializer=flwr_dot_proto_dot_run__pb2.GetRunRequest.SerializeToString,
@@ -85,6 +90,21 @@ class ServerAppIoStub(object):
                 request_serializer=flwr_dot_proto_dot_message__pb2.PullObjectRequest.SerializeToString,
                 response_deserializer=flwr_dot_proto_dot_message__pb2.PullObjectResponse.FromString,
                 )
+        self.PushObjects = channel.stream_stream(
+                '/flwr.proto.ServerAppIo/PushObjects',
+                request_serializer=flwr_dot_proto_dot_message__pb2.PushObjectRequest.SerializeToString,
+                response_deserializer=flwr_dot_proto_dot_message__pb2.PushObjectsResponse.FromString,
+                )
+        self.PullObjects = channel.unary_stream(
+                '/flwr.proto.ServerAppIo/PullObjects',
+                request_serializer=flwr_dot_proto_dot_message__pb2.PullObjectsRequest.SerializeToString,
+                response_deserializer=flwr_dot_proto_dot_message__pb2.PullObjectsResponse.FromString,
+                )
+        self.GetObjectsStatus = channel.unary_unary(
+                '/flwr.proto.ServerAppIo/GetObjectsStatus',
+                request_serializer=flwr_dot_proto_dot_message__pb2.GetObjectsStatusRequest.SerializeToString,
+                response_deserializer=flwr_dot_proto_dot_message__pb2.GetObjectsStatusResponse.FromString,
+                )
         self.ConfirmMessageReceived = channel.unary_unary(
                 '/flwr.proto.ServerAppIo/ConfirmMessageReceived',
                 request_serializer=flwr_dot_proto_dot_message__pb2.ConfirmMessageReceivedRequest.SerializeToString,
@@ -116,6 +136,13 @@ class ServerAppIoServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WaitForReplies(self, request, context):
+        """Wait until replies to the given messages are available
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetRun(self, request, context):
         """Get run details
         """
@@ -186,6 +213,27 @@ class ServerAppIoServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PushObjects(self, request_iterator, context):
+        """Push a stream of objects
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PullObjects(self, request, context):
+        """Pull a stream of objects
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetObjectsStatus(self, request, context):
+        """Get the availability of multiple objects
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ConfirmMessageReceived(self, request, context):
         """Confirm Message Received
         """
@@ -211,6 +259,11 @@ def add_ServerAppIoServicer_to_server(servicer, server):
                     request_deserializer=flwr_dot_proto_dot_appio__pb2.PullAppMessagesRequest.FromString,
                     response_serializer=flwr_dot_proto_dot_appio__pb2.PullAppMessagesResponse.SerializeToString,
             ),
+            'WaitForReplies': grpc.unary_unary_rpc_method_handler(
+                    servicer.WaitForReplies,
+                    request_deserializer=flwr_dot_proto_dot_serverappio__pb2.WaitForRepliesRequest.FromString,
+                    response_serializer=flwr_dot_proto_dot_serverappio__pb2.WaitForRepliesResponse.SerializeToString,
+            ),
             'GetRun': grpc.unary_unary_rpc_method_handler(
                     servicer.GetRun,
                     request_deserializer=flwr_dot_proto_dot_run__pb2.GetRunRequest.FromString,
@@ -261,6 +314,21 @@ def add_ServerAppIoServicer_to_server(servicer, server):
                     request_deserializer=flwr_dot_proto_dot_message__pb2.PullObjectRequest.FromString,
                     response_serializer=flwr_dot_proto_dot_message__pb2.PullObjectResponse.SerializeToString,
             ),
+            'PushObjects': grpc.stream_stream_rpc_method_handler(
+                    servicer.PushObjects,
+                    request_deserializer=flwr_dot_proto_dot_message__pb2.PushObjectRequest.FromString,
+                    response_serializer=flwr_dot_proto_dot_message__pb2.PushObjectsResponse.SerializeToString,
+            ),
+            'PullObjects': grpc.unary_stream_rpc_method_handler(
+                    servicer.PullObjects,
+                    request_deserializer=flwr_dot_proto_dot_message__pb2.PullObjectsRequest.FromString,
+                    response_serializer=flwr_dot_proto_dot_message__pb2.PullObjectsResponse.SerializeToString,
+            ),
+            'GetObjectsStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetObjectsStatus,
+                    request_deserializer=flwr_dot_proto_dot_message__pb2.GetObjectsStatusRequest.FromString,
+                    response_serializer=flwr_dot_proto_dot_message__pb2.GetObjectsStatusResponse.SerializeToString,
+            ),
             'ConfirmMessageReceived': grpc.unary_unary_rpc_method_handler(
                     servicer.ConfirmMessageReceived,
                     request_deserializer=flwr_dot_proto_dot_message__pb2.ConfirmMessageReceivedRequest.FromString,
@@ -327,6 +395,23 @@ class ServerAppIo(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def WaitForReplies(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/flwr.proto.ServerAppIo/WaitForReplies',
+            flwr_dot_proto_dot_serverappio__pb2.WaitForRepliesRequest.SerializeToString,
+            flwr_dot_proto_dot_serverappio__pb2.WaitForRepliesResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def GetRun(request,
             target,
@@ -497,6 +582,57 @@ class ServerAppIo(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def PushObjects(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/flwr.proto.ServerAppIo/PushObjects',
+            flwr_dot_proto_dot_message__pb2.PushObjectRequest.SerializeToString,
+            flwr_dot_proto_dot_message__pb2.PushObjectsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PullObjects(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/flwr.proto.ServerAppIo/PullObjects',
+            flwr_dot_proto_dot_message__pb2.PullObjectsRequest.SerializeToString,
+            flwr_dot_proto_dot_message__pb2.PullObjectsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetObjectsStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/flwr.proto.ServerAppIo/GetObjectsStatus',
+            flwr_dot_proto_dot_message__pb2.GetObjectsStatusRequest.SerializeToString,
+            flwr_dot_proto_dot_message__pb2.GetObjectsStatusResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def ConfirmMessageReceived(request,
             target,
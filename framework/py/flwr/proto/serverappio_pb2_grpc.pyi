@@ -11,6 +11,7 @@ import flwr.proto.message_pb2
 import flwr.proto.run_pb2
 import flwr.proto.serverappio_pb2
 import grpc
+import typing
 
 class ServerAppIoStub:
     def __init__(self, channel: grpc.Channel) -> None: ...
@@ -29,6 +30,11 @@ class ServerAppIoStub:
         flwr.proto.appio_pb2.PullAppMessagesResponse]
     """Get message results"""
 
+    WaitForReplies: grpc.UnaryUnaryMultiCallable[
+        flwr.proto.serverappio_pb2.WaitForRepliesRequest,
+        flwr.proto.serverappio_pb2.WaitForRepliesResponse]
+    """Wait until replies to the given messages are available"""
+
     GetRun: grpc.UnaryUnaryMultiCallable[
         flwr.proto.run_pb2.GetRunRequest,
         flwr.proto.run_pb2.GetRunResponse]
@@ -79,6 +85,21 @@ class ServerAppIoStub:
         flwr.proto.message_pb2.PullObjectResponse]
     """Pull Object"""
 
+    PushObjects: grpc.StreamStreamMultiCallable[
+        flwr.proto.message_pb2.PushObjectRequest,
+        flwr.proto.message_pb2.PushObjectsResponse]
+    """Push a stream of objects"""
+
+    PullObjects: grpc.UnaryStreamMultiCallable[
+        flwr.proto.message_pb2.PullObjectsRequest,
+        flwr.proto.message_pb2.PullObjectsResponse]
+    """Pull a stream of objects"""
+
+    GetObjectsStatus: grpc.UnaryUnaryMultiCallable[
+        flwr.proto.message_pb2.GetObjectsStatusRequest,
+        flwr.proto.message_pb2.GetObjectsStatusResponse]
+    """Get the availability of multiple objects"""
+
     ConfirmMessageReceived: grpc.UnaryUnaryMultiCallable[
         flwr.proto.message_pb2.ConfirmMessageReceivedRequest,
         flwr.proto.message_pb2.ConfirmMessageReceivedResponse]
@@ -110,6 +131,14 @@ class ServerAppIoServicer(metaclass=abc.ABCMeta):
         """Get message results"""
         pass
 
+    @abc.abstractmethod
+    def WaitForReplies(self,
+        request: flwr.proto.serverappio_pb2.WaitForRepliesRequest,
+        context: grpc.ServicerContext,
+    ) -> flwr.proto.serverappio_pb2.WaitForRepliesResponse:
+        """Wait until replies to the given messages are available"""
+        pass
+
     @abc.abstractmethod
     def GetRun(self,
         request: flwr.proto.run_pb2.GetRunRequest,
@@ -190,6 +219,30 @@ class ServerAppIoServicer(metaclass=abc.ABCMeta):
         """Pull Object"""
         pass
 
+    @abc.abstractmethod
+    def PushObjects(self,
+        request_iterator: typing.Iterator[flwr.proto.message_pb2.PushObjectRequest],
+        context: grpc.ServicerContext,
+    ) -> typing.Iterator[flwr.proto.message_pb2.PushObjectsResponse]:
+        """Push a stream of objects"""
+        pass
+
+    @abc.abstractmethod
+    def PullObjects(self,
+        request: flwr.proto.message_pb2.PullObjectsRequest,
+        context: grpc.ServicerContext,
+    ) -> typing.Iterator[flwr.proto.message_pb2.PullObjectsResponse]:
+        """Pull a stream of objects"""
+        pass
+
+    @abc.abstractmethod
+    def GetObjectsStatus(self,
+        request: flwr.proto.message_pb2.GetObjectsStatusRequest,
+        context: grpc.ServicerContext,
+    ) -> flwr.proto.message_pb2.GetObjectsStatusResponse:
+        """Get the availability of multiple objects"""
+        pass
+
     @abc.abstractmethod
     def ConfirmMessageReceived(self,
         request: flwr.proto.message_pb2.ConfirmMessageReceivedRequest,
@@ -46,6 +46,7 @@ from flwr.common.constant import (
     EXEC_API_DEFAULT_SERVER_ADDRESS,
     FLEET_API_GRPC_RERE_DEFAULT_ADDRESS,
     FLEET_API_REST_DEFAULT_ADDRESS,
+    FLWR_IN_MEMORY_OBJECT_STORE,
     ISOLATION_MODE_PROCESS,
     ISOLATION_MODE_SUBPROCESS,
     SERVER_OCTET,
@@ -169,7 +170,7 @@ def run_superlink() -> None:
     ffs_factory = FfsFactory(args.storage_dir)
 
     # Initialize ObjectStoreFactory
-    objectstore_factory = ObjectStoreFactory()
+    objectstore_factory = ObjectStoreFactory(args.object_store)
 
     # Start Exec API
     executor = load_executor(args)
@@ -337,6 +338,7 @@ def run_superlink() -> None:
         event_type=EventType.RUN_SUPERLINK_LEAVE,
         exit_message="SuperLink terminated gracefully.",
         grpc_servers=grpc_servers,
+        exit_handlers=[state_factory.close],
     )
 
     # Block until a thread exits prematurely
@@ -714,7 +716,9 @@ def _add_args_common(parser: argparse.ArgumentParser) -> None:
         help="A string representing the path to the database "
         "file that will be opened. Note that passing ':memory:' "
         "will open a connection to a database that is in RAM, "
-        "instead of on disk. If nothing is provided, "
+        "instead of on disk. Passing a URL starting with 'postgresql://' "
+        "connects to a PostgreSQL database that can be shared by multiple "
+        "SuperLinks (requires the `postgres` extra). If nothing is provided, "
         "Flower will just create a state in memory.",
         default=DATABASE,
     )
@@ -723,6 +727,15 @@ def _add_args_common(parser: argparse.ArgumentParser) -> None:
         help="The base directory to store the objects for the Flower File System.",
         default=BASE_DIR,
     )
+    parser.add_argument(
+        "--object-store",
+        help="A string representing where the ObjectStore persists objects "
+        "(e.g., model parameters). Passing the path to a SQLite database file "
+        "(ending in `.db` or `.sqlite`) or ':memory:' keeps objects in SQLite. "
+        "Any other path is used as a directory for memory-mapped segment files. "
+        "If nothing is provided, Flower will keep all objects in memory.",
+        default=FLWR_IN_MEMORY_OBJECT_STORE,
+    )
     parser.add_argument(
         "--auth-list-public-keys",
         type=str,
@@ -15,7 +15,9 @@
 """Flower Fleet API event log interceptor."""
 
 
-from typing import Any, Callable, cast
+from collections.abc import Iterator
+from itertools import chain
+from typing import Any, Callable, Optional, cast
 
 import grpc
 from google.protobuf.message import Message as GrpcMessage
@@ -37,14 +39,18 @@ class FleetEventLogInterceptor(grpc.ServerInterceptor):  # type: ignore
     ) -> grpc.RpcMethodHandler:
         """Flower Fleet API server interceptor logging logic.
 
-        Intercept all unary-unary calls from users and log the event. Continue RPC call
-        if event logger is enabled on the SuperLink, else, terminate RPC call by setting
-        context to abort.
+        Intercept all unary-unary/unary-stream/stream-stream calls from users and log
+        the event. Continue RPC call if event logger is enabled on the SuperLink, else,
+        terminate RPC call by setting context to abort.
         """
         # One of the method handlers in
         # `flwr.server.superlink.fleet.grpc_rere.fleet_servicer.FleetServicer`
         method_handler: grpc.RpcMethodHandler = continuation(handler_call_details)
         method_name: str = handler_call_details.method
+        if method_handler.unary_stream or method_handler.stream_stream:
+            return self._generic_event_log_stream_method_handler(
+                method_handler, method_name
+            )
         return self._generic_event_log_unary_method_handler(method_handler, method_name)
 
     def _generic_event_log_unary_method_handler(
@@ -92,3 +98,70 @@ class FleetEventLogInterceptor(grpc.ServerInterceptor):  # type: ignore
             request_deserializer=method_handler.request_deserializer,
             response_serializer=method_handler.response_serializer,
         )
+
+    def _generic_event_log_stream_method_handler(
+        self, method_handler: grpc.RpcMethodHandler, method_name: str
+    ) -> grpc.RpcMethodHandler:
+        def _log_stream(
+            request: GrpcMessage,
+            context: grpc.ServicerContext,
+            response_iterator: Iterator[GrpcMessage],
+        ) -> Iterator[GrpcMessage]:
+            # Log before call
+            log_entry = self.log_plugin.compose_log_before_event(
+                request=request,
+                context=context,
+                account_info=None,
+                method_name=method_name,
+            )
+            self.log_plugin.write_log(log_entry)
+
+            stream_response: Optional[GrpcMessage] = None
+            error: Optional[BaseException] = None
+            try:
+                # pylint: disable-next=use-yield-from
+                for stream_response in response_iterator:
+                    yield stream_response
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                # Log after the stream is consumed or interrupted
+                log_entry = self.log_plugin.compose_log_after_event(
+                    request=request,
+                    context=context,
+                    account_info=None,
+                    method_name=method_name,
+                    response=stream_response or error,
+                )
+                self.log_plugin.write_log(log_entry)
+
+        def _unary_stream_method_handler(
+            request: GrpcMessage, context: grpc.ServicerContext
+        ) -> Iterator[GrpcMessage]:
+            response_iterator = method_handler.unary_stream(request, context)
+            yield from _log_stream(request, context, response_iterator)
+
+        def _stream_stream_method_handler(
+            request_iterator: Iterator[GrpcMessage], context: grpc.ServicerContext
+        ) -> Iterator[GrpcMessage]:
+            # The first request of the stream is used for logging
+            first_request = next(request_iterator, None)
+            if first_request is None:
+                return
+            response_iterator = method_handler.stream_stream(
+                chain([first_request], request_iterator), context
+            )
+            yield from _log_stream(first_request, context, response_iterator)
+
+        if method_handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                _unary_stream_method_handler,
+                request_deserializer=method_handler.request_deserializer,
+                response_serializer=method_handler.response_serializer,
+            )
+        return grpc.stream_stream_rpc_method_handler(
+            _stream_stream_method_handler,
+            request_deserializer=method_handler.request_deserializer,
+            response_serializer=method_handler.response_serializer,
+        )
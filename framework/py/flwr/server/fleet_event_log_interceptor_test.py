@@ -25,6 +25,7 @@ from google.protobuf.message import Message as GrpcMessage
 from flwr.common.dummy_grpc_handlers_test import (
     NoOpUnaryUnaryHandlerException,
     NoOpUnsupportedHandler,
+    get_noop_unary_stream_handler,
     get_noop_unary_unary_handler,
 )
 from flwr.common.event_log_plugin import EventLogWriterPlugin
@@ -166,6 +167,29 @@ class TestFleetEventLogInterceptor(unittest.TestCase):
         expected_logs = self.get_expected_logs(expected_method_name)
         self.assertEqual(self.log_plugin.logs, expected_logs)
 
+    def test_unary_stream_interceptor(self) -> None:
+        """Test unary-stream RPC call logging."""
+        handler_call_details = MagicMock()
+        handler_call_details.method = "dummy_stream_method"
+        expected_method_name = handler_call_details.method
+        continuation = get_noop_unary_stream_handler
+        intercepted_handler = self.interceptor.intercept_service(
+            continuation, handler_call_details
+        )
+        expected_logs = self.get_expected_logs(expected_method_name)
+
+        # Execute: Invoke the intercepted unary_stream method
+        dummy_request = MagicMock()
+        dummy_context = MagicMock()
+        response_iterator = intercepted_handler.unary_stream(
+            dummy_request, dummy_context
+        )
+        responses = list(response_iterator)
+
+        # Assert: Verify responses and that logs were written before and after
+        self.assertEqual(responses, ["stream response 1", "stream response 2"])
+        self.assertEqual(self.log_plugin.logs, expected_logs)
+
     def test_unsupported_rpc_method(self) -> None:
         """Test that unsupported RPC method types raise NotImplementedError."""
 
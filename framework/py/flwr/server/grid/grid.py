@@ -15,11 +15,13 @@
 """Grid (abstract base class)."""
 
 
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Optional
 
 from flwr.common import Message, RecordDict
+from flwr.common.constant import WAIT_FOR_REPLIES_INTERVAL
 from flwr.common.typing import Run
 
 
@@ -125,6 +127,61 @@ class Grid(ABC):
             An iterable of messages received.
         """
 
+    def _wait_for_replies(  # pylint: disable=unused-argument
+        self, message_ids: set[str], timeout: float
+    ) -> None:
+        """Block until a reply to any of the given message IDs may be available.
+
+        Called by ``iter_replies`` between two pulls. Override this to return as soon
+        as a reply is stored instead of waiting for the full `timeout`.
+        """
+        if timeout > 0:
+            time.sleep(timeout)
+
+    def iter_replies(
+        self,
+        message_ids: Iterable[str],
+        *,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Message]:
+        """Yield the reply messages for the given message IDs as they arrive.
+
+        Unlike ``send_and_receive``, this allows processing replies, e.g.,
+        aggregating them, while waiting for the remaining ones. Replies are yielded
+        as soon as the SuperLink receives them.
+
+        Parameters
+        ----------
+        message_ids : Iterable[str]
+            An iterable of message IDs, as returned by ``push_messages``, for which
+            reply messages are to be retrieved.
+        timeout : Optional[float] (default: None)
+            The timeout duration in seconds. If specified, the iterator stops after
+            this duration, even if replies are missing. If `None`, there is no time
+            limit and the iterator stops once replies for all messages are received.
+
+        Returns
+        -------
+        replies : Iterator[Message]
+            An iterator over the reply messages received from the SuperLink.
+        """
+        msg_ids = set(message_ids)
+        end_time = time.time() + (timeout if timeout is not None else 0.0)
+        while timeout is None or time.time() < end_time:
+            res_msgs = list(self.pull_messages(msg_ids))
+            msg_ids.difference_update(
+                {msg.metadata.reply_to_message_id for msg in res_msgs}
+            )
+            yield from res_msgs
+            if len(msg_ids) == 0:
+                break
+            # Wait until the next reply is stored, but pull at least every
+            # `WAIT_FOR_REPLIES_INTERVAL` seconds to receive error replies
+            wait: float = WAIT_FOR_REPLIES_INTERVAL
+            if timeout is not None:
+                wait = min(wait, end_time - time.time())
+            self._wait_for_replies(msg_ids, wait)
+
     @abstractmethod
     def send_and_receive(
         self,
@@ -29,19 +29,14 @@ from flwr.common.constant import (
 )
 from flwr.common.grpc import create_channel, on_channel_state_change
 from flwr.common.inflatable import (
-    get_all_nested_objects,
-    get_object_tree,
+    get_all_nested_objects_and_tree,
     no_object_id_recompute,
 )
 from flwr.common.inflatable_grpc_utils import (
-    make_pull_object_fn_grpc,
-    make_push_object_fn_grpc,
-)
-from flwr.common.inflatable_utils import (
-    inflate_object_from_contents,
-    pull_objects,
-    push_objects,
+    pull_objects_stream_grpc,
+    push_objects_stream_grpc,
 )
+from flwr.common.inflatable_utils import inflate_object_from_contents
 from flwr.common.logger import log, warn_deprecated_feature
 from flwr.common.message import remove_content_from_message
 from flwr.common.retry_invoker import _make_simple_grpc_retry_invoker, _wrap_stub
@@ -61,6 +56,7 @@ from flwr.proto.run_pb2 import GetRunRequest, GetRunResponse  # pylint: disable=
 from flwr.proto.serverappio_pb2 import (  # pylint: disable=E0611
     GetNodesRequest,
     GetNodesResponse,
+    WaitForRepliesRequest,
 )
 from flwr.proto.serverappio_pb2_grpc import ServerAppIoStub  # pylint: disable=E0611
 
@@ -95,7 +91,7 @@ at once, or pull messages individually, for example:
 """
 
 
-class GrpcGrid(Grid):
+class GrpcGrid(Grid):  # pylint: disable=too-many-instance-attributes
     """`GrpcGrid` provides an interface to the ServerAppIo API.
 
     Parameters
@@ -122,6 +118,7 @@ class GrpcGrid(Grid):
         self._channel: Optional[grpc.Channel] = None
         self.node = Node(node_id=SUPERLINK_NODE_ID)
         self._retry_invoker = _make_simple_grpc_retry_invoker()
+        self._wait_for_replies_supported = True
         super().__init__()
 
     @property
@@ -220,9 +217,8 @@ class GrpcGrid(Grid):
     def _try_push_message(self, run_id: int, message: Message) -> str:
         """Push one message and its associated objects."""
         # Compute mapping of message descendants
-        all_objects = get_all_nested_objects(message)
+        all_objects, object_tree = get_all_nested_objects_and_tree(message)
         msg_id = message.object_id
-        object_tree = get_object_tree(message)
 
         # Call GrpcServerAppIoStub method
         res: PushAppMessagesResponse = self._stub.PushMessages(
@@ -238,13 +234,12 @@ class GrpcGrid(Grid):
         if msg_id is not None:
             obj_ids_to_push = set(res.objects_to_push[msg_id].object_ids)
             # Push only object that are not in the store
-            push_objects(
+            push_objects_stream_grpc(
                 all_objects,
-                push_object_fn=make_push_object_fn_grpc(
-                    push_object_grpc=self._stub.PushObject,
-                    node=self.node,
-                    run_id=run_id,
-                ),
+                push_objects_grpc=self._stub.PushObjects,
+                push_object_grpc=self._stub.PushObject,
+                node=self.node,
+                run_id=run_id,
                 object_ids_to_push=obj_ids_to_push,
             )
         return msg_id
@@ -306,13 +301,13 @@ class GrpcGrid(Grid):
             inflated_msgs: list[Message] = []
             for msg_proto in res.messages_list:
                 msg_id = msg_proto.metadata.message_id
-                all_object_contents = pull_objects(
+                all_object_contents = pull_objects_stream_grpc(
                     list(res.objects_to_pull[msg_id].object_ids) + [msg_id],
-                    pull_object_fn=make_pull_object_fn_grpc(
-                        pull_object_grpc=self._stub.PullObject,
-                        node=self.node,
-                        run_id=run_id,
-                    ),
+                    pull_objects_grpc=self._stub.PullObjects,
+                    get_objects_status_grpc=self._stub.GetObjectsStatus,
+                    pull_object_grpc=self._stub.PullObject,
+                    node=self.node,
+                    run_id=run_id,
                 )
 
                 # Confirm that the message has been received
@@ -335,6 +330,28 @@ class GrpcGrid(Grid):
                 return []
             raise
 
+    def _wait_for_replies(self, message_ids: set[str], timeout: float) -> None:
+        """Block until a reply is stored or `timeout` expires."""
+        if timeout <= 0:
+            return
+        if self._wait_for_replies_supported:
+            try:
+                self._stub.WaitForReplies(
+                    WaitForRepliesRequest(
+                        run_id=cast(Run, self._run).run_id,
+                        message_ids=message_ids,
+                        timeout=timeout,
+                    )
+                )
+                return
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:  # pylint: disable=E1101
+                    raise
+                # Fall back to polling if the SuperLink doesn't support long-polling
+                log(DEBUG, "SuperLink does not support `WaitForReplies`")
+                self._wait_for_replies_supported = False
+        time.sleep(timeout)
+
     def send_and_receive(
         self,
         messages: Iterable[Message],
@@ -348,22 +365,10 @@ class GrpcGrid(Grid):
         received or the specified timeout duration is exceeded.
         """
         # Push messages
-        msg_ids = set(self.push_messages(messages))
+        msg_ids = self.push_messages(messages)
 
         # Pull messages
-        end_time = time.time() + (timeout if timeout is not None else 0.0)
-        ret: list[Message] = []
-        while timeout is None or time.time() < end_time:
-            res_msgs = self.pull_messages(msg_ids)
-            ret.extend(res_msgs)
-            msg_ids.difference_update(
-                {msg.metadata.reply_to_message_id for msg in res_msgs}
-            )
-            if len(msg_ids) == 0:
-                break
-            # Sleep
-            time.sleep(3)
-        return ret
+        return list(self.iter_replies(msg_ids, timeout=timeout))
 
     def close(self) -> None:
         """Disconnect from the SuperLink if connected."""
@@ -37,7 +37,10 @@ from flwr.proto.run_pb2 import (  # pylint: disable=E0611
     GetRunResponse,
     Run,
 )
-from flwr.proto.serverappio_pb2 import GetNodesRequest  # pylint: disable=E0611
+from flwr.proto.serverappio_pb2 import (  # pylint: disable=E0611
+    GetNodesRequest,
+    WaitForRepliesRequest,
+)
 
 from .grpc_grid import GrpcGrid
 
@@ -133,7 +136,9 @@ class TestGrpcGrid(unittest.TestCase):
             mock_response_msg1,
             mock_response_msg2,
         ]
-        self.mock_stub.PushObject.return_value = Mock(stored=True)
+        self.mock_stub.PushObjects.side_effect = lambda reqs: (
+            Mock(object_id=req.object_id, stored=True) for req in reqs
+        )
 
         # Execute
         msg_ids = self.grid.push_messages(msgs)
@@ -179,11 +184,15 @@ class TestGrpcGrid(unittest.TestCase):
             },
         )
 
-        # Prepare: Mock response of PullObject
-        self.mock_stub.PullObject.side_effect = lambda req: Mock(
-            object_found=True,
-            object_available=True,
-            object_content=obj_store[req.object_id],
+        # Prepare: Mock response of PullObjects
+        self.mock_stub.PullObjects.side_effect = lambda req: (
+            Mock(
+                object_id=obj_id,
+                object_found=True,
+                object_available=True,
+                object_content=obj_store[obj_id],
+            )
+            for obj_id in req.object_ids
         )
 
         # Execute
@@ -200,7 +209,7 @@ class TestGrpcGrid(unittest.TestCase):
         self.assertEqual(msgs[0].content, ok_msg.content)
         self.assertEqual(msgs[1].metadata, err_msg.metadata)
         self.assertEqual(msgs[1].error, err_msg.error)
-        self.assertEqual(self.mock_stub.PullObject.call_count, len(obj_store))
+        self.assertEqual(self.mock_stub.PullObjects.call_count, 2)
 
     def test_send_and_receive_messages_complete(self) -> None:
         """Test send and receive all messages successfully."""
@@ -214,7 +223,9 @@ class TestGrpcGrid(unittest.TestCase):
                 ),
             },
         )
-        self.mock_stub.PushObject.return_value = Mock(stored=True)
+        self.mock_stub.PushObjects.side_effect = lambda reqs: (
+            Mock(object_id=req.object_id, stored=True) for req in reqs
+        )
 
         # Prepare: create an error reply message and mock responses
         reply = Message(Error(0), reply_to=msg)
@@ -225,8 +236,15 @@ class TestGrpcGrid(unittest.TestCase):
                 reply.object_id: Mock(object_ids=[reply.object_id]),
             },
         )
-        self.mock_stub.PullObject.return_value = Mock(
-            object_found=True, object_available=True, object_content=reply.deflate()
+        self.mock_stub.PullObjects.return_value = iter(
+            [
+                Mock(
+                    object_id=reply.object_id,
+                    object_found=True,
+                    object_available=True,
+                    object_content=reply.deflate(),
+                )
+            ]
         )
 
         # Execute
@@ -251,9 +269,14 @@ class TestGrpcGrid(unittest.TestCase):
             },
         )
         self.mock_stub.PushMessages.return_value = mock_response
-        self.mock_stub.PushObject.return_value = Mock(stored=True)
+        self.mock_stub.PushObjects.side_effect = lambda reqs: (
+            Mock(object_id=req.object_id, stored=True) for req in reqs
+        )
         mock_response = Mock(messages_list=[])
         self.mock_stub.PullMessages.return_value = mock_response
+        self.mock_stub.WaitForReplies.side_effect = lambda req: sleep_fn(
+            req.timeout * 0.01
+        )
 
         # Execute
         with patch("time.sleep", side_effect=lambda t: sleep_fn(t * 0.01)):
@@ -264,6 +287,37 @@ class TestGrpcGrid(unittest.TestCase):
         self.assertLess(time.time() - start_time, 0.2)
         self.assertEqual(len(ret_msgs), 0)
 
+    def test_wait_for_replies(self) -> None:
+        """Test waiting for replies uses the `WaitForReplies` long-poll."""
+        # Execute
+        with patch("time.sleep") as mock_sleep:
+            # pylint: disable-next=protected-access
+            self.grid._wait_for_replies({"mock_id"}, 1.5)
+
+        # Assert
+        self.mock_stub.WaitForReplies.assert_called_once_with(
+            WaitForRepliesRequest(run_id=61016, message_ids=["mock_id"], timeout=1.5)
+        )
+        mock_sleep.assert_not_called()
+
+    def test_wait_for_replies_falls_back_to_sleep(self) -> None:
+        """Test waiting for replies sleeps if `WaitForReplies` is unimplemented."""
+        # Prepare
+        grpc_exc = grpc.RpcError()
+        grpc_exc.code = lambda: grpc.StatusCode.UNIMPLEMENTED
+        self.mock_stub.WaitForReplies.side_effect = grpc_exc
+
+        # Execute
+        with patch("time.sleep") as mock_sleep:
+            for _ in range(2):
+                # pylint: disable-next=protected-access
+                self.grid._wait_for_replies({"mock_id"}, 1.5)
+
+        # Assert
+        self.mock_stub.WaitForReplies.assert_called_once()
+        self.assertEqual(mock_sleep.call_count, 2)
+        mock_sleep.assert_called_with(1.5)
+
     def test_del_with_initialized_grid(self) -> None:
         """Test cleanup behavior when Grid is initialized."""
         # Execute
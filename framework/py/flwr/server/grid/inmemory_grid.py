@@ -15,7 +15,6 @@
 """Flower in-memory Grid."""
 
 
-import time
 from collections.abc import Iterable
 from typing import Optional, cast
 from uuid import uuid4
@@ -38,7 +37,8 @@ class InMemoryGrid(Grid):
     state_factory : StateFactory
         A StateFactory embedding a state that this grid can interface with.
     pull_interval : float (default=0.1)
-        Sleep duration between calls to `pull_messages`.
+        Maximum time to wait between calls to `pull_messages`. Waiting ends early
+        once a reply is stored.
     """
 
     _deprecation_warning_logged = False
@@ -106,20 +106,17 @@ class InMemoryGrid(Grid):
         This method takes an iterable of messages and sends each message
         to the node specified in `dst_node_id`.
         """
-        msg_ids: list[str] = []
-        for msg in messages:
+        msg_list = list(messages)
+        for msg in msg_list:
             # Populate metadata
             msg.metadata.__dict__["_run_id"] = cast(Run, self._run).run_id
             msg.metadata.__dict__["_src_node_id"] = self.node.node_id
             msg.metadata.__dict__["_message_id"] = str(uuid4())
             # Check message
             self._check_message(msg)
-            # Store in state
-            msg_id = self.state.store_message_ins(msg)
-            if msg_id:
-                msg_ids.append(str(msg_id))
-
-        return msg_ids
+        # Store in state
+        msg_ids = self.state.store_message_ins_batch(msg_list)
+        return [str(msg_id) for msg_id in msg_ids if msg_id]
 
     def pull_messages(self, message_ids: Iterable[str]) -> Iterable[Message]:
         """Pull messages based on message IDs.
@@ -139,6 +136,13 @@ class InMemoryGrid(Grid):
 
         return message_res_list
 
+    def _wait_for_replies(self, message_ids: set[str], timeout: float) -> None:
+        """Block until a reply is stored or `timeout` expires."""
+        # Pull at least every `pull_interval` seconds to receive error replies
+        timeout = min(timeout, self.pull_interval)
+        if timeout > 0:
+            self.state.wait_for_message_res(message_ids, timeout)
+
     def send_and_receive(
         self,
         messages: Iterable[Message],
@@ -152,19 +156,7 @@ class InMemoryGrid(Grid):
         received or the specified timeout duration is exceeded.
         """
         # Push messages
-        msg_ids = set(self.push_messages(messages))
+        msg_ids = self.push_messages(messages)
 
         # Pull messages
-        end_time = time.time() + (timeout if timeout is not None else 0.0)
-        ret: list[Message] = []
-        while timeout is None or time.time() < end_time:
-            res_msgs = self.pull_messages(msg_ids)
-            ret.extend(res_msgs)
-            msg_ids.difference_update(
-                {msg.metadata.reply_to_message_id for msg in res_msgs}
-            )
-            if len(msg_ids) == 0:
-                break
-            # Sleep
-            time.sleep(self.pull_interval)
-        return ret
+        return list(self.iter_replies(msg_ids, timeout=timeout))
@@ -15,6 +15,7 @@
 """Tests for in-memory grid."""
 
 
+import threading
 import time
 import unittest
 from collections.abc import Iterable
@@ -123,7 +124,7 @@ class TestInMemoryGrid(unittest.TestCase):
         msgs = [Message(RecordDict(), 1, "query") for _ in range(num_messages)]
 
         msg_ids = [uuid4() for _ in range(num_messages)]
-        self.state.store_message_ins.side_effect = msg_ids
+        self.state.store_message_ins_batch.return_value = msg_ids
 
         # Execute
         msg_res_ids = list(self.grid.push_messages(msgs))
@@ -157,7 +158,7 @@ class TestInMemoryGrid(unittest.TestCase):
         msg_ids = [str(uuid4()) for _ in range(2)]
         message_res_list = create_message_replies_for_specific_ids(msg_ids)
         self.state.get_message_res.return_value = message_res_list
-        self.state.store_message_ins.side_effect = msg_ids
+        self.state.store_message_ins_batch.return_value = msg_ids[:1]
 
         # Execute
         ret_msgs = list(self.grid.send_and_receive(msgs))
@@ -174,7 +175,7 @@ class TestInMemoryGrid(unittest.TestCase):
         msg_ids = [str(uuid4()) for _ in range(2)]
         message_res_list = create_message_replies_for_specific_ids(msg_ids)
         self.state.get_message_res.return_value = message_res_list
-        self.state.store_message_ins.side_effect = msg_ids
+        self.state.store_message_ins_batch.return_value = msg_ids[:1]
 
         # Execute
         with patch("time.sleep", side_effect=lambda t: time.sleep(t * 0.01)):
@@ -233,6 +234,38 @@ class TestInMemoryGrid(unittest.TestCase):
         self.assertEqual(len(state.message_res_store), 0)
         self.assertEqual(len(state.message_ins_store), 0)
 
+    def test_iter_replies_without_waiting_for_pull_interval(self) -> None:
+        """Test that replies are yielded as soon as they are stored."""
+        # Prepare
+        state_factory = LinkStateFactory(":flwr-in-memory-state:")
+        state = state_factory.state()
+        run_id = state.create_run("", "", "", {}, ConfigRecord(), "")
+        self.grid = InMemoryGrid(state_factory, pull_interval=10)
+        self.grid.set_run(run_id=run_id)
+        msg_ids, node_id = push_messages(self.grid, num_nodes=1)
+        messages = state.get_message_ins(node_id, limit=None)
+
+        def reply() -> None:
+            for msg in messages:
+                time.sleep(0.1)
+                reply_msg = Message(RecordDict(), reply_to=msg)
+                reply_msg.metadata.__dict__["_message_id"] = str(uuid4())
+                state.store_message_res(message=reply_msg)
+
+        # Execute
+        start = time.monotonic()
+        thread = threading.Thread(target=reply)
+        thread.start()
+        reply_tos = [
+            msg.metadata.reply_to_message_id
+            for msg in self.grid.iter_replies(msg_ids, timeout=30)
+        ]
+        thread.join()
+
+        # Assert
+        self.assertEqual(reply_tos, [msg.metadata.message_id for msg in messages])
+        self.assertLess(time.monotonic() - start, 5)
+
 
 def create_message_replies_for_specific_ids(message_ids: list[str]) -> list[Message]:
     """Create reply Messages for a set of message IDs."""
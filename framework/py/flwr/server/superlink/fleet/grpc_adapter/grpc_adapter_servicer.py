@@ -42,6 +42,7 @@ from flwr.proto.grpcadapter_pb2 import MessageContainer  # pylint: disable=E0611
 from flwr.proto.heartbeat_pb2 import SendNodeHeartbeatRequest  # pylint: disable=E0611
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
     ConfirmMessageReceivedRequest,
+    GetObjectsStatusRequest,
     PullObjectRequest,
     PushObjectRequest,
 )
@@ -102,6 +103,10 @@ class GrpcAdapterServicer(grpcadapter_pb2_grpc.GrpcAdapterServicer, FleetService
             return _handle(request, context, PushObjectRequest, self.PushObject)
         if request.grpc_message_name == PullObjectRequest.__qualname__:
             return _handle(request, context, PullObjectRequest, self.PullObject)
+        if request.grpc_message_name == GetObjectsStatusRequest.__qualname__:
+            return _handle(
+                request, context, GetObjectsStatusRequest, self.GetObjectsStatus
+            )
         if request.grpc_message_name == ConfirmMessageReceivedRequest.__qualname__:
             return _handle(
                 request,
@@ -15,7 +15,8 @@
 """Tests for Fleet API gRPC adapter servicer."""
 
 
-from typing import get_type_hints
+from collections.abc import Iterator
+from typing import get_origin, get_type_hints
 from unittest.mock import Mock, patch
 
 from ..grpc_rere.fleet_servicer import FleetServicer
@@ -34,6 +35,9 @@ def test_rpc_completion() -> None:
 
         # Find the request type from the method's type hints
         type_hints = get_type_hints(method)
+        if get_origin(type_hints["return"]) is Iterator:
+            # Streaming RPCs are emulated with unary RPCs by the `GrpcAdapter`
+            continue
         request_type = type_hints["request"]
 
         # Patch the `_handle` method to simulate the request handling
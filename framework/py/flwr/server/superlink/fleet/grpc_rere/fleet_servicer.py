@@ -15,11 +15,20 @@
 """Fleet API gRPC request-response servicer."""
 
 
+import threading
+import time
+from collections.abc import Iterator
 from logging import DEBUG, INFO
 
 import grpc
 from google.protobuf.json_format import MessageToDict
 
+from flwr.common.constant import (
+    FLEET_MAX_CONCURRENT_LONG_POLLS,
+    OBJECT_STATUS_MAX_CONCURRENT_WAITS,
+    PULL_MESSAGES_MAX_WAIT,
+    PULL_MESSAGES_WAIT_INTERVAL,
+)
 from flwr.common.inflatable import UnexpectedObjectContentError
 from flwr.common.logger import log
 from flwr.common.typing import InvalidRunStatusException
@@ -42,10 +51,15 @@ from flwr.proto.heartbeat_pb2 import (  # pylint: disable=E0611
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
     ConfirmMessageReceivedRequest,
     ConfirmMessageReceivedResponse,
+    GetObjectsStatusRequest,
+    GetObjectsStatusResponse,
     PullObjectRequest,
     PullObjectResponse,
+    PullObjectsRequest,
+    PullObjectsResponse,
     PushObjectRequest,
     PushObjectResponse,
+    PushObjectsResponse,
 )
 from flwr.proto.run_pb2 import GetRunRequest, GetRunResponse  # pylint: disable=E0611
 from flwr.server.superlink.fleet.message_handler import message_handler
@@ -67,6 +81,13 @@ class FleetServicer(fleet_pb2_grpc.FleetServicer):
         self.state_factory = state_factory
         self.ffs_factory = ffs_factory
         self.objectstore_factory = objectstore_factory
+        # Each long-poll blocks a server thread, so their number is limited
+        self.long_poll_slots = threading.BoundedSemaphore(
+            FLEET_MAX_CONCURRENT_LONG_POLLS
+        )
+        self.object_status_slots = threading.BoundedSemaphore(
+            OBJECT_STATUS_MAX_CONCURRENT_WAITS
+        )
 
     def CreateNode(
         self, request: CreateNodeRequest, context: grpc.ServicerContext
@@ -113,11 +134,38 @@ class FleetServicer(fleet_pb2_grpc.FleetServicer):
         """Pull Messages."""
         log(INFO, "[Fleet.PullMessages] node_id=%s", request.node.node_id)
         log(DEBUG, "[Fleet.PullMessages] Request: %s", MessageToDict(request))
-        return message_handler.pull_messages(
-            request=request,
-            state=self.state_factory.state(),
-            store=self.objectstore_factory.store(),
-        )
+        state = self.state_factory.state()
+        store = self.objectstore_factory.store()
+
+        # Return immediately if not requested or no long-poll slot is free
+        timeout = min(max(request.timeout, 0.0), PULL_MESSAGES_MAX_WAIT)
+        # pylint: disable-next=R1732
+        if timeout <= 0 or not self.long_poll_slots.acquire(blocking=False):
+            return message_handler.pull_messages(
+                request=request, state=state, store=store
+            )
+
+        # Hold the request until a Message arrives or the timeout expires. Wait in
+        # short intervals to stop early if the RPC is terminated, e.g., because
+        # the SuperNode disconnected or the server is shutting down
+        try:
+            deadline = time.monotonic() + timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                response = message_handler.pull_messages(
+                    request=request,
+                    state=state,
+                    store=store,
+                    timeout=min(max(remaining, 0.0), PULL_MESSAGES_WAIT_INTERVAL),
+                )
+                if (
+                    response.messages_list
+                    or remaining <= PULL_MESSAGES_WAIT_INTERVAL
+                    or not context.is_active()
+                ):
+                    return response
+        finally:
+            self.long_poll_slots.release()
 
     def PushMessages(
         self, request: PushMessagesRequest, context: grpc.ServicerContext
@@ -224,6 +272,70 @@ class FleetServicer(fleet_pb2_grpc.FleetServicer):
 
         return res
 
+    def PushObjects(
+        self,
+        request_iterator: Iterator[PushObjectRequest],
+        context: grpc.ServicerContext,
+    ) -> Iterator[PushObjectsResponse]:
+        """Push a stream of objects to the ObjectStore."""
+        log(DEBUG, "[Fleet.PushObjects] Push a stream of objects")
+
+        try:
+            # Insert in Store, acknowledging each object
+            yield from message_handler.push_objects(
+                request_iterator=request_iterator,
+                state=self.state_factory.state(),
+                store=self.objectstore_factory.store(),
+            )
+        except InvalidRunStatusException as e:
+            abort_grpc_context(e.message, context)
+        except UnexpectedObjectContentError as e:
+            # Object content is not valid
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, str(e))
+
+    def PullObjects(
+        self, request: PullObjectsRequest, context: grpc.ServicerContext
+    ) -> Iterator[PullObjectsResponse]:
+        """Pull a stream of objects from the ObjectStore."""
+        log(
+            DEBUG,
+            "[Fleet.PullObjects] Pull %s objects",
+            len(request.object_ids),
+        )
+
+        try:
+            # Fetch from store
+            yield from message_handler.pull_objects(
+                request=request,
+                state=self.state_factory.state(),
+                store=self.objectstore_factory.store(),
+            )
+        except InvalidRunStatusException as e:
+            abort_grpc_context(e.message, context)
+
+    def GetObjectsStatus(
+        self, request: GetObjectsStatusRequest, context: grpc.ServicerContext
+    ) -> GetObjectsStatusResponse:
+        """Get the availability of multiple objects in the ObjectStore."""
+        log(
+            DEBUG,
+            "[Fleet.GetObjectsStatus] Get status of %s objects",
+            len(request.object_ids),
+        )
+
+        try:
+            # Check availability in store
+            res = message_handler.get_objects_status(
+                request=request,
+                state=self.state_factory.state(),
+                store=self.objectstore_factory.store(),
+                wait_slots=self.object_status_slots,
+            )
+        except InvalidRunStatusException as e:
+            abort_grpc_context(e.message, context)
+
+        return res
+
     def ConfirmMessageReceived(
         self, request: ConfirmMessageReceivedRequest, context: grpc.ServicerContext
     ) -> ConfirmMessageReceivedResponse:
@@ -16,6 +16,8 @@
 
 
 import tempfile
+import threading
+import time
 import unittest
 
 import grpc
@@ -46,11 +48,16 @@ from flwr.proto.fleet_pb2 import (  # pylint: disable=E0611
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
     ConfirmMessageReceivedRequest,
     ConfirmMessageReceivedResponse,
+    GetObjectsStatusRequest,
+    GetObjectsStatusResponse,
     ObjectTree,
     PullObjectRequest,
     PullObjectResponse,
+    PullObjectsRequest,
+    PullObjectsResponse,
     PushObjectRequest,
     PushObjectResponse,
+    PushObjectsResponse,
 )
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 from flwr.proto.run_pb2 import GetRunRequest, GetRunResponse  # pylint: disable=E0611
@@ -65,7 +72,7 @@ from flwr.supercore.ffs import FfsFactory
 from flwr.supercore.object_store import ObjectStoreFactory
 
 
-class TestFleetServicer(unittest.TestCase):  # pylint: disable=R0902
+class TestFleetServicer(unittest.TestCase):  # pylint: disable=R0902,R0904
     """FleetServicer tests for allowed RunStatuses."""
 
     def setUp(self) -> None:
@@ -123,6 +130,21 @@ class TestFleetServicer(unittest.TestCase):  # pylint: disable=R0902
             request_serializer=PullObjectRequest.SerializeToString,
             response_deserializer=PullObjectResponse.FromString,
         )
+        self._push_objects = self._channel.stream_stream(
+            "/flwr.proto.Fleet/PushObjects",
+            request_serializer=PushObjectRequest.SerializeToString,
+            response_deserializer=PushObjectsResponse.FromString,
+        )
+        self._pull_objects = self._channel.unary_stream(
+            "/flwr.proto.Fleet/PullObjects",
+            request_serializer=PullObjectsRequest.SerializeToString,
+            response_deserializer=PullObjectsResponse.FromString,
+        )
+        self._get_objects_status = self._channel.unary_unary(
+            "/flwr.proto.Fleet/GetObjectsStatus",
+            request_serializer=GetObjectsStatusRequest.SerializeToString,
+            response_deserializer=GetObjectsStatusResponse.FromString,
+        )
         self._confirm_message_received = self._channel.unary_unary(
             "/flwr.proto.Fleet/ConfirmMessageReceived",
             request_serializer=ConfirmMessageReceivedRequest.SerializeToString,
@@ -280,6 +302,47 @@ class TestFleetServicer(unittest.TestCase):  # pylint: disable=R0902
             # Ins message was deleted
             assert self.state.num_message_ins() == 0
 
+    def test_pull_messages_long_poll(self) -> None:
+        """Test `PullMessages` holds the request until a Message is available."""
+        # Prepare
+        node_id = self.state.create_node(heartbeat_interval=30)
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        self._transition_run_status(run_id, 2)
+        message_ins = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+            )
+        )
+        # pylint: disable-next=W0212
+        message_ins.metadata._message_id = message_ins.object_id  # type: ignore
+        self.store.preregister(run_id, get_object_tree(message_ins))
+        timer = threading.Timer(0.3, self.state.store_message_ins, (message_ins,))
+
+        # Execute
+        request = PullMessagesRequest(node=Node(node_id=node_id), timeout=10)
+        timer.start()
+        start = time.monotonic()
+        response: PullMessagesResponse = self._pull_messages(request)
+        timer.join()
+
+        # Assert: Returned once the Message was stored
+        self.assertEqual(len(response.messages_list), 1)
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_pull_messages_long_poll_timeout(self) -> None:
+        """Test `PullMessages` returns after the timeout without Messages."""
+        # Prepare
+        node_id = self.state.create_node(heartbeat_interval=30)
+
+        # Execute
+        request = PullMessagesRequest(node=Node(node_id=node_id), timeout=0.3)
+        start = time.monotonic()
+        response: PullMessagesResponse = self._pull_messages(request)
+
+        # Assert
+        self.assertEqual(len(response.messages_list), 0)
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+
     def test_successful_get_run_if_running(self) -> None:
         """Test `GetRun` success."""
         # Prepare
@@ -499,6 +562,135 @@ class TestFleetServicer(unittest.TestCase):  # pylint: disable=R0902
         # Empty response
         assert not res.object_found
 
+    def test_push_objects_successful(self) -> None:
+        """Test `PushObjects` acknowledges every object in the stream."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        node_id = self.state.create_node(heartbeat_interval=30)
+        objs = [ConfigRecord({"a": i}) for i in range(3)]
+        self._transition_run_status(run_id, 2)
+        for obj in objs:
+            self.store.preregister(run_id, get_object_tree(obj))
+
+        # Execute
+        reqs = [
+            PushObjectRequest(
+                node=Node(node_id=node_id),
+                run_id=run_id,
+                object_id=obj.object_id,
+                object_content=obj.deflate(),
+            )
+            for obj in objs
+        ]
+        res: list[PushObjectsResponse] = list(self._push_objects(iter(reqs)))
+
+        # Assert
+        self.assertEqual([r.object_id for r in res], [o.object_id for o in objs])
+        self.assertTrue(all(r.stored for r in res))
+        for obj in objs:
+            self.assertEqual(self.store.get(obj.object_id), obj.deflate())
+
+    def test_push_objects_fails_if_not_running(self) -> None:
+        """Test `PushObjects` is not allowed if the run is not running."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        req = PushObjectRequest(node=Node(node_id=123), run_id=run_id)
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError) as e:
+            list(self._push_objects(iter([req])))
+        assert e.exception.code() == grpc.StatusCode.PERMISSION_DENIED
+
+    def test_pull_objects(self) -> None:
+        """Test `PullObjects` streams found, pending and unknown objects."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        self._transition_run_status(run_id, 2)
+        node_id = self.state.create_node(heartbeat_interval=30)
+        obj1 = ConfigRecord({"a": 1})
+        obj2 = ConfigRecord({"a": 2})
+        self.store.preregister(run_id, get_object_tree(obj1))
+        self.store.preregister(run_id, get_object_tree(obj2))
+        self.store.put(obj1.object_id, obj1.deflate())
+
+        # Execute
+        req = PullObjectsRequest(
+            node=Node(node_id=node_id),
+            run_id=run_id,
+            object_ids=[obj1.object_id, obj2.object_id, "1234"],
+        )
+        res: list[PullObjectsResponse] = list(self._pull_objects(req))
+
+        # Assert
+        self.assertEqual(len(res), 3)
+        assert res[0].object_found and res[0].object_available
+        self.assertEqual(res[0].object_content, obj1.deflate())
+        assert res[1].object_found and not res[1].object_available
+        assert not res[2].object_found
+
+    def test_get_objects_status(self) -> None:
+        """Test `GetObjectsStatus` returns the availability of objects."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        self._transition_run_status(run_id, 2)
+        node_id = self.state.create_node(heartbeat_interval=30)
+        obj1 = ConfigRecord({"a": 1})
+        obj2 = ConfigRecord({"a": 2})
+        self.store.preregister(run_id, get_object_tree(obj1))
+        self.store.preregister(run_id, get_object_tree(obj2))
+        self.store.put(obj1.object_id, obj1.deflate())
+
+        # Execute
+        req = GetObjectsStatusRequest(
+            node=Node(node_id=node_id),
+            run_id=run_id,
+            object_ids=[obj1.object_id, obj2.object_id, "1234"],
+        )
+        res: GetObjectsStatusResponse = self._get_objects_status(req)
+
+        # Assert: Objects that are not pre-registered are omitted
+        self.assertEqual(
+            dict(res.object_availability),
+            {obj1.object_id: True, obj2.object_id: False},
+        )
+
+    def test_get_objects_status_long_poll(self) -> None:
+        """Test `GetObjectsStatus` holds the request until an object is available."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        self._transition_run_status(run_id, 2)
+        node_id = self.state.create_node(heartbeat_interval=30)
+        obj = ConfigRecord({"a": 1})
+        self.store.preregister(run_id, get_object_tree(obj))
+        timer = threading.Timer(0.3, self.store.put, (obj.object_id, obj.deflate()))
+
+        # Execute
+        req = GetObjectsStatusRequest(
+            node=Node(node_id=node_id),
+            run_id=run_id,
+            object_ids=[obj.object_id],
+            timeout=10,
+        )
+        timer.start()
+        start = time.monotonic()
+        res: GetObjectsStatusResponse = self._get_objects_status(req)
+        timer.join()
+
+        # Assert: Returned once the object became available
+        self.assertEqual(dict(res.object_availability), {obj.object_id: True})
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_get_objects_status_fails_if_not_running(self) -> None:
+        """Test `GetObjectsStatus` is not allowed if the run is not running."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        req = GetObjectsStatusRequest(node=Node(node_id=123), run_id=run_id)
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError) as e:
+            self._get_objects_status(req)
+        assert e.exception.code() == grpc.StatusCode.PERMISSION_DENIED
+
     def test_confirm_message_received_successful(self) -> None:
         """Test `ConfirmMessageReceived` functionality."""
         # Prepare
@@ -16,14 +16,28 @@
 
 
 import datetime
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
 from typing import Any, Callable, Optional, cast
 
 import grpc
+from cryptography.hazmat.primitives.asymmetric import ec
 from google.protobuf.message import Message as GrpcMessage
 
 from flwr.common import now
 from flwr.common.constant import (
     PUBLIC_KEY_HEADER,
+    SESSION_ID_HEADER,
+    SESSION_MAC_HEADER,
+    SESSION_PUBLIC_KEY_HEADER,
+    SESSION_REQUEST_HEADER,
+    SESSION_TTL,
+    SESSION_TTL_HEADER,
     SIGNATURE_HEADER,
     SYSTEM_TIME_TOLERANCE,
     TIMESTAMP_HEADER,
@@ -31,11 +45,14 @@ from flwr.common.constant import (
 )
 from flwr.common.secure_aggregation.crypto.symmetric_encryption import (
     bytes_to_public_key,
+    generate_shared_key,
+    public_key_to_bytes,
     verify_signature,
 )
 from flwr.proto.fleet_pb2 import (  # pylint: disable=E0611
     CreateNodeRequest,
     CreateNodeResponse,
+    DeleteNodeResponse,
 )
 from flwr.server.superlink.linkstate import LinkStateFactory
 
@@ -53,6 +70,16 @@ def _unary_unary_rpc_terminator(
     return grpc.unary_unary_rpc_method_handler(terminate)
 
 
+@dataclass(frozen=True)
+class _Session:
+    """Authentication session of a node."""
+
+    key: bytes
+    node_id: int
+    public_key: bytes
+    expires_at: float
+
+
 class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
     """Server interceptor for node authentication.
 
@@ -64,11 +91,30 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
         If True, nodes are authenticated without requiring their public keys to be
         pre-stored in the LinkState. If False, only nodes with pre-stored public keys
         can be authenticated.
+    session_ttl : float (default: SESSION_TTL)
+        Lifetime in seconds of the sessions issued to nodes. After a node has been
+        authenticated by its signature, it can authenticate subsequent calls with an
+        HMAC using the session key instead, which is much cheaper to verify.
+
+    The session key is never sent. The SuperLink sends the public key of an ephemeral
+    key pair instead, and both sides derive the session key by ECDH between that key
+    pair and the key pair of the node. Sessions therefore do not rely on TLS, and an
+    eavesdropper on an insecure Fleet API cannot obtain the key.
     """
 
-    def __init__(self, state_factory: LinkStateFactory, auto_auth: bool = False):
+    def __init__(
+        self,
+        state_factory: LinkStateFactory,
+        auto_auth: bool = False,
+        session_ttl: float = SESSION_TTL,
+    ):
         self.state_factory = state_factory
         self.auto_auth = auto_auth
+        self.session_ttl = session_ttl
+        self.sessions: dict[bytes, _Session] = {}
+        self.node_sessions: dict[int, bytes] = {}
+        self.sessions_lock = threading.Lock()
+        self.next_session_cleanup = time.monotonic() + session_ttl
 
     def intercept_service(  # pylint: disable=too-many-return-statements
         self,
@@ -91,23 +137,44 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
         state = self.state_factory.state()
         metadata_dict = dict(handler_call_details.invocation_metadata)
 
-        # Retrieve info from the metadata
+        # Retrieve info from the metadata. Calls authenticated by a session carry no
+        # signature
         try:
             node_pk_bytes = cast(bytes, metadata_dict[PUBLIC_KEY_HEADER])
             timestamp_iso = cast(str, metadata_dict[TIMESTAMP_HEADER])
-            signature = cast(bytes, metadata_dict[SIGNATURE_HEADER])
         except KeyError:
             return _unary_unary_rpc_terminator("Missing authentication metadata")
+        signature = cast(Optional[bytes], metadata_dict.get(SIGNATURE_HEADER))
+
+        # Authenticate the node by its session if it has a valid one, which avoids
+        # verifying the signature
+        expected_node_id = self._verify_session(
+            metadata_dict, node_pk_bytes, timestamp_iso
+        )
+        issue_session = False
+        if expected_node_id is None:
+            if signature is None:
+                # The node retries with a signature if its session is unknown
+                if SESSION_ID_HEADER in metadata_dict:
+                    return _unary_unary_rpc_terminator("Invalid session")
+                return _unary_unary_rpc_terminator("Missing authentication metadata")
+            if not self.auto_auth:
+                # Abort the RPC call if the node public key is not found
+                if node_pk_bytes not in state.get_node_public_keys():
+                    return _unary_unary_rpc_terminator("Public key not recognized")
 
-        if not self.auto_auth:
-            # Abort the RPC call if the node public key is not found
-            if node_pk_bytes not in state.get_node_public_keys():
-                return _unary_unary_rpc_terminator("Public key not recognized")
+            # Verify the signature
+            node_pk = bytes_to_public_key(node_pk_bytes)
+            if not verify_signature(node_pk, timestamp_iso.encode("ascii"), signature):
+                return _unary_unary_rpc_terminator("Invalid signature")
 
-        # Verify the signature
-        node_pk = bytes_to_public_key(node_pk_bytes)
-        if not verify_signature(node_pk, timestamp_iso.encode("ascii"), signature):
-            return _unary_unary_rpc_terminator("Invalid signature")
+            expected_node_id = state.get_node_id(node_pk_bytes)
+            # Issue a session if requested or if the session of the node is invalid,
+            # e.g., because it expired or the SuperLink restarted
+            issue_session = (
+                SESSION_REQUEST_HEADER in metadata_dict
+                or SESSION_ID_HEADER in metadata_dict
+            )
 
         # Verify the timestamp
         current = now()
@@ -117,7 +184,6 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
             return _unary_unary_rpc_terminator("Invalid timestamp")
 
         # Continue the RPC call
-        expected_node_id = state.get_node_id(node_pk_bytes)
         if not handler_call_details.method.endswith("CreateNode"):
             # All calls, except for `CreateNode`, must provide a public key that is
             # already mapped to a `node_id` (in `LinkState`)
@@ -127,20 +193,98 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
         # `flwr.server.superlink.fleet.grpc_rere.fleet_server.FleetServicer`
         method_handler: grpc.RpcMethodHandler = continuation(handler_call_details)
         return self._wrap_method_handler(
-            method_handler, expected_node_id, node_pk_bytes
+            method_handler, expected_node_id, node_pk_bytes, issue_session
         )
 
+    def _verify_session(
+        self,
+        metadata_dict: dict[str, Any],
+        node_public_key: bytes,
+        timestamp_iso: str,
+    ) -> Optional[int]:
+        """Return the node ID if the call is authenticated by a valid session."""
+        session_id = metadata_dict.get(SESSION_ID_HEADER)
+        session_mac = metadata_dict.get(SESSION_MAC_HEADER)
+        if session_id is None or session_mac is None:
+            return None
+
+        with self.sessions_lock:
+            session = self.sessions.get(session_id)
+        if (
+            session is None
+            or session.expires_at < time.monotonic()
+            or session.public_key != node_public_key
+        ):
+            return None
+
+        # Verify the MAC of the timestamp in constant time
+        expected_mac = hmac.digest(
+            session.key, timestamp_iso.encode("ascii"), hashlib.sha256
+        )
+        if not hmac.compare_digest(expected_mac, session_mac):
+            return None
+        return session.node_id
+
+    def _create_session(
+        self, node_id: int, node_public_key: bytes
+    ) -> Sequence[tuple[str, Any]]:
+        """Create a session for the node, replacing its previous one.
+
+        Return the trailing metadata that hands the session over to the node. It holds
+        the public key from which the node derives the session key, not the key itself.
+        """
+        node_pk = bytes_to_public_key(node_public_key)
+        ephemeral_sk = ec.generate_private_key(node_pk.curve)
+        session_id = secrets.token_bytes(16)
+        session = _Session(
+            key=generate_shared_key(ephemeral_sk, node_pk),
+            node_id=node_id,
+            public_key=node_public_key,
+            expires_at=time.monotonic() + self.session_ttl,
+        )
+        with self.sessions_lock:
+            self._remove_expired_sessions()
+            self._remove_session(node_id)
+            self.sessions[session_id] = session
+            self.node_sessions[node_id] = session_id
+        return (
+            (SESSION_ID_HEADER, session_id),
+            (SESSION_PUBLIC_KEY_HEADER, public_key_to_bytes(ephemeral_sk.public_key())),
+            (SESSION_TTL_HEADER, str(self.session_ttl)),
+        )
+
+    def _remove_session(self, node_id: int) -> None:
+        """Remove the session of the node, if any.
+
+        Must be called while holding `sessions_lock`.
+        """
+        if (session_id := self.node_sessions.pop(node_id, None)) is not None:
+            del self.sessions[session_id]
+
+    def _remove_expired_sessions(self) -> None:
+        """Remove expired sessions at most once per session lifetime.
+
+        Must be called while holding `sessions_lock`.
+        """
+        current = time.monotonic()
+        if current < self.next_session_cleanup:
+            return
+        self.next_session_cleanup = current + self.session_ttl
+        for session_id, session in list(self.sessions.items()):
+            if session.expires_at < current:
+                del self.sessions[session_id]
+                del self.node_sessions[session.node_id]
+
     def _wrap_method_handler(
         self,
         method_handler: grpc.RpcMethodHandler,
         expected_node_id: Optional[int],
         node_public_key: bytes,
+        issue_session: bool,
     ) -> grpc.RpcMethodHandler:
-        def _generic_method_handler(
-            request: GrpcMessage,
-            context: grpc.ServicerContext,
-        ) -> GrpcMessage:
-            # Verify the node ID
+        def _verify_node_id(
+            request: GrpcMessage, context: grpc.ServicerContext
+        ) -> None:
             if not isinstance(request, CreateNodeRequest):
                 try:
                     if request.node.node_id != expected_node_id:  # type: ignore
@@ -148,6 +292,13 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
                 except (AttributeError, ValueError):
                     context.abort(grpc.StatusCode.UNAUTHENTICATED, "Invalid node ID")
 
+        def _generic_method_handler(
+            request: GrpcMessage,
+            context: grpc.ServicerContext,
+        ) -> GrpcMessage:
+            # Verify the node ID
+            _verify_node_id(request, context)
+
             response: GrpcMessage = method_handler.unary_unary(request, context)
 
             # Set the public key after a successful CreateNode request
@@ -160,8 +311,50 @@ class AuthenticateServerInterceptor(grpc.ServerInterceptor):  # type: ignore
                     state.delete_node(response.node.node_id)
                     context.abort(grpc.StatusCode.UNAUTHENTICATED, str(e))
 
+            if expected_node_id is not None:
+                # Invalidate the session of a deleted node
+                if isinstance(response, DeleteNodeResponse):
+                    with self.sessions_lock:
+                        self._remove_session(expected_node_id)
+                elif issue_session:
+                    context.set_trailing_metadata(
+                        self._create_session(expected_node_id, node_public_key)
+                    )
+
             return response
 
+        def _unary_stream_method_handler(
+            request: GrpcMessage,
+            context: grpc.ServicerContext,
+        ) -> Iterator[GrpcMessage]:
+            # Verify the node ID
+            _verify_node_id(request, context)
+            yield from method_handler.unary_stream(request, context)
+
+        def _stream_stream_method_handler(
+            request_iterator: Iterator[GrpcMessage],
+            context: grpc.ServicerContext,
+        ) -> Iterator[GrpcMessage]:
+            def verified_requests() -> Iterator[GrpcMessage]:
+                # Verify the node ID of every request in the stream
+                for request in request_iterator:
+                    _verify_node_id(request, context)
+                    yield request
+
+            yield from method_handler.stream_stream(verified_requests(), context)
+
+        if method_handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                _unary_stream_method_handler,
+                request_deserializer=method_handler.request_deserializer,
+                response_serializer=method_handler.response_serializer,
+            )
+        if method_handler.stream_stream:
+            return grpc.stream_stream_rpc_method_handler(
+                _stream_stream_method_handler,
+                request_deserializer=method_handler.request_deserializer,
+                response_serializer=method_handler.response_serializer,
+            )
         return grpc.unary_unary_rpc_method_handler(
             _generic_method_handler,
             request_deserializer=method_handler.request_deserializer,
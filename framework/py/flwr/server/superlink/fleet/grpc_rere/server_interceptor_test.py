@@ -16,6 +16,9 @@
 
 
 import datetime
+import hashlib
+import hmac
+import tempfile
 import unittest
 from typing import Any, Callable
 
@@ -26,13 +29,20 @@ from flwr.common import ConfigRecord, now
 from flwr.common.constant import (
     FLEET_API_GRPC_RERE_DEFAULT_ADDRESS,
     PUBLIC_KEY_HEADER,
+    SESSION_ID_HEADER,
+    SESSION_MAC_HEADER,
+    SESSION_PUBLIC_KEY_HEADER,
+    SESSION_REQUEST_HEADER,
+    SESSION_TTL_HEADER,
     SIGNATURE_HEADER,
     SUPERLINK_NODE_ID,
     TIMESTAMP_HEADER,
     Status,
 )
 from flwr.common.secure_aggregation.crypto.symmetric_encryption import (
+    bytes_to_public_key,
     generate_key_pairs,
+    generate_shared_key,
     public_key_to_bytes,
     sign_message,
 )
@@ -53,10 +63,15 @@ from flwr.proto.heartbeat_pb2 import (  # pylint: disable=E0611
     SendNodeHeartbeatResponse,
 )
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
+    GetObjectsStatusRequest,
+    GetObjectsStatusResponse,
     PullObjectRequest,
     PullObjectResponse,
+    PullObjectsRequest,
+    PullObjectsResponse,
     PushObjectRequest,
     PushObjectResponse,
+    PushObjectsResponse,
 )
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 from flwr.proto.run_pb2 import GetRunRequest, GetRunResponse  # pylint: disable=E0611
@@ -78,7 +93,8 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
 
         state_factory = LinkStateFactory(":flwr-in-memory-state:")
         self.state = state_factory.state()
-        ffs_factory = FfsFactory(".")
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        ffs_factory = FfsFactory(self.temp_dir.name)
         self.ffs = ffs_factory.ffs()
         objectstore_factory = ObjectStoreFactory()
         self.state.store_node_public_keys({public_key_to_bytes(self.node_pk)})
@@ -125,6 +141,21 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
             request_serializer=PushObjectRequest.SerializeToString,
             response_deserializer=PushObjectResponse.FromString,
         )
+        self._pull_objects = self._channel.unary_stream(
+            "/flwr.proto.Fleet/PullObjects",
+            request_serializer=PullObjectsRequest.SerializeToString,
+            response_deserializer=PullObjectsResponse.FromString,
+        )
+        self._push_objects = self._channel.stream_stream(
+            "/flwr.proto.Fleet/PushObjects",
+            request_serializer=PushObjectRequest.SerializeToString,
+            response_deserializer=PushObjectsResponse.FromString,
+        )
+        self._get_objects_status = self._channel.unary_unary(
+            "/flwr.proto.Fleet/GetObjectsStatus",
+            request_serializer=GetObjectsStatusRequest.SerializeToString,
+            response_deserializer=GetObjectsStatusResponse.FromString,
+        )
         self._get_run = self._channel.unary_unary(
             "/flwr.proto.Fleet/GetRun",
             request_serializer=GetRunRequest.SerializeToString,
@@ -144,6 +175,7 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
     def tearDown(self) -> None:
         """Clean up grpc server."""
         self._server.stop(None)
+        self.temp_dir.cleanup()
 
     def _make_metadata(self) -> list[Any]:
         """Create metadata with signature and timestamp."""
@@ -246,6 +278,48 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         )
         return self._push_object.with_call(request=req, metadata=metadata)
 
+    def _test_pull_objects(self, metadata: list[Any]) -> Any:
+        """Test PullObjects."""
+        node_id = self._create_node_and_set_public_key()
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        # Transition status to running. PullObjects is only allowed in running status.
+        self.state.update_run_status(run_id, RunStatus(Status.STARTING, "", ""))
+        self.state.update_run_status(run_id, RunStatus(Status.RUNNING, "", ""))
+        req = PullObjectsRequest(
+            node=Node(node_id=node_id), run_id=run_id, object_ids=["1234"]
+        )
+        call = self._pull_objects(req, metadata=metadata)
+        return list(call), call
+
+    def _test_push_objects(self, metadata: list[Any]) -> Any:
+        """Test PushObjects."""
+        node_id = self._create_node_and_set_public_key()
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        # Transition status to running. PushObjects is only allowed in running status.
+        self.state.update_run_status(run_id, RunStatus(Status.STARTING, "", ""))
+        self.state.update_run_status(run_id, RunStatus(Status.RUNNING, "", ""))
+        req = PushObjectRequest(
+            node=Node(node_id=node_id),
+            run_id=run_id,
+            object_id="1234",
+            object_content=b"1234",
+        )
+        call = self._push_objects(iter([req, req]), metadata=metadata)
+        return list(call), call
+
+    def _test_get_objects_status(self, metadata: list[Any]) -> Any:
+        """Test GetObjectsStatus."""
+        node_id = self._create_node_and_set_public_key()
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        # Transition status to running. GetObjectsStatus is only allowed in running
+        # status.
+        self.state.update_run_status(run_id, RunStatus(Status.STARTING, "", ""))
+        self.state.update_run_status(run_id, RunStatus(Status.RUNNING, "", ""))
+        req = GetObjectsStatusRequest(
+            node=Node(node_id=node_id), run_id=run_id, object_ids=["1234"]
+        )
+        return self._get_objects_status.with_call(request=req, metadata=metadata)
+
     def _test_get_run(self, metadata: list[Any]) -> Any:
         """Test GetRun."""
         node_id = self._create_node_and_set_public_key()
@@ -291,6 +365,9 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
             (_test_push_messages,),
             (_test_pull_object,),
             (_test_push_object,),
+            (_test_pull_objects,),
+            (_test_push_objects,),
+            (_test_get_objects_status,),
             (_test_get_run,),
             (_test_send_node_heartbeat,),
             (_test_get_fab,),
@@ -314,6 +391,9 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
             (_test_push_messages,),
             (_test_pull_object,),
             (_test_push_object,),
+            (_test_pull_objects,),
+            (_test_push_objects,),
+            (_test_get_objects_status,),
             (_test_get_run,),
             (_test_send_node_heartbeat,),
             (_test_get_fab,),
@@ -336,6 +416,9 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
             (_test_push_messages,),
             (_test_pull_object,),
             (_test_push_object,),
+            (_test_pull_objects,),
+            (_test_push_objects,),
+            (_test_get_objects_status,),
             (_test_get_run,),
             (_test_send_node_heartbeat,),
             (_test_get_fab,),
@@ -358,6 +441,9 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
             (_test_push_messages,),
             (_test_pull_object,),
             (_test_push_object,),
+            (_test_pull_objects,),
+            (_test_push_objects,),
+            (_test_get_objects_status,),
             (_test_get_run,),
             (_test_send_node_heartbeat,),
             (_test_get_fab,),
@@ -371,3 +457,117 @@ class TestServerInterceptor(unittest.TestCase):  # pylint: disable=R0902
         with self.assertRaises(grpc.RpcError) as cm:
             rpc(self, self._make_metadata_with_invalid_timestamp())
         assert cm.exception.code() == grpc.StatusCode.UNAUTHENTICATED
+
+    def _request_session(self, node_id: int) -> tuple[bytes, bytes]:
+        """Request a session with a signed call and return its ID and derived key."""
+        req = SendNodeHeartbeatRequest(node=Node(node_id=node_id))
+        metadata = self._make_metadata() + [(SESSION_REQUEST_HEADER, "1")]
+        _, call = self._send_node_heartbeat.with_call(request=req, metadata=metadata)
+        trailing_metadata = dict(call.trailing_metadata())
+        assert SESSION_TTL_HEADER in trailing_metadata
+        # The session key itself is never sent
+        session_pk = bytes_to_public_key(trailing_metadata[SESSION_PUBLIC_KEY_HEADER])
+        return (
+            trailing_metadata[SESSION_ID_HEADER],
+            generate_shared_key(self.node_sk, session_pk),
+        )
+
+    def _make_session_metadata(self, session_id: bytes, key: bytes) -> list[Any]:
+        """Create metadata with session MAC and invalid signature."""
+        metadata = self._make_metadata_with_invalid_signature()
+        timestamp = dict(metadata)[TIMESTAMP_HEADER]
+        mac = hmac.digest(key, timestamp.encode("ascii"), hashlib.sha256)
+        return metadata + [(SESSION_ID_HEADER, session_id), (SESSION_MAC_HEADER, mac)]
+
+    def test_successful_rpc_with_session(self) -> None:
+        """Test that calls with a valid session skip signature verification."""
+        # Prepare
+        node_id = self._create_node_and_set_public_key()
+        session_id, key = self._request_session(node_id)
+        req = SendNodeHeartbeatRequest(node=Node(node_id=node_id))
+
+        # Execute
+        _, call = self._send_node_heartbeat.with_call(
+            request=req, metadata=self._make_session_metadata(session_id, key)
+        )
+
+        # Assert
+        assert call.code() == grpc.StatusCode.OK
+
+    def test_successful_rpc_with_session_without_signature(self) -> None:
+        """Test that calls authenticated by a valid session need no signature."""
+        # Prepare
+        node_id = self._create_node_and_set_public_key()
+        session_id, key = self._request_session(node_id)
+        req = SendNodeHeartbeatRequest(node=Node(node_id=node_id))
+        metadata = [
+            (k, v)
+            for k, v in self._make_session_metadata(session_id, key)
+            if k != SIGNATURE_HEADER
+        ]
+
+        # Execute
+        _, call = self._send_node_heartbeat.with_call(request=req, metadata=metadata)
+
+        # Assert
+        assert call.code() == grpc.StatusCode.OK
+
+    def test_unsuccessful_rpc_with_unknown_session_without_signature(self) -> None:
+        """Test that calls with an unknown session and no signature are rejected."""
+        # Prepare
+        node_id = self._create_node_and_set_public_key()
+        req = SendNodeHeartbeatRequest(node=Node(node_id=node_id))
+        metadata = [
+            (k, v)
+            for k, v in self._make_session_metadata(b"unknown", b"key")
+            if k != SIGNATURE_HEADER
+        ]
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError) as cm:
+            self._send_node_heartbeat.with_call(request=req, metadata=metadata)
+        assert cm.exception.code() == grpc.StatusCode.UNAUTHENTICATED
+        assert cm.exception.details() == "Invalid session"
+
+    def test_unsuccessful_rpc_with_invalid_session_mac(self) -> None:
+        """Test that calls with an invalid session MAC fall back to the signature."""
+        # Prepare
+        node_id = self._create_node_and_set_public_key()
+        session_id, _ = self._request_session(node_id)
+        req = SendNodeHeartbeatRequest(node=Node(node_id=node_id))
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError) as cm:
+            self._send_node_heartbeat.with_call(
+                request=req, metadata=self._make_session_metadata(session_id, b"key")
+            )
+        assert cm.exception.code() == grpc.StatusCode.UNAUTHENTICATED
+
+    def test_unsuccessful_rpc_with_expired_session(self) -> None:
+        """Test that expired sessions are not accepted."""
+        # Prepare
+        node_id = self._create_node_and_set_public_key()
+        self._server_interceptor.session_ttl = -1
+        session_id, key = self._request_session(node_id)
+        req = SendNodeHeartbeatRequest(node=Node(node_id=node_id))
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError) as cm:
+            self._send_node_heartbeat.with_call(
+                request=req, metadata=self._make_session_metadata(session_id, key)
+            )
+        assert cm.exception.code() == grpc.StatusCode.UNAUTHENTICATED
+
+    def test_delete_node_removes_session(self) -> None:
+        """Test that the session of a node is removed when the node is deleted."""
+        # Prepare
+        node_id = self._create_node_and_set_public_key()
+        self._request_session(node_id)
+
+        # Execute
+        req = DeleteNodeRequest(node=Node(node_id=node_id))
+        self._delete_node.with_call(request=req, metadata=self._make_metadata())
+
+        # Assert
+        assert not self._server_interceptor.sessions
+        assert not self._server_interceptor.node_sessions
@@ -14,6 +14,8 @@
 # ==============================================================================
 """Fleet API message handlers."""
 
+import threading
+from collections.abc import Iterator
 from logging import ERROR
 from typing import Optional
 
@@ -46,10 +48,15 @@ from flwr.proto.heartbeat_pb2 import (  # pylint: disable=E0611
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
     ConfirmMessageReceivedRequest,
     ConfirmMessageReceivedResponse,
+    GetObjectsStatusRequest,
+    GetObjectsStatusResponse,
     PullObjectRequest,
     PullObjectResponse,
+    PullObjectsRequest,
+    PullObjectsResponse,
     PushObjectRequest,
     PushObjectResponse,
+    PushObjectsResponse,
 )
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 from flwr.proto.run_pb2 import (  # pylint: disable=E0611
@@ -58,7 +65,7 @@ from flwr.proto.run_pb2 import (  # pylint: disable=E0611
     Run,
 )
 from flwr.server.superlink.linkstate import LinkState
-from flwr.server.superlink.utils import check_abort
+from flwr.server.superlink.utils import check_abort, get_objects_availability
 from flwr.supercore.ffs import Ffs
 from flwr.supercore.object_store import NoObjectInStoreError, ObjectStore
 
@@ -101,14 +108,24 @@ def pull_messages(
     request: PullMessagesRequest,
     state: LinkState,
     store: ObjectStore,
+    timeout: float = 0.0,
 ) -> PullMessagesResponse:
-    """Pull Messages handler."""
+    """Pull Messages handler.
+
+    If no Message is available, wait up to `timeout` seconds for one.
+    """
     # Get node_id if client node is not anonymous
     node = request.node  # pylint: disable=no-member
     node_id: int = node.node_id
 
     # Retrieve Message from State
     message_list: list[Message] = state.get_message_ins(node_id=node_id, limit=1)
+    if (
+        not message_list
+        and timeout > 0
+        and state.wait_for_message_ins(node_id=node_id, timeout=timeout)
+    ):
+        message_list = state.get_message_ins(node_id=node_id, limit=1)
 
     # Convert to Messages
     msg_proto = []
@@ -261,11 +278,96 @@ def pull_object(
         return PullObjectResponse(
             object_found=True,
             object_available=object_available,
-            object_content=content,
+            object_content=bytes(content),
         )
     return PullObjectResponse(object_found=False, object_available=False)
 
 
+def push_objects(
+    request_iterator: Iterator[PushObjectRequest],
+    state: LinkState,
+    store: ObjectStore,
+) -> Iterator[PushObjectsResponse]:
+    """Push a stream of objects, acknowledging each of them."""
+    checked_run_id: Optional[int] = None
+    for request in request_iterator:
+        # Abort if the run is not running (checked once per run in the stream)
+        if request.run_id != checked_run_id:
+            abort_msg = check_abort(
+                request.run_id,
+                [Status.PENDING, Status.STARTING, Status.FINISHED],
+                state,
+                store,
+            )
+            if abort_msg:
+                raise InvalidRunStatusException(abort_msg)
+            checked_run_id = request.run_id
+
+        stored = False
+        try:
+            store.put(request.object_id, request.object_content)
+            stored = True
+        except (NoObjectInStoreError, ValueError) as e:
+            log(ERROR, str(e))
+        except UnexpectedObjectContentError as e:
+            # Object content is not valid
+            log(ERROR, str(e))
+            raise
+        yield PushObjectsResponse(object_id=request.object_id, stored=stored)
+
+
+def pull_objects(
+    request: PullObjectsRequest, state: LinkState, store: ObjectStore
+) -> Iterator[PullObjectsResponse]:
+    """Pull a stream of objects."""
+    abort_msg = check_abort(
+        request.run_id,
+        [Status.PENDING, Status.STARTING, Status.FINISHED],
+        state,
+        store,
+    )
+    if abort_msg:
+        raise InvalidRunStatusException(abort_msg)
+
+    # Fetch from store, one object at a time
+    for object_id in request.object_ids:
+        content = store.get(object_id)
+        if content is None:
+            yield PullObjectsResponse(object_id=object_id, object_found=False)
+        elif content == b"":
+            yield PullObjectsResponse(object_id=object_id, object_found=True)
+        else:
+            yield PullObjectsResponse(
+                object_id=object_id,
+                object_found=True,
+                object_available=True,
+                object_content=bytes(content),
+            )
+
+
+def get_objects_status(
+    request: GetObjectsStatusRequest,
+    state: LinkState,
+    store: ObjectStore,
+    wait_slots: Optional[threading.BoundedSemaphore] = None,
+) -> GetObjectsStatusResponse:
+    """Get the availability of multiple objects."""
+    abort_msg = check_abort(
+        request.run_id,
+        [Status.PENDING, Status.STARTING, Status.FINISHED],
+        state,
+        store,
+    )
+    if abort_msg:
+        raise InvalidRunStatusException(abort_msg)
+
+    # Check availability, holding the request if a timeout is given
+    availability = get_objects_availability(
+        store, list(request.object_ids), request.timeout, wait_slots
+    )
+    return GetObjectsStatusResponse(object_availability=availability)
+
+
 def confirm_message_received(
     request: ConfirmMessageReceivedRequest,
     state: LinkState,
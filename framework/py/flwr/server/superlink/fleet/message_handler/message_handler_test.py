@@ -15,6 +15,7 @@
 """Fleet API message handler tests."""
 
 
+import threading
 from unittest.mock import MagicMock
 
 from flwr.common import Metadata, RecordDict, now
@@ -26,9 +27,16 @@ from flwr.proto.fleet_pb2 import (  # pylint: disable=E0611
     PullMessagesRequest,
     PushMessagesRequest,
 )
+from flwr.proto.message_pb2 import GetObjectsStatusRequest  # pylint: disable=E0611
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 
-from .message_handler import create_node, delete_node, pull_messages, push_messages
+from .message_handler import (
+    create_node,
+    delete_node,
+    get_objects_status,
+    pull_messages,
+    push_messages,
+)
 
 
 def test_create_node() -> None:
@@ -104,6 +112,44 @@ def test_pull_messages() -> None:
     state.get_message_res.assert_not_called()
 
 
+def test_pull_messages_with_timeout() -> None:
+    """Test pull_messages waits for a Message if none is available."""
+    # Prepare
+    request = PullMessagesRequest(node=Node(node_id=1234))
+    state = MagicMock()
+    state.get_message_ins.return_value = []
+    state.wait_for_message_ins.return_value = True
+    store = MagicMock()
+
+    # Execute
+    pull_messages(request=request, state=state, store=store, timeout=1.5)
+
+    # Assert
+    state.wait_for_message_ins.assert_called_once_with(node_id=1234, timeout=1.5)
+    assert state.get_message_ins.call_count == 2
+
+
+def test_get_objects_status_without_free_wait_slot() -> None:
+    """Test get_objects_status does not wait if no wait slot is free."""
+    # Prepare
+    request = GetObjectsStatusRequest(run_id=1, object_ids=["a"], timeout=10)
+    state = MagicMock()
+    state.get_run_status.return_value = {1: MagicMock(status="running")}
+    store = MagicMock()
+    store.get_availability.return_value = {"a": False}
+    wait_slots = threading.BoundedSemaphore(1)
+    wait_slots.acquire()  # pylint: disable=R1732
+
+    # Execute
+    response = get_objects_status(
+        request=request, state=state, store=store, wait_slots=wait_slots
+    )
+
+    # Assert
+    assert dict(response.object_availability) == {"a": False}
+    store.wait_for_change.assert_not_called()
+
+
 def test_push_messages() -> None:
     """Test push_messages."""
     # Prepare
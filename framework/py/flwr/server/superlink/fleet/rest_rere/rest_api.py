@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable
 from typing import Callable, TypeVar, cast
 
@@ -41,6 +42,8 @@ from flwr.proto.heartbeat_pb2 import (  # pylint: disable=E0611
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
     ConfirmMessageReceivedRequest,
     ConfirmMessageReceivedResponse,
+    GetObjectsStatusRequest,
+    GetObjectsStatusResponse,
     PullObjectRequest,
     PullObjectResponse,
     PushObjectRequest,
@@ -160,6 +163,21 @@ async def push_object(request: PushObjectRequest) -> PushObjectResponse:
     return message_handler.push_object(request=request, state=state, store=store)
 
 
+@rest_request_response(GetObjectsStatusRequest)
+async def get_objects_status(
+    request: GetObjectsStatusRequest,
+) -> GetObjectsStatusResponse:
+    """Get availability of objects."""
+    # Get state from app
+    state: LinkState = cast(LinkStateFactory, app.state.STATE_FACTORY).state()
+    store: ObjectStore = cast(ObjectStoreFactory, app.state.OBJECTSTORE_FACTORY).store()
+
+    # Handle message in a worker thread, a long-poll must not block the event loop
+    return await asyncio.to_thread(
+        message_handler.get_objects_status, request=request, state=state, store=store
+    )
+
+
 @rest_request_response(SendNodeHeartbeatRequest)
 async def send_node_heartbeat(
     request: SendNodeHeartbeatRequest,
@@ -219,6 +237,7 @@ routes = [
     Route("/api/v0/fleet/push-messages", push_message, methods=["POST"]),
     Route("/api/v0/fleet/pull-object", pull_object, methods=["POST"]),
     Route("/api/v0/fleet/push-object", push_object, methods=["POST"]),
+    Route("/api/v0/fleet/get-objects-status", get_objects_status, methods=["POST"]),
     Route("/api/v0/fleet/send-node-heartbeat", send_node_heartbeat, methods=["POST"]),
     Route("/api/v0/fleet/get-run", get_run, methods=["POST"]),
     Route("/api/v0/fleet/get-fab", get_fab, methods=["POST"]),
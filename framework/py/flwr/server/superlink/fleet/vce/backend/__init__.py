@@ -18,11 +18,16 @@
 import importlib
 
 from .backend import Backend, BackendConfig
+from .processbackend import ProcessBackend
+from .threadbackend import ThreadBackend
 
 is_ray_installed = importlib.util.find_spec("ray") is not None
 
 # Mapping of supported backends
-supported_backends: dict[str, type[Backend]] = {}
+supported_backends: dict[str, type[Backend]] = {
+    "process": ProcessBackend,
+    "thread": ThreadBackend,
+}
 
 # To log backend-specific error message when chosen backend isn't available
 error_messages_backends: dict[str, str] = {}
@@ -16,7 +16,7 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, Union
 
 from flwr.client.client_app import ClientApp
 from flwr.common.context import Context
@@ -49,6 +49,14 @@ class Backend(ABC):
         """
         return 0
 
+    @property
+    def max_batch_size(self) -> int:
+        """Return the max number of Messages a worker processes in one call.
+
+        This is the max number of jobs passed to `process_messages`.
+        """
+        return 1
+
     @abstractmethod
     def is_worker_idle(self) -> bool:
         """Report whether a backend worker is idle and can therefore run a ClientApp."""
@@ -64,3 +72,21 @@ class Backend(ABC):
         context: Context,
     ) -> tuple[Message, Context]:
         """Submit a job to the backend."""
+
+    def process_messages(
+        self,
+        jobs: list[tuple[Message, Context]],
+    ) -> list[Union[tuple[Message, Context], Exception]]:
+        """Submit multiple jobs to the backend.
+
+        By default, the jobs are processed one after the other. Backends with a
+        `max_batch_size` larger than one process them with a single call to a worker.
+        The result of a job that failed is the exception it raised.
+        """
+        results: list[Union[tuple[Message, Context], Exception]] = []
+        for message, context in jobs:
+            try:
+                results.append(self.process_message(message, context))
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                results.append(ex)
+        return results
@@ -0,0 +1,313 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Process pool backend for the Fleet API using the Simulation Engine."""
+
+
+import multiprocessing
+import os
+import pickle
+import sys
+from logging import DEBUG, ERROR, WARN
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from multiprocessing.shared_memory import SharedMemory
+from queue import Queue
+from typing import Any, Callable, Optional, Union
+
+from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppError
+from flwr.common.context import Context
+from flwr.common.logger import log
+from flwr.common.message import Message
+
+from .backend import Backend, BackendConfig
+
+ClientResourcesDict = dict[str, Union[int, float]]
+
+# Initial size of the shared memory segment of each worker, grown on demand
+INITIAL_SEGMENT_SIZE = 1 << 20  # 1 MB
+
+# Commands sent to workers and replies sent back to the backend
+_RUN = "run"
+_OK = "ok"
+_GROW = "grow"
+_LOAD_ERROR = "load_error"
+_ERROR = "error"
+
+
+def _worker_loop(app_fn: Callable[[], ClientApp], conn: Connection) -> None:
+    """Run ClientApps in a worker process until receiving `None`.
+
+    The `ClientApp` is loaded once and reused for all Messages. Messages, Contexts and
+    their replies are exchanged through a shared memory segment owned by the backend.
+    The connection only transfers the commands.
+    """
+    app: Optional[ClientApp] = None
+    load_error: Optional[str] = None
+    try:
+        app = app_fn()
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        load_error = str(ex)
+
+    segment: Optional[SharedMemory] = None
+    try:
+        while (command := conn.recv()) is not None:
+            # Attach to the segment holding the Message and Context
+            _, name, num_bytes = command
+            if segment is None or segment.name != name:
+                segment = _attach(segment, name)
+            message, context = pickle.loads(segment.buf[:num_bytes])
+
+            # Run the ClientApp on the Message
+            try:
+                if app is None:
+                    raise LoadClientAppError(load_error)
+                out_message = app(message=message, context=context)
+            except LoadClientAppError as ex:
+                conn.send((_LOAD_ERROR, str(ex)))
+                continue
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                conn.send((_ERROR, str(ex)))
+                continue
+
+            # Write the reply to the segment, asking for a larger one if needed
+            reply = pickle.dumps((out_message, context), pickle.HIGHEST_PROTOCOL)
+            if len(reply) > segment.size:
+                conn.send((_GROW, len(reply)))
+                segment = _attach(segment, conn.recv())
+            segment.buf[: len(reply)] = reply
+            conn.send((_OK, len(reply)))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if segment is not None:
+            segment.close()
+
+
+def _get_mp_context(app_fn: Callable[[], ClientApp]) -> Any:
+    """Return the multiprocessing context used to start the workers.
+
+    Workers are started with "forkserver" where available and "spawn" otherwise, so
+    they do not inherit the threads and locks of the Simulation Engine. This requires
+    `app_fn` to be picklable. If it is not, e.g., because it is a closure, workers are
+    forked on Linux, and an error is raised on other platforms, where forking is not
+    safe.
+    """
+    try:
+        pickle.dumps(app_fn)
+    except (pickle.PicklingError, AttributeError, TypeError) as ex:
+        if sys.platform != "linux":
+            raise ValueError(
+                "The function loading the `ClientApp` must be picklable to start "
+                f"worker processes on {sys.platform}. Define it at module level."
+            ) from ex
+        log(
+            DEBUG,
+            "The function loading the `ClientApp` is not picklable (%s), forking "
+            "worker processes",
+            ex,
+        )
+        return multiprocessing.get_context("fork")
+
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _attach(segment: Optional[SharedMemory], name: str) -> SharedMemory:
+    """Close `segment` and attach to the shared memory segment `name`."""
+    if segment is not None:
+        segment.close()
+    return SharedMemory(name=name)
+
+
+class _Worker:
+    """Handle of a worker process and its shared memory segment."""
+
+    def __init__(
+        self,
+        app_fn: Callable[[], ClientApp],
+        mp_context: Any,
+    ) -> None:
+        # Create the segment first, such that the worker shares the resource tracker
+        self.segment = SharedMemory(create=True, size=INITIAL_SEGMENT_SIZE)
+        self.conn, child_conn = mp_context.Pipe()
+        self.process: BaseProcess = mp_context.Process(
+            target=_worker_loop, args=(app_fn, child_conn), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    def replace_segment(self, size: int) -> None:
+        """Replace the shared memory segment with one of at least `size` bytes."""
+        self.release_segment()
+        self.segment = SharedMemory(create=True, size=max(size, 2 * self.segment.size))
+
+    def release_segment(self) -> None:
+        """Release the shared memory segment."""
+        self.segment.close()
+        self.segment.unlink()
+
+    def run(self, message: Message, context: Context) -> tuple[Message, Context]:
+        """Let the worker run the ClientApp and return its reply and Context."""
+        payload = pickle.dumps((message, context), pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.segment.size:
+            self.replace_segment(len(payload))
+        self.segment.buf[: len(payload)] = payload
+        self.conn.send((_RUN, self.segment.name, len(payload)))
+
+        status, value = self.conn.recv()
+        if status == _GROW:
+            self.replace_segment(value)
+            self.conn.send(self.segment.name)
+            status, value = self.conn.recv()
+        if status == _LOAD_ERROR:
+            raise LoadClientAppError(value)
+        if status == _ERROR:
+            raise ClientAppException(value)
+        out_message, updated_context = pickle.loads(self.segment.buf[:value])
+        return out_message, updated_context
+
+    def terminate(self) -> None:
+        """Stop the worker process and release its resources."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.conn.close()
+        self.release_segment()
+
+
+class ProcessBackend(Backend):
+    """A backend that runs ClientApps in a pool of persistent worker processes.
+
+    Each worker loads the `ClientApp` once and keeps it loaded. The number of workers
+    is the number of CPUs divided by the `num_cpus` in `client_resources`. The number
+    of CPUs defaults to the CPUs available to the process and can be limited with
+    `num_cpus` in `init_args`.
+    """
+
+    def __init__(
+        self,
+        backend_config: BackendConfig,
+    ) -> None:
+        """Prepare ProcessBackend by determining the size of the pool."""
+        log(DEBUG, "Initialising: %s", self.__class__.__name__)
+        log(DEBUG, "Backend config: %s", backend_config)
+
+        self.client_resources_key = "client_resources"
+        self.client_resources = self._validate_client_resources(config=backend_config)
+        self.pool_size = self._pool_size_from_resources(backend_config)
+        self.mp_context: Any = None
+
+        self.workers: list[_Worker] = []
+        self.idle_workers: Queue[_Worker] = Queue()
+        self.app_fn: Optional[Callable[[], ClientApp]] = None
+
+    def _validate_client_resources(self, config: BackendConfig) -> ClientResourcesDict:
+        client_resources: ClientResourcesDict = {"num_cpus": 1, "num_gpus": 0.0}
+        for k, v in config.get(self.client_resources_key, {}).items():
+            if not isinstance(v, (int, float)):
+                raise ValueError(
+                    f"client resources are expected to be of type {(int, float)} "
+                    f"but found `{type(v)}` for key `{k}`",
+                )
+            client_resources[k] = v
+
+        if client_resources["num_cpus"] <= 0:
+            raise ValueError("`num_cpus` in client resources must be positive.")
+        if client_resources.get("num_gpus", 0) > 0:
+            log(
+                WARN,
+                "%s does not manage GPUs. `num_gpus` in client resources is ignored.",
+                self.__class__.__name__,
+            )
+        return client_resources
+
+    def _pool_size_from_resources(self, config: BackendConfig) -> int:
+        num_cpus = config.get("init_args", {}).get("num_cpus")
+        if not isinstance(num_cpus, (int, float)):
+            if hasattr(os, "sched_getaffinity"):
+                num_cpus = len(os.sched_getaffinity(0))
+            else:
+                num_cpus = os.cpu_count() or 1
+        pool_size = int(num_cpus / self.client_resources["num_cpus"])
+        if pool_size < 1:
+            raise ValueError(
+                "No worker fits the available CPUs. Check `num_cpus` in the client "
+                "resources and init args."
+            )
+        return pool_size
+
+    @property
+    def num_workers(self) -> int:
+        """Return number of worker processes."""
+        return len(self.workers)
+
+    def is_worker_idle(self) -> bool:
+        """Report whether a worker process is idle."""
+        return not self.idle_workers.empty()
+
+    def build(self, app_fn: Callable[[], ClientApp]) -> None:
+        """Start the worker processes."""
+        self.app_fn = app_fn
+        self.mp_context = _get_mp_context(app_fn)
+        for _ in range(self.pool_size):
+            worker = _Worker(app_fn, self.mp_context)
+            self.workers.append(worker)
+            self.idle_workers.put(worker)
+        log(DEBUG, "Started %i worker processes", self.pool_size)
+
+    def process_message(
+        self,
+        message: Message,
+        context: Context,
+    ) -> tuple[Message, Context]:
+        """Run ClientApp that process a given message.
+
+        Return output message and updated context.
+        """
+        if self.app_fn is None or self.mp_context is None:
+            raise ValueError(
+                "Unspecified function to load a `ClientApp`. "
+                "Call the backend's `build()` method before processing messages."
+            )
+
+        worker = self.idle_workers.get()
+        try:
+            return worker.run(message, context)
+        except (EOFError, BrokenPipeError, ConnectionResetError) as ex:
+            log(
+                ERROR,
+                "A worker process of %s died while processing a message",
+                self.__class__.__name__,
+            )
+            # Replace the dead worker
+            worker.terminate()
+            self.workers.remove(worker)
+            worker = _Worker(self.app_fn, self.mp_context)
+            self.workers.append(worker)
+            raise ClientAppException(str(ex)) from ex
+        finally:
+            self.idle_workers.put(worker)
+
+    def terminate(self) -> None:
+        """Terminate all worker processes."""
+        for worker in self.workers:
+            worker.terminate()
+        self.workers.clear()
+        log(DEBUG, "Terminated %s", self.__class__.__name__)
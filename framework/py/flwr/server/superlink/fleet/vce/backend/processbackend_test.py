@@ -0,0 +1,198 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test for process pool backend for the Fleet API using the Simulation Engine."""
+
+
+import os
+import sys
+from math import pi
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppError
+from flwr.common import ArrayRecord, Context, Message, RecordDict
+from flwr.common.message import make_message
+
+from . import processbackend
+from .processbackend import ProcessBackend
+
+
+def _make_message(factor: float) -> Message:
+    return make_message(
+        content=RecordDict({"arrays": ArrayRecord([np.array([factor])])}),
+        metadata=Message(RecordDict(), dst_node_id=0, message_type="train").metadata,
+    )
+
+
+def _make_context() -> Context:
+    return Context(
+        run_id=1, node_id=0, node_config={}, state=RecordDict(), run_config={}
+    )
+
+
+def _load_app() -> ClientApp:
+    app = ClientApp()
+    pid = os.getpid()
+
+    @app.train()
+    def train(message: Message, context: Context) -> Message:
+        factor = message.content.array_records["arrays"]["0"].numpy()[0]
+        if factor < 0:
+            raise ValueError("Negative factor")
+        context.state["arrays"] = ArrayRecord([np.ones(int(factor))])
+        return Message(
+            RecordDict({"arrays": ArrayRecord([np.array([factor * pi, pid])])}),
+            reply_to=message,
+        )
+
+    return app
+
+
+def _load_broken_app() -> ClientApp:
+    raise LoadClientAppError("Broken app")
+
+
+class TestProcessBackend(TestCase):
+    """Tests for ProcessBackend."""
+
+    def setUp(self) -> None:
+        """Use small shared memory segments to exercise their replacement."""
+        self.initial_segment_size = processbackend.INITIAL_SEGMENT_SIZE
+        processbackend.INITIAL_SEGMENT_SIZE = 1024
+
+    def tearDown(self) -> None:
+        """Restore the size of shared memory segments."""
+        processbackend.INITIAL_SEGMENT_SIZE = self.initial_segment_size
+
+    def test_pool_size_from_client_resources(self) -> None:
+        """Test that the pool size honors `num_cpus` in the client resources."""
+        backend = ProcessBackend(
+            {"client_resources": {"num_cpus": 2}, "init_args": {"num_cpus": 5}}
+        )
+        assert backend.pool_size == 2
+
+        with self.assertRaises(ValueError):
+            ProcessBackend(
+                {"client_resources": {"num_cpus": 4}, "init_args": {"num_cpus": 2}}
+            )
+
+    def test_start_method(self) -> None:
+        """Test that workers are only forked on Linux and only if needed."""
+        backend = ProcessBackend({"init_args": {"num_cpus": 1}})
+        backend.build(_load_app)
+        try:
+            assert backend.mp_context.get_start_method() != "fork"
+        finally:
+            backend.terminate()
+
+        def load_local_app() -> ClientApp:
+            return _load_app()
+
+        with patch.object(sys, "platform", "darwin"):
+            with self.assertRaises(ValueError):
+                ProcessBackend({"init_args": {"num_cpus": 1}}).build(load_local_app)
+
+        with patch.object(sys, "platform", "linux"):
+            backend = ProcessBackend({"init_args": {"num_cpus": 1}})
+            backend.build(load_local_app)
+            try:
+                assert backend.mp_context.get_start_method() == "fork"
+                out_message, _ = backend.process_message(
+                    _make_message(1.0), _make_context()
+                )
+                assert out_message.content.array_records["arrays"]["0"].numpy()[0] == pi
+            finally:
+                backend.terminate()
+
+    def test_process_message(self) -> None:
+        """Test that workers keep the ClientApp loaded and return the Context."""
+        backend = ProcessBackend({"init_args": {"num_cpus": 1}})
+        backend.build(_load_app)
+        try:
+            assert backend.num_workers == 1
+            assert backend.is_worker_idle()
+            pids = set()
+            for factor in (1.0, 2.0):
+                out_message, context = backend.process_message(
+                    _make_message(factor), _make_context()
+                )
+                result, pid = out_message.content.array_records["arrays"]["0"].numpy()
+                pids.add(pid)
+                assert result == factor * pi
+                assert len(context.state.array_records["arrays"]["0"].numpy()) == factor
+            assert len(pids) == 1
+            assert pids != {os.getpid()}
+        finally:
+            backend.terminate()
+
+    def test_process_large_message(self) -> None:
+        """Test that Messages and replies larger than the segment are exchanged."""
+        backend = ProcessBackend({"init_args": {"num_cpus": 1}})
+        backend.build(_load_app)
+        try:
+            message = _make_message(5000.0)
+            message.content["padding"] = ArrayRecord([np.zeros(10_000)])
+            out_message, context = backend.process_message(message, _make_context())
+            assert (
+                out_message.content.array_records["arrays"]["0"].numpy()[0]
+                == 5000.0 * pi
+            )
+            assert len(context.state.array_records["arrays"]["0"].numpy()) == 5000
+            assert backend.workers[0].segment.size > 1024
+        finally:
+            backend.terminate()
+
+    def test_exceptions(self) -> None:
+        """Test that errors in the ClientApp are raised by the backend."""
+        backend = ProcessBackend({"init_args": {"num_cpus": 1}})
+        backend.build(_load_app)
+        try:
+            with self.assertRaises(ClientAppException):
+                backend.process_message(_make_message(-1.0), _make_context())
+            # The worker remains usable
+            out_message, _ = backend.process_message(
+                _make_message(1.0), _make_context()
+            )
+            assert out_message.content.array_records["arrays"]["0"].numpy()[0] == pi
+        finally:
+            backend.terminate()
+
+        backend = ProcessBackend({"init_args": {"num_cpus": 1}})
+        backend.build(_load_broken_app)
+        try:
+            with self.assertRaises(LoadClientAppError):
+                backend.process_message(_make_message(1.0), _make_context())
+        finally:
+            backend.terminate()
+
+    def test_replace_dead_worker(self) -> None:
+        """Test that a worker that died is replaced."""
+        backend = ProcessBackend({"init_args": {"num_cpus": 1}})
+        backend.build(_load_app)
+        try:
+            backend.workers[0].process.kill()
+            backend.workers[0].process.join()
+            with self.assertRaises(ClientAppException):
+                backend.process_message(_make_message(1.0), _make_context())
+            assert backend.num_workers == 1
+            assert backend.workers[0].process.is_alive()
+            out_message, _ = backend.process_message(
+                _make_message(1.0), _make_context()
+            )
+            assert out_message.content.array_records["arrays"]["0"].numpy()[0] == pi
+        finally:
+            backend.terminate()
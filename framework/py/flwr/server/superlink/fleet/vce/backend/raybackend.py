@@ -21,12 +21,13 @@ from typing import Callable, Optional, Union
 
 import ray
 
-from flwr.client.client_app import ClientApp
+from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppError
 from flwr.common.constant import PARTITION_ID_KEY
 from flwr.common.context import Context
 from flwr.common.logger import log
 from flwr.common.message import Message
 from flwr.common.typing import ConfigRecordValues
+from flwr.simulation.ray_transport.broadcast import BroadcastCache
 from flwr.simulation.ray_transport.ray_actor import BasicActorPool, ClientAppActor
 from flwr.simulation.ray_transport.utils import enable_tf_gpu_growth
 
@@ -36,7 +37,7 @@ ClientResourcesDict = dict[str, Union[int, float]]
 ActorArgsDict = dict[str, Union[int, float, Callable[[], None]]]
 
 
-class RayBackend(Backend):
+class RayBackend(Backend):  # pylint: disable=too-many-instance-attributes
     """A backend that submits jobs to a `BasicActorPool`."""
 
     def __init__(
@@ -59,6 +60,12 @@ class RayBackend(Backend):
         self.actor_kwargs = self._validate_actor_arguments(config=backend_config)
         self.pool: Optional[BasicActorPool] = None
 
+        # Max number of Messages an actor processes in one call
+        self._max_batch_size = self._validate_max_batch_size(config=backend_config)
+
+        # Places the Arrays sent to many nodes in the object store once
+        self.broadcast_cache = BroadcastCache()
+
         self.app_fn: Optional[Callable[[], ClientApp]] = None
 
     def _validate_client_resources(self, config: BackendConfig) -> ClientResourcesDict:
@@ -99,6 +106,14 @@ class RayBackend(Backend):
                 actor_args["on_actor_init_fn"] = enable_tf_gpu_growth
         return actor_args
 
+    def _validate_max_batch_size(self, config: BackendConfig) -> int:
+        max_batch_size = config.get("actor", {}).get("max_batch_size", 1)
+        if not isinstance(max_batch_size, int) or max_batch_size < 1:
+            raise ValueError(
+                "`max_batch_size` in the actor config must be a positive integer."
+            )
+        return max_batch_size
+
     def init_ray(self, backend_config: BackendConfig) -> None:
         """Intialises Ray if not already initialised."""
         if not ray.is_initialized():
@@ -120,6 +135,11 @@ class RayBackend(Backend):
         """Return number of actors in pool."""
         return self.pool.num_actors if self.pool else 0
 
+    @property
+    def max_batch_size(self) -> int:
+        """Return the max number of Messages an actor processes in one call."""
+        return self._max_batch_size
+
     def is_worker_idle(self) -> bool:
         """Report whether the pool has idle actors."""
         return self.pool.is_actor_available() if self.pool else False
@@ -161,10 +181,13 @@ class RayBackend(Backend):
                 "Call the backend's `build()` method before processing messages."
             )
 
+        message, array_refs = self.broadcast_cache.split(message)
         try:
             # Submit a task to the pool
             future = self.pool.submit(
-                lambda a, a_fn, mssg, cid, state: a.run.remote(a_fn, mssg, cid, state),
+                lambda a, a_fn, mssg, cid, state: a.run.remote(
+                    a_fn, mssg, cid, state, array_refs
+                ),
                 (self.app_fn, message, str(partition_id), context),
             )
 
@@ -186,6 +209,67 @@ class RayBackend(Backend):
             self.pool.add_actor_back_to_pool(future)
             raise ex
 
+    def process_messages(
+        self,
+        jobs: list[tuple[Message, Context]],
+    ) -> list[Union[tuple[Message, Context], Exception]]:
+        """Run ClientApp on multiple messages with a single call to an actor.
+
+        Return output message and updated context, or the exception raised, for each
+        message.
+        """
+        if len(jobs) == 1:
+            return super().process_messages(jobs)
+
+        if self.pool is None:
+            raise ValueError("The actor pool is empty, unfit to process messages.")
+
+        if self.app_fn is None:
+            raise ValueError(
+                "Unspecified function to load a `ClientApp`. "
+                "Call the backend's `build()` method before processing messages."
+            )
+
+        messages, array_refs = zip(
+            *(self.broadcast_cache.split(message) for message, _ in jobs)
+        )
+        contexts = [context for _, context in jobs]
+        partition_ids = [
+            str(context.node_config[PARTITION_ID_KEY]) for context in contexts
+        ]
+        try:
+            # Submit all jobs to one actor of the pool
+            future = self.pool.submit_batch(
+                lambda a, a_fn, mssgs, cids, states: a.run_batch.remote(
+                    a_fn, mssgs, cids, states, list(array_refs)
+                ),
+                (self.app_fn, list(messages), partition_ids, contexts),
+            )
+
+            # Fetch results
+            results = self.pool.fetch_batch_results_and_return_actor_to_pool(future)
+
+        except Exception as ex:
+            log(
+                ERROR,
+                "An exception was raised when processing messages by %s",
+                self.__class__.__name__,
+            )
+            # add actor back into pool
+            self.pool.add_actor_back_to_pool(future)
+            raise ex
+
+        # Raise the same exceptions as `process_message`
+        return [
+            (
+                ClientAppException(str(result))
+                if isinstance(result, Exception)
+                and not isinstance(result, LoadClientAppError)
+                else result
+            )
+            for result in results
+        ]
+
     def terminate(self) -> None:
         """Terminate all actors in actor pool."""
         if self.pool:
@@ -19,20 +19,24 @@ from math import pi
 from typing import Callable, Optional, Union
 from unittest import TestCase
 
+import numpy as np
 import ray
 
 from flwr.client import Client, NumPyClient
-from flwr.client.client_app import ClientApp
+from flwr.client.client_app import ClientApp, ClientAppException
 from flwr.client.run_info_store import DeprecatedRunInfoStore
 from flwr.common import (
     DEFAULT_TTL,
+    ArrayRecord,
     Config,
     ConfigRecord,
     Context,
     GetPropertiesIns,
     Message,
+    MessageType,
     MessageTypeLegacy,
     Metadata,
+    MetricRecord,
     RecordDict,
     Scalar,
     now,
@@ -70,6 +74,20 @@ def _load_app() -> ClientApp:
     return ClientApp(client_fn=get_dummy_client)
 
 
+def _load_sum_app() -> ClientApp:
+    app = ClientApp()
+
+    @app.query()
+    def query(message: Message, context: Context) -> Message:  # pylint: disable=W0613
+        array = message.content.array_records["arrays"]["0"].numpy(readonly=True)
+        return Message(
+            RecordDict({"sum": MetricRecord({"sum": float(array.sum())})}),
+            reply_to=message,
+        )
+
+    return app
+
+
 def backend_build_process_and_termination(
     backend: RayBackend,
     app_fn: Callable[[], ClientApp],
@@ -234,3 +252,82 @@ class TestRayBackend(TestCase):
 
         finally:
             ray.shutdown()
+
+    def test_backend_process_messages_in_batch(self) -> None:
+        """Test processing multiple messages with a single call to an actor."""
+        backend = RayBackend(
+            backend_config={
+                "init_args": {"num_cpus": 1},
+                "client_resources": {"num_cpus": 1, "num_gpus": 0},
+                "actor": {"max_batch_size": 4},
+            }
+        )
+        assert backend.max_batch_size == 4
+        backend.build(_load_app)
+
+        jobs = [_create_message_and_context() for _ in range(3)]
+        # A message the ClientApp fails to process
+        invalid_message, invalid_context, _ = _create_message_and_context()
+        invalid_message.content = RecordDict()
+
+        try:
+            results = backend.process_messages(
+                [(message, context) for message, context, _ in jobs]
+                + [(invalid_message, invalid_context)]
+            )
+        finally:
+            backend.terminate()
+
+        for result, (_, _, expected_output) in zip(results, jobs):
+            assert not isinstance(result, Exception)
+            out_mssg, updated_context = result
+            content = out_mssg.content
+            assert (
+                content.config_records["getpropertiesres.properties"]["result"]
+                == expected_output
+            )
+            assert (
+                updated_context.state.config_records["result"]["result"]
+                == expected_output
+            )
+        assert isinstance(results[3], ClientAppException)
+
+    def test_backend_broadcasts_arrays(self) -> None:
+        """Test that Arrays sent to several nodes are placed in the object store
+        once."""
+        backend = RayBackend(
+            backend_config={
+                "init_args": {"num_cpus": 1},
+                "client_resources": {"num_cpus": 1, "num_gpus": 0},
+                "actor": {"max_batch_size": 4},
+            }
+        )
+        backend.build(_load_sum_app)
+
+        arrays = ArrayRecord([np.arange(100_000.0)])
+        jobs = []
+        for _ in range(3):
+            _, context, _ = _create_message_and_context()
+            message = Message(
+                RecordDict({"arrays": arrays}),
+                dst_node_id=0,
+                message_type=MessageType.QUERY,
+            )
+            jobs.append((message, context))
+
+        try:
+            results: list[Union[tuple[Message, Context], Exception]] = [
+                backend.process_message(*jobs[0])
+            ]
+            results += backend.process_messages(jobs[1:])
+            assert len(backend.broadcast_cache) == 1
+        finally:
+            backend.terminate()
+
+        for result in results:
+            assert not isinstance(result, Exception)
+            out_mssg, _ = result
+            assert (
+                out_mssg.content.metric_records["sum"]["sum"]
+                == np.arange(100_000.0).sum()
+            )
@@ -0,0 +1,138 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""In-process threaded backend for the Fleet API using the Simulation Engine."""
+
+
+import os
+import threading
+from copy import deepcopy
+from logging import DEBUG
+from typing import Callable, Optional
+
+from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppError
+from flwr.common.context import Context
+from flwr.common.logger import log
+from flwr.common.message import Message
+from flwr.common.record import RecordDict
+
+from .backend import Backend, BackendConfig
+
+
+def _copy_context(context: Context) -> Context:
+    """Return a copy of the Context, deep-copying the state if it is not empty."""
+    return Context(
+        run_id=context.run_id,
+        node_id=context.node_id,
+        node_config=context.node_config.copy(),
+        state=deepcopy(context.state) if len(context.state) > 0 else RecordDict(),
+        run_config=context.run_config.copy(),
+    )
+
+
+class ThreadBackend(Backend):
+    """A backend that runs ClientApps in the threads of the Simulation Engine.
+
+    The `ClientApp` is loaded once and called directly from the worker threads, without
+    serializing Messages and Contexts. This suits `ClientApp` objects that are small or
+    release the GIL. The number of threads is set with `num_threads` in `init_args`
+    and defaults to the number of CPUs.
+
+    By default, the `ClientApp` modifies the `Context` of the node in place. Setting
+    `isolate_context` to `True` in `init_args` lets it run on a copy instead, such
+    that the `Context` of the node is only updated when the `ClientApp` succeeds.
+    The copy is eager: a non-empty `state` is deep-copied before every call, whether
+    or not the `ClientApp` modifies it.
+
+    The `Message` is never copied. Unlike with the other backends, changes the
+    `ClientApp` makes to the content of the received `Message` therefore also alter
+    the instruction `Message` stored in an `InMemoryLinkState`.
+    """
+
+    def __init__(
+        self,
+        backend_config: BackendConfig,
+    ) -> None:
+        """Prepare ThreadBackend by reading the number of threads."""
+        log(DEBUG, "Initialising: %s", self.__class__.__name__)
+        log(DEBUG, "Backend config: %s", backend_config)
+
+        init_args = backend_config.get("init_args", {})
+        num_threads = init_args.get("num_threads", os.cpu_count() or 1)
+        if not isinstance(num_threads, int) or num_threads < 1:
+            raise ValueError("`num_threads` in init args must be a positive integer.")
+        self.num_threads = num_threads
+        self.isolate_context = bool(init_args.get("isolate_context", False))
+
+        self.app: Optional[ClientApp] = None
+        self.load_error: Optional[str] = None
+        self.num_busy = 0
+        self.lock = threading.Lock()
+
+    @property
+    def num_workers(self) -> int:
+        """Return number of threads running ClientApps."""
+        return self.num_threads
+
+    def is_worker_idle(self) -> bool:
+        """Report whether a thread is idle."""
+        with self.lock:
+            return self.num_busy < self.num_threads
+
+    def build(self, app_fn: Callable[[], ClientApp]) -> None:
+        """Load the ClientApp."""
+        try:
+            self.app = app_fn()
+        except LoadClientAppError as ex:
+            # Reported when processing Messages, as for the other backends
+            self.load_error = str(ex)
+
+    def process_message(
+        self,
+        message: Message,
+        context: Context,
+    ) -> tuple[Message, Context]:
+        """Run ClientApp that process a given message.
+
+        Return output message and updated context.
+        """
+        if self.load_error is not None:
+            raise LoadClientAppError(self.load_error)
+        if self.app is None:
+            raise ValueError(
+                "Unspecified function to load a `ClientApp`. "
+                "Call the backend's `build()` method before processing messages."
+            )
+
+        if self.isolate_context:
+            context = _copy_context(context)
+
+        with self.lock:
+            self.num_busy += 1
+        try:
+            out_message = self.app(message=message, context=context)
+        except LoadClientAppError:
+            raise
+        except Exception as ex:
+            raise ClientAppException(str(ex)) from ex
+        finally:
+            with self.lock:
+                self.num_busy -= 1
+
+        return out_message, context
+
+    def terminate(self) -> None:
+        """Release the ClientApp."""
+        self.app = None
+        log(DEBUG, "Terminated %s", self.__class__.__name__)
@@ -0,0 +1,103 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test for in-process threaded backend for the Fleet API."""
+
+
+from typing import cast
+from unittest import TestCase
+
+from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppError
+from flwr.common import ConfigRecord, Context, Message, RecordDict
+
+from .threadbackend import ThreadBackend
+
+
+def _make_message(fail: bool = False) -> Message:
+    return Message(
+        RecordDict({"config": ConfigRecord({"fail": fail})}),
+        dst_node_id=0,
+        message_type="train",
+    )
+
+
+def _make_context() -> Context:
+    return Context(
+        run_id=1, node_id=0, node_config={}, state=RecordDict(), run_config={}
+    )
+
+
+def _load_app() -> ClientApp:
+    app = ClientApp()
+
+    @app.train()
+    def train(message: Message, context: Context) -> Message:
+        counter = context.state.config_records.get("counter", ConfigRecord({"n": 0}))
+        counter["n"] = cast(int, counter["n"]) + 1
+        context.state["counter"] = counter
+        if message.content.config_records["config"]["fail"]:
+            raise ValueError("Failure requested")
+        return Message(RecordDict(), reply_to=message)
+
+    return app
+
+
+def _load_broken_app() -> ClientApp:
+    raise LoadClientAppError("Broken app")
+
+
+class TestThreadBackend(TestCase):
+    """Tests for ThreadBackend."""
+
+    def test_num_workers(self) -> None:
+        """Test that the number of threads is configurable."""
+        assert ThreadBackend({"init_args": {"num_threads": 7}}).num_workers == 7
+        with self.assertRaises(ValueError):
+            ThreadBackend({"init_args": {"num_threads": 0}})
+
+    def test_process_message_in_place(self) -> None:
+        """Test that the ClientApp updates the Context in place by default."""
+        backend = ThreadBackend({})
+        backend.build(_load_app)
+        context = _make_context()
+
+        _, updated_context = backend.process_message(_make_message(), context)
+        with self.assertRaises(ClientAppException):
+            backend.process_message(_make_message(fail=True), context)
+
+        assert updated_context is context
+        assert context.state.config_records["counter"]["n"] == 2
+        assert backend.is_worker_idle()
+
+    def test_process_message_isolated(self) -> None:
+        """Test that the Context is only updated when the ClientApp succeeds."""
+        backend = ThreadBackend({"init_args": {"isolate_context": True}})
+        backend.build(_load_app)
+        context = _make_context()
+
+        with self.assertRaises(ClientAppException):
+            backend.process_message(_make_message(fail=True), context)
+        assert len(context.state) == 0
+
+        _, context = backend.process_message(_make_message(), context)
+        with self.assertRaises(ClientAppException):
+            backend.process_message(_make_message(fail=True), context)
+        assert context.state.config_records["counter"]["n"] == 1
+
+    def test_load_error(self) -> None:
+        """Test that errors loading the ClientApp are raised when processing."""
+        backend = ThreadBackend({})
+        backend.build(_load_broken_app)
+        with self.assertRaises(LoadClientAppError):
+            backend.process_message(_make_message(), _make_context())
@@ -19,23 +19,25 @@ import json
 import threading
 import time
 import traceback
+from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor
 from logging import DEBUG, ERROR, INFO, WARN
 from pathlib import Path
 from queue import Empty, Queue
-from time import sleep
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 from uuid import uuid4
 
 from flwr.app.error import Error
 from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppError
 from flwr.client.clientapp.utils import get_load_client_app_fn
 from flwr.client.run_info_store import DeprecatedRunInfoStore
-from flwr.common import Message
+from flwr.common import Context, Message
 from flwr.common.constant import (
     HEARTBEAT_MAX_INTERVAL,
     NUM_PARTITIONS_KEY,
     PARTITION_ID_KEY,
+    VCE_BATCH_TARGET_DURATION,
+    VCE_DISPATCH_SWEEP_INTERVAL,
     ErrorCode,
 )
 from flwr.common.logger import log
@@ -85,7 +87,100 @@ def _register_node_info_stores(
     return node_info_store
 
 
-# pylint: disable=too-many-arguments,too-many-locals
+class AdaptiveBatchSize:
+    """Adapt the number of Messages per call of a backend to the measured latency.
+
+    The batch size is chosen such that processing a batch takes about
+    `target_duration` seconds, based on a moving average of the time taken per
+    Message. It is at most `max_batch_size`.
+    """
+
+    def __init__(self, max_batch_size: int, target_duration: float) -> None:
+        self.max_batch_size = max_batch_size
+        self.target_duration = target_duration
+        self.latency: Optional[float] = None
+        self.value = 1
+
+    def update(self, batch_size: int, duration: float) -> None:
+        """Record the time taken to process a batch and adapt the batch size."""
+        latency = duration / batch_size
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = 0.8 * self.latency + 0.2 * latency
+        self.value = max(
+            1,
+            min(
+                self.max_batch_size,
+                int(self.target_duration / max(self.latency, 1e-6)),
+            ),
+        )
+
+
+def _error_reply(message: Message, ex: Exception) -> Message:
+    """Log the exception and return it as a reply to `message`."""
+    log(ERROR, ex)
+    log(ERROR, "".join(traceback.format_exception(type(ex), ex, ex.__traceback__)))
+
+    if isinstance(ex, ClientAppException):
+        e_code = ErrorCode.CLIENT_APP_RAISED_EXCEPTION
+    elif isinstance(ex, LoadClientAppError):
+        e_code = ErrorCode.LOAD_CLIENT_APP_EXCEPTION
+    else:
+        e_code = ErrorCode.UNKNOWN
+
+    reason = str(type(ex)) + ":<'" + str(ex) + "'>"
+    return Message(Error(code=e_code, reason=reason), reply_to=message)
+
+
+def _process_messages(
+    messages: list[Message],
+    node_info_store: dict[int, DeprecatedRunInfoStore],
+    backend: Backend,
+    batch_size: AdaptiveBatchSize,
+) -> list[Message]:
+    """Let the backend process the Messages, update contexts, and return replies."""
+    replies: list[Message] = []
+    jobs: list[tuple[Message, Context]] = []
+    for message in messages:
+        try:
+            # Retrieve context
+            context = node_info_store[message.metadata.dst_node_id].retrieve_context(
+                run_id=message.metadata.run_id
+            )
+            jobs.append((message, context))
+        # Exceptions aren't raised but reported as an error message
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            replies.append(_error_reply(message, ex))
+
+    if not jobs:
+        return replies
+
+    # Let backend process messages
+    start = time.perf_counter()
+    results: list[Union[tuple[Message, Context], Exception]]
+    try:
+        results = backend.process_messages(jobs)
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        results = [ex] * len(jobs)
+    batch_size.update(len(jobs), time.perf_counter() - start)
+
+    for (message, _), result in zip(jobs, results):
+        try:
+            if isinstance(result, Exception):
+                raise result
+            out_mssg, updated_context = result
+
+            # Update Context
+            node_info_store[message.metadata.dst_node_id].update_context(
+                message.metadata.run_id, context=updated_context
+            )
+            replies.append(out_mssg)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            replies.append(_error_reply(message, ex))
+    return replies
+
+
 def worker(
     messageins_queue: Queue[Message],
     messageres_queue: Queue[Message],
@@ -94,51 +189,37 @@ def worker(
     f_stop: threading.Event,
 ) -> None:
     """Process messages from the queue, execute them, update context, and enqueue
-    replies."""
+    replies.
+
+    Backends supporting batches process up to `backend.max_batch_size` Messages at
+    once. The size of the batches adapts to the time taken per Message, and leaves
+    a fair share of the queued Messages to the other workers.
+    """
+    batch_size = AdaptiveBatchSize(backend.max_batch_size, VCE_BATCH_TARGET_DURATION)
     while not f_stop.is_set():
-        out_mssg = None
         try:
             # Fetch from queue with timeout. We use a timeout so
             # the stopping event can be evaluated even when the queue is empty.
-            message: Message = messageins_queue.get(timeout=1.0)
-            node_id = message.metadata.dst_node_id
-
-            # Retrieve context
-            context = node_info_store[node_id].retrieve_context(
-                run_id=message.metadata.run_id
-            )
-
-            # Let backend process message
-            out_mssg, updated_context = backend.process_message(message, context)
-
-            # Update Context
-            node_info_store[node_id].update_context(
-                message.metadata.run_id, context=updated_context
-            )
+            messages = [messageins_queue.get(timeout=1.0)]
         except Empty:
             # An exception raised if queue.get times out
-            pass
-        # Exceptions aren't raised but reported as an error message
-        except Exception as ex:  # pylint: disable=broad-exception-caught
-            log(ERROR, ex)
-            log(ERROR, traceback.format_exc())
+            continue
 
-            if isinstance(ex, ClientAppException):
-                e_code = ErrorCode.CLIENT_APP_RAISED_EXCEPTION
-            elif isinstance(ex, LoadClientAppError):
-                e_code = ErrorCode.LOAD_CLIENT_APP_EXCEPTION
-            else:
-                e_code = ErrorCode.UNKNOWN
+        # Fetch more Messages without waiting
+        fair_share = 1 + messageins_queue.qsize() // max(backend.num_workers, 1)
+        while len(messages) < min(batch_size.value, fair_share):
+            try:
+                messages.append(messageins_queue.get_nowait())
+            except Empty:
+                break
 
-            reason = str(type(ex)) + ":<'" + str(ex) + "'>"
-            out_mssg = Message(Error(code=e_code, reason=reason), reply_to=message)
-
-        finally:
-            if out_mssg:
-                # Assign a message_id
-                out_mssg.metadata.__dict__["_message_id"] = str(uuid4())
-                # Store reply Messages in state
-                messageres_queue.put(out_mssg)
+        for out_mssg in _process_messages(
+            messages, node_info_store, backend, batch_size
+        ):
+            # Assign a message_id
+            out_mssg.metadata.__dict__["_message_id"] = str(uuid4())
+            # Store reply Messages in state
+            messageres_queue.put(out_mssg)
 
 
 def add_messages_to_queue(
@@ -146,30 +227,52 @@ def add_messages_to_queue(
     queue: Queue[Message],
     nodes_mapping: NodeToPartitionMapping,
     f_stop: threading.Event,
+    ready_nodes: Queue[int],
 ) -> None:
-    """Put Messages in the queue from the LinkState."""
+    """Put Messages in the queue from the LinkState.
+
+    Only the nodes in `ready_nodes`, which the LinkState reports when storing Messages
+    for them, are checked for Messages. All nodes are checked at the start and
+    periodically thereafter, to dispatch Messages stored by other processes.
+    """
+    next_sweep = 0.0
     while not f_stop.is_set():
-        for node_id in nodes_mapping.keys():
-            message_ins_list = state.get_message_ins(node_id=node_id, limit=1)
-            for msg in message_ins_list:
-                queue.put(msg)
-        sleep(0.1)
+        if time.monotonic() >= next_sweep:
+            node_ids: Iterable[int] = nodes_mapping.keys()
+            next_sweep = time.monotonic() + VCE_DISPATCH_SWEEP_INTERVAL
+        else:
+            try:
+                node_ids = [ready_nodes.get(timeout=1.0)]
+            except Empty:
+                continue
+        for node_id in node_ids:
+            if node_id in nodes_mapping:
+                for msg in state.get_message_ins(node_id=node_id, limit=None):
+                    queue.put(msg)
 
 
 def put_message_into_state(
     state: LinkState, queue: Queue[Message], f_stop: threading.Event
 ) -> None:
-    """Store reply Messages into the LinkState from the queue."""
+    """Store reply Messages into the LinkState from the queue.
+
+    All replies available in the queue are stored at once.
+    """
     while not f_stop.is_set():
         try:
-            message_reply = queue.get(timeout=1.0)
-            state.store_message_res(message_reply)
+            message_replies = [queue.get(timeout=1.0)]
         except Empty:
             # queue is empty when timeout was triggered
-            pass
+            continue
+        while True:
+            try:
+                message_replies.append(queue.get_nowait())
+            except Empty:
+                break
+        state.store_message_res_batch(message_replies)
 
 
-# pylint: disable=too-many-positional-arguments
+# pylint: disable=too-many-arguments,too-many-positional-arguments
 def run_api(
     app_fn: Callable[[], ClientApp],
     backend_fn: Callable[[], Backend],
@@ -181,6 +284,8 @@ def run_api(
     """Run the VCE."""
     messageins_queue: Queue[Message] = Queue()
     messageres_queue: Queue[Message] = Queue()
+    ready_nodes: Queue[int] = Queue()
+    state: Optional[LinkState] = None
 
     try:
 
@@ -193,6 +298,9 @@ def run_api(
         # Add workers (they submit Messages to Backend)
         state = state_factory.state()
 
+        # Let the LinkState report the nodes it stores Messages for
+        state.add_message_ins_listener(ready_nodes.put)
+
         extractor_th = threading.Thread(
             target=add_messages_to_queue,
             args=(
@@ -200,6 +308,7 @@ def run_api(
                 messageins_queue,
                 nodes_mapping,
                 f_stop,
+                ready_nodes,
             ),
         )
         extractor_th.start()
@@ -244,6 +353,10 @@ def run_api(
 
     finally:
 
+        # Stop reporting nodes to this run of the Simulation Engine
+        if state is not None:
+            state.remove_message_ins_listener(ready_nodes.put)
+
         # Terminate backend
         backend.terminate()
 
@@ -20,9 +20,11 @@ from itertools import cycle
 from json import JSONDecodeError
 from math import pi
 from pathlib import Path
+from queue import Queue
 from time import sleep
 from typing import Optional
 from unittest import TestCase
+from unittest.mock import Mock, patch
 
 from flwr.client import Client, ClientApp, NumPyClient
 from flwr.client.client_app import LoadClientAppError
@@ -32,23 +34,31 @@ from flwr.common import (
     ConfigRecord,
     Context,
     GetPropertiesIns,
+    Message,
     MessageTypeLegacy,
     Metadata,
     RecordDict,
     Scalar,
     now,
 )
-from flwr.common.constant import Status
+from flwr.common.constant import SUPERLINK_NODE_ID, Status
 from flwr.common.message import make_message
 from flwr.common.recorddict_compat import getpropertiesins_to_recorddict
+from flwr.common.serde import message_from_proto
 from flwr.common.typing import Run, RunStatus
 from flwr.server.superlink.fleet.vce.vce_api import (
+    AdaptiveBatchSize,
     NodeToPartitionMapping,
+    _register_node_info_stores,
     _register_nodes,
+    add_messages_to_queue,
+    put_message_into_state,
     start_vce,
+    worker,
 )
 from flwr.server.superlink.linkstate import InMemoryLinkState, LinkStateFactory
 from flwr.server.superlink.linkstate.in_memory_linkstate import RunRecord
+from flwr.server.superlink.linkstate.linkstate_test import create_ins_message
 
 
 class DummyClient(NumPyClient):
@@ -325,3 +335,126 @@ class TestFleetSimulationEngineRayBackend(TestCase):
                 content.config_records["getpropertiesres.properties"]["result"]
                 == expected_results[message_res.metadata.reply_to_message_id]
             )
+
+
+class TestMessageDispatch(TestCase):
+    """Tests for dispatching Messages between the LinkState and the backend."""
+
+    def test_add_messages_to_queue_of_notified_nodes(self) -> None:
+        """Test that only notified nodes are checked after the initial sweep."""
+        # Prepare
+        state_factory = LinkStateFactory(":flwr-in-memory-state:")
+        nodes_mapping = _register_nodes(num_nodes=100, state_factory=state_factory)
+        state = state_factory.state()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        msg = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID,
+                dst_node_id=next(iter(nodes_mapping)),
+                run_id=run_id,
+            )
+        )
+        queue: Queue[Message] = Queue()
+        ready_nodes: Queue[int] = Queue()
+        f_stop = threading.Event()
+        state.add_message_ins_listener(ready_nodes.put)
+
+        # Execute
+        with patch.object(
+            state, "get_message_ins", wraps=state.get_message_ins
+        ) as get_message_ins:
+            extractor_th = threading.Thread(
+                target=add_messages_to_queue,
+                args=(state, queue, nodes_mapping, f_stop, ready_nodes),
+            )
+            extractor_th.start()
+            state.store_message_ins(msg)
+            dispatched = queue.get(timeout=5)
+            f_stop.set()
+            extractor_th.join()
+
+        # Assert
+        assert dispatched.metadata.message_id == msg.metadata.message_id
+        assert get_message_ins.call_count <= len(nodes_mapping) + 1
+
+    def test_put_message_into_state_in_batches(self) -> None:
+        """Test that available replies are stored at once."""
+        # Prepare
+        state = Mock()
+        replies = [Message(RecordDict(), dst_node_id=0, message_type="train")] * 3
+        queue: Queue[Message] = Queue()
+        for reply in replies:
+            queue.put(reply)
+        f_stop = threading.Event()
+        state.store_message_res_batch.side_effect = lambda _: f_stop.set()
+
+        # Execute
+        put_message_into_state(state, queue, f_stop)
+
+        # Assert
+        state.store_message_res_batch.assert_called_once_with(replies)
+
+    def test_adaptive_batch_size(self) -> None:
+        """Test that the batch size follows the time taken per Message."""
+        batch_size = AdaptiveBatchSize(max_batch_size=64, target_duration=1.0)
+        assert batch_size.value == 1
+
+        # Fast Messages are batched up to the max batch size
+        batch_size.update(batch_size=1, duration=0.001)
+        assert batch_size.value == 64
+
+        # Slow Messages are not batched
+        for _ in range(20):
+            batch_size.update(batch_size=4, duration=8.0)
+        assert batch_size.value == 1
+
+    def test_worker_processes_batches(self) -> None:
+        """Test that the worker passes batches of Messages to the backend."""
+        # Prepare
+        nodes_mapping = {node_id: node_id - 10 for node_id in range(10, 20)}
+        run = Run.create_empty(run_id=1234)
+        node_info_stores = _register_node_info_stores(nodes_mapping, run)
+        messageins_queue: Queue[Message] = Queue()
+        messageres_queue: Queue[Message] = Queue()
+        for node_id in nodes_mapping:
+            messageins_queue.put(
+                message_from_proto(
+                    create_ins_message(
+                        src_node_id=SUPERLINK_NODE_ID,
+                        dst_node_id=node_id,
+                        run_id=run.run_id,
+                    )
+                )
+            )
+        batches: list[int] = []
+
+        def process_messages(
+            jobs: list[tuple[Message, Context]],
+        ) -> list[tuple[Message, Context]]:
+            batches.append(len(jobs))
+            return [(Message(RecordDict(), reply_to=msg), ctx) for msg, ctx in jobs]
+
+        backend = Mock(max_batch_size=8, num_workers=1)
+        backend.process_messages.side_effect = process_messages
+        f_stop = threading.Event()
+
+        # Execute
+        worker_th = threading.Thread(
+            target=worker,
+            args=(
+                messageins_queue,
+                messageres_queue,
+                node_info_stores,
+                backend,
+                f_stop,
+            ),
+        )
+        worker_th.start()
+        replies = [messageres_queue.get(timeout=5) for _ in nodes_mapping]
+        f_stop.set()
+        worker_th.join()
+
+        # Assert
+        assert {reply.metadata.dst_node_id for reply in replies} == {SUPERLINK_NODE_ID}
+        assert sum(batches) == len(nodes_mapping)
+        assert 1 < max(batches) <= 8
@@ -15,13 +15,15 @@
 """In-memory LinkState implementation."""
 
 
+import heapq
 import threading
 import time
 from bisect import bisect_right
 from collections import defaultdict
+from collections.abc import Hashable
 from dataclasses import dataclass, field
 from logging import ERROR, WARNING
-from typing import Optional
+from typing import Callable, Optional, cast
 
 from flwr.common import Context, Message, log, now
 from flwr.common.constant import (
@@ -41,6 +43,7 @@ from flwr.server.superlink.linkstate.linkstate import LinkState
 from flwr.server.utils import validate_message
 
 from .utils import (
+    MessageNotifier,
     check_node_availability_for_in_message,
     generate_rand_int_from_bytes,
     has_valid_sub_status,
@@ -80,47 +83,97 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
         self.message_res_store: dict[str, Message] = {}
         self.message_ins_id_to_message_res_id: dict[str, str] = {}
 
+        # Map dst_node_id to the IDs of its undelivered instruction Messages. The
+        # inner dicts are used as ordered sets to keep FIFO order and O(1) removal
+        self.message_ins_inboxes: dict[int, dict[str, None]] = {}
+        self.num_inbox_message_ins = 0
+        # Map run_id to the IDs of its instruction Messages
+        self.run_id_to_message_ins_ids: dict[int, set[str]] = defaultdict(set)
+        # Min-heap of (expires_at, message_id, dst_node_id) to evict expired
+        # instruction Messages from the inboxes. Entries of Messages that left their
+        # inbox are dropped lazily, see `_compact_message_ins_expiry`
+        self.message_ins_expiry: list[tuple[float, str, int]] = []
+        self.message_ins_notifier = MessageNotifier()
+        self.message_res_notifier = MessageNotifier()
+
         # Map flwr_aid to run_ids for O(1) reverse index lookup
         self.flwr_aid_to_run_ids: dict[str, set[int]] = defaultdict(set)
 
         self.node_public_keys: set[bytes] = set()
 
+        # `lock` guards nodes, runs and keys, `message_lock` guards the message
+        # stores and their indexes. If both are needed, `message_lock` is acquired
+        # first
         self.lock = threading.RLock()
+        self.message_lock = threading.Lock()
 
     def store_message_ins(self, message: Message) -> Optional[str]:
         """Store one Message."""
-        # Validate message
-        errors = validate_message(message, is_reply_message=False)
-        if any(errors):
-            log(ERROR, errors)
-            return None
-        # Validate run_id
-        if message.metadata.run_id not in self.run_ids:
-            log(ERROR, "Invalid run ID for Message: %s", message.metadata.run_id)
-            return None
-        # Validate source node ID
-        if message.metadata.src_node_id != SUPERLINK_NODE_ID:
-            log(
-                ERROR,
-                "Invalid source node ID for Message: %s",
-                message.metadata.src_node_id,
-            )
-            return None
-        # Validate destination node ID
-        if message.metadata.dst_node_id not in self.node_ids:
-            log(
-                ERROR,
-                "Invalid destination node ID for Message: %s",
-                message.metadata.dst_node_id,
-            )
-            return None
+        return self.store_message_ins_batch([message])[0]
 
-        message_id = message.metadata.message_id
+    def store_message_ins_batch(self, messages: list[Message]) -> list[Optional[str]]:
+        """Store multiple Messages."""
+        message_ids: list[Optional[str]] = [None] * len(messages)
+        valid_messages: list[tuple[int, Message]] = []
         with self.lock:
-            self.message_ins_store[message_id] = message
+            for index, message in enumerate(messages):
+                # Validate message
+                errors = validate_message(message, is_reply_message=False)
+                if any(errors):
+                    log(ERROR, errors)
+                    continue
+                # Validate run_id
+                if message.metadata.run_id not in self.run_ids:
+                    log(
+                        ERROR,
+                        "Invalid run ID for Message: %s",
+                        message.metadata.run_id,
+                    )
+                    continue
+                # Validate source node ID
+                if message.metadata.src_node_id != SUPERLINK_NODE_ID:
+                    log(
+                        ERROR,
+                        "Invalid source node ID for Message: %s",
+                        message.metadata.src_node_id,
+                    )
+                    continue
+                # Validate destination node ID
+                if message.metadata.dst_node_id not in self.node_ids:
+                    log(
+                        ERROR,
+                        "Invalid destination node ID for Message: %s",
+                        message.metadata.dst_node_id,
+                    )
+                    continue
+                valid_messages.append((index, message))
+
+        with self.message_lock:
+            for index, message in valid_messages:
+                metadata = message.metadata
+                message_id = metadata.message_id
+                self.message_ins_store[message_id] = message
+                self.run_id_to_message_ins_ids[metadata.run_id].add(message_id)
+                message_ids[index] = message_id
+                inbox = self.message_ins_inboxes.setdefault(metadata.dst_node_id, {})
+                if message_id in inbox:
+                    continue
+                inbox[message_id] = None
+                self.num_inbox_message_ins += 1
+                heapq.heappush(
+                    self.message_ins_expiry,
+                    (
+                        metadata.created_at + metadata.ttl,
+                        message_id,
+                        metadata.dst_node_id,
+                    ),
+                )
 
-        # Return the new message_id
-        return message_id
+        for _, message in valid_messages:
+            self.message_ins_notifier.notify(message.metadata.dst_node_id)
+
+        # Return the new message_ids
+        return message_ids
 
     def get_message_ins(self, node_id: int, limit: Optional[int]) -> list[Message]:
         """Get all Messages that have not been delivered yet."""
@@ -130,107 +183,194 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
         # Find Message for node_id that were not delivered yet
         message_ins_list: list[Message] = []
         current_time = time.time()
-        with self.lock:
-            for _, msg_ins in self.message_ins_store.items():
+        delivered_at = now().isoformat()
+        with self.message_lock:
+            self._evict_expired_message_ins(current_time)
+            inbox = self.message_ins_inboxes.get(node_id)
+            if inbox is None:
+                return message_ins_list
+
+            for message_id in list(inbox):
+                if limit and len(message_ins_list) == limit:
+                    break
+                self._remove_from_inbox(node_id, message_id)
+                msg_ins = self.message_ins_store[message_id]
                 if (
-                    msg_ins.metadata.dst_node_id == node_id
-                    and msg_ins.metadata.delivered_at == ""
+                    msg_ins.metadata.delivered_at == ""
                     and msg_ins.metadata.created_at + msg_ins.metadata.ttl
                     > current_time
                 ):
+                    # Mark as delivered
+                    msg_ins.metadata.delivered_at = delivered_at
                     message_ins_list.append(msg_ins)
-                if limit and len(message_ins_list) == limit:
-                    break
 
-        # Mark all of them as delivered
-        delivered_at = now().isoformat()
-        for msg_ins in message_ins_list:
-            msg_ins.metadata.delivered_at = delivered_at
+            self._compact_message_ins_expiry()
 
         # Return list of messages
         return message_ins_list
 
-    # pylint: disable=R0911
+    def wait_for_message_ins(self, node_id: int, timeout: float) -> bool:
+        """Wait until an instruction Message for the given node is available."""
+        with self.message_ins_notifier.subscribe((node_id,)) as event:
+            with self.message_lock:
+                self._evict_expired_message_ins(time.time())
+                if self.message_ins_inboxes.get(node_id):
+                    return True
+            return event.wait(timeout)
+
+    def add_message_ins_listener(self, callback: Callable[[int], None]) -> None:
+        """Register a function to call for each newly stored instruction Message."""
+        self.message_ins_notifier.add_listener(
+            cast(Callable[[Hashable], None], callback)
+        )
+
+    def remove_message_ins_listener(self, callback: Callable[[int], None]) -> None:
+        """Unregister a function registered with `add_message_ins_listener`."""
+        self.message_ins_notifier.remove_listener(
+            cast(Callable[[Hashable], None], callback)
+        )
+
+    def _evict_expired_message_ins(self, current_time: float) -> None:
+        """Remove expired instruction Messages from the inboxes.
+
+        Expired Messages are kept in `message_ins_store` such that replies to them
+        can still be reported as unavailable.
+        """
+        expiry = self.message_ins_expiry
+        while expiry and expiry[0][0] <= current_time:
+            _, message_id, node_id = heapq.heappop(expiry)
+            self._remove_from_inbox(node_id, message_id)
+
+    def _remove_from_inbox(self, node_id: int, message_id: str) -> None:
+        """Remove an instruction Message from the inbox of a node, if present.
+
+        Empty inboxes are removed. Must be called while holding `message_lock`.
+        """
+        inbox = self.message_ins_inboxes.get(node_id)
+        if inbox is None or message_id not in inbox:
+            return
+        del inbox[message_id]
+        self.num_inbox_message_ins -= 1
+        if not inbox:
+            del self.message_ins_inboxes[node_id]
+
+    def _compact_message_ins_expiry(self) -> None:
+        """Rebuild the expiry heap once most of its entries are dead.
+
+        Entries of delivered or deleted Messages stay in the heap until they expire.
+        Rebuilding the heap when they make up more than half of it bounds its size
+        by twice the number of undelivered Messages at amortized O(1) cost. Must be
+        called while holding `message_lock`.
+        """
+        if len(self.message_ins_expiry) <= 2 * self.num_inbox_message_ins:
+            return
+        self.message_ins_expiry = [
+            entry
+            for entry in self.message_ins_expiry
+            if entry[1] in self.message_ins_inboxes.get(entry[2], ())
+        ]
+        heapq.heapify(self.message_ins_expiry)
+
     def store_message_res(self, message: Message) -> Optional[str]:
         """Store one Message."""
-        # Validate message
-        errors = validate_message(message, is_reply_message=True)
-        if any(errors):
-            log(ERROR, errors)
-            return None
-
+        return self.store_message_res_batch([message])[0]
+
+    def store_message_res_batch(self, messages: list[Message]) -> list[Optional[str]]:
+        """Store multiple Messages."""
+        message_ids: list[Optional[str]] = [None] * len(messages)
+        valid_messages: list[tuple[int, Message]] = []
+        for index, message in enumerate(messages):
+            # Validate message
+            errors = validate_message(message, is_reply_message=True)
+            if any(errors):
+                log(ERROR, errors)
+                continue
+            valid_messages.append((index, message))
+
+        stored_msg_ins_ids: list[str] = []
+        with self.message_lock:
+            for index, message in valid_messages:
+                if not self._check_message_res(message):
+                    continue
+                message_id = message.metadata.message_id
+                msg_ins_id = message.metadata.reply_to_message_id
+                self.message_res_store[message_id] = message
+                self.message_ins_id_to_message_res_id[msg_ins_id] = message_id
+                stored_msg_ins_ids.append(msg_ins_id)
+                message_ids[index] = message_id
+
+        for msg_ins_id in stored_msg_ins_ids:
+            self.message_res_notifier.notify(msg_ins_id)
+
+        # Return the new message_ids
+        return message_ids
+
+    def _check_message_res(self, message: Message) -> bool:
+        """Check whether a reply Message can be stored.
+
+        Must be called while holding `message_lock`.
+        """
         res_metadata = message.metadata
-        with self.lock:
-            # Check if the Message it is replying to exists and is valid
-            msg_ins_id = res_metadata.reply_to_message_id
-            msg_ins = self.message_ins_store.get(msg_ins_id)
-
-            # Ensure that dst_node_id of original Message matches the src_node_id of
-            # reply Message.
-            if (
-                msg_ins
-                and message
-                and msg_ins.metadata.dst_node_id != res_metadata.src_node_id
-            ):
-                return None
 
-            if msg_ins is None:
-                log(
-                    ERROR,
-                    "Message with ID %s does not exist.",
-                    msg_ins_id,
-                )
-                return None
+        # Check if the Message it is replying to exists and is valid
+        msg_ins_id = res_metadata.reply_to_message_id
+        msg_ins = self.message_ins_store.get(msg_ins_id)
+        if msg_ins is None:
+            log(
+                ERROR,
+                "Message with ID %s does not exist.",
+                msg_ins_id,
+            )
+            return False
 
-            ins_metadata = msg_ins.metadata
-            if ins_metadata.created_at + ins_metadata.ttl <= time.time():
-                log(
-                    ERROR,
-                    "Failed to store Message: the message it is replying to "
-                    "(with ID %s) has expired",
-                    msg_ins_id,
-                )
-                return None
+        # Ensure that dst_node_id of original Message matches the src_node_id of
+        # reply Message.
+        ins_metadata = msg_ins.metadata
+        if ins_metadata.dst_node_id != res_metadata.src_node_id:
+            return False
 
-            # Fail if the Message TTL exceeds the
-            # expiration time of the Message it replies to.
-            # Condition: ins_metadata.created_at + ins_metadata.ttl ≥
-            #            res_metadata.created_at + res_metadata.ttl
-            # A small tolerance is introduced to account
-            # for floating-point precision issues.
-            max_allowed_ttl = (
-                ins_metadata.created_at + ins_metadata.ttl - res_metadata.created_at
+        if ins_metadata.created_at + ins_metadata.ttl <= time.time():
+            log(
+                ERROR,
+                "Failed to store Message: the message it is replying to "
+                "(with ID %s) has expired",
+                msg_ins_id,
             )
-            if res_metadata.ttl and (
-                res_metadata.ttl - max_allowed_ttl > MESSAGE_TTL_TOLERANCE
-            ):
-                log(
-                    WARNING,
-                    "Received Message with TTL %.2f exceeding the allowed maximum "
-                    "TTL %.2f.",
-                    res_metadata.ttl,
-                    max_allowed_ttl,
-                )
-                return None
+            return False
+
+        # Fail if the Message TTL exceeds the
+        # expiration time of the Message it replies to.
+        # Condition: ins_metadata.created_at + ins_metadata.ttl ≥
+        #            res_metadata.created_at + res_metadata.ttl
+        # A small tolerance is introduced to account
+        # for floating-point precision issues.
+        max_allowed_ttl = (
+            ins_metadata.created_at + ins_metadata.ttl - res_metadata.created_at
+        )
+        if res_metadata.ttl and (
+            res_metadata.ttl - max_allowed_ttl > MESSAGE_TTL_TOLERANCE
+        ):
+            log(
+                WARNING,
+                "Received Message with TTL %.2f exceeding the allowed maximum "
+                "TTL %.2f.",
+                res_metadata.ttl,
+                max_allowed_ttl,
+            )
+            return False
 
         # Validate run_id
         if res_metadata.run_id != ins_metadata.run_id:
             log(ERROR, "`metadata.run_id` is invalid")
-            return None
-
-        message_id = message.metadata.message_id
-        with self.lock:
-            self.message_res_store[message_id] = message
-            self.message_ins_id_to_message_res_id[msg_ins_id] = message_id
+            return False
 
-        # Return the new message_id
-        return message_id
+        return True
 
     def get_message_res(self, message_ids: set[str]) -> list[Message]:
         """Get reply Messages for the given Message IDs."""
         ret: dict[str, Message] = {}
 
-        with self.lock:
+        with self.message_lock:
             current = time.time()
 
             # Verify Message IDs
@@ -245,14 +385,16 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
                 self.message_ins_store[message_id].metadata.dst_node_id
                 for message_id in message_ids
             }
-            tmp_ret_dict = check_node_availability_for_in_message(
-                inquired_in_message_ids=message_ids,
-                found_in_message_dict=self.message_ins_store,
-                node_id_to_online_until={
+            with self.lock:
+                node_id_to_online_until = {
                     node_id: self.node_ids[node_id][0]
                     for node_id in dst_node_ids
                     if node_id in self.node_ids
-                },
+                }
+            tmp_ret_dict = check_node_availability_for_in_message(
+                inquired_in_message_ids=message_ids,
+                found_in_message_dict=self.message_ins_store,
+                node_id_to_online_until=node_id_to_online_until,
                 current_time=current,
             )
             ret.update(tmp_ret_dict)
@@ -282,32 +424,49 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
 
         return list(ret.values())
 
+    def wait_for_message_res(self, message_ids: set[str], timeout: float) -> bool:
+        """Wait until a reply to any of the given Message IDs is available."""
+        with self.message_res_notifier.subscribe(message_ids) as event:
+            with self.message_lock:
+                for message_id in message_ids:
+                    message_res_id = self.message_ins_id_to_message_res_id.get(
+                        message_id
+                    )
+                    if (
+                        message_res_id
+                        and self.message_res_store[message_res_id].metadata.delivered_at
+                        == ""
+                    ):
+                        return True
+            return event.wait(timeout)
+
     def delete_messages(self, message_ins_ids: set[str]) -> None:
         """Delete a Message and its reply based on provided Message IDs."""
         if not message_ins_ids:
             return
 
-        with self.lock:
+        with self.message_lock:
             for message_id in message_ins_ids:
-                # Delete Messages
-                if message_id in self.message_ins_store:
-                    del self.message_ins_store[message_id]
+                # Delete Messages and remove them from the indexes
+                if msg_ins := self.message_ins_store.pop(message_id, None):
+                    metadata = msg_ins.metadata
+                    self._remove_from_inbox(metadata.dst_node_id, message_id)
+                    run_message_ids = self.run_id_to_message_ins_ids[metadata.run_id]
+                    run_message_ids.discard(message_id)
+                    if not run_message_ids:
+                        del self.run_id_to_message_ins_ids[metadata.run_id]
                 # Delete Message replies
                 if message_id in self.message_ins_id_to_message_res_id:
                     message_res_id = self.message_ins_id_to_message_res_id.pop(
                         message_id
                     )
                     del self.message_res_store[message_res_id]
+            self._compact_message_ins_expiry()
 
     def get_message_ids_from_run_id(self, run_id: int) -> set[str]:
         """Get all instruction Message IDs for the given run_id."""
-        message_id_list: set[str] = set()
-        with self.lock:
-            for message_id, message in self.message_ins_store.items():
-                if message.metadata.run_id == run_id:
-                    message_id_list.add(message_id)
-
-        return message_id_list
+        with self.message_lock:
+            return set(self.run_id_to_message_ins_ids.get(run_id, ()))
 
     def num_message_ins(self) -> int:
         """Calculate the number of instruction Messages in store.
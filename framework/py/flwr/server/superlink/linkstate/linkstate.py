@@ -16,7 +16,7 @@
 
 
 import abc
-from typing import Optional
+from typing import Callable, Optional
 
 from flwr.common import Context, Message
 from flwr.common.record import ConfigRecord
@@ -44,6 +44,19 @@ class LinkState(abc.ABC):  # pylint: disable=R0904
         storing the `message` MUST fail.
         """
 
+    @abc.abstractmethod
+    def store_message_ins_batch(self, messages: list[Message]) -> list[Optional[str]]:
+        """Store multiple Messages.
+
+        Usually, the ServerAppIo API calls this to schedule the instructions of a
+        round at once, which is cheaper than calling `store_message_ins` for each
+        of them.
+
+        Each Message is validated as in `store_message_ins`. Returns a list of the
+        same length as `messages`, containing the `message_id` (str) of each stored
+        Message or `None` if storing it failed.
+        """
+
     @abc.abstractmethod
     def get_message_ins(self, node_id: int, limit: Optional[int]) -> list[Message]:
         """Get zero or more `Message` objects for the provided `node_id`.
@@ -59,6 +72,54 @@ class LinkState(abc.ABC):  # pylint: disable=R0904
         `limit` is set, it has to be greater zero.
         """
 
+    @abc.abstractmethod
+    def wait_for_message_ins(self, node_id: int, timeout: float) -> bool:
+        """Wait until an instruction Message for the given node is available.
+
+        Usually, the Fleet API calls this to hold `PullMessages` requests of idle
+        nodes instead of letting them poll `get_message_ins`.
+
+        Parameters
+        ----------
+        node_id : int
+            The ID of the node to wait for an instruction Message for.
+        timeout : float
+            The maximum time to wait in seconds.
+
+        Returns
+        -------
+        bool
+            `True` if a Message that was not delivered yet is available, `False` if
+            `timeout` expired.
+        """
+
+    @abc.abstractmethod
+    def add_message_ins_listener(self, callback: Callable[[int], None]) -> None:
+        """Register a function to call for each newly stored instruction Message.
+
+        Usually, the Simulation Engine calls this to dispatch instruction Messages to
+        its virtual nodes as they are stored instead of polling `get_message_ins` for
+        every node.
+
+        Parameters
+        ----------
+        callback : Callable[[int], None]
+            The function to call with the destination node ID of each instruction
+            Message stored through this LinkState from now on. Messages stored by
+            other processes sharing the same database are not reported. It must
+            return quickly, as it is called by the thread storing the Messages.
+        """
+
+    @abc.abstractmethod
+    def remove_message_ins_listener(self, callback: Callable[[int], None]) -> None:
+        """Unregister a function registered with `add_message_ins_listener`.
+
+        Parameters
+        ----------
+        callback : Callable[[int], None]
+            The function to no longer call for newly stored instruction Messages.
+        """
+
     @abc.abstractmethod
     def store_message_res(self, message: Message) -> Optional[str]:
         """Store one Message.
@@ -76,6 +137,19 @@ class LinkState(abc.ABC):  # pylint: disable=R0904
         storing the `message` MUST fail.
         """
 
+    @abc.abstractmethod
+    def store_message_res_batch(self, messages: list[Message]) -> list[Optional[str]]:
+        """Store multiple reply Messages.
+
+        Usually, the Simulation Engine calls this to store the replies of its virtual
+        nodes at once, which is cheaper than calling `store_message_res` for each of
+        them.
+
+        Each Message is validated as in `store_message_res`. Returns a list of the
+        same length as `messages`, containing the `message_id` (str) of each stored
+        Message or `None` if storing it failed.
+        """
+
     @abc.abstractmethod
     def get_message_res(self, message_ids: set[str]) -> list[Message]:
         """Get reply Messages for the given Message IDs.
@@ -111,6 +185,28 @@ class LinkState(abc.ABC):  # pylint: disable=R0904
     def num_message_res(self) -> int:
         """Calculate the number of reply Messages in store."""
 
+    @abc.abstractmethod
+    def wait_for_message_res(self, message_ids: set[str], timeout: float) -> bool:
+        """Wait until a reply to any of the given Message IDs is available.
+
+        Usually, the ServerAppIo API calls this to return replies to the ServerApp
+        as soon as they are stored instead of polling `get_message_res`.
+
+        Parameters
+        ----------
+        message_ids : set[str]
+            A set of Message IDs to wait for replies to.
+        timeout : float
+            The maximum time to wait in seconds.
+
+        Returns
+        -------
+        bool
+            `True` if a reply that was not delivered yet is available, `False` if
+            `timeout` expired. Error replies generated by `get_message_res` for
+            expired Messages or unavailable nodes do not end the wait.
+        """
+
     @abc.abstractmethod
     def delete_messages(self, message_ins_ids: set[str]) -> None:
         """Delete a Message and its reply based on provided Message IDs.
@@ -15,9 +15,11 @@
 """Factory class that creates State instances."""
 
 
+import threading
 from logging import DEBUG
 from typing import Optional
 
+from flwr.common.constant import POSTGRES_URL_PREFIXES
 from flwr.common.logger import log
 
 from .in_memory_linkstate import InMemoryLinkState
@@ -34,12 +36,15 @@ class LinkStateFactory:
         A string representing the path to the database file that will be opened.
         Note that passing ':memory:' will open a connection to a database that is
         in RAM, instead of on disk. For more information on special in-memory
-        databases, please refer to https://sqlite.org/inmemorydb.html.
+        databases, please refer to https://sqlite.org/inmemorydb.html. Passing a
+        URL starting with `postgresql://` connects to a PostgreSQL database, which
+        can be shared by multiple SuperLinks.
     """
 
     def __init__(self, database: str) -> None:
         self.database = database
         self.state_instance: Optional[LinkState] = None
+        self.lock = threading.Lock()
 
     def state(self) -> LinkState:
         """Return a State instance and create it, if necessary."""
@@ -50,8 +55,32 @@ class LinkStateFactory:
             log(DEBUG, "Using InMemoryState")
             return self.state_instance
 
-        # SqliteState
-        state = SqliteLinkState(self.database)
-        state.initialize()
+        # PostgresState, shared by all SuperLinks connected to the same database
+        if self.database.startswith(POSTGRES_URL_PREFIXES):
+            with self.lock:
+                if self.state_instance is None:
+                    # Only import the optional dependency if it is needed
+                    # pylint: disable-next=import-outside-toplevel
+                    from .postgres_linkstate import PostgresLinkState
+
+                    postgres_state = PostgresLinkState(self.database)
+                    postgres_state.initialize()
+                    self.state_instance = postgres_state
+            log(DEBUG, "Using PostgresState")
+            return self.state_instance
+
+        # SqliteState, the tables are created once and each thread uses its own
+        # connection to the shared instance
+        with self.lock:
+            if self.state_instance is None:
+                state = SqliteLinkState(self.database)
+                state.initialize()
+                self.state_instance = state
         log(DEBUG, "Using SqliteState")
-        return state
+        return self.state_instance
+
+    def close(self) -> None:
+        """Close the State instance, if any, writing the data it buffers."""
+        with self.lock:
+            if isinstance(self.state_instance, SqliteLinkState):
+                self.state_instance.close()
@@ -15,13 +15,16 @@
 """Tests all LinkState implemenations have to conform to."""
 # pylint: disable=invalid-name, too-many-lines, R0904, R0913
 
+import os
+import sqlite3
 import tempfile
+import threading
 import time
 import unittest
 from abc import abstractmethod
 from datetime import datetime, timedelta, timezone
 from itertools import product
-from typing import Optional
+from typing import Optional, cast
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -60,8 +63,20 @@ from flwr.proto.recorddict_pb2 import RecordDict as ProtoRecordDict
 from flwr.server.superlink.linkstate import (
     InMemoryLinkState,
     LinkState,
+    LinkStateFactory,
     SqliteLinkState,
 )
+from flwr.server.superlink.linkstate.sqlite_linkstate import SQL_MIGRATIONS
+
+# Connection URL of a PostgreSQL database, whose content is deleted by the tests
+POSTGRES_URL = os.environ.get("FLWR_TEST_POSTGRES_URL")
+
+SQL_SELECT_INDEXES = "SELECT name FROM sqlite_schema WHERE type = 'index';"
+SQLITE_MESSAGE_INDEXES = (
+    "idx_message_ins_dst_node",
+    "idx_message_ins_run",
+    "idx_message_res_reply_to",
+)
 
 
 class StateTest(unittest.TestCase):
@@ -397,6 +412,138 @@ class StateTest(unittest.TestCase):
         assert state.store_message_ins(msg) is None
         assert state.store_message_ins(msg2) is None
 
+    def test_store_message_ins_batch(self) -> None:
+        """Test store_message_ins_batch with valid and invalid Messages."""
+        # Prepare
+        state = self.state_factory()
+        node_ids = [state.create_node(1e3) for _ in range(3)]
+        invalid_node_id = 61016 if 61016 not in node_ids else 61017
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        valid_msgs = [
+            message_from_proto(
+                create_ins_message(
+                    src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+                )
+            )
+            for node_id in node_ids
+        ]
+        # A message for a node that doesn't exist
+        msg_invalid_node = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID,
+                dst_node_id=invalid_node_id,
+                run_id=run_id,
+            )
+        )
+        # A message for a run that doesn't exist
+        msg_invalid_run = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_ids[0], run_id=61016
+            )
+        )
+        msgs = [valid_msgs[0], msg_invalid_node, valid_msgs[1], msg_invalid_run]
+        msgs.append(valid_msgs[2])
+
+        # Execute
+        message_ids = state.store_message_ins_batch(msgs)
+
+        # Assert
+        assert message_ids == [
+            valid_msgs[0].metadata.message_id,
+            None,
+            valid_msgs[1].metadata.message_id,
+            None,
+            valid_msgs[2].metadata.message_id,
+        ]
+        assert state.num_message_ins() == 3
+        for node_id, msg in zip(node_ids, valid_msgs):
+            pulled = state.get_message_ins(node_id=node_id, limit=None)
+            assert [m.metadata.message_id for m in pulled] == [msg.metadata.message_id]
+
+    def test_store_message_ins_batch_empty(self) -> None:
+        """Test store_message_ins_batch without Messages."""
+        # Prepare
+        state = self.state_factory()
+
+        # Execute and assert
+        assert not state.store_message_ins_batch([])
+
+    def test_store_message_res_batch(self) -> None:
+        """Test store_message_res_batch with valid and invalid Messages."""
+        # Prepare
+        state = self.state_factory()
+        node_id = state.create_node(1e3)
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        msgs = [
+            message_from_proto(
+                create_ins_message(
+                    src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+                )
+            )
+            for _ in range(3)
+        ]
+        # The last Message is not stored
+        state.store_message_ins_batch(msgs[:2])
+        replies = [Message(RecordDict(), reply_to=msg) for msg in msgs]
+        for reply in replies:
+            # pylint: disable-next=W0212
+            reply.metadata._message_id = str(uuid4())  # type: ignore
+
+        # Execute
+        message_ids = state.store_message_res_batch(
+            [replies[0], replies[2], replies[1]]
+        )
+
+        # Assert
+        assert message_ids == [
+            replies[0].metadata.message_id,
+            None,
+            replies[1].metadata.message_id,
+        ]
+        assert state.num_message_res() == 2
+        res = state.get_message_res({msgs[0].metadata.message_id})
+        assert [msg.metadata.message_id for msg in res] == message_ids[:1]
+        assert not state.store_message_res_batch([])
+
+    def test_add_message_ins_listener(self) -> None:
+        """Test that listeners are called with the node IDs of stored Messages."""
+        # Prepare
+        state = self.state_factory()
+        node_ids = [state.create_node(1e3) for _ in range(3)]
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        msgs = [
+            message_from_proto(
+                create_ins_message(
+                    src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+                )
+            )
+            for node_id in node_ids
+        ]
+        notified: list[int] = []
+
+        # Execute
+        state.store_message_ins(msgs[0])
+        state.add_message_ins_listener(notified.append)
+        state.store_message_ins_batch(msgs[1:])
+
+        # Assert
+        assert notified == node_ids[1:]
+
+        # Execute
+        state.remove_message_ins_listener(notified.append)
+        state.store_message_ins(
+            message_from_proto(
+                create_ins_message(
+                    src_node_id=SUPERLINK_NODE_ID,
+                    dst_node_id=node_ids[0],
+                    run_id=run_id,
+                )
+            )
+        )
+
+        # Assert
+        assert notified == node_ids[1:]
+
     def test_store_and_delete_messages(self) -> None:
         """Test delete_message."""
         # Prepare
@@ -1006,6 +1153,112 @@ class StateTest(unittest.TestCase):
         assert err_message.has_error()
         assert err_message.error.code == ErrorCode.NODE_UNAVAILABLE
 
+    def test_wait_for_message_res(self) -> None:
+        """Test that wait_for_message_res returns once a reply is stored."""
+        # Prepare
+        state: LinkState = self.state_factory()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        node_id = state.create_node(1e3)
+        msg = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+            )
+        )
+        msg_id = cast(str, state.store_message_ins(message=msg))
+        msg_to_reply_to = state.get_message_ins(node_id=node_id, limit=1)[0]
+        reply_msg = Message(RecordDict(), reply_to=msg_to_reply_to)
+        reply_msg.metadata.__dict__["_message_id"] = reply_msg.object_id
+        timer = threading.Timer(0.2, state.store_message_res, args=(reply_msg,))
+
+        # Execute
+        start = time.monotonic()
+        timer.start()
+        available = state.wait_for_message_res({msg_id}, timeout=10)
+        elapsed = time.monotonic() - start
+        timer.join()
+
+        # Assert
+        assert available
+        assert elapsed < 5
+        # Returns immediately while the reply is not delivered
+        assert state.wait_for_message_res({msg_id}, timeout=10)
+        # Delivered replies don't count
+        assert len(state.get_message_res({msg_id})) == 1
+        assert not state.wait_for_message_res({msg_id}, timeout=0.1)
+
+    def test_wait_for_message_res_timeout(self) -> None:
+        """Test that wait_for_message_res returns after the timeout without replies."""
+        # Prepare
+        state: LinkState = self.state_factory()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        node_id = state.create_node(1e3)
+        msg = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+            )
+        )
+        msg_id = cast(str, state.store_message_ins(message=msg))
+
+        # Execute
+        start = time.monotonic()
+        available = state.wait_for_message_res({msg_id}, timeout=0.2)
+
+        # Assert
+        assert not available
+        assert time.monotonic() - start >= 0.2
+
+    def test_wait_for_message_ins(self) -> None:
+        """Test that wait_for_message_ins returns once a Message is stored."""
+        # Prepare
+        state: LinkState = self.state_factory()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        node_id = state.create_node(1e3)
+        msg = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+            )
+        )
+        timer = threading.Timer(0.2, state.store_message_ins, args=(msg,))
+
+        # Execute
+        start = time.monotonic()
+        timer.start()
+        available = state.wait_for_message_ins(node_id, timeout=10)
+        elapsed = time.monotonic() - start
+        timer.join()
+
+        # Assert
+        assert available
+        assert elapsed < 5
+        # Returns immediately while the Message is not delivered
+        assert state.wait_for_message_ins(node_id, timeout=10)
+        # Delivered Messages don't count
+        assert len(state.get_message_ins(node_id=node_id, limit=None)) == 1
+        assert not state.wait_for_message_ins(node_id, timeout=0.1)
+
+    def test_wait_for_message_ins_timeout(self) -> None:
+        """Test that wait_for_message_ins returns after the timeout without Messages."""
+        # Prepare
+        state: LinkState = self.state_factory()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        node_id = state.create_node(1e3)
+        other_node_id = state.create_node(1e3)
+        # A Message for another node must not wake up the waiting node
+        msg = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=other_node_id, run_id=run_id
+            )
+        )
+        state.store_message_ins(msg)
+
+        # Execute
+        start = time.monotonic()
+        available = state.wait_for_message_ins(node_id, timeout=0.2)
+
+        # Assert
+        assert not available
+        assert time.monotonic() - start >= 0.2
+
     def test_store_message_res_message_ins_expired(self) -> None:
         """Test behavior of store_message_res when the Message it replies to is
         expired."""
@@ -1394,6 +1647,37 @@ class StateTest(unittest.TestCase):
         unique_int = next(num for num in range(0, 1) if num not in {run_id})
         assert state.get_federation_options(run_id=unique_int) is None
 
+    def test_concurrent_get_message_ins(self) -> None:
+        """Test that concurrent pulls never deliver the same Message twice."""
+        # Prepare
+        state = self.state_factory()
+        node_id = state.create_node(1e3)
+        run_id = state.create_run(None, None, None, {}, ConfigRecord(), None)
+        for _ in range(50):
+            msg = message_from_proto(
+                create_ins_message(
+                    src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+                )
+            )
+            state.store_message_ins(msg)
+        lock = threading.Lock()
+        delivered: list[str] = []
+
+        def pull() -> None:
+            while messages := state.get_message_ins(node_id=node_id, limit=3):
+                with lock:
+                    delivered.extend(msg.metadata.message_id for msg in messages)
+
+        # Execute
+        threads = [threading.Thread(target=pull) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(delivered) == len(set(delivered)) == 50
+
 
 def create_ins_message(
     src_node_id: int,
@@ -1459,6 +1743,135 @@ class InMemoryStateTest(StateTest):
         """Return InMemoryState."""
         return InMemoryLinkState()
 
+    def test_get_message_ins_fifo_inbox(self) -> None:
+        """Test that Messages are pulled in FIFO order from the node's inbox."""
+        # Prepare
+        state = cast(InMemoryLinkState, self.state_factory())
+        node_id_0 = state.create_node(1e3)
+        node_id_1 = state.create_node(1e3)
+        run_id = state.create_run(None, None, None, {}, ConfigRecord(), None)
+        message_ids = []
+        for dst_node_id in [node_id_0, node_id_1] * 3:
+            msg = message_from_proto(
+                create_ins_message(
+                    src_node_id=SUPERLINK_NODE_ID,
+                    dst_node_id=dst_node_id,
+                    run_id=run_id,
+                )
+            )
+            message_ids.append(state.store_message_ins(msg))
+
+        # Execute
+        first = state.get_message_ins(node_id=node_id_0, limit=2)
+        second = state.get_message_ins(node_id=node_id_0, limit=2)
+
+        # Assert
+        assert [msg.metadata.message_id for msg in first + second] == message_ids[::2]
+        assert list(state.message_ins_inboxes) == [node_id_1]
+        assert len(state.message_ins_inboxes[node_id_1]) == 3
+
+    def test_expired_message_ins_evicted_from_inbox(self) -> None:
+        """Test that expired Messages are removed from the inbox but kept in store."""
+        # Prepare
+        state = cast(InMemoryLinkState, self.state_factory())
+        node_id = state.create_node(1e3)
+        run_id = state.create_run(None, None, None, {}, ConfigRecord(), None)
+        msg = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+            )
+        )
+        msg.metadata.ttl = 10
+        message_id = state.store_message_ins(msg)
+
+        # Execute
+        with patch("time.time", side_effect=lambda: msg.metadata.created_at + 11):
+            message_list = state.get_message_ins(node_id=node_id, limit=None)
+
+        # Assert
+        assert not message_list
+        assert not state.message_ins_inboxes
+        assert not state.message_ins_expiry
+        assert message_id in state.message_ins_store
+
+    def test_delete_messages_updates_indexes(self) -> None:
+        """Test that deleted Messages are removed from all indexes."""
+        # Prepare
+        state = cast(InMemoryLinkState, self.state_factory())
+        node_id = state.create_node(1e3)
+        run_id = state.create_run(None, None, None, {}, ConfigRecord(), None)
+        message_ids = set()
+        for _ in range(3):
+            msg = message_from_proto(
+                create_ins_message(
+                    src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+                )
+            )
+            message_ids.add(cast(str, state.store_message_ins(msg)))
+
+        # Execute
+        state.delete_messages(message_ids)
+
+        # Assert
+        assert not state.get_message_ids_from_run_id(run_id)
+        assert not state.run_id_to_message_ins_ids
+        assert node_id not in state.message_ins_inboxes
+        assert not state.message_ins_expiry
+        assert not state.get_message_ins(node_id=node_id, limit=None)
+
+    def test_message_ins_expiry_compacted_after_delivery(self) -> None:
+        """Test that the expiry heap does not keep entries of delivered Messages."""
+        # Prepare
+        state = cast(InMemoryLinkState, self.state_factory())
+        node_id = state.create_node(1e3)
+        run_id = state.create_run(None, None, None, {}, ConfigRecord(), None)
+        for _ in range(10):
+            msg = message_from_proto(
+                create_ins_message(
+                    src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+                )
+            )
+            state.store_message_ins(msg)
+
+        # Execute
+        for num_delivered in range(1, 11):
+            state.get_message_ins(node_id=node_id, limit=1)
+
+            # Assert: At most half of the entries are dead
+            assert len(state.message_ins_expiry) <= 2 * (10 - num_delivered)
+        assert not state.message_ins_expiry
+        assert not state.message_ins_inboxes
+
+
+@unittest.skipUnless(POSTGRES_URL, "Set FLWR_TEST_POSTGRES_URL to run")
+class PostgresStateTest(StateTest):
+    """Test PostgresState implementation."""
+
+    __test__ = True
+
+    def state_factory(self) -> LinkState:
+        """Return PostgresState with an empty database."""
+        # Only import the optional dependency if it is needed
+        # pylint: disable-next=import-outside-toplevel
+        from .postgres_linkstate import PostgresLinkState
+
+        state = PostgresLinkState(cast(str, POSTGRES_URL), max_connections=4)
+        state.initialize()
+        state.clear()
+        self.addCleanup(state.close)
+        return state
+
+    def test_sqlite_only_syntax(self) -> None:
+        """Test that queries with SQLite-specific syntax are rejected."""
+        # Prepare
+        state = cast(SqliteLinkState, self.state_factory())
+
+        # Execute and assert
+        with self.assertRaises(ValueError):
+            state.query("SELECT * FROM message_res ORDER BY rowid;")
+        with self.assertRaises(AttributeError):
+            SqliteLinkState.delete_node(state, 0)
+
 
 class SqliteInMemoryStateTest(StateTest, unittest.TestCase):
     """Test SqliteState implemenation with in-memory database."""
@@ -1480,7 +1893,211 @@ class SqliteInMemoryStateTest(StateTest, unittest.TestCase):
         result = state.query("SELECT name FROM sqlite_schema;")
 
         # Assert
-        assert len(result) == 15
+        assert len(result) == 18
+
+    def test_store_message_batches_in_chunks(self) -> None:
+        """Test that the IDs looked up when storing batches are chunked."""
+        # Prepare
+        state = self.state_factory()
+        node_ids = [state.create_node(1e3) for _ in range(3)]
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        msgs = [
+            message_from_proto(
+                create_ins_message(
+                    src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+                )
+            )
+            for node_id in node_ids
+        ]
+        replies = [Message(RecordDict(), reply_to=msg) for msg in msgs]
+        for reply in replies:
+            # pylint: disable-next=W0212
+            reply.metadata._message_id = str(uuid4())  # type: ignore
+
+        # Execute
+        with (
+            patch(
+                "flwr.server.superlink.linkstate.sqlite_linkstate.MAX_QUERY_PARAMETERS",
+                2,
+            ),
+            patch.object(state, "query", wraps=state.query) as mock_query,
+        ):
+            ins_ids = state.store_message_ins_batch(msgs)
+            res_ids = state.store_message_res_batch(replies)
+
+        # Assert
+        assert ins_ids == [msg.metadata.message_id for msg in msgs]
+        assert res_ids == [reply.metadata.message_id for reply in replies]
+        assert all(
+            len(call.args[1]) <= 2
+            for call in mock_query.call_args_list
+            if " IN (" in call.args[0]
+        )
+
+    def test_wait_for_message_res_in_chunks(self) -> None:
+        """Test that the IDs checked by wait_for_message_res are chunked."""
+        # Prepare
+        state = self.state_factory()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        node_id = state.create_node(1e3)
+        msg = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+            )
+        )
+        msg_id = cast(str, state.store_message_ins(message=msg))
+        msg_to_reply_to = state.get_message_ins(node_id=node_id, limit=1)[0]
+        reply_msg = Message(RecordDict(), reply_to=msg_to_reply_to)
+        reply_msg.metadata.__dict__["_message_id"] = reply_msg.object_id
+        state.store_message_res(reply_msg)
+        message_ids = {str(uuid4()) for _ in range(4)} | {msg_id}
+
+        # Execute
+        with (
+            patch(
+                "flwr.server.superlink.linkstate.sqlite_linkstate.MAX_QUERY_PARAMETERS",
+                2,
+            ),
+            patch.object(state, "query", wraps=state.query) as mock_query,
+        ):
+            available = state.wait_for_message_res(message_ids, timeout=0.1)
+
+        # Assert
+        assert available
+        assert all(
+            len(call.args[1]) <= 2
+            for call in mock_query.call_args_list
+            if " IN (" in call.args[0]
+        )
+
+    def test_run_status_cache(self) -> None:
+        """Test that run statuses are cached and invalidated on updates."""
+        # Prepare
+        state = self.state_factory()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        state.get_run_status({run_id})
+
+        # Execute
+        with patch.object(state, "query", wraps=state.query) as mock_query:
+            cached_status = state.get_run_status({run_id})[run_id]
+            num_queries_cached = mock_query.call_count
+        state.update_run_status(run_id, RunStatus(Status.STARTING, "", ""))
+        updated_status = state.get_run_status({run_id})[run_id]
+
+        # Assert
+        assert num_queries_cached == 0
+        assert cached_status.status == Status.PENDING
+        assert updated_status.status == Status.STARTING
+        assert state.run_status_cache.hits == 1
+
+    def test_run_status_cache_heartbeat_expiry(self) -> None:
+        """Test that cached statuses of runs without heartbeat are not used."""
+        # Prepare
+        state = self.state_factory()
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        state.update_run_status(run_id, RunStatus(Status.STARTING, "", ""))
+        state.update_run_status(run_id, RunStatus(Status.RUNNING, "", ""))
+        state.acknowledge_app_heartbeat(run_id, heartbeat_interval=0.1)
+        assert state.get_run_status({run_id})[run_id].status == Status.RUNNING
+
+        # Execute
+        time.sleep(HEARTBEAT_PATIENCE * 0.1 + 0.1)
+        status = state.get_run_status({run_id})[run_id]
+
+        # Assert
+        assert status.status == Status.FINISHED
+        assert status.sub_status == SubStatus.FAILED
+
+    def test_node_heartbeats_are_buffered(self) -> None:
+        """Test that node heartbeats are buffered until the availability is read."""
+        # Prepare
+        state = self.state_factory()
+        state.heartbeat_buffer.max_staleness = 100
+        run_id = state.create_run(None, None, "9f86d08", {}, ConfigRecord(), "i1r9f")
+        node_id = state.create_node(heartbeat_interval=1e-9)
+        query = "SELECT online_until FROM node;"
+        online_until = state.query(query)[0]["online_until"]
+
+        # Execute
+        acknowledged = state.acknowledge_node_heartbeat(node_id, 1e3)
+        online_until_buffered = state.query(query)[0]["online_until"]
+        node_ids = state.get_nodes(run_id)
+        online_until_flushed = state.query(query)[0]["online_until"]
+
+        # Assert
+        assert acknowledged
+        assert online_until_buffered == online_until
+        assert node_ids == {node_id}
+        assert online_until_flushed > time.time() + 1e3
+
+    def test_node_heartbeats_are_flushed_in_batches(self) -> None:
+        """Test that buffered node heartbeats are written once they are due."""
+        # Prepare
+        state = self.state_factory()
+        state.heartbeat_buffer.max_staleness = 0.1
+        node_ids = [state.create_node(heartbeat_interval=1e-9) for _ in range(3)]
+        query = "SELECT online_until FROM node;"
+
+        # Execute
+        for node_id in node_ids:
+            state.acknowledge_node_heartbeat(node_id, 1e3)
+        num_updated_before = sum(
+            row["online_until"] > time.time() for row in state.query(query)
+        )
+        time.sleep(0.2)
+        state.acknowledge_node_heartbeat(node_ids[0], 1e3)
+        num_updated_after = sum(
+            row["online_until"] > time.time() for row in state.query(query)
+        )
+
+        # Assert
+        assert num_updated_before == 0
+        assert num_updated_after == 3
+
+    def test_node_heartbeats_are_flushed_periodically(self) -> None:
+        """Test that buffered node heartbeats are written without further calls."""
+        # Prepare
+        state = self.state_factory()
+        state.heartbeat_buffer.max_staleness = 0.1
+        node_id = state.create_node(heartbeat_interval=1e-9)
+        query = "SELECT online_until FROM node;"
+
+        # Execute
+        state.acknowledge_node_heartbeat(node_id, 1e3)
+        time.sleep(0.5)
+        online_until = state.query(query)[0]["online_until"]
+
+        # Assert
+        assert online_until > time.time() + 1e3
+
+    def test_node_heartbeats_are_flushed_on_close(self) -> None:
+        """Test that buffered node heartbeats are written when closing the state."""
+        # Prepare
+        state = self.state_factory()
+        state.heartbeat_buffer.max_staleness = 100
+        node_id = state.create_node(heartbeat_interval=1e-9)
+        query = "SELECT online_until FROM node;"
+
+        # Execute
+        state.acknowledge_node_heartbeat(node_id, 1e3)
+        state.close()
+        online_until = state.query(query)[0]["online_until"]
+
+        # Assert
+        assert online_until > time.time() + 1e3
+
+    def test_acknowledge_node_heartbeat_after_delete(self) -> None:
+        """Test that heartbeats of deleted nodes are not acknowledged."""
+        # Prepare
+        state = self.state_factory()
+        node_id = state.create_node(heartbeat_interval=10)
+        assert state.acknowledge_node_heartbeat(node_id, 10)
+
+        # Execute
+        state.delete_node(node_id)
+
+        # Assert
+        assert not state.acknowledge_node_heartbeat(node_id, 10)
 
 
 class SqliteFileBasedTest(StateTest, unittest.TestCase):
@@ -1505,7 +2122,109 @@ class SqliteFileBasedTest(StateTest, unittest.TestCase):
         result = state.query("SELECT name FROM sqlite_schema;")
 
         # Assert
-        assert len(result) == 15
+        assert len(result) == 18
+
+    def test_wal_mode(self) -> None:
+        """Test that the database is opened in WAL mode."""
+        # Prepare
+        state = self.state_factory()
+
+        # Execute
+        result = state.query("PRAGMA journal_mode;")
+
+        # Assert
+        assert result == [{"journal_mode": "wal"}]
+
+    def test_per_thread_connections(self) -> None:
+        """Test that each thread uses its own connection to the same database."""
+        # Prepare
+        state = self.state_factory()
+        state.create_node(heartbeat_interval=10)
+        results: list[object] = []
+
+        def worker() -> None:
+            results.append(state.conn)
+            results.append(state.query("SELECT count(*) AS num FROM node;"))
+
+        # Execute
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        # Assert
+        assert results[0] is not None and results[0] is not state.conn
+        assert results[1] == [{"num": 1}]
+
+    def test_migrate_existing_database(self) -> None:
+        """Test that initializing a database of an older version migrates it."""
+        # Prepare: Revert the database to version 0
+        state = self.state_factory()
+        for index in SQLITE_MESSAGE_INDEXES:
+            state.query(f"DROP INDEX {index};")
+        state.query("PRAGMA user_version = 0;")
+
+        # Execute
+        migrated_state = SqliteLinkState(database_path=self.tmp_file.name)
+        migrated_state.initialize()
+
+        # Assert
+        names = {row["name"] for row in migrated_state.query(SQL_SELECT_INDEXES)}
+        assert set(SQLITE_MESSAGE_INDEXES) <= names
+        version = migrated_state.query("PRAGMA user_version;")
+        assert version == [{"user_version": len(SQL_MIGRATIONS)}]
+
+    def test_message_queries_use_indexes(self) -> None:
+        """Test that polling and looking up messages does not scan the tables."""
+        # Prepare
+        state = self.state_factory()
+        node_id = state.create_node(1e3)
+        run_id = state.create_run(None, None, None, {}, ConfigRecord(), None)
+        msg = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+            )
+        )
+        msg_id = state.store_message_ins(msg)
+        assert msg_id
+        queries: list[str] = []
+        cast(sqlite3.Connection, state.conn).set_trace_callback(
+            lambda query: queries.append(" ".join(query.split()))
+        )
+
+        # Execute
+        state.get_message_ins(node_id=node_id, limit=None)
+        state.get_message_res(message_ids={msg_id})
+        state.get_message_ids_from_run_id(run_id)
+        cast(sqlite3.Connection, state.conn).set_trace_callback(None)
+
+        # Assert
+        selects = {
+            "message_ins WHERE dst_node_id": "idx_message_ins_dst_node",
+            "message_res WHERE reply_to_message_id": "idx_message_res_reply_to",
+            "message_ins WHERE run_id": "idx_message_ins_run",
+        }
+        for fragment, index in selects.items():
+            query = next(q for q in queries if q.startswith("SELECT") and fragment in q)
+            plan = " ".join(
+                row["detail"] for row in state.query(f"EXPLAIN QUERY PLAN {query}")
+            )
+            assert index in plan, plan
+            assert "SCAN" not in plan, plan
+
+    def test_factory_reuses_state(self) -> None:
+        """Test that the factory creates the tables and the state only once."""
+        # Prepare
+        # pylint: disable-next=consider-using-with,attribute-defined-outside-init
+        self.tmp_file = tempfile.NamedTemporaryFile()
+        factory = LinkStateFactory(self.tmp_file.name)
+
+        # Execute
+        with patch.object(SqliteLinkState, "initialize") as mock_initialize:
+            states = [factory.state() for _ in range(3)]
+
+        # Assert
+        assert states[0] is states[1] is states[2]
+        mock_initialize.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -20,19 +20,25 @@
 import json
 import re
 import sqlite3
+import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Hashable, Iterable, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
 from logging import DEBUG, ERROR, WARNING
-from typing import Any, Optional, Union, cast
+from typing import Any, Callable, Optional, Union, cast
 
 from flwr.common import Context, Message, Metadata, log, now
 from flwr.common.constant import (
     HEARTBEAT_MAX_INTERVAL,
     HEARTBEAT_PATIENCE,
+    MESSAGE_POLL_INTERVAL,
     MESSAGE_TTL_TOLERANCE,
+    NODE_HEARTBEAT_FLUSH_INTERVAL,
     NODE_ID_NUM_BYTES,
     RUN_FAILURE_DETAILS_NO_HEARTBEAT,
     RUN_ID_NUM_BYTES,
+    RUN_STATUS_CACHE_MAX_STALENESS,
     SUPERLINK_NODE_ID,
     Status,
     SubStatus,
@@ -52,6 +58,9 @@ from flwr.server.utils.validator import validate_message
 
 from .linkstate import LinkState
 from .utils import (
+    MessageNotifier,
+    NodeHeartbeatBuffer,
+    RunStatusCache,
     check_node_availability_for_in_message,
     configrecord_from_bytes,
     configrecord_to_bytes,
@@ -68,6 +77,9 @@ from .utils import (
     verify_message_ids,
 )
 
+# Maximum number of host parameters in a single query (SQLite < 3.32 allows 999)
+MAX_QUERY_PARAMETERS = 900
+
 SQL_CREATE_TABLE_NODE = """
 CREATE TABLE IF NOT EXISTS node(
     node_id         INTEGER UNIQUE,
@@ -163,26 +175,113 @@ CREATE TABLE IF NOT EXISTS message_res(
 );
 """
 
+SQL_CREATE_INDEX_MESSAGE_INS_DST_NODE = """
+CREATE INDEX IF NOT EXISTS idx_message_ins_dst_node
+ON message_ins (dst_node_id, delivered_at, (created_at + ttl), message_id);
+"""
+
+SQL_CREATE_INDEX_MESSAGE_INS_RUN = """
+CREATE INDEX IF NOT EXISTS idx_message_ins_run ON message_ins (run_id, message_id);
+"""
+
+SQL_CREATE_INDEX_MESSAGE_RES_REPLY_TO = """
+CREATE INDEX IF NOT EXISTS idx_message_res_reply_to
+ON message_res (reply_to_message_id, delivered_at);
+"""
+
+# Statements to migrate the schema of existing databases. The schema version
+# (`PRAGMA user_version`) is the number of migrations applied to the database.
+SQL_MIGRATIONS: list[list[str]] = [
+    # Version 1: Secondary indexes for polling and looking up messages
+    [
+        SQL_CREATE_INDEX_MESSAGE_INS_DST_NODE,
+        SQL_CREATE_INDEX_MESSAGE_INS_RUN,
+        SQL_CREATE_INDEX_MESSAGE_RES_REPLY_TO,
+    ],
+]
+
+SQLITE_CACHE_SIZE = -16_384  # Page cache size per connection in KiB (16 MiB)
+SQLITE_CACHED_STATEMENTS = 256  # Prepared statements cached per connection
+
+# Databases that only exist for the lifetime of a single connection
+PRIVATE_DATABASES = (":memory:", "")
+
 DictOrTuple = Union[tuple[Any, ...], dict[str, Any]]
 
 
-class SqliteLinkState(LinkState):  # pylint: disable=R0904
+class SqliteLinkState(LinkState):  # pylint: disable=R0902,R0904
     """SQLite-based LinkState implementation."""
 
+    # Exceptions raised by `query` when a constraint is violated
+    integrity_errors: tuple[type[Exception], ...] = (sqlite3.IntegrityError,)
+
     def __init__(
         self,
         database_path: str,
+        heartbeat_flush_interval: float = NODE_HEARTBEAT_FLUSH_INTERVAL,
     ) -> None:
         """Initialize an SqliteLinkState.
 
+        Each thread uses its own connection to the database, which is opened in
+        WAL mode such that readers do not block writers. Private databases
+        (":memory:" and "") only exist for the lifetime of a connection, so a single
+        connection is shared by all threads instead.
+
         Parameters
         ----------
         database : (path-like object)
             The path to the database file to be opened. Pass ":memory:" to open
             a connection to a database that is in RAM, instead of on disk.
+        heartbeat_flush_interval : float (default: NODE_HEARTBEAT_FLUSH_INTERVAL)
+            The maximum time in seconds node heartbeats are buffered before they are
+            written to the database in a single transaction. Reads of the node
+            availability flush the buffer first, and `close` flushes it on shutdown.
         """
         self.database_path = database_path
-        self.conn: Optional[sqlite3.Connection] = None
+        self.log_queries = False
+        self.initialized = False
+        self.local = threading.local()
+        self.shared_conn: Optional[sqlite3.Connection] = None
+        self.lock: AbstractContextManager[Any] = nullcontext()
+        self.message_ins_notifier = MessageNotifier()
+        self.message_res_notifier = MessageNotifier()
+        self.run_status_cache = RunStatusCache(RUN_STATUS_CACHE_MAX_STALENESS)
+        self.heartbeat_buffer = NodeHeartbeatBuffer(
+            heartbeat_flush_interval, self._flush_node_heartbeats
+        )
+        self.heartbeat_flush_lock = threading.Lock()
+        if database_path in PRIVATE_DATABASES:
+            self.lock = threading.RLock()
+
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """Return the connection of the current thread, opening it if necessary."""
+        if not self.initialized:
+            return None
+        if self.database_path in PRIVATE_DATABASES:
+            return self.shared_conn
+        conn: Optional[sqlite3.Connection] = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self.local.conn = conn
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection and configure it."""
+        conn = sqlite3.connect(
+            self.database_path,
+            check_same_thread=self.database_path not in PRIVATE_DATABASES,
+            cached_statements=SQLITE_CACHED_STATEMENTS,
+        )
+        if self.database_path not in PRIVATE_DATABASES:
+            conn.execute("PRAGMA journal_mode = WAL;")
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute(f"PRAGMA cache_size = {SQLITE_CACHE_SIZE};")
+        conn.row_factory = dict_factory
+        if self.log_queries:
+            conn.set_trace_callback(lambda query: log(DEBUG, query))
+        return conn
 
     def initialize(self, log_queries: bool = False) -> list[tuple[str]]:
         """Create tables if they don't exist yet.
@@ -197,24 +296,55 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         list[tuple[str]]
             The list of all tables in the DB.
         """
-        self.conn = sqlite3.connect(self.database_path)
-        self.conn.execute("PRAGMA foreign_keys = ON;")
-        self.conn.row_factory = dict_factory
-        if log_queries:
-            self.conn.set_trace_callback(lambda query: log(DEBUG, query))
-        cur = self.conn.cursor()
-
-        # Create each table if not exists queries
-        cur.execute(SQL_CREATE_TABLE_RUN)
-        cur.execute(SQL_CREATE_TABLE_LOGS)
-        cur.execute(SQL_CREATE_TABLE_CONTEXT)
-        cur.execute(SQL_CREATE_TABLE_MESSAGE_INS)
-        cur.execute(SQL_CREATE_TABLE_MESSAGE_RES)
-        cur.execute(SQL_CREATE_TABLE_NODE)
-        cur.execute(SQL_CREATE_TABLE_PUBLIC_KEY)
-        cur.execute(SQL_CREATE_INDEX_ONLINE_UNTIL)
-        res = cur.execute("SELECT name FROM sqlite_schema;")
-        return res.fetchall()
+        self.log_queries = log_queries
+        conn = self._connect()
+        if self.database_path in PRIVATE_DATABASES:
+            self.shared_conn = conn
+        else:
+            self.local.conn = conn
+        self.initialized = True
+
+        with self.lock:
+            cur = conn.cursor()
+
+            # Create each table if not exists queries
+            cur.execute(SQL_CREATE_TABLE_RUN)
+            cur.execute(SQL_CREATE_TABLE_LOGS)
+            cur.execute(SQL_CREATE_TABLE_CONTEXT)
+            cur.execute(SQL_CREATE_TABLE_MESSAGE_INS)
+            cur.execute(SQL_CREATE_TABLE_MESSAGE_RES)
+            cur.execute(SQL_CREATE_TABLE_NODE)
+            cur.execute(SQL_CREATE_TABLE_PUBLIC_KEY)
+            cur.execute(SQL_CREATE_INDEX_ONLINE_UNTIL)
+            self._migrate(conn)
+            res = cur.execute("SELECT name FROM sqlite_schema;")
+            return res.fetchall()
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Apply all schema migrations the database has not seen yet."""
+        version = conn.execute("PRAGMA user_version;").fetchone()["user_version"]
+        if version >= len(SQL_MIGRATIONS):
+            return
+
+        # Lock the database such that concurrent processes migrate only once
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            version = conn.execute("PRAGMA user_version;").fetchone()["user_version"]
+            for statements in SQL_MIGRATIONS[version:]:
+                for statement in statements:
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {len(SQL_MIGRATIONS)};")
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+        if version < len(SQL_MIGRATIONS):
+            log(
+                DEBUG,
+                "Migrated LinkState schema from version %s to %s",
+                version,
+                len(SQL_MIGRATIONS),
+            )
 
     def query(
         self,
@@ -222,25 +352,25 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         data: Optional[Union[Sequence[DictOrTuple], DictOrTuple]] = None,
     ) -> list[dict[str, Any]]:
         """Execute a SQL query."""
-        if self.conn is None:
+        if (conn := self.conn) is None:
             raise AttributeError("LinkState is not initialized.")
 
         if data is None:
             data = []
 
-        # Clean up whitespace to make the logs nicer
-        query = re.sub(r"\s+", " ", query)
+        # Clean up whitespace to make the logs nicer and to reuse cached statements
+        query = _clean_query(query)
 
         try:
-            with self.conn:
+            with self.lock, conn:
                 if (
                     len(data) > 0
                     and isinstance(data, (tuple, list))
                     and isinstance(data[0], (tuple, dict))
                 ):
-                    rows = self.conn.executemany(query, data)
+                    rows = conn.executemany(query, data)
                 else:
-                    rows = self.conn.execute(query, data)
+                    rows = conn.execute(query, data)
 
                 # Extract results before committing to support
                 #   INSERT/UPDATE ... RETURNING
@@ -251,55 +381,88 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
 
         return result
 
-    def store_message_ins(self, message: Message) -> Optional[str]:
-        """Store one Message."""
-        # Validate message
-        errors = validate_message(message=message, is_reply_message=False)
-        if any(errors):
-            log(ERROR, errors)
-            return None
-
-        # Store Message
-        data = (message_to_dict(message),)
+    def _query_in(self, query: str, values: Sequence[Any]) -> list[dict[str, Any]]:
+        """Execute a SQL query with `IN ({})` for each chunk of the values.
 
-        # Convert values from uint64 to sint64 for SQLite
-        convert_uint64_values_in_dict_to_sint64(
-            data[0], ["run_id", "src_node_id", "dst_node_id"]
-        )
-
-        # Validate run_id
-        query = "SELECT run_id FROM run WHERE run_id = ?;"
-        if not self.query(query, (data[0]["run_id"],)):
-            log(ERROR, "Invalid run ID for Message: %s", message.metadata.run_id)
-            return None
+        The `{}` in `query` is replaced by one placeholder per value of the chunk,
+        which keeps the number of parameters of each query within the database limits.
+        """
+        result: list[dict[str, Any]] = []
+        for i in range(0, len(values), MAX_QUERY_PARAMETERS):
+            chunk = values[i : i + MAX_QUERY_PARAMETERS]
+            result += self.query(query.format(",".join(["?"] * len(chunk))), chunk)
+        return result
 
-        # Validate source node ID
-        if message.metadata.src_node_id != SUPERLINK_NODE_ID:
-            log(
-                ERROR,
-                "Invalid source node ID for Message: %s",
-                message.metadata.src_node_id,
+    def store_message_ins(self, message: Message) -> Optional[str]:
+        """Store one Message."""
+        return self.store_message_ins_batch([message])[0]
+
+    def store_message_ins_batch(self, messages: list[Message]) -> list[Optional[str]]:
+        """Store multiple Messages."""
+        message_ids: list[Optional[str]] = [None] * len(messages)
+        rows: dict[int, dict[str, Any]] = {}
+        for index, message in enumerate(messages):
+            # Validate message
+            errors = validate_message(message=message, is_reply_message=False)
+            if any(errors):
+                log(ERROR, errors)
+                continue
+
+            # Validate source node ID
+            if message.metadata.src_node_id != SUPERLINK_NODE_ID:
+                log(
+                    ERROR,
+                    "Invalid source node ID for Message: %s",
+                    message.metadata.src_node_id,
+                )
+                continue
+
+            # Convert values from uint64 to sint64 for SQLite
+            row = message_to_dict(message)
+            convert_uint64_values_in_dict_to_sint64(
+                row, ["run_id", "src_node_id", "dst_node_id"]
             )
-            return None
+            rows[index] = row
 
-        # Validate destination node ID
-        query = "SELECT node_id FROM node WHERE node_id = ?;"
-        if not self.query(query, (data[0]["dst_node_id"],)):
-            log(
-                ERROR,
-                "Invalid destination node ID for Message: %s",
-                message.metadata.dst_node_id,
-            )
-            return None
+        if not rows:
+            return message_ids
+
+        # Validate run_ids and destination node IDs with as few queries as possible
+        run_ids = list({row["run_id"] for row in rows.values()})
+        query = "SELECT run_id FROM run WHERE run_id IN ({});"
+        valid_run_ids = {row["run_id"] for row in self._query_in(query, run_ids)}
+        node_ids = list({row["dst_node_id"] for row in rows.values()})
+        query = "SELECT node_id FROM node WHERE node_id IN ({});"
+        valid_node_ids = {row["node_id"] for row in self._query_in(query, node_ids)}
+
+        for index, row in list(rows.items()):
+            metadata = messages[index].metadata
+            if row["run_id"] not in valid_run_ids:
+                log(ERROR, "Invalid run ID for Message: %s", metadata.run_id)
+                del rows[index]
+            elif row["dst_node_id"] not in valid_node_ids:
+                log(
+                    ERROR,
+                    "Invalid destination node ID for Message: %s",
+                    metadata.dst_node_id,
+                )
+                del rows[index]
 
-        columns = ", ".join([f":{key}" for key in data[0]])
+        if not rows:
+            return message_ids
+
+        # Insert all valid Messages in a single transaction
+        columns = ", ".join([f":{key}" for key in next(iter(rows.values()))])
         query = f"INSERT INTO message_ins VALUES({columns});"
 
         # Only invalid run_id can trigger IntegrityError.
         # This may need to be changed in the future version with more integrity checks.
-        self.query(query, data)
+        self.query(query, list(rows.values()))
 
-        return message.metadata.message_id
+        for index in rows:
+            message_ids[index] = messages[index].metadata.message_id
+            self.message_ins_notifier.notify(messages[index].metadata.dst_node_id)
+        return message_ids
 
     def get_message_ins(self, node_id: int, limit: Optional[int]) -> list[Message]:
         """Get all Messages that have not been delivered yet."""
@@ -322,6 +485,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
             WHERE   dst_node_id == :node_id
             AND   delivered_at = ""
             AND   (created_at + ttl) > CAST(strftime('%s', 'now') AS REAL)
+            ORDER BY rowid
         """
 
         if limit is not None:
@@ -340,6 +504,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
                 UPDATE message_ins
                 SET delivered_at = :delivered_at
                 WHERE message_id IN ({placeholders})
+                AND delivered_at = ''
                 RETURNING *;
             """
 
@@ -362,78 +527,189 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
 
         return result
 
+    def wait_for_message_ins(self, node_id: int, timeout: float) -> bool:
+        """Wait until an instruction Message for the given node is available."""
+        query = """
+            SELECT message_id
+            FROM message_ins
+            WHERE dst_node_id = ?
+            AND delivered_at = ""
+            AND (created_at + ttl) > CAST(strftime('%s', 'now') AS REAL)
+            LIMIT 1;
+        """
+        data = (convert_uint64_to_sint64(node_id),)
+        return self._wait_for_rows(
+            self.message_ins_notifier,
+            (node_id,),
+            lambda: bool(self.query(query, data)),
+            timeout,
+        )
+
     def store_message_res(self, message: Message) -> Optional[str]:
         """Store one Message."""
-        # Validate message
-        errors = validate_message(message=message, is_reply_message=True)
-        if any(errors):
-            log(ERROR, errors)
-            return None
+        return self.store_message_res_batch([message])[0]
+
+    def store_message_res_batch(  # pylint: disable=R0914
+        self, messages: list[Message]
+    ) -> list[Optional[str]]:
+        """Store multiple Messages."""
+        message_ids: list[Optional[str]] = [None] * len(messages)
+        valid_messages: dict[int, Message] = {}
+        for index, message in enumerate(messages):
+            # Validate message
+            errors = validate_message(message=message, is_reply_message=True)
+            if any(errors):
+                log(ERROR, errors)
+                continue
+            valid_messages[index] = message
+
+        if not valid_messages:
+            return message_ids
+
+        # Fetch the Messages replied to with as few queries as possible
+        msg_ins_ids = tuple(
+            {
+                message.metadata.reply_to_message_id
+                for message in valid_messages.values()
+            }
+        )
+        query = "SELECT * FROM message_ins WHERE message_id IN ({});"
+        msg_ins_rows = {
+            row["message_id"]: row for row in self._query_in(query, msg_ins_ids)
+        }
 
-        res_metadata = message.metadata
-        msg_ins_id = res_metadata.reply_to_message_id
-        msg_ins = self.get_valid_message_ins(msg_ins_id)
-        if msg_ins is None:
-            log(
-                ERROR,
-                "Failed to store Message reply: "
-                "The message it replies to with message_id %s does not exist or "
-                "has expired.",
-                msg_ins_id,
+        current = time.time()
+        rows: dict[int, dict[str, Any]] = {}
+        for index, message in valid_messages.items():
+            res_metadata = message.metadata
+            msg_ins_id = res_metadata.reply_to_message_id
+            msg_ins = msg_ins_rows.get(msg_ins_id)
+            if msg_ins is None or (
+                msg_ins["ttl"] is not None
+                and msg_ins["created_at"] + msg_ins["ttl"] <= current
+            ):
+                log(
+                    ERROR,
+                    "Failed to store Message reply: "
+                    "The message it replies to with message_id %s does not exist or "
+                    "has expired.",
+                    msg_ins_id,
+                )
+                continue
+
+            # Ensure that the dst_node_id of the original message matches the
+            # src_node_id of reply being processed.
+            if convert_sint64_to_uint64(msg_ins["dst_node_id"]) != (
+                res_metadata.src_node_id
+            ):
+                continue
+
+            # Fail if the Message TTL exceeds the
+            # expiration time of the Message it replies to.
+            # Condition: ins_metadata.created_at + ins_metadata.ttl ≥
+            #            res_metadata.created_at + res_metadata.ttl
+            # A small tolerance is introduced to account
+            # for floating-point precision issues.
+            max_allowed_ttl = (
+                msg_ins["created_at"] + msg_ins["ttl"] - res_metadata.created_at
             )
-            return None
-
-        # Ensure that the dst_node_id of the original message matches the src_node_id of
-        # reply being processed.
-        if (
-            msg_ins
-            and message
-            and convert_sint64_to_uint64(msg_ins["dst_node_id"])
-            != res_metadata.src_node_id
-        ):
-            return None
-
-        # Fail if the Message TTL exceeds the
-        # expiration time of the Message it replies to.
-        # Condition: ins_metadata.created_at + ins_metadata.ttl ≥
-        #            res_metadata.created_at + res_metadata.ttl
-        # A small tolerance is introduced to account
-        # for floating-point precision issues.
-        max_allowed_ttl = (
-            msg_ins["created_at"] + msg_ins["ttl"] - res_metadata.created_at
-        )
-        if res_metadata.ttl and (
-            res_metadata.ttl - max_allowed_ttl > MESSAGE_TTL_TOLERANCE
-        ):
-            log(
-                WARNING,
-                "Received Message with TTL %.2f exceeding the allowed maximum "
-                "TTL %.2f.",
-                res_metadata.ttl,
-                max_allowed_ttl,
+            if res_metadata.ttl and (
+                res_metadata.ttl - max_allowed_ttl > MESSAGE_TTL_TOLERANCE
+            ):
+                log(
+                    WARNING,
+                    "Received Message with TTL %.2f exceeding the allowed maximum "
+                    "TTL %.2f.",
+                    res_metadata.ttl,
+                    max_allowed_ttl,
+                )
+                continue
+
+            # Convert values from uint64 to sint64 for SQLite
+            row = message_to_dict(message)
+            convert_uint64_values_in_dict_to_sint64(
+                row, ["run_id", "src_node_id", "dst_node_id"]
             )
-            return None
-
-        # Store Message
-        data = (message_to_dict(message),)
+            rows[index] = row
 
-        # Convert values from uint64 to sint64 for SQLite
-        convert_uint64_values_in_dict_to_sint64(
-            data[0], ["run_id", "src_node_id", "dst_node_id"]
-        )
+        if not rows:
+            return message_ids
 
-        columns = ", ".join([f":{key}" for key in data[0]])
+        # Insert all valid Messages in a single transaction
+        columns = ", ".join([f":{key}" for key in next(iter(rows.values()))])
         query = f"INSERT INTO message_res VALUES({columns});"
 
         # Only invalid run_id can trigger IntegrityError.
         # This may need to be changed in the future version with more integrity checks.
         try:
-            self.query(query, data)
-        except sqlite3.IntegrityError:
-            log(ERROR, "`run` is invalid")
-            return None
+            self.query(query, list(rows.values()))
+        except self.integrity_errors:
+            # Insert the Messages one by one to only reject the invalid ones
+            for index, row in list(rows.items()):
+                try:
+                    self.query(query, [row])
+                except self.integrity_errors:
+                    log(ERROR, "`run` is invalid")
+                    del rows[index]
+
+        for index in rows:
+            message = messages[index]
+            message_ids[index] = message.metadata.message_id
+            self.message_res_notifier.notify(message.metadata.reply_to_message_id)
+        return message_ids
+
+    def add_message_ins_listener(self, callback: Callable[[int], None]) -> None:
+        """Register a function to call for each newly stored instruction Message."""
+        self.message_ins_notifier.add_listener(
+            cast(Callable[[Hashable], None], callback)
+        )
 
-        return message.metadata.message_id
+    def remove_message_ins_listener(self, callback: Callable[[int], None]) -> None:
+        """Unregister a function registered with `add_message_ins_listener`."""
+        self.message_ins_notifier.remove_listener(
+            cast(Callable[[Hashable], None], callback)
+        )
+
+    def wait_for_message_res(self, message_ids: set[str], timeout: float) -> bool:
+        """Wait until a reply to any of the given Message IDs is available."""
+        if not message_ids:
+            return False
+
+        # The IDs are checked in chunks to stay within the limit of query parameters
+        query = """
+            SELECT message_id
+            FROM message_res
+            WHERE reply_to_message_id IN ({})
+            AND delivered_at = ''
+            LIMIT 1;
+        """
+        values = list(message_ids)
+        return self._wait_for_rows(
+            self.message_res_notifier,
+            message_ids,
+            lambda: bool(self._query_in(query, values)),
+            timeout,
+        )
+
+    def _wait_for_rows(
+        self,
+        notifier: MessageNotifier,
+        keys: Iterable[Hashable],
+        has_rows: Callable[[], bool],
+        timeout: float,
+    ) -> bool:
+        """Wait until `has_rows` returns True or any of `keys` is notified."""
+        deadline = time.monotonic() + timeout
+        with notifier.subscribe(keys) as event:
+            while not event.is_set():
+                if has_rows():
+                    return True
+                if (remaining := deadline - time.monotonic()) <= 0:
+                    return False
+                # Messages stored by other processes sharing the database are not
+                # notified, so the database is checked again periodically
+                event.wait(min(remaining, MESSAGE_POLL_INTERVAL))
+        return True
 
     def get_message_res(self, message_ids: set[str]) -> list[Message]:
         """Get reply Messages for the given Message IDs."""
@@ -467,12 +743,15 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
             in_message = found_message_ins_dict[message_id]
             sint_node_id = convert_uint64_to_sint64(in_message.metadata.dst_node_id)
             dst_node_ids.add(sint_node_id)
-        query = f"""
-                    SELECT node_id, online_until
-                    FROM node
-                    WHERE node_id IN ({",".join(["?"] * len(dst_node_ids))});
-                """
-        rows = self.query(query, tuple(dst_node_ids))
+        self._flush_node_heartbeats()
+        rows = []
+        if dst_node_ids:
+            query = f"""
+                        SELECT node_id, online_until
+                        FROM node
+                        WHERE node_id IN ({",".join(["?"] * len(dst_node_ids))});
+                    """
+            rows = self.query(query, tuple(dst_node_ids))
         tmp_ret_dict = check_node_availability_for_in_message(
             inquired_in_message_ids=message_ids,
             found_in_message_dict=found_message_ins_dict,
@@ -485,13 +764,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         ret.update(tmp_ret_dict)
 
         # Find all reply Messages
-        query = f"""
-            SELECT *
-            FROM message_res
-            WHERE reply_to_message_id IN ({",".join(["?"] * len(message_ids))})
-            AND delivered_at = "";
-        """
-        rows = self.query(query, tuple(str(message_id) for message_id in message_ids))
+        rows = self._get_undelivered_message_res(message_ids)
         for row in rows:
             convert_sint64_values_in_dict_to_uint64(
                 row, ["run_id", "src_node_id", "dst_node_id"]
@@ -511,16 +784,32 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         message_res_ids = [
             message_res.metadata.message_id for message_res in ret.values()
         ]
-        query = f"""
-            UPDATE message_res
-            SET delivered_at = ?
-            WHERE message_id IN ({",".join(["?"] * len(message_res_ids))});
-        """
-        data: list[Any] = [delivered_at] + message_res_ids
-        self.query(query, data)
+        if message_res_ids:
+            query = f"""
+                UPDATE message_res
+                SET delivered_at = ?
+                WHERE message_id IN ({",".join(["?"] * len(message_res_ids))});
+            """
+            data: list[Any] = [delivered_at] + message_res_ids
+            self.query(query, data)
 
         return list(ret.values())
 
+    def _get_undelivered_message_res(
+        self, message_ids: set[str]
+    ) -> list[dict[str, Any]]:
+        """Return the rows of undelivered replies to the given Message IDs."""
+        if not message_ids:
+            return []
+        query = f"""
+            SELECT *
+            FROM message_res
+            WHERE reply_to_message_id IN ({",".join(["?"] * len(message_ids))})
+            AND delivered_at = ''
+            ORDER BY rowid;
+        """
+        return self.query(query, tuple(str(message_id) for message_id in message_ids))
+
     def num_message_ins(self) -> int:
         """Calculate the number of instruction Messages in store.
 
@@ -546,7 +835,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         """Delete a Message and its reply based on provided Message IDs."""
         if not message_ins_ids:
             return
-        if self.conn is None:
+        if (conn := self.conn) is None:
             raise AttributeError("LinkState not initialized")
 
         placeholders = ",".join(["?"] * len(message_ins_ids))
@@ -564,13 +853,13 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
             WHERE reply_to_message_id IN ({placeholders});
         """
 
-        with self.conn:
-            self.conn.execute(query_1, data)
-            self.conn.execute(query_2, data)
+        with self.lock, conn:
+            conn.execute(query_1, data)
+            conn.execute(query_2, data)
 
     def get_message_ids_from_run_id(self, run_id: int) -> set[str]:
         """Get all instruction Message IDs for the given run_id."""
-        if self.conn is None:
+        if (conn := self.conn) is None:
             raise AttributeError("LinkState not initialized")
 
         query = """
@@ -582,8 +871,8 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         sint64_run_id = convert_uint64_to_sint64(run_id)
         data = {"run_id": sint64_run_id}
 
-        with self.conn:
-            rows = self.conn.execute(query, data).fetchall()
+        with self.lock, conn:
+            rows = conn.execute(query, data).fetchall()
 
         return {row["message_id"] for row in rows}
 
@@ -614,10 +903,12 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
                     b"",  # Initialize with an empty public key
                 ),
             )
-        except sqlite3.IntegrityError:
+        except self.integrity_errors:
             log(ERROR, "Unexpected node registration failure.")
             return 0
 
+        self.heartbeat_buffer.add_known(uint64_node_id)
+
         # Note: we need to return the uint64 value of the node_id
         return uint64_node_id
 
@@ -629,16 +920,17 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         query = "DELETE FROM node WHERE node_id = ?"
         params = (sint64_node_id,)
 
-        if self.conn is None:
+        if (conn := self.conn) is None:
             raise AttributeError("LinkState is not initialized.")
 
         try:
-            with self.conn:
-                rows = self.conn.execute(query, params)
+            with self.lock, conn:
+                rows = conn.execute(query, params)
                 if rows.rowcount < 1:
                     raise ValueError(f"Node {node_id} not found")
         except KeyError as exc:
             log(ERROR, {"query": query, "data": params, "exception": exc})
+        self.heartbeat_buffer.discard(node_id)
 
     def get_nodes(self, run_id: int) -> set[int]:
         """Retrieve all currently stored node IDs as a set.
@@ -652,11 +944,12 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         sint64_run_id = convert_uint64_to_sint64(run_id)
 
         # Validate run ID
-        query = "SELECT COUNT(*) FROM run WHERE run_id = ?;"
-        if self.query(query, (sint64_run_id,))[0]["COUNT(*)"] == 0:
+        query = "SELECT COUNT(*) AS num FROM run WHERE run_id = ?;"
+        if self.query(query, (sint64_run_id,))[0]["num"] == 0:
             return set()
 
         # Get nodes
+        self._flush_node_heartbeats()
         query = "SELECT node_id FROM node WHERE online_until > ?;"
         rows = self.query(query, (time.time(),))
 
@@ -730,9 +1023,9 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         sint64_run_id = convert_uint64_to_sint64(uint64_run_id)
 
         # Check conflicts
-        query = "SELECT COUNT(*) FROM run WHERE run_id = ?;"
+        query = "SELECT COUNT(*) AS num FROM run WHERE run_id = ?;"
         # If sint64_run_id does not exist
-        if self.query(query, (sint64_run_id,))[0]["COUNT(*)"] == 0:
+        if self.query(query, (sint64_run_id,))[0]["num"] == 0:
             query = (
                 "INSERT INTO run "
                 "(run_id, active_until, heartbeat_interval, fab_id, fab_version, "
@@ -854,23 +1147,39 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
 
     def get_run_status(self, run_ids: set[int]) -> dict[int, RunStatus]:
         """Retrieve the statuses for the specified runs."""
+        # Serve recently retrieved statuses from the cache
+        statuses, generation = self.run_status_cache.get(run_ids)
+        missing_run_ids = set(run_ids) - statuses.keys()
+        if not missing_run_ids:
+            return statuses
+
         # Check if runs are still active
-        self._check_and_tag_inactive_run(run_ids=run_ids)
+        self._check_and_tag_inactive_run(run_ids=missing_run_ids)
 
         # Convert the uint64 value to sint64 for SQLite
-        sint64_run_ids = (convert_uint64_to_sint64(run_id) for run_id in set(run_ids))
-        query = f"SELECT * FROM run WHERE run_id IN ({','.join(['?'] * len(run_ids))});"
+        sint64_run_ids = (
+            convert_uint64_to_sint64(run_id) for run_id in missing_run_ids
+        )
+        query = "SELECT * FROM run WHERE run_id IN "
+        query += f"({','.join(['?'] * len(missing_run_ids))});"
         rows = self.query(query, tuple(sint64_run_ids))
 
-        return {
+        for row in rows:
             # Restore uint64 run IDs
-            convert_sint64_to_uint64(row["run_id"]): RunStatus(
+            run_id = convert_sint64_to_uint64(row["run_id"])
+            statuses[run_id] = RunStatus(
                 status=determine_run_status(row),
                 sub_status=row["sub_status"],
                 details=row["details"],
             )
-            for row in rows
-        }
+            # Active runs must be checked again once their heartbeat is overdue
+            valid_until = (
+                row["active_until"]
+                if statuses[run_id].status in (Status.STARTING, Status.RUNNING)
+                else float("inf")
+            )
+            self.run_status_cache.put(run_id, statuses[run_id], valid_until, generation)
+        return statuses
 
     def update_run_status(self, run_id: int, new_status: RunStatus) -> bool:
         """Update the status of the run with the specified `run_id`."""
@@ -947,6 +1256,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
             convert_uint64_to_sint64(run_id),
         )
         self.query(query % timestamp_fld, data)
+        self.run_status_cache.invalidate({run_id})
         return True
 
     def get_pending_run_id(self) -> Optional[int]:
@@ -986,27 +1296,40 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         HEARTBEAT_PATIENCE = N allows for N-1 missed heartbeat before
         the node is marked as offline.
         """
-        sint64_node_id = convert_uint64_to_sint64(node_id)
-
-        # Check if the node exists in the `node` table
-        query = "SELECT 1 FROM node WHERE node_id = ?"
-        if not self.query(query, (sint64_node_id,)):
-            return False
-
-        # Update `online_until` and `heartbeat_interval` for the given `node_id`
-        query = (
-            "UPDATE node SET online_until = ?, heartbeat_interval = ? WHERE node_id = ?"
-        )
-        self.query(
-            query,
-            (
-                time.time() + HEARTBEAT_PATIENCE * heartbeat_interval,
-                heartbeat_interval,
-                sint64_node_id,
-            ),
-        )
+        # Check if the node exists in the `node` table, unless it is known to exist
+        if not self.heartbeat_buffer.is_known(node_id):
+            query = "SELECT 1 FROM node WHERE node_id = ?"
+            if not self.query(query, (convert_uint64_to_sint64(node_id),)):
+                return False
+            self.heartbeat_buffer.add_known(node_id)
+
+        # Buffer the update of `online_until` and `heartbeat_interval` for the given
+        # `node_id`, which is written together with the updates of other nodes
+        online_until = time.time() + HEARTBEAT_PATIENCE * heartbeat_interval
+        if self.heartbeat_buffer.add(node_id, online_until, heartbeat_interval):
+            self._flush_node_heartbeats()
         return True
 
+    def close(self) -> None:
+        """Write the buffered node heartbeats to the database."""
+        self._flush_node_heartbeats()
+
+    def _flush_node_heartbeats(self) -> None:
+        """Write all buffered node heartbeats to the database in one transaction."""
+        with self.heartbeat_flush_lock:
+            pending = self.heartbeat_buffer.pop_all()
+            if not pending:
+                return
+            query = "UPDATE node SET online_until = ?, heartbeat_interval = ? "
+            query += "WHERE node_id = ?;"
+            self.query(
+                query,
+                [
+                    (online_until, heartbeat_interval, convert_uint64_to_sint64(nid))
+                    for nid, (online_until, heartbeat_interval) in pending.items()
+                ],
+            )
+
     def acknowledge_app_heartbeat(self, run_id: int, heartbeat_interval: float) -> bool:
         """Acknowledge a heartbeat received from a ServerApp for a given run.
 
@@ -1060,8 +1383,8 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         sint_run_id = convert_uint64_to_sint64(run_id)
 
         # Check if any existing Context assigned to the run_id
-        query = "SELECT COUNT(*) FROM context WHERE run_id = ?;"
-        if self.query(query, (sint_run_id,))[0]["COUNT(*)"] > 0:
+        query = "SELECT COUNT(*) AS num FROM context WHERE run_id = ?;"
+        if self.query(query, (sint_run_id,))[0]["num"] > 0:
             # Update context
             query = "UPDATE context SET context = ? WHERE run_id = ?;"
             self.query(query, (context_bytes, sint_run_id))
@@ -1070,7 +1393,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
                 # Store context
                 query = "INSERT INTO context (run_id, context) VALUES (?, ?);"
                 self.query(query, (sint_run_id, context_bytes))
-            except sqlite3.IntegrityError:
+            except self.integrity_errors:
                 raise ValueError(f"Run {run_id} not found") from None
 
     def add_serverapp_log(self, run_id: int, log_message: str) -> None:
@@ -1084,7 +1407,7 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
                 INSERT INTO logs (timestamp, run_id, node_id, log) VALUES (?, ?, ?, ?);
             """
             self.query(query, (now().timestamp(), sint64_run_id, 0, log_message))
-        except sqlite3.IntegrityError:
+        except self.integrity_errors:
             raise ValueError(f"Run {run_id} not found") from None
 
     def get_serverapp_log(
@@ -1139,6 +1462,12 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         return message_ins
 
 
+@lru_cache(maxsize=1024)
+def _clean_query(query: str) -> str:
+    """Collapse whitespace in a query."""
+    return re.sub(r"\s+", " ", query)
+
+
 def dict_factory(
     cursor: sqlite3.Cursor,
     row: sqlite3.Row,
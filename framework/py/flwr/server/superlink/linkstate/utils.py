@@ -15,8 +15,13 @@
 """Utility functions for State."""
 
 
+import threading
+import time
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from logging import ERROR
 from os import urandom
-from typing import Optional
+from typing import Callable, Optional, cast
 
 from flwr.common import ConfigRecord, Context, Error, Message, Metadata, now, serde
 from flwr.common.constant import (
@@ -27,6 +32,7 @@ from flwr.common.constant import (
     Status,
     SubStatus,
 )
+from flwr.common.logger import log
 from flwr.common.message import make_message
 from flwr.common.typing import RunStatus
 
@@ -439,3 +445,183 @@ def check_node_availability_for_in_message(
             )
             ret_dict[in_message_id] = reply_message
     return ret_dict
+
+
+class MessageNotifier:
+    """Notify threads waiting for Messages related to specific keys.
+
+    Keys are, e.g., the IDs of instruction Messages to wait for replies to, or the IDs
+    of nodes to wait for instruction Messages for.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: dict[threading.Event, set[Hashable]] = {}
+        self._listeners: tuple[Callable[[Hashable], None], ...] = ()
+
+    @contextmanager
+    def subscribe(self, keys: Iterable[Hashable]) -> Iterator[threading.Event]:
+        """Yield an event that is set once any of the given keys is notified.
+
+        Subscribe before checking whether Messages are already available, such that no
+        Message stored in between is missed.
+        """
+        event = threading.Event()
+        with self._lock:
+            self._waiters[event] = set(keys)
+        try:
+            yield event
+        finally:
+            with self._lock:
+                del self._waiters[event]
+
+    def add_listener(self, callback: Callable[[Hashable], None]) -> None:
+        """Call `callback` with every key notified from now on."""
+        with self._lock:
+            self._listeners = (*self._listeners, callback)
+
+    def remove_listener(self, callback: Callable[[Hashable], None]) -> None:
+        """Stop calling `callback` with notified keys."""
+        with self._lock:
+            self._listeners = tuple(
+                listener for listener in self._listeners if listener != callback
+            )
+
+    def notify(self, key: Hashable) -> None:
+        """Wake up all threads waiting for the given key and call the listeners."""
+        with self._lock:
+            for event, keys in self._waiters.items():
+                if key in keys:
+                    event.set()
+        for callback in self._listeners:
+            callback(key)
+
+
+class RunStatusCache:
+    """Cache run statuses to avoid querying the database on every request.
+
+    An entry is used for at most `max_staleness` seconds, which bounds how long
+    status changes made by other processes sharing the database go unnoticed.
+    Entries of starting or running runs additionally expire once the run misses
+    its heartbeat deadline, such that the run is checked and tagged as failed.
+    Status changes made through this process must be reported via `invalidate`.
+    """
+
+    def __init__(self, max_staleness: float) -> None:
+        self.max_staleness = max_staleness
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: dict[int, tuple[RunStatus, float]] = {}
+        self._generation = 0
+
+    def get(self, run_ids: set[int]) -> tuple[dict[int, RunStatus], int]:
+        """Return the cached statuses of the given runs.
+
+        Also return the current generation of the cache, which has to be passed to
+        `put` when storing the statuses of the runs that were not cached.
+        """
+        current = time.time()
+        statuses: dict[int, RunStatus] = {}
+        with self._lock:
+            for run_id in run_ids:
+                entry = self._entries.get(run_id)
+                if entry is not None and entry[1] > current:
+                    statuses[run_id] = entry[0]
+            self.hits += len(statuses)
+            self.misses += len(run_ids) - len(statuses)
+            return statuses, self._generation
+
+    def put(
+        self, run_id: int, status: RunStatus, valid_until: float, generation: int
+    ) -> None:
+        """Cache the status of a run until `valid_until` at the latest.
+
+        The status is discarded if the cache was invalidated since `generation` was
+        returned by `get`, as it may have been read before the invalidating change.
+        """
+        expires_at = min(time.time() + self.max_staleness, valid_until)
+        with self._lock:
+            if generation == self._generation:
+                self._entries[run_id] = (status, expires_at)
+
+    def invalidate(self, run_ids: set[int]) -> None:
+        """Remove the cached statuses of the given runs."""
+        with self._lock:
+            self._generation += 1
+            for run_id in run_ids:
+                self._entries.pop(run_id, None)
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of run status lookups served from the cache."""
+        with self._lock:
+            total = self.hits + self.misses
+            return self.hits / total if total else 0.0
+
+
+class NodeHeartbeatBuffer:
+    """Buffer node heartbeats to write them to the database in batches.
+
+    Only the latest heartbeat of each node is kept. The buffered heartbeats are due
+    to be flushed once the oldest one has been buffered for `max_staleness` seconds.
+    If `flush` is given, it is called by a timer at that point, unless the buffer was
+    emptied before. The buffer also remembers the nodes known to exist, such that
+    heartbeats of these nodes can be acknowledged without querying the database.
+    """
+
+    def __init__(
+        self, max_staleness: float, flush: Optional[Callable[[], None]] = None
+    ) -> None:
+        self.max_staleness = max_staleness
+        self._flush = flush
+        self._lock = threading.Lock()
+        self._pending: dict[int, tuple[float, float]] = {}
+        self._known_node_ids: set[int] = set()
+        self._flush_at = float("inf")
+        self._timer: Optional[threading.Timer] = None
+
+    def is_known(self, node_id: int) -> bool:
+        """Return True if the node is known to exist."""
+        with self._lock:
+            return node_id in self._known_node_ids
+
+    def add_known(self, node_id: int) -> None:
+        """Remember that the node exists."""
+        with self._lock:
+            self._known_node_ids.add(node_id)
+
+    def add(self, node_id: int, online_until: float, heartbeat_interval: float) -> bool:
+        """Buffer a heartbeat and return True if the buffer is due to be flushed."""
+        with self._lock:
+            if not self._pending:
+                self._flush_at = time.monotonic() + self.max_staleness
+                if self._flush is not None:
+                    self._timer = threading.Timer(self.max_staleness, self._run_flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+            self._pending[node_id] = (online_until, heartbeat_interval)
+            return time.monotonic() >= self._flush_at
+
+    def pop_all(self) -> dict[int, tuple[float, float]]:
+        """Remove and return the `(online_until, heartbeat_interval)` of all nodes."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, {}
+            self._flush_at = float("inf")
+            return pending
+
+    def _run_flush(self) -> None:
+        """Flush the buffer from the timer thread."""
+        try:
+            cast(Callable[[], None], self._flush)()
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            log(ERROR, "Failed to flush node heartbeats: %s", ex)
+
+    def discard(self, node_id: int) -> None:
+        """Forget the node and its buffered heartbeat, e.g., after it was deleted."""
+        with self._lock:
+            self._pending.pop(node_id, None)
+            self._known_node_ids.discard(node_id)
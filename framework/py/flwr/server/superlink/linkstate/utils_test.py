@@ -15,11 +15,19 @@
 """Utils tests."""
 
 
+import threading
+import time
 import unittest
+from unittest.mock import patch
 
 from parameterized import parameterized
 
+from flwr.common.constant import Status
+from flwr.common.typing import RunStatus
+
 from .utils import (
+    NodeHeartbeatBuffer,
+    RunStatusCache,
     convert_sint64_to_uint64,
     convert_sint64_values_in_dict_to_uint64,
     convert_uint64_to_sint64,
@@ -149,3 +157,135 @@ class UtilsTest(unittest.TestCase):
             with self.subTest(num_bytes=num_bytes):
                 rand_int = generate_rand_int_from_bytes(num_bytes)
                 self.assertGreaterEqual(rand_int, 0)
+
+
+class RunStatusCacheTest(unittest.TestCase):
+    """Test RunStatusCache."""
+
+    def test_get_and_put(self) -> None:
+        """Test that cached statuses are returned and counted as hits."""
+        # Prepare
+        cache = RunStatusCache(max_staleness=10)
+        status = RunStatus(Status.RUNNING, "", "")
+        _, generation = cache.get({1})
+
+        # Execute
+        cache.put(1, status, float("inf"), generation)
+        statuses, _ = cache.get({1, 2})
+
+        # Assert
+        self.assertEqual(statuses, {1: status})
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertAlmostEqual(cache.hit_rate, 1 / 3)
+
+    def test_expiry(self) -> None:
+        """Test that entries expire after `max_staleness` or `valid_until`."""
+        # Prepare
+        cache = RunStatusCache(max_staleness=10)
+        status = RunStatus(Status.RUNNING, "", "")
+        current = time.time()
+        cache.put(1, status, float("inf"), 0)
+        cache.put(2, status, current + 5, 0)
+
+        # Execute
+        with patch("time.time", return_value=current + 6):
+            statuses_after_deadline, _ = cache.get({1, 2})
+        with patch("time.time", return_value=current + 11):
+            statuses_after_staleness, _ = cache.get({1, 2})
+
+        # Assert
+        self.assertEqual(statuses_after_deadline.keys(), {1})
+        self.assertEqual(statuses_after_staleness, {})
+
+    def test_invalidate(self) -> None:
+        """Test that invalidation removes entries and discards outdated puts."""
+        # Prepare
+        cache = RunStatusCache(max_staleness=10)
+        status = RunStatus(Status.RUNNING, "", "")
+        _, generation = cache.get({1, 2})
+        cache.put(1, status, float("inf"), generation)
+
+        # Execute
+        cache.invalidate({1})
+        cache.put(2, status, float("inf"), generation)
+        statuses, _ = cache.get({1, 2})
+
+        # Assert
+        self.assertEqual(statuses, {})
+
+
+class NodeHeartbeatBufferTest(unittest.TestCase):
+    """Test NodeHeartbeatBuffer."""
+
+    def test_add_and_pop_all(self) -> None:
+        """Test that only the latest heartbeat per node is kept until popped."""
+        # Prepare
+        buffer = NodeHeartbeatBuffer(max_staleness=10)
+
+        # Execute
+        due = [
+            buffer.add(1, 100.0, 10.0),
+            buffer.add(2, 200.0, 20.0),
+            buffer.add(1, 300.0, 30.0),
+        ]
+        pending = buffer.pop_all()
+
+        # Assert
+        self.assertEqual(due, [False, False, False])
+        self.assertEqual(pending, {1: (300.0, 30.0), 2: (200.0, 20.0)})
+        self.assertEqual(buffer.pop_all(), {})
+
+    def test_due_after_max_staleness(self) -> None:
+        """Test that the buffer is due once the oldest heartbeat is too old."""
+        # Prepare
+        buffer = NodeHeartbeatBuffer(max_staleness=10)
+        current = time.monotonic()
+        with patch("time.monotonic", return_value=current):
+            buffer.add(1, 100.0, 10.0)
+
+        # Execute
+        with patch("time.monotonic", return_value=current + 11):
+            due = buffer.add(2, 200.0, 20.0)
+
+        # Assert
+        self.assertTrue(due)
+
+    def test_flush_after_max_staleness(self) -> None:
+        """Test that `flush` is called once the oldest heartbeat is too old."""
+        # Prepare
+        flushed = threading.Event()
+        buffer = NodeHeartbeatBuffer(max_staleness=0.05, flush=flushed.set)
+
+        # Execute
+        buffer.add(1, 100.0, 10.0)
+        buffer.add(2, 200.0, 20.0)
+
+        # Assert
+        self.assertTrue(flushed.wait(5))
+
+    def test_no_flush_after_pop_all(self) -> None:
+        """Test that `flush` is not called if the buffer was emptied before."""
+        # Prepare
+        flushed = threading.Event()
+        buffer = NodeHeartbeatBuffer(max_staleness=0.05, flush=flushed.set)
+        buffer.add(1, 100.0, 10.0)
+
+        # Execute
+        buffer.pop_all()
+
+        # Assert
+        self.assertFalse(flushed.wait(0.2))
+
+    def test_discard(self) -> None:
+        """Test that discarding a node removes its heartbeat and known state."""
+        # Prepare
+        buffer = NodeHeartbeatBuffer(max_staleness=10)
+        buffer.add_known(1)
+        buffer.add(1, 100.0, 10.0)
+
+        # Execute
+        buffer.discard(1)
+
+        # Assert
+        self.assertFalse(buffer.is_known(1))
+        self.assertEqual(buffer.pop_all(), {})
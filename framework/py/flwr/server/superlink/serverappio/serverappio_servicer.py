@@ -16,17 +16,22 @@
 
 
 import threading
+from collections.abc import Iterator
 from logging import DEBUG, ERROR, INFO
 from typing import Optional
 
 import grpc
 
 from flwr.common import Message
-from flwr.common.constant import SUPERLINK_NODE_ID, Status
+from flwr.common.constant import (
+    OBJECT_STATUS_MAX_CONCURRENT_WAITS,
+    SUPERLINK_NODE_ID,
+    WAIT_FOR_REPLIES_MAX_WAIT,
+    Status,
+)
 from flwr.common.inflatable import (
     UnexpectedObjectContentError,
-    get_all_nested_objects,
-    get_object_tree,
+    get_all_nested_objects_and_tree,
     iterate_object_tree,
     no_object_id_recompute,
 )
@@ -65,11 +70,16 @@ from flwr.proto.log_pb2 import (  # pylint: disable=E0611
 from flwr.proto.message_pb2 import (  # pylint: disable=E0611
     ConfirmMessageReceivedRequest,
     ConfirmMessageReceivedResponse,
+    GetObjectsStatusRequest,
+    GetObjectsStatusResponse,
     ObjectIDs,
     PullObjectRequest,
     PullObjectResponse,
+    PullObjectsRequest,
+    PullObjectsResponse,
     PushObjectRequest,
     PushObjectResponse,
+    PushObjectsResponse,
 )
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 from flwr.proto.run_pb2 import (  # pylint: disable=E0611
@@ -83,9 +93,11 @@ from flwr.proto.run_pb2 import (  # pylint: disable=E0611
 from flwr.proto.serverappio_pb2 import (  # pylint: disable=E0611
     GetNodesRequest,
     GetNodesResponse,
+    WaitForRepliesRequest,
+    WaitForRepliesResponse,
 )
 from flwr.server.superlink.linkstate import LinkState, LinkStateFactory
-from flwr.server.superlink.utils import abort_if
+from flwr.server.superlink.utils import abort_if, get_objects_availability
 from flwr.server.utils.validator import validate_message
 from flwr.supercore.ffs import Ffs, FfsFactory
 from flwr.supercore.object_store import NoObjectInStoreError, ObjectStoreFactory
@@ -106,6 +118,10 @@ class ServerAppIoServicer(serverappio_pb2_grpc.ServerAppIoServicer):
         self.ffs_factory = ffs_factory
         self.objectstore_factory = objectstore_factory
         self.lock = threading.RLock()
+        # Each long-poll blocks a server thread, so their number is limited
+        self.object_status_slots = threading.BoundedSemaphore(
+            OBJECT_STATUS_MAX_CONCURRENT_WAITS
+        )
 
     def GetNodes(
         self, request: GetNodesRequest, context: grpc.ServicerContext
@@ -155,7 +171,7 @@ class ServerAppIoServicer(serverappio_pb2_grpc.ServerAppIoServicer):
             request_name="PushMessages",
             detail="`messages_list` must not be empty",
         )
-        message_ids: list[Optional[str]] = []
+        messages: list[Message] = []
         for message_proto in request.messages_list:
             message = message_from_proto(message_proto=message_proto)
             validation_errors = validate_message(message, is_reply_message=False)
@@ -169,9 +185,10 @@ class ServerAppIoServicer(serverappio_pb2_grpc.ServerAppIoServicer):
                 request_name="PushMessages",
                 detail="`Message.metadata` has mismatched `run_id`",
             )
-            # Store
-            message_id: Optional[str] = state.store_message_ins(message=message)
-            message_ids.append(message_id)
+            messages.append(message)
+
+        # Store all Messages at once
+        message_ids = state.store_message_ins_batch(messages)
 
         # Store Message object to descendants mapping and preregister objects
         objects_to_push = store_mapping_and_register_objects(store, request=request)
@@ -183,6 +200,30 @@ class ServerAppIoServicer(serverappio_pb2_grpc.ServerAppIoServicer):
             objects_to_push=objects_to_push,
         )
 
+    def WaitForReplies(
+        self, request: WaitForRepliesRequest, context: grpc.ServicerContext
+    ) -> WaitForRepliesResponse:
+        """Wait until replies to the given Messages are available."""
+        log(DEBUG, "ServerAppIoServicer.WaitForReplies")
+
+        # Init state and store
+        state = self.state_factory.state()
+        store = self.objectstore_factory.store()
+
+        # Abort if the run is not running
+        abort_if(
+            request.run_id,
+            [Status.PENDING, Status.STARTING, Status.FINISHED],
+            state,
+            store,
+            context,
+        )
+
+        # Hold the request until a reply is stored or the timeout expires
+        timeout = min(max(request.timeout, 0.0), WAIT_FOR_REPLIES_MAX_WAIT)
+        available = state.wait_for_message_res(set(request.message_ids), timeout)
+        return WaitForRepliesResponse(replies_available=available)
+
     def PullMessages(  # pylint: disable=R0914
         self, request: PullAppMessagesRequest, context: grpc.ServicerContext
     ) -> PullAppMessagesResponse:
@@ -211,9 +252,9 @@ class ServerAppIoServicer(serverappio_pb2_grpc.ServerAppIoServicer):
         for msg_res in messages_res:
             if msg_res.metadata.src_node_id == SUPERLINK_NODE_ID:
                 with no_object_id_recompute():
-                    all_objects = get_all_nested_objects(msg_res)
+                    all_objects, object_tree = get_all_nested_objects_and_tree(msg_res)
                     # Preregister
-                    store.preregister(request.run_id, get_object_tree(msg_res))
+                    store.preregister(request.run_id, object_tree)
                     # Store objects
                     for obj_id, obj in all_objects.items():
                         store.put(obj_id, obj.deflate())
@@ -485,10 +526,121 @@ class ServerAppIoServicer(serverappio_pb2_grpc.ServerAppIoServicer):
             return PullObjectResponse(
                 object_found=True,
                 object_available=object_available,
-                object_content=content,
+                object_content=bytes(content),
             )
         return PullObjectResponse(object_found=False, object_available=False)
 
+    def PushObjects(
+        self,
+        request_iterator: Iterator[PushObjectRequest],
+        context: grpc.ServicerContext,
+    ) -> Iterator[PushObjectsResponse]:
+        """Push a stream of objects to the ObjectStore."""
+        log(DEBUG, "ServerAppIoServicer.PushObjects")
+
+        # Init state and store
+        state = self.state_factory.state()
+        store = self.objectstore_factory.store()
+
+        checked_run_id: Optional[int] = None
+        for request in request_iterator:
+            # Abort if the run is not running (checked once per run in the stream)
+            if request.run_id != checked_run_id:
+                abort_if(
+                    request.run_id,
+                    [Status.PENDING, Status.STARTING, Status.FINISHED],
+                    state,
+                    store,
+                    context,
+                )
+                checked_run_id = request.run_id
+
+            if request.node.node_id != SUPERLINK_NODE_ID:
+                # Cancel insertion in ObjectStore
+                context.abort(
+                    grpc.StatusCode.FAILED_PRECONDITION, "Unexpected node ID."
+                )
+
+            # Insert in store
+            stored = False
+            try:
+                store.put(request.object_id, request.object_content)
+                stored = True
+            except (NoObjectInStoreError, ValueError) as e:
+                log(ERROR, str(e))
+            except UnexpectedObjectContentError as e:
+                # Object content is not valid
+                context.abort(grpc.StatusCode.FAILED_PRECONDITION, str(e))
+
+            yield PushObjectsResponse(object_id=request.object_id, stored=stored)
+
+    def PullObjects(
+        self, request: PullObjectsRequest, context: grpc.ServicerContext
+    ) -> Iterator[PullObjectsResponse]:
+        """Pull a stream of objects from the ObjectStore."""
+        log(DEBUG, "ServerAppIoServicer.PullObjects")
+
+        # Init state and store
+        state = self.state_factory.state()
+        store = self.objectstore_factory.store()
+
+        # Abort if the run is not running
+        abort_if(
+            request.run_id,
+            [Status.PENDING, Status.STARTING, Status.FINISHED],
+            state,
+            store,
+            context,
+        )
+
+        if request.node.node_id != SUPERLINK_NODE_ID:
+            # Cancel retrieval from ObjectStore
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, "Unexpected node ID.")
+
+        # Fetch from store, one object at a time
+        for object_id in request.object_ids:
+            content = store.get(object_id)
+            if content is None:
+                yield PullObjectsResponse(object_id=object_id, object_found=False)
+            elif content == b"":
+                yield PullObjectsResponse(object_id=object_id, object_found=True)
+            else:
+                yield PullObjectsResponse(
+                    object_id=object_id,
+                    object_found=True,
+                    object_available=True,
+                    object_content=bytes(content),
+                )
+
+    def GetObjectsStatus(
+        self, request: GetObjectsStatusRequest, context: grpc.ServicerContext
+    ) -> GetObjectsStatusResponse:
+        """Get the availability of multiple objects in the ObjectStore."""
+        log(DEBUG, "ServerAppIoServicer.GetObjectsStatus")
+
+        # Init state and store
+        state = self.state_factory.state()
+        store = self.objectstore_factory.store()
+
+        # Abort if the run is not running
+        abort_if(
+            request.run_id,
+            [Status.PENDING, Status.STARTING, Status.FINISHED],
+            state,
+            store,
+            context,
+        )
+
+        if request.node.node_id != SUPERLINK_NODE_ID:
+            # Cancel checking availability in ObjectStore
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, "Unexpected node ID.")
+
+        # Check availability, holding the request if a timeout is given
+        availability = get_objects_availability(
+            store, list(request.object_ids), request.timeout, self.object_status_slots
+        )
+        return GetObjectsStatusResponse(object_availability=availability)
+
     def ConfirmMessageReceived(
         self, request: ConfirmMessageReceivedRequest, context: grpc.ServicerContext
     ) -> ConfirmMessageReceivedResponse:
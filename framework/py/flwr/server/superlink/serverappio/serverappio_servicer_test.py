@@ -16,6 +16,8 @@
 
 
 import tempfile
+import threading
+import time
 import unittest
 from typing import Optional
 from unittest.mock import patch
@@ -59,8 +61,11 @@ from flwr.proto.message_pb2 import (  # pylint: disable=E0611
     ObjectTree,
     PullObjectRequest,
     PullObjectResponse,
+    PullObjectsRequest,
+    PullObjectsResponse,
     PushObjectRequest,
     PushObjectResponse,
+    PushObjectsResponse,
 )
 from flwr.proto.node_pb2 import Node  # pylint: disable=E0611
 from flwr.proto.run_pb2 import (  # pylint: disable=E0611
@@ -70,6 +75,8 @@ from flwr.proto.run_pb2 import (  # pylint: disable=E0611
 from flwr.proto.serverappio_pb2 import (  # pylint: disable=E0611
     GetNodesRequest,
     GetNodesResponse,
+    WaitForRepliesRequest,
+    WaitForRepliesResponse,
 )
 from flwr.server.superlink.linkstate.linkstate_factory import LinkStateFactory
 from flwr.server.superlink.linkstate.linkstate_test import create_ins_message
@@ -168,6 +175,11 @@ class TestServerAppIoServicer(unittest.TestCase):  # pylint: disable=R0902, R090
             request_serializer=PullAppMessagesRequest.SerializeToString,
             response_deserializer=PullAppMessagesResponse.FromString,
         )
+        self._wait_for_replies = self._channel.unary_unary(
+            "/flwr.proto.ServerAppIo/WaitForReplies",
+            request_serializer=WaitForRepliesRequest.SerializeToString,
+            response_deserializer=WaitForRepliesResponse.FromString,
+        )
         self._push_serverapp_outputs = self._channel.unary_unary(
             "/flwr.proto.ServerAppIo/PushAppOutputs",
             request_serializer=PushAppOutputsRequest.SerializeToString,
@@ -193,6 +205,16 @@ class TestServerAppIoServicer(unittest.TestCase):  # pylint: disable=R0902, R090
             request_serializer=PullObjectRequest.SerializeToString,
             response_deserializer=PullObjectResponse.FromString,
         )
+        self._push_objects = self._channel.stream_stream(
+            "/flwr.proto.ServerAppIo/PushObjects",
+            request_serializer=PushObjectRequest.SerializeToString,
+            response_deserializer=PushObjectsResponse.FromString,
+        )
+        self._pull_objects = self._channel.unary_stream(
+            "/flwr.proto.ServerAppIo/PullObjects",
+            request_serializer=PullObjectsRequest.SerializeToString,
+            response_deserializer=PullObjectsResponse.FromString,
+        )
         self._confirm_message_received = self._channel.unary_unary(
             "/flwr.proto.ServerAppIo/ConfirmMessageReceived",
             request_serializer=ConfirmMessageReceivedRequest.SerializeToString,
@@ -529,6 +551,60 @@ class TestServerAppIoServicer(unittest.TestCase):  # pylint: disable=R0902, R090
             assert list(response.objects_to_pull.keys()) == [msg_res.object_id]
             assert list(response.objects_to_pull.values())[0].object_ids == []
 
+    def test_wait_for_replies_returns_once_reply_is_stored(self) -> None:
+        """Test `WaitForReplies` returns as soon as a reply is stored."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        node_id = self.state.create_node(heartbeat_interval=30)
+        self._transition_run_status(run_id, 2)
+        message_ins = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+            )
+        )
+        msg_id = self.state.store_message_ins(message=message_ins)
+        msg_ = self.state.get_message_ins(node_id=node_id, limit=1)[0]
+        reply_msg = Message(RecordDict(), reply_to=msg_)
+        # pylint: disable-next=W0212
+        reply_msg.metadata._message_id = reply_msg.object_id  # type: ignore
+        timer = threading.Timer(0.2, self.state.store_message_res, args=(reply_msg,))
+        request = WaitForRepliesRequest(
+            run_id=run_id, message_ids=[str(msg_id)], timeout=10
+        )
+
+        # Execute
+        start = time.monotonic()
+        timer.start()
+        response, call = self._wait_for_replies.with_call(request=request)
+
+        # Assert
+        assert call.code() == grpc.StatusCode.OK
+        assert response.replies_available
+        assert time.monotonic() - start < 5
+
+    def test_wait_for_replies_timeout(self) -> None:
+        """Test `WaitForReplies` returns after the timeout if no reply is stored."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        node_id = self.state.create_node(heartbeat_interval=30)
+        self._transition_run_status(run_id, 2)
+        message_ins = message_from_proto(
+            create_ins_message(
+                src_node_id=SUPERLINK_NODE_ID, dst_node_id=node_id, run_id=run_id
+            )
+        )
+        msg_id = self.state.store_message_ins(message=message_ins)
+        request = WaitForRepliesRequest(
+            run_id=run_id, message_ids=[str(msg_id)], timeout=0.2
+        )
+
+        # Execute
+        response, call = self._wait_for_replies.with_call(request=request)
+
+        # Assert
+        assert call.code() == grpc.StatusCode.OK
+        assert not response.replies_available
+
     def test_push_serverapp_outputs_successful_if_running(self) -> None:
         """Test `PushServerAppOutputs` success."""
         # Prepare
@@ -755,6 +831,65 @@ class TestServerAppIoServicer(unittest.TestCase):  # pylint: disable=R0902, R090
         # Assert: object not inserted
         assert not res.stored
 
+    def test_push_and_pull_objects(self) -> None:
+        """Test `PushObjects` and `PullObjects`."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        self._transition_run_status(run_id, 2)
+        objs = [ConfigRecord({"a": i}) for i in range(3)]
+        for obj in objs:
+            self.store.preregister(run_id, get_object_tree(obj))
+        node = Node(node_id=SUPERLINK_NODE_ID)
+
+        # Execute: Push all objects over a single stream
+        push_res: list[PushObjectsResponse] = list(
+            self._push_objects(
+                iter(
+                    PushObjectRequest(
+                        node=node,
+                        run_id=run_id,
+                        object_id=obj.object_id,
+                        object_content=obj.deflate(),
+                    )
+                    for obj in objs
+                )
+            )
+        )
+
+        # Assert
+        self.assertEqual(len(push_res), len(objs))
+        self.assertTrue(all(r.stored for r in push_res))
+
+        # Execute: Pull all objects over a single stream
+        req = PullObjectsRequest(
+            node=node, run_id=run_id, object_ids=[obj.object_id for obj in objs]
+        )
+        pull_res: list[PullObjectsResponse] = list(self._pull_objects(req))
+
+        # Assert
+        self.assertEqual(
+            [r.object_content for r in pull_res], [obj.deflate() for obj in objs]
+        )
+
+    def test_push_and_pull_objects_fail_with_unknown_node(self) -> None:
+        """Test `PushObjects` and `PullObjects` reject node IDs other than SuperLink."""
+        # Prepare
+        run_id = self.state.create_run("", "", "", {}, ConfigRecord(), "")
+        self._transition_run_status(run_id, 2)
+
+        # Execute & Assert
+        with self.assertRaises(grpc.RpcError) as e:
+            list(
+                self._push_objects(
+                    iter([PushObjectRequest(node=Node(node_id=123), run_id=run_id)])
+                )
+            )
+        assert e.exception.code() == grpc.StatusCode.FAILED_PRECONDITION
+        with self.assertRaises(grpc.RpcError) as e:
+            req = PullObjectsRequest(node=Node(node_id=123), run_id=run_id)
+            list(self._pull_objects(req))
+        assert e.exception.code() == grpc.StatusCode.FAILED_PRECONDITION
+
     def test_pull_object_successful(self) -> None:
         """Test `PullObject` functionality."""
         # Prepare
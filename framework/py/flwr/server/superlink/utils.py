@@ -15,11 +15,18 @@
 """SuperLink utilities."""
 
 
+import threading
+import time
 from typing import Optional, Union
 
 import grpc
 
-from flwr.common.constant import Status, SubStatus
+from flwr.common.constant import (
+    OBJECT_STATUS_MAX_WAIT,
+    OBJECT_STATUS_POLL_INTERVAL,
+    Status,
+    SubStatus,
+)
 from flwr.common.typing import RunStatus
 from flwr.proto.appio_pb2 import PushAppMessagesRequest  # pylint: disable=E0611
 from flwr.proto.fleet_pb2 import PushMessagesRequest  # pylint: disable=E0611
@@ -97,3 +104,43 @@ def store_mapping_and_register_objects(
         )
 
     return objects_to_push
+
+
+def get_objects_availability(
+    store: ObjectStore,
+    object_ids: list[str],
+    timeout: float = 0,
+    wait_slots: Optional[threading.BoundedSemaphore] = None,
+) -> dict[str, bool]:
+    """Get the availability of objects, optionally waiting for changes.
+
+    If `timeout` is positive, hold until at least one of the requested objects that
+    was not yet available becomes available (or is removed from the store), or until
+    `timeout` (capped at `OBJECT_STATUS_MAX_WAIT`) seconds have passed. If
+    `wait_slots` is given and none of its slots is free, return immediately instead.
+    """
+    num_changes = store.num_changes
+    availability = store.get_availability(object_ids)
+    pending = [obj_id for obj_id, available in availability.items() if not available]
+    if timeout <= 0 or not pending:
+        return availability
+    # pylint: disable-next=R1732
+    if wait_slots is not None and not wait_slots.acquire(blocking=False):
+        return availability
+
+    try:
+        deadline = time.monotonic() + min(timeout, OBJECT_STATUS_MAX_WAIT)
+        while (remaining := deadline - time.monotonic()) > 0:
+            # Objects put by other processes sharing the store are not notified, so
+            # the store is checked again periodically
+            store.wait_for_change(
+                num_changes, min(OBJECT_STATUS_POLL_INTERVAL, remaining)
+            )
+            num_changes = store.num_changes
+            updated = store.get_availability(pending)
+            if len(updated) < len(pending) or any(updated.values()):
+                return store.get_availability(object_ids)
+        return availability
+    finally:
+        if wait_slots is not None:
+            wait_slots.release()
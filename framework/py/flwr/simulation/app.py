@@ -200,13 +200,14 @@ def run_simulation_process(  # pylint: disable=R0914, disable=W0212, disable=R09
                     "Federation options expects `num-supernodes` to be set."
                 )
             backend_config: BackendConfig = fed_opt.get("backend", {})
+            backend_name: str = backend_config.pop("name", "ray")  # type: ignore
             verbose: bool = fed_opt.get("verbose", False)
             enable_tf_gpu_growth: bool = fed_opt.get("enable_tf_gpu_growth", False)
 
             event(
                 EventType.FLWR_SIMULATION_RUN_ENTER,
                 event_details={
-                    "backend": "ray",
+                    "backend": backend_name,
                     "num-supernodes": num_supernodes,
                     "run-id-hash": get_sha256_hash(run.run_id),
                 },
@@ -227,6 +228,7 @@ def run_simulation_process(  # pylint: disable=R0914, disable=W0212, disable=R09
                 server_app_attr=server_app_attr,
                 client_app_attr=client_app_attr,
                 num_supernodes=num_supernodes,
+                backend_name=backend_name,
                 backend_config=backend_config,
                 app_dir=str(app_path),
                 run=run,
@@ -0,0 +1,136 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Broadcast of Arrays to Ray actors through the object store."""
+
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+import ray
+from ray import ObjectRef
+
+from flwr.common import Array, ArrayRecord, Message, RecordDict
+from flwr.common.constant import VCE_BROADCAST_MIN_ARRAY_SIZE
+from flwr.common.message import make_message
+
+# Record key -> Array key -> reference to the data of the Array
+ArrayRefs = dict[str, dict[str, "ObjectRef[Any]"]]
+
+
+class BroadcastCache:
+    """Cache placing the data of each Array sent to actors in the object store once.
+
+    A ServerApp usually sends the same `Array` objects to all nodes of a round.
+    Instead of serializing their data into each call to an actor, the data of each
+    `Array` is placed in the object store once and actors read it without copying.
+    Entries are keyed on the ID of the `Array` object and released when the `Array`
+    is garbage collected, typically at the end of the round.
+
+    Parameters
+    ----------
+    min_size : int (default: VCE_BROADCAST_MIN_ARRAY_SIZE)
+        Smallest `Array`, in bytes, placed in the object store. Smaller Arrays are
+        serialized with the Message.
+    """
+
+    def __init__(self, min_size: int = VCE_BROADCAST_MIN_ARRAY_SIZE) -> None:
+        self.min_size = min_size
+        # Array ID -> (weak reference to the Array, data of the Array, ObjectRef)
+        self.entries: dict[int, tuple[weakref.ref[Array], Any, ObjectRef[Any]]] = {}
+        # Reentrant, as an Array may be garbage collected while the lock is held
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return the number of Arrays in the object store."""
+        with self.lock:
+            return len(self.entries)
+
+    def _get_ref(self, array: Array) -> ObjectRef[Any]:
+        """Return the reference to the data of the Array, placing it if needed."""
+        key = id(array)
+        with self.lock:
+            entry = self.entries.get(key)
+            # The data of the Array may have been replaced since it was placed
+            if entry is not None and entry[1] is array.data:
+                return entry[2]
+
+            # Released by the weak reference when the Array is garbage collected
+            ref: ObjectRef[Any] = ray.put(np.frombuffer(array.data, dtype=np.uint8))
+            self.entries[key] = (
+                weakref.ref(array, lambda _: self._remove(key)),
+                array.data,
+                ref,
+            )
+            return ref
+
+    def _remove(self, key: int) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def split(self, message: Message) -> tuple[Message, ArrayRefs]:
+        """Split the data of large Arrays from the Message.
+
+        Return a copy of the Message in which these Arrays have no data, and the
+        references to their data in the object store. The Message is not modified.
+        """
+        array_refs: ArrayRefs = {}
+        if message.has_error():
+            return message, array_refs
+
+        content = RecordDict()
+        for record_key, record in message.content.items():
+            if isinstance(record, ArrayRecord):
+                refs = {
+                    array_key: self._get_ref(array)
+                    for array_key, array in record.items()
+                    if memoryview(array.data).nbytes >= self.min_size
+                }
+                if refs:
+                    array_refs[record_key] = refs
+                    record = ArrayRecord(
+                        OrderedDict(
+                            (
+                                array_key,
+                                (
+                                    Array(array.dtype, array.shape, array.stype, b"")
+                                    if array_key in refs
+                                    else array
+                                ),
+                            )
+                            for array_key, array in record.items()
+                        )
+                    )
+            content[record_key] = record
+
+        if not array_refs:
+            return message, array_refs
+        return make_message(metadata=message.metadata, content=content), array_refs
+
+
+def materialize(message: Message, array_refs: ArrayRefs) -> None:
+    """Set the data of the Arrays split from the Message by `BroadcastCache`.
+
+    The data of each Array is a read-only view of the object store.
+    """
+    for record_key, refs in array_refs.items():
+        record = message.content.array_records[record_key]
+        values = ray.get(list(refs.values()))
+        for array_key, value in zip(refs, values):
+            record[array_key].data = memoryview(value)
@@ -0,0 +1,102 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Test for broadcast of Arrays to Ray actors."""
+
+
+import gc
+from unittest import TestCase
+
+import numpy as np
+import ray
+
+from flwr.common import ArrayRecord, ConfigRecord, Message, RecordDict
+
+from .broadcast import BroadcastCache, materialize
+
+
+def _make_message(arrays: ArrayRecord) -> Message:
+    return Message(
+        RecordDict({"arrays": arrays, "config": ConfigRecord({"lr": 0.1})}),
+        dst_node_id=0,
+        message_type="train",
+    )
+
+
+class TestBroadcastCache(TestCase):
+    """Tests for BroadcastCache."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Start Ray."""
+        ray.init(num_cpus=1, include_dashboard=False)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Stop Ray."""
+        ray.shutdown()
+
+    def test_split_and_materialize(self) -> None:
+        """Test that large Arrays are placed once and read back as views."""
+        cache = BroadcastCache(min_size=1024)
+        arrays = ArrayRecord([np.arange(1000.0), np.arange(10.0)])
+        messages = [_make_message(arrays) for _ in range(3)]
+
+        splits = [cache.split(message) for message in messages]
+
+        # The large Array is placed once, the small one is kept in the Message
+        assert len(cache) == 1
+        assert {tuple(refs["arrays"]) for _, refs in splits} == {("0",)}
+        assert len({refs["arrays"]["0"] for _, refs in splits}) == 1
+        # The Messages are not modified
+        assert messages[0].content.array_records["arrays"] is arrays
+        split_message, refs = splits[0]
+        assert split_message.metadata == messages[0].metadata
+        assert len(split_message.content.array_records["arrays"]["0"].data) == 0
+        assert split_message.content.config_records["config"]["lr"] == 0.1
+
+        materialize(split_message, refs)
+        array = split_message.content.array_records["arrays"]["0"]
+        assert (array.numpy() == np.arange(1000.0)).all()
+        assert not array.numpy(readonly=True).flags.writeable
+        assert (
+            split_message.content.array_records["arrays"]["1"].numpy()
+            == np.arange(10.0)
+        ).all()
+
+    def test_release(self) -> None:
+        """Test that Arrays are released when garbage collected."""
+        cache = BroadcastCache(min_size=1024)
+        arrays = ArrayRecord([np.arange(1000.0)])
+        cache.split(_make_message(arrays))
+        assert len(cache) == 1
+
+        # Replacing the data places it again
+        arrays["0"].data = np.ones(1000).tobytes()
+        _, refs = cache.split(_make_message(arrays))
+        assert len(cache) == 1
+        assert (np.frombuffer(ray.get(refs["arrays"]["0"])) == 1).all()
+
+        del arrays, refs
+        gc.collect()
+        assert len(cache) == 0
+
+    def test_messages_without_large_arrays(self) -> None:
+        """Test that Messages without large Arrays are returned as they are."""
+        cache = BroadcastCache(min_size=1024)
+        message = _make_message(ArrayRecord([np.arange(10.0)]))
+        split_message, refs = cache.split(message)
+        assert split_message is message
+        assert not refs
+        assert len(cache) == 0
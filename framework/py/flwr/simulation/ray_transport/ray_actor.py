@@ -28,6 +28,8 @@ from flwr.client.client_app import ClientApp, ClientAppException, LoadClientAppE
 from flwr.common import Context, Message
 from flwr.common.logger import log
 
+from .broadcast import ArrayRefs, materialize
+
 ClientAppFn = Callable[[], ClientApp]
 
 
@@ -39,18 +41,26 @@ class VirtualClientEngineActor(ABC):
         log(WARNING, "Manually terminating %s", self.__class__.__name__)
         ray.actor.exit_actor()
 
-    def run(
+    def run(  # pylint: disable=too-many-arguments,R0917
         self,
         client_app_fn: ClientAppFn,
         message: Message,
         cid: str,
         context: Context,
+        array_refs: Optional[ArrayRefs] = None,
     ) -> tuple[str, Message, Context]:
-        """Run a client run."""
+        """Run a client run.
+
+        The data of the Arrays split from the Message by `BroadcastCache` is read from
+        `array_refs`.
+        """
         # Pass message through ClientApp and return a message
         # return also cid which is needed to ensure results
         # from the pool are correctly assigned to each ClientProxy
         try:
+            if array_refs:
+                materialize(message, array_refs)
+
             # Load app
             app: ClientApp = client_app_fn()
 
@@ -65,6 +75,40 @@ class VirtualClientEngineActor(ABC):
 
         return cid, out_message, context
 
+    def run_batch(  # pylint: disable=too-many-arguments,R0917
+        self,
+        client_app_fn: ClientAppFn,
+        messages: list[Message],
+        cids: list[str],
+        contexts: list[Context],
+        array_refs: Optional[list[ArrayRefs]] = None,
+    ) -> list[Union[tuple[str, Message, Context], Exception]]:
+        """Run a client run for each Message, one after the other.
+
+        The `ClientApp` is loaded once for all Messages. Errors are returned instead of
+        raised, such that a failing client run does not affect the others.
+        """
+        if array_refs:
+            for message, refs in zip(messages, array_refs):
+                materialize(message, refs)
+
+        try:
+            app: ClientApp = client_app_fn()
+        except LoadClientAppError as load_ex:
+            return [LoadClientAppError(str(load_ex)) for _ in messages]
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            return [Exception(str(ex)) for _ in messages]
+
+        results: list[Union[tuple[str, Message, Context], Exception]] = []
+        for message, cid, context in zip(messages, cids, contexts):
+            try:
+                out_message = app(message=message, context=context)
+                results.append((cid, out_message, context))
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                # Only pass the description, as the exception may not be picklable
+                results.append(Exception(str(ex)))
+        return results
+
 
 @ray.remote
 class ClientAppActor(VirtualClientEngineActor):
@@ -466,6 +510,22 @@ class BasicActorPool:
         self._future_to_actor[future] = actor
         return future
 
+    def submit_batch(
+        self,
+        actor_fn: Any,
+        jobs: tuple[ClientAppFn, list[Message], list[str], list[Context]],
+    ) -> Any:
+        """On idle actor, submit multiple jobs at once and return future."""
+        # Remove idle actor from pool
+        actor = self.pool.pop()
+        # Submit jobs to actor
+        app_fn, mssgs, cids, contexts = jobs
+        future = actor_fn(actor, app_fn, mssgs, cids, contexts)
+        # Keep track of future:actor (so we can fetch the actor upon job completion
+        # and add it back to the pool)
+        self._future_to_actor[future] = actor
+        return future
+
     def add_actor_back_to_pool(self, future: Any) -> None:
         """Ad actor assigned to run future back into the pool."""
         actor = self._future_to_actor.pop(future)
@@ -481,3 +541,15 @@ class BasicActorPool:
         # Get actor that ran job
         self.add_actor_back_to_pool(future)
         return out_mssg, updated_context
+
+    def fetch_batch_results_and_return_actor_to_pool(
+        self, future: Any
+    ) -> list[Union[tuple[Message, Context], Exception]]:
+        """Pull results of multiple jobs given a future and add actor back to pool."""
+        results = ray.get(future)
+        # Get actor that ran jobs
+        self.add_actor_back_to_pool(future)
+        return [
+            result if isinstance(result, Exception) else (result[1], result[2])
+            for result in results
+        ]
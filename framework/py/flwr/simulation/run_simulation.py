@@ -172,7 +172,9 @@ def run_simulation(
         ServerApp and receive a Message describing what the ClientApp should perform.
 
     backend_name : str (default: ray)
-        A simulation backend that runs `ClientApp` objects.
+        A simulation backend that runs `ClientApp` objects. Use `process` to run them
+        in a pool of worker processes without Ray, or `thread` to run them in threads
+        of the current process.
 
     backend_config : Optional[BackendConfig]
         'A dictionary to configure a backend. Separate dictionaries to configure
@@ -538,7 +540,8 @@ def _parse_args_run_simulation() -> argparse.ArgumentParser:
         "--backend",
         default="ray",
         type=str,
-        help="Simulation backend that executes the ClientApp.",
+        help="Simulation backend that executes the ClientApp: `ray`, `process` or "
+        "`thread`.",
     )
     parser.add_argument(
         "--backend-config",
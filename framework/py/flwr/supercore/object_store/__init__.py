@@ -14,11 +14,12 @@
 # ==============================================================================
 """Flower ObjectStore."""
 
-from .object_store import NoObjectInStoreError, ObjectStore
+from .object_store import NoObjectInStoreError, ObjectStore, PreregisterStats
 from .object_store_factory import ObjectStoreFactory
 
 __all__ = [
     "NoObjectInStoreError",
     "ObjectStore",
     "ObjectStoreFactory",
+    "PreregisterStats",
 ]
@@ -0,0 +1,541 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Flower disk-backed ObjectStore implementation."""
+
+
+import json
+import mmap
+import os
+import threading
+from dataclasses import dataclass
+from io import BufferedWriter, TextIOWrapper
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from flwr.common.constant import OBJECT_STORE_SEGMENT_SIZE
+from flwr.common.inflatable import (
+    get_object_id,
+    is_valid_sha256_hash,
+    iterate_object_tree,
+)
+from flwr.common.inflatable_utils import validate_object_content
+from flwr.proto.message_pb2 import ObjectTree  # pylint: disable=E0611
+
+from .object_store import NoObjectInStoreError, ObjectStore, PreregisterStats
+
+INDEX_FILE_NAME = "index.jsonl"
+SEGMENT_DIR_NAME = "segments"
+SEGMENT_FILE_SUFFIX = ".seg"
+
+
+@dataclass
+class DiskObjectEntry:
+    """Data class representing an object entry in the disk-backed store."""
+
+    # Location of the content as (segment ID, offset, length), None if not available
+    location: Optional[tuple[int, int, int]]
+    child_object_ids: list[str]  # List of child object IDs
+    ref_count: int  # Number of references (direct parents) to this object
+    runs: set[int]  # Set of run IDs that used this object
+
+
+class DiskObjectStore(ObjectStore):  # pylint: disable=R0902
+    """Disk-backed implementation of the ObjectStore interface.
+
+    Object contents are appended to segment files in `base_dir` and served as
+    read-only `memoryview`s over memory-mapped segments, so no object content is
+    kept on the Python heap. Object metadata (children, reference counts and run
+    membership) is kept in memory and journaled to an append-only index file, which
+    is replayed and compacted when the store is opened again.
+
+    With `fsync` enabled, an object is on disk once `put` returns: its content is
+    synced to its segment before the index record pointing to it, and syncing that
+    record also syncs all earlier records of the index. Later preregistrations and
+    deletions that are only flushed to the OS may be lost on a power failure, in which
+    case deleted objects reappear until their run is deleted and preregistered
+    objects have to be pushed again.
+
+    The content returned by `get` is not copied. It is copied once when it is put
+    into a protobuf message, as protobuf `bytes` fields do not accept `memoryview`s.
+
+    Parameters
+    ----------
+    base_dir : str
+        The directory in which the segment files and the index are stored.
+    verify : bool (default: True)
+        Whether to verify that the content of an object matches its object ID
+        when it is put into the store.
+    segment_size : int (default: OBJECT_STORE_SEGMENT_SIZE)
+        The size in bytes after which a segment is sealed and a new one is started.
+        Segments whose objects have all been deleted are removed from disk.
+    fsync : bool (default: True)
+        Whether to sync the content and the index to disk when an object is put.
+        Disabling it speeds up `put`, but objects put shortly before a power failure
+        may be lost.
+    """
+
+    def __init__(
+        self,
+        base_dir: str,
+        verify: bool = True,
+        segment_size: int = OBJECT_STORE_SEGMENT_SIZE,
+        fsync: bool = True,
+    ) -> None:
+        super().__init__()
+        self.verify = verify
+        self.segment_size = segment_size
+        self.fsync = fsync
+        self.base_dir = Path(base_dir)
+        self.segment_dir = self.base_dir / SEGMENT_DIR_NAME
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self.store: dict[str, DiskObjectEntry] = {}
+        self.lock_store = threading.RLock()
+        # Mapping each run ID to a set of object IDs that are used in that run
+        self.run_objects_mapping: dict[int, set[str]] = {}
+        # Number of available objects stored in each segment
+        self.segment_live_objects: dict[int, int] = {}
+        # Read-only memory maps of segments, with the number of mapped bytes
+        self.segment_maps: dict[int, tuple[mmap.mmap, int]] = {}
+        self.active_segment_id = 0
+        self.active_segment_size = 0
+        self.active_segment: Optional[BufferedWriter] = None
+        self.index: Optional[TextIOWrapper] = None
+        self._load()
+
+    def preregister(self, run_id: int, object_tree: ObjectTree) -> list[str]:
+        """Identify and preregister missing objects."""
+        new_objects = []
+        stats = PreregisterStats()
+        with self.lock_store:
+            if run_id not in self.run_objects_mapping:
+                self.run_objects_mapping[run_id] = set()
+
+            for tree_node in iterate_object_tree(object_tree):
+                obj_id = tree_node.object_id
+                # Verify object ID format (must be a valid sha256 hash)
+                if not is_valid_sha256_hash(obj_id):
+                    raise ValueError(f"Invalid object ID format: {obj_id}")
+                stats.num_objects += 1
+                if obj_id not in self.store:
+                    child_ids = [child.object_id for child in tree_node.children]
+                    self._apply_register(obj_id, child_ids, run_id)
+                    self._journal(
+                        {
+                            "op": "reg",
+                            "id": obj_id,
+                            "children": child_ids,
+                            "run": run_id,
+                        }
+                    )
+
+                    # Add to the list of new objects
+                    new_objects.append(obj_id)
+                else:
+                    # Object is in store, retrieve it
+                    obj_entry = self.store[obj_id]
+
+                    # Add to the list of new objects if not available
+                    if obj_entry.location is None:
+                        new_objects.append(obj_id)
+                    else:
+                        stats.num_deduplicated += 1
+                        stats.bytes_deduplicated += obj_entry.location[2]
+
+                    # If the object is already registered but not in this run,
+                    # add the run ID to its runs
+                    if obj_id not in self.run_objects_mapping[run_id]:
+                        obj_entry.runs.add(run_id)
+                        self.run_objects_mapping[run_id].add(obj_id)
+                        self._journal({"op": "run", "id": obj_id, "run": run_id})
+
+        self._record_preregister_stats(run_id, stats)
+        return new_objects
+
+    def get_object_tree(self, object_id: str) -> ObjectTree:
+        """Get the object tree for a given object ID."""
+        with self.lock_store:
+            # Raise an exception if there's no object with the given ID
+            if not (object_entry := self.store.get(object_id)):
+                raise NoObjectInStoreError(
+                    f"Object with ID '{object_id}' was not pre-registered."
+                )
+
+            # Build the tree top-down, adding the children of each node in place
+            tree = ObjectTree(object_id=object_id)
+            stack = [(tree, object_entry)]
+            while stack:
+                node, entry = stack.pop()
+                for child_id in entry.child_object_ids:
+                    if (child_entry := self.store.get(child_id)) is None:
+                        # Raise an error if any child object is missing
+                        # This indicates an integrity issue
+                        raise NoObjectInStoreError(
+                            f"Object tree for object ID '{object_id}' contains "
+                            "missing children. This may indicate a corrupted "
+                            "object store."
+                        )
+                    stack.append((node.children.add(object_id=child_id), child_entry))
+            return tree
+
+    def put(self, object_id: str, object_content: bytes) -> None:
+        """Put an object into the store."""
+        if self.verify:
+            # Verify object_id and object_content match
+            object_id_from_content = get_object_id(object_content)
+            if object_id != object_id_from_content:
+                raise ValueError(f"Object ID {object_id} does not match content hash")
+
+            # Validate object content
+            validate_object_content(content=object_content)
+
+        with self.lock_store:
+            # Only allow adding the object if it has been preregistered
+            if object_id not in self.store:
+                raise NoObjectInStoreError(
+                    f"Object with ID '{object_id}' was not pre-registered."
+                )
+
+            # Return if object is already present in the store
+            if self.store[object_id].location is not None:
+                return
+
+            # Append the content to the active segment before journaling it,
+            # so that the index never points to content that is not on disk
+            location = self._append_to_segment(object_content)
+            self._apply_put(object_id, location)
+            self._journal(
+                {"op": "put", "id": object_id, "loc": list(location)}, sync=True
+            )
+        self._notify_change()
+
+    def get(self, object_id: str) -> Optional[Union[bytes, memoryview]]:
+        """Get an object from the store.
+
+        The content of available objects is returned as a read-only `memoryview`
+        over the memory-mapped segment holding it.
+        """
+        with self.lock_store:
+            # Check if the object ID is pre-registered
+            if (object_entry := self.store.get(object_id)) is None:
+                return None
+
+            # Return b"" if the object is not yet available
+            if object_entry.location is None:
+                return b""
+
+            segment_id, offset, length = object_entry.location
+            with memoryview(self._get_segment_map(segment_id, offset + length)) as view:
+                return view[offset : offset + length]
+
+    def get_availability(self, object_ids: list[str]) -> dict[str, bool]:
+        """Get the availability of multiple objects in the store."""
+        with self.lock_store:
+            return {
+                object_id: entry.location is not None
+                for object_id in object_ids
+                if (entry := self.store.get(object_id)) is not None
+            }
+
+    def delete(self, object_id: str) -> None:
+        """Delete an object and its unreferenced descendants from the store."""
+        with self.lock_store:
+            pending = [object_id]
+            while pending:
+                obj_id = pending.pop()
+                # Skip objects not in the store or still referenced by others
+                object_entry = self.store.get(obj_id)
+                if object_entry is None or object_entry.ref_count != 0:
+                    continue
+
+                self._apply_delete(obj_id)
+                self._journal({"op": "del", "id": obj_id})
+
+                # Try to delete the child objects next
+                pending.extend(object_entry.child_object_ids)
+        self._notify_change()
+
+    def delete_objects_in_run(self, run_id: int) -> None:
+        """Delete all objects that were registered in a specific run."""
+        with self.lock_store:
+            if run_id not in self.run_objects_mapping:
+                return
+            for object_id in list(self.run_objects_mapping[run_id]):
+                # Check if the object is still in the store
+                if (object_entry := self.store.get(object_id)) is None:
+                    continue
+
+                # Remove the run ID from the object's runs
+                object_entry.runs.discard(run_id)
+
+                # Only message objects are allowed to have a `ref_count` of 0,
+                # and every message object must have a `ref_count` of 0
+                if object_entry.ref_count == 0:
+                    # Delete the message object and its unreferenced descendants
+                    self.delete(object_id)
+
+            self._apply_delete_run(run_id)
+            self._journal({"op": "delrun", "run": run_id})
+            self._clear_preregister_stats(run_id)
+
+    def clear(self) -> None:
+        """Clear the store."""
+        with self.lock_store:
+            self._close_files()
+            self.segment_maps.clear()
+            for segment_path in self.segment_dir.glob(f"*{SEGMENT_FILE_SUFFIX}"):
+                segment_path.unlink()
+            (self.base_dir / INDEX_FILE_NAME).unlink(missing_ok=True)
+            self.store.clear()
+            self.run_objects_mapping.clear()
+            self.segment_live_objects.clear()
+            self._clear_preregister_stats()
+            self._open_files(segment_id=0)
+        self._notify_change()
+
+    def close(self) -> None:
+        """Flush and close the index and the active segment."""
+        with self.lock_store:
+            self._close_files()
+
+    def __contains__(self, object_id: str) -> bool:
+        """Check if an object_id is in the store."""
+        with self.lock_store:
+            return object_id in self.store
+
+    def __len__(self) -> int:
+        """Get the number of objects in the store."""
+        with self.lock_store:
+            return len(self.store)
+
+    def _apply_register(
+        self, object_id: str, child_ids: list[str], run_id: int
+    ) -> None:
+        """Register a new object and increment the reference count of its children."""
+        self.store[object_id] = DiskObjectEntry(
+            location=None,  # Initially not available
+            child_object_ids=child_ids,
+            ref_count=0,  # Reference count starts at 0
+            runs={run_id},  # Start with the current run ID
+        )
+
+        # Increment the reference count for all its children
+        # Post-order traversal ensures that children are registered before parents
+        for child_id in child_ids:
+            self.store[child_id].ref_count += 1
+
+        # Add the object ID to the run's mapping
+        self.run_objects_mapping.setdefault(run_id, set()).add(object_id)
+
+    def _apply_put(self, object_id: str, location: tuple[int, int, int]) -> None:
+        """Mark an object as available at the given location."""
+        self.store[object_id].location = location
+        segment_id = location[0]
+        self.segment_live_objects[segment_id] = (
+            self.segment_live_objects.get(segment_id, 0) + 1
+        )
+
+    def _apply_delete(self, object_id: str) -> None:
+        """Remove a single object and decrement the reference count of its children."""
+        object_entry = self.store.pop(object_id)
+
+        # Remove the object from the run's mapping
+        for run_id in object_entry.runs:
+            self.run_objects_mapping[run_id].discard(object_id)
+
+        # Decrease the reference count of its children
+        for child_id in object_entry.child_object_ids:
+            self.store[child_id].ref_count -= 1
+
+        # Release the segment holding the content if it is no longer used
+        if object_entry.location is not None:
+            segment_id = object_entry.location[0]
+            self.segment_live_objects[segment_id] -= 1
+            # Segments are not removed while the index is being replayed
+            if (
+                self.segment_live_objects[segment_id] == 0
+                and self.active_segment is not None
+                and segment_id != self.active_segment_id
+            ):
+                self._remove_segment(segment_id)
+
+    def _apply_delete_run(self, run_id: int) -> None:
+        """Remove a run from the mapping and from the runs of its objects."""
+        for object_id in self.run_objects_mapping.pop(run_id, set()):
+            if (object_entry := self.store.get(object_id)) is not None:
+                object_entry.runs.discard(run_id)
+
+    def _append_to_segment(self, content: bytes) -> tuple[int, int, int]:
+        """Append content to the active segment and return its location."""
+        # Seal the active segment if it is full
+        if self.active_segment_size > 0 and (
+            self.active_segment_size + len(content) > self.segment_size
+        ):
+            self._seal_active_segment()
+
+        assert self.active_segment is not None
+        offset = self.active_segment_size
+        self.active_segment.write(content)
+        self.active_segment.flush()
+        if self.fsync:
+            os.fsync(self.active_segment.fileno())
+        self.active_segment_size += len(content)
+        return self.active_segment_id, offset, len(content)
+
+    def _seal_active_segment(self) -> None:
+        """Close the active segment and start a new one."""
+        sealed_id = self.active_segment_id
+        if self.active_segment is not None:
+            self.active_segment.close()
+        self._open_segment(sealed_id + 1)
+        # Remove the sealed segment if all its objects were already deleted
+        if self.segment_live_objects.get(sealed_id, 0) == 0:
+            self._remove_segment(sealed_id)
+
+    def _get_segment_map(self, segment_id: int, min_size: int) -> mmap.mmap:
+        """Return a memory map of a segment covering at least `min_size` bytes."""
+        if (mapped := self.segment_maps.get(segment_id)) is not None:
+            if mapped[1] >= min_size:
+                return mapped[0]
+            # The segment has grown since it was mapped
+            _close_map(mapped[0])
+
+        with open(self._segment_path(segment_id), "rb") as f:
+            segment_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.segment_maps[segment_id] = (segment_map, len(segment_map))
+        return segment_map
+
+    def _remove_segment(self, segment_id: int) -> None:
+        """Remove a segment that no longer holds any object from disk."""
+        self.segment_live_objects.pop(segment_id, None)
+        if (mapped := self.segment_maps.pop(segment_id, None)) is not None:
+            _close_map(mapped[0])
+        self._segment_path(segment_id).unlink(missing_ok=True)
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.segment_dir / f"{segment_id:08d}{SEGMENT_FILE_SUFFIX}"
+
+    def _journal(self, record: dict[str, Any], sync: bool = False) -> None:
+        """Append a record to the index, syncing it to disk if `sync` and `fsync`."""
+        assert self.index is not None
+        self.index.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.index.flush()
+        if sync and self.fsync:
+            os.fsync(self.index.fileno())
+
+    def _load(self) -> None:
+        """Replay the index, compact it and start a new active segment."""
+        index_path = self.base_dir / INDEX_FILE_NAME
+        if index_path.exists():
+            with open(index_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Ignore a partially written last record
+                        break
+                    self._replay(record)
+
+        # Remove segments that do not hold any object
+        segment_ids = [
+            int(path.stem) for path in self.segment_dir.glob(f"*{SEGMENT_FILE_SUFFIX}")
+        ]
+        for segment_id in segment_ids:
+            if self.segment_live_objects.get(segment_id, 0) == 0:
+                self._remove_segment(segment_id)
+
+        # Write a compacted index with one record per object and run
+        compacted_path = index_path.with_suffix(".tmp")
+        with open(compacted_path, "w", encoding="utf-8") as f:
+            for object_id, entry in self.store.items():
+                record = {
+                    "op": "obj",
+                    "id": object_id,
+                    "children": entry.child_object_ids,
+                    "ref": entry.ref_count,
+                    "runs": sorted(entry.runs),
+                    "loc": list(entry.location) if entry.location else None,
+                }
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            for run_id in self.run_objects_mapping:
+                f.write(json.dumps({"op": "newrun", "run": run_id}) + "\n")
+            # Sync the compacted index before it replaces the old one
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        compacted_path.replace(index_path)
+
+        self._open_files(segment_id=max(segment_ids, default=-1) + 1)
+
+    def _replay(self, record: dict[str, Any]) -> None:
+        """Apply a single index record."""
+        op = record["op"]
+        if op == "reg":
+            self._apply_register(record["id"], record["children"], record["run"])
+        elif op == "run":
+            self.store[record["id"]].runs.add(record["run"])
+            self.run_objects_mapping.setdefault(record["run"], set()).add(record["id"])
+        elif op == "put":
+            self._apply_put(record["id"], tuple(record["loc"]))
+        elif op == "del":
+            self._apply_delete(record["id"])
+        elif op == "delrun":
+            self._apply_delete_run(record["run"])
+        elif op == "obj":
+            self.store[record["id"]] = DiskObjectEntry(
+                location=None,
+                child_object_ids=record["children"],
+                ref_count=record["ref"],
+                runs=set(record["runs"]),
+            )
+            for run_id in record["runs"]:
+                self.run_objects_mapping.setdefault(run_id, set()).add(record["id"])
+            if record["loc"] is not None:
+                self._apply_put(record["id"], tuple(record["loc"]))
+        elif op == "newrun":
+            self.run_objects_mapping.setdefault(record["run"], set())
+
+    def _open_files(self, segment_id: int) -> None:
+        """Open the index for appending and start the active segment."""
+        self.index = open(  # pylint: disable=R1732
+            self.base_dir / INDEX_FILE_NAME, "a", encoding="utf-8"
+        )
+        self._open_segment(segment_id)
+
+    def _open_segment(self, segment_id: int) -> None:
+        self.active_segment_id = segment_id
+        self.active_segment_size = 0
+        self.active_segment = open(  # pylint: disable=R1732
+            self._segment_path(segment_id), "wb"
+        )
+
+    def _close_files(self) -> None:
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        if self.active_segment is not None:
+            self.active_segment.close()
+            self.active_segment = None
+
+
+def _close_map(segment_map: mmap.mmap) -> None:
+    """Close a memory map unless views of it are still in use.
+
+    A map with exported views is closed automatically once the last view is released, so
+    it is safe to drop it here.
+    """
+    try:
+        segment_map.close()
+    except BufferError:
+        pass
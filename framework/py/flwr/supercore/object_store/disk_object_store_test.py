@@ -0,0 +1,140 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for DiskObjectStore."""
+
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from flwr.common.inflatable import get_object_tree
+
+from .disk_object_store import SEGMENT_DIR_NAME, DiskObjectStore
+from .object_store import ObjectStore
+from .object_store_test import ObjectStoreTest, _create_object_hierarchy
+
+
+class DiskObjectStoreTest(ObjectStoreTest):
+    """Test DiskObjectStore implementation."""
+
+    __test__ = True
+
+    def setUp(self) -> None:
+        """Set up the test case."""
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+
+    def tearDown(self) -> None:
+        """Clean up the test case."""
+        self.temp_dir.cleanup()
+
+    def object_store_factory(self) -> ObjectStore:
+        """Provide ObjectStore implementation to test."""
+        return DiskObjectStore(self.temp_dir.name)
+
+    def test_get_returns_memoryview(self) -> None:
+        """Test that available objects are served as read-only memoryviews."""
+        # Prepare
+        objects, id_to_content = _create_object_hierarchy()
+        object_store = self.object_store_factory()
+        object_store.preregister(self.run_id, get_object_tree(objects[3]))
+        obj_id = objects[0].object_id
+        object_store.put(obj_id, id_to_content[obj_id])
+
+        # Execute
+        retrieved = object_store.get(obj_id)
+
+        # Assert
+        assert isinstance(retrieved, memoryview)
+        self.assertTrue(retrieved.readonly)
+        self.assertEqual(retrieved, id_to_content[obj_id])
+
+    def test_restart(self) -> None:
+        """Test that objects and references survive re-opening the store."""
+        # Prepare
+        objects, id_to_content = _create_object_hierarchy()
+        ids = list(id_to_content.keys())
+        object_store = DiskObjectStore(self.temp_dir.name)
+        object_store.preregister(run_id=1, object_tree=get_object_tree(objects[3]))
+        object_store.preregister(run_id=2, object_tree=get_object_tree(objects[4]))
+        for obj_id, content in list(id_to_content.items())[:-1]:
+            object_store.put(obj_id, content)
+        object_store.close()
+
+        # Execute
+        reopened = DiskObjectStore(self.temp_dir.name)
+
+        # Assert: Contents are restored and the missing object is still pending
+        self.assertEqual(len(reopened), 5)
+        for obj_id, content in list(id_to_content.items())[:-1]:
+            self.assertEqual(reopened.get(obj_id), content)
+        self.assertEqual(reopened.get(ids[4]), b"")
+        self.assertEqual(
+            reopened.preregister(run_id=2, object_tree=get_object_tree(objects[4])),
+            [ids[4]],
+        )
+
+        # Execute: Delete objects in run 1 after restart
+        reopened.delete_objects_in_run(run_id=1)
+
+        # Assert: Reference counts were restored
+        self.assertEqual(len(reopened), 2)
+        self.assertTrue(ids[2] in reopened)
+        self.assertTrue(ids[4] in reopened)
+
+    def test_unused_segments_are_removed(self) -> None:
+        """Test that segments are removed once all their objects are deleted."""
+        # Prepare
+        objects, id_to_content = _create_object_hierarchy()
+        object_store = DiskObjectStore(self.temp_dir.name, segment_size=1)
+        object_store.preregister(self.run_id, get_object_tree(objects[3]))
+        object_store.preregister(self.run_id, get_object_tree(objects[4]))
+        for obj_id, content in id_to_content.items():
+            object_store.put(obj_id, content)
+        segment_dir = Path(self.temp_dir.name) / SEGMENT_DIR_NAME
+
+        # Execute
+        object_store.delete_objects_in_run(self.run_id)
+
+        # Assert: Only the (empty) active segment remains
+        self.assertEqual(len(object_store), 0)
+        self.assertEqual(len(list(segment_dir.iterdir())), 1)
+
+    def test_put_syncs_content_and_index(self) -> None:
+        """Test that put syncs the segment and the index only if fsync is enabled."""
+        # Prepare
+        objects, id_to_content = _create_object_hierarchy()
+        obj_id = objects[0].object_id
+        synced_store = DiskObjectStore(self.temp_dir.name)
+        synced_store.preregister(self.run_id, get_object_tree(objects[3]))
+        with tempfile.TemporaryDirectory() as unsynced_dir:
+            unsynced_store = DiskObjectStore(unsynced_dir, fsync=False)
+            unsynced_store.preregister(self.run_id, get_object_tree(objects[3]))
+
+            # Execute
+            with patch("os.fsync") as mock_fsync:
+                synced_store.put(obj_id, id_to_content[obj_id])
+                num_synced = mock_fsync.call_count
+                unsynced_store.put(obj_id, id_to_content[obj_id])
+            unsynced_store.close()
+
+        # Assert: Segment and index are synced
+        self.assertEqual(num_synced, 2)
+        self.assertEqual(mock_fsync.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
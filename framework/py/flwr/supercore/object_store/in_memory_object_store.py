@@ -17,7 +17,7 @@
 
 import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
 
 from flwr.common.inflatable import (
     get_object_id,
@@ -27,7 +27,7 @@ from flwr.common.inflatable import (
 from flwr.common.inflatable_utils import validate_object_content
 from flwr.proto.message_pb2 import ObjectTree  # pylint: disable=E0611
 
-from .object_store import NoObjectInStoreError, ObjectStore
+from .object_store import NoObjectInStoreError, ObjectStore, PreregisterStats
 
 
 @dataclass
@@ -45,6 +45,7 @@ class InMemoryObjectStore(ObjectStore):
     """In-memory implementation of the ObjectStore interface."""
 
     def __init__(self, verify: bool = True) -> None:
+        super().__init__()
         self.verify = verify
         self.store: dict[str, ObjectEntry] = {}
         self.lock_store = threading.RLock()
@@ -57,6 +58,7 @@ class InMemoryObjectStore(ObjectStore):
     def preregister(self, run_id: int, object_tree: ObjectTree) -> list[str]:
         """Identify and preregister missing objects."""
         new_objects = []
+        stats = PreregisterStats()
         if run_id not in self.run_objects_mapping:
             self.run_objects_mapping[run_id] = set()
 
@@ -65,6 +67,7 @@ class InMemoryObjectStore(ObjectStore):
             # Verify object ID format (must be a valid sha256 hash)
             if not is_valid_sha256_hash(obj_id):
                 raise ValueError(f"Invalid object ID format: {obj_id}")
+            stats.num_objects += 1
             with self.lock_store:
                 if obj_id not in self.store:
                     self.store[obj_id] = ObjectEntry(
@@ -96,6 +99,9 @@ class InMemoryObjectStore(ObjectStore):
                     # Add to the list of new objects if not available
                     if not obj_entry.is_available:
                         new_objects.append(obj_id)
+                    else:
+                        stats.num_deduplicated += 1
+                        stats.bytes_deduplicated += len(obj_entry.content)
 
                     # If the object is already registered but not in this run,
                     # add the run ID to its runs
@@ -103,6 +109,7 @@ class InMemoryObjectStore(ObjectStore):
                         obj_entry.runs.add(run_id)
                         self.run_objects_mapping[run_id].add(obj_id)
 
+        self._record_preregister_stats(run_id, stats)
         return new_objects
 
     def get_object_tree(self, object_id: str) -> ObjectTree:
@@ -114,22 +121,22 @@ class InMemoryObjectStore(ObjectStore):
                     f"Object with ID '{object_id}' was not pre-registered."
                 )
 
-            # Build the object trees of all children
-            try:
-                child_trees = [
-                    self.get_object_tree(child_id)
-                    for child_id in object_entry.child_object_ids
-                ]
-            except NoObjectInStoreError as e:
-                # Raise an error if any child object is missing
-                # This indicates an integrity issue
-                raise NoObjectInStoreError(
-                    f"Object tree for object ID '{object_id}' contains missing "
-                    "children. This may indicate a corrupted object store."
-                ) from e
-
-            # Create and return the ObjectTree for the current object
-            return ObjectTree(object_id=object_id, children=child_trees)
+            # Build the tree top-down, adding the children of each node in place
+            tree = ObjectTree(object_id=object_id)
+            stack = [(tree, object_entry)]
+            while stack:
+                node, entry = stack.pop()
+                for child_id in entry.child_object_ids:
+                    if (child_entry := self.store.get(child_id)) is None:
+                        # Raise an error if any child object is missing
+                        # This indicates an integrity issue
+                        raise NoObjectInStoreError(
+                            f"Object tree for object ID '{object_id}' contains "
+                            "missing children. This may indicate a corrupted "
+                            "object store."
+                        )
+                    stack.append((node.children.add(object_id=child_id), child_entry))
+            return tree
 
     def put(self, object_id: str, object_content: bytes) -> None:
         """Put an object into the store."""
@@ -156,8 +163,9 @@ class InMemoryObjectStore(ObjectStore):
             # Update the object entry in the store
             self.store[object_id].content = object_content
             self.store[object_id].is_available = True
+        self._notify_change()
 
-    def get(self, object_id: str) -> Optional[bytes]:
+    def get(self, object_id: str) -> Optional[Union[bytes, memoryview]]:
         """Get an object from the store."""
         with self.lock_store:
             # Check if the object ID is pre-registered
@@ -167,27 +175,38 @@ class InMemoryObjectStore(ObjectStore):
             # Return content (if not yet available, it will b"")
             return self.store[object_id].content
 
+    def get_availability(self, object_ids: list[str]) -> dict[str, bool]:
+        """Get the availability of multiple objects in the store."""
+        with self.lock_store:
+            return {
+                object_id: entry.is_available
+                for object_id in object_ids
+                if (entry := self.store.get(object_id)) is not None
+            }
+
     def delete(self, object_id: str) -> None:
         """Delete an object and its unreferenced descendants from the store."""
         with self.lock_store:
-            # If the object is not in the store, nothing to delete
-            if (object_entry := self.store.get(object_id)) is None:
-                return
+            pending = [object_id]
+            while pending:
+                obj_id = pending.pop()
+                # Skip objects not in the store or still referenced by others
+                object_entry = self.store.get(obj_id)
+                if object_entry is None or object_entry.ref_count != 0:
+                    continue
 
-            # Delete the object if it has no references left
-            if object_entry.ref_count == 0:
-                del self.store[object_id]
+                del self.store[obj_id]
 
                 # Remove the object from the run's mapping
                 for run_id in object_entry.runs:
-                    self.run_objects_mapping[run_id].discard(object_id)
+                    self.run_objects_mapping[run_id].discard(obj_id)
 
                 # Decrease the reference count of its children
+                # and try to delete them next
                 for child_id in object_entry.child_object_ids:
                     self.store[child_id].ref_count -= 1
-
-                    # Recursively try to delete the child object
-                    self.delete(child_id)
+                    pending.append(child_id)
+        self._notify_change()
 
     def delete_objects_in_run(self, run_id: int) -> None:
         """Delete all objects that were registered in a specific run."""
@@ -210,6 +229,7 @@ class InMemoryObjectStore(ObjectStore):
 
             # Remove the run from the mapping
             del self.run_objects_mapping[run_id]
+            self._clear_preregister_stats(run_id)
 
     def clear(self) -> None:
         """Clear the store."""
@@ -217,6 +237,8 @@ class InMemoryObjectStore(ObjectStore):
             self.store.clear()
             self.msg_descendant_objects_mapping.clear()
             self.run_objects_mapping.clear()
+            self._clear_preregister_stats()
+        self._notify_change()
 
     def __contains__(self, object_id: str) -> bool:
         """Check if an object_id is in the store."""
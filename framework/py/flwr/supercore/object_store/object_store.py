@@ -16,8 +16,12 @@
 
 
 import abc
-from typing import Optional
+import threading
+from dataclasses import dataclass, replace
+from logging import DEBUG
+from typing import Optional, Union
 
+from flwr.common.logger import log
 from flwr.proto.message_pb2 import ObjectTree  # pylint: disable=E0611
 
 
@@ -33,6 +37,20 @@ class NoObjectInStoreError(Exception):
         return f"NoObjectInStoreError: {self.message}"
 
 
+@dataclass
+class PreregisterStats:
+    """Deduplication statistics of `ObjectStore.preregister` calls."""
+
+    num_objects: int = 0  # Number of objects in the preregistered object trees
+    num_deduplicated: int = 0  # Number of objects that were already available
+    bytes_deduplicated: int = 0  # Total size of the objects already available
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of objects that were already available."""
+        return self.num_deduplicated / self.num_objects if self.num_objects else 0.0
+
+
 class ObjectStore(abc.ABC):
     """Abstract base class for `ObjectStore` implementations.
 
@@ -40,6 +58,95 @@ class ObjectStore(abc.ABC):
     delete objects identified by object IDs.
     """
 
+    def __init__(self) -> None:
+        # Accumulated deduplication statistics of `preregister` calls for each run
+        self._preregister_stats: dict[int, PreregisterStats] = {}
+        self._preregister_stats_lock = threading.Lock()
+        # Number of times objects were put or deleted, to wake up waiting threads
+        self._num_changes = 0
+        self._change_condition = threading.Condition()
+
+    @property
+    def num_changes(self) -> int:
+        """Return the number of times objects were put into or deleted from the store.
+
+        Pass it to `wait_for_change` to wait for changes made after reading it.
+        """
+        with self._change_condition:
+            return self._num_changes
+
+    def wait_for_change(self, num_changes: int, timeout: float) -> bool:
+        """Wait until objects are put or deleted after `num_changes` was read.
+
+        Only changes made through this instance are notified, not those made by other
+        processes sharing the same storage.
+
+        Parameters
+        ----------
+        num_changes : int
+            The value of `num_changes` read before checking the objects.
+        timeout : float
+            The maximum time to wait in seconds.
+
+        Returns
+        -------
+        bool
+            `True` if the store changed, `False` if `timeout` expired.
+        """
+        with self._change_condition:
+            return self._change_condition.wait_for(
+                lambda: self._num_changes != num_changes, timeout
+            )
+
+    def _notify_change(self) -> None:
+        """Wake up all threads waiting for objects to be put or deleted."""
+        with self._change_condition:
+            self._num_changes += 1
+            self._change_condition.notify_all()
+
+    def get_preregister_stats(self, run_id: int) -> PreregisterStats:
+        """Get the deduplication statistics of all `preregister` calls for a run.
+
+        Parameters
+        ----------
+        run_id : int
+            The ID of the run for which to get the statistics.
+
+        Returns
+        -------
+        PreregisterStats
+            The number of preregistered objects, and the number and total size of
+            objects that were already available and thus don't need to be pushed.
+        """
+        with self._preregister_stats_lock:
+            return replace(self._preregister_stats.get(run_id, PreregisterStats()))
+
+    def _record_preregister_stats(self, run_id: int, stats: PreregisterStats) -> None:
+        """Add the statistics of a single `preregister` call to those of the run."""
+        with self._preregister_stats_lock:
+            total = self._preregister_stats.setdefault(run_id, PreregisterStats())
+            total.num_objects += stats.num_objects
+            total.num_deduplicated += stats.num_deduplicated
+            total.bytes_deduplicated += stats.bytes_deduplicated
+        log(
+            DEBUG,
+            "[ObjectStore] Preregistered %d objects for run %s, %d already "
+            "available (hit rate: %.1f%%, %d bytes deduplicated)",
+            stats.num_objects,
+            run_id,
+            stats.num_deduplicated,
+            100 * stats.hit_rate,
+            stats.bytes_deduplicated,
+        )
+
+    def _clear_preregister_stats(self, run_id: Optional[int] = None) -> None:
+        """Clear the statistics of a run, or of all runs if `run_id` is None."""
+        with self._preregister_stats_lock:
+            if run_id is None:
+                self._preregister_stats.clear()
+            else:
+                self._preregister_stats.pop(run_id, None)
+
     @abc.abstractmethod
     def preregister(self, run_id: int, object_tree: ObjectTree) -> list[str]:
         """Identify and preregister missing objects in the `ObjectStore`.
@@ -58,6 +165,11 @@ class ObjectStore(abc.ABC):
         list[str]
             A list of object IDs that were either not previously preregistered
             in the `ObjectStore`, or were preregistered but are not yet available.
+
+        Notes
+        -----
+        Implementations record the number and total size of objects that were
+        already available (see `get_preregister_stats`).
         """
 
     @abc.abstractmethod
@@ -89,7 +201,7 @@ class ObjectStore(abc.ABC):
         """
 
     @abc.abstractmethod
-    def get(self, object_id: str) -> Optional[bytes]:
+    def get(self, object_id: str) -> Optional[Union[bytes, memoryview]]:
         """Get an object from the store.
 
         Parameters
@@ -99,8 +211,29 @@ class ObjectStore(abc.ABC):
 
         Returns
         -------
-        bytes
-            The object stored under the given object_id.
+        Optional[Union[bytes, memoryview]]
+            The object stored under the given object_id. Implementations that
+            keep objects outside the Python heap may return a read-only
+            `memoryview` instead of `bytes`. An empty value is returned if the
+            object is preregistered but not yet available, and None if it is
+            not in the store.
+        """
+
+    @abc.abstractmethod
+    def get_availability(self, object_ids: list[str]) -> dict[str, bool]:
+        """Get the availability of multiple objects in the store.
+
+        Parameters
+        ----------
+        object_ids : list[str]
+            The object_ids of the objects to check.
+
+        Returns
+        -------
+        dict[str, bool]
+            A dictionary mapping each object_id in the store to True if the object
+            is available, or to False if it is preregistered but not yet available.
+            Object IDs that are not in the store are omitted.
         """
 
     @abc.abstractmethod
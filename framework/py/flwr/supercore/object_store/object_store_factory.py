@@ -18,16 +18,33 @@
 from logging import DEBUG
 from typing import Optional
 
+from flwr.common.constant import FLWR_IN_MEMORY_OBJECT_STORE
 from flwr.common.logger import log
 
+from .disk_object_store import DiskObjectStore
 from .in_memory_object_store import InMemoryObjectStore
 from .object_store import ObjectStore
+from .sqlite_object_store import SqliteObjectStore
+
+SQLITE_SUFFIXES = (".db", ".sqlite")
 
 
 class ObjectStoreFactory:
-    """Factory class that creates ObjectStore instances."""
+    """Factory class that creates ObjectStore instances.
+
+    Parameters
+    ----------
+    database : str (default: FLWR_IN_MEMORY_OBJECT_STORE)
+        A string representing where objects are stored. Passing
+        `FLWR_IN_MEMORY_OBJECT_STORE` keeps all objects in memory. Passing
+        ':memory:' or the path to a SQLite database file (ending in `.db` or
+        `.sqlite`) creates a `SqliteObjectStore`. Any other value is interpreted
+        as the path to a directory in which a `DiskObjectStore` persists objects
+        across restarts.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, database: str = FLWR_IN_MEMORY_OBJECT_STORE) -> None:
+        self.database = database
         self.store_instance: Optional[ObjectStore] = None
 
     def store(self) -> ObjectStore:
@@ -38,7 +55,22 @@ class ObjectStoreFactory:
         ObjectStore
             An ObjectStore instance for storing objects by object_id.
         """
+        # InMemoryObjectStore
+        if self.database == FLWR_IN_MEMORY_OBJECT_STORE:
+            if self.store_instance is None:
+                self.store_instance = InMemoryObjectStore()
+            log(DEBUG, "Using InMemoryObjectStore")
+            return self.store_instance
+
+        # SqliteObjectStore
+        if self.database == ":memory:" or self.database.endswith(SQLITE_SUFFIXES):
+            if self.store_instance is None:
+                self.store_instance = SqliteObjectStore(self.database)
+            log(DEBUG, "Using SqliteObjectStore")
+            return self.store_instance
+
+        # DiskObjectStore
         if self.store_instance is None:
-            self.store_instance = InMemoryObjectStore()
-        log(DEBUG, "Using InMemoryObjectStore")
+            self.store_instance = DiskObjectStore(self.database)
+        log(DEBUG, "Using DiskObjectStore")
         return self.store_instance
@@ -15,10 +15,13 @@
 """Tests for factory class that creates ObjectStore instances."""
 
 
+import tempfile
 import unittest
 
+from .disk_object_store import DiskObjectStore
 from .in_memory_object_store import InMemoryObjectStore
 from .object_store_factory import ObjectStoreFactory
+from .sqlite_object_store import SqliteObjectStore
 
 
 class TestObjectStoreFactory(unittest.TestCase):
@@ -37,6 +40,21 @@ class TestObjectStoreFactory(unittest.TestCase):
         store2 = factory.store()
         self.assertIs(store1, store2)
 
+    def test_store_creates_disk_object_store(self) -> None:
+        """Test that the factory creates a DiskObjectStore for a directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            factory = ObjectStoreFactory(temp_dir)
+            store = factory.store()
+            self.assertIsInstance(store, DiskObjectStore)
+            self.assertIs(store, factory.store())
+
+    def test_store_creates_sqlite_object_store(self) -> None:
+        """Test that the factory creates a SqliteObjectStore for a database."""
+        factory = ObjectStoreFactory(":memory:")
+        store = factory.store()
+        self.assertIsInstance(store, SqliteObjectStore)
+        self.assertIs(store, factory.store())
+
 
 if __name__ == "__main__":
     unittest.main()
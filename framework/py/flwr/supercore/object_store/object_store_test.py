@@ -15,20 +15,28 @@
 """Tests for ObjectStore."""
 
 
+import sys
+import threading
+import time
 import unittest
 from abc import abstractmethod
 
 from parameterized import parameterized
 
-from flwr.common.inflatable import get_object_id, get_object_tree, iterate_object_tree
+from flwr.common.inflatable import (
+    get_object_id,
+    get_object_tree,
+    iterate_object_tree,
+    no_object_id_recompute,
+)
 from flwr.common.inflatable_test import CustomDataClass
 from flwr.proto.message_pb2 import ObjectTree  # pylint: disable=E0611
 
 from .in_memory_object_store import InMemoryObjectStore
-from .object_store import NoObjectInStoreError, ObjectStore
+from .object_store import NoObjectInStoreError, ObjectStore, PreregisterStats
 
 
-class ObjectStoreTest(unittest.TestCase):
+class ObjectStoreTest(unittest.TestCase):  # pylint: disable=R0904
     """Test all ObjectStore implementations."""
 
     # This is to True in each child class
@@ -71,6 +79,56 @@ class ObjectStoreTest(unittest.TestCase):
         # Assert
         self.assertEqual(object_content, retrieved_value)
 
+    def test_get_availability(self) -> None:
+        """Test get_availability method."""
+        # Prepare
+        object_store = self.object_store_factory()
+        objects, id_to_content = _create_object_hierarchy()
+        object_store.preregister(self.run_id, get_object_tree(objects[3]))
+        obj_id1, obj_id2 = objects[0].object_id, objects[1].object_id
+        object_store.put(obj_id1, id_to_content[obj_id1])
+
+        # Execute
+        availability = object_store.get_availability(
+            [obj_id1, obj_id2, "non_existent_object_id"]
+        )
+
+        # Assert: Unknown objects are omitted
+        self.assertEqual(availability, {obj_id1: True, obj_id2: False})
+
+    def test_wait_for_change_woken_by_put(self) -> None:
+        """Test wait_for_change returns once an object is put by another thread."""
+        # Prepare
+        object_store = self.object_store_factory()
+        obj = CustomDataClass(data=b"test_value")
+        object_content = obj.deflate()
+        object_id = get_object_id(object_content)
+        object_store.preregister(self.run_id, get_object_tree(obj))
+        num_changes = object_store.num_changes
+        timer = threading.Timer(0.1, object_store.put, (object_id, object_content))
+
+        # Execute
+        start = time.monotonic()
+        timer.start()
+        changed = object_store.wait_for_change(num_changes, timeout=5)
+        timer.join()
+
+        # Assert
+        self.assertTrue(changed)
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(object_store.get_availability([object_id]), {object_id: True})
+
+    def test_wait_for_change_timeout(self) -> None:
+        """Test wait_for_change returns False if nothing changes in time."""
+        # Prepare
+        object_store = self.object_store_factory()
+
+        # Execute
+        changed = object_store.wait_for_change(object_store.num_changes, timeout=0.1)
+
+        # Assert
+        self.assertFalse(changed)
+
     def test_put_overwrite(self) -> None:
         """Test put method with an existing object_id."""
         # Prepare
@@ -224,6 +282,67 @@ class ObjectStoreTest(unittest.TestCase):
         # Assert the unavailable object is returned
         self.assertEqual([object_id2], not_present)
 
+    def test_preregister_stats(self) -> None:
+        """Test that preregister records deduplication statistics."""
+        # Prepare
+        objects, id_to_content = _create_object_hierarchy()
+        ids = list(id_to_content.keys())
+        object_store = self.object_store_factory()
+        object_store.preregister(run_id=1, object_tree=get_object_tree(objects[3]))
+        for obj_id in ids[:4]:
+            object_store.put(obj_id, id_to_content[obj_id])
+
+        # Execute: Preregister parent2 (sharing child2 with parent1) and parent1 again
+        object_store.preregister(run_id=2, object_tree=get_object_tree(objects[4]))
+        object_store.preregister(run_id=2, object_tree=get_object_tree(objects[3]))
+
+        # Assert
+        stats1 = object_store.get_preregister_stats(run_id=1)
+        self.assertEqual(stats1, PreregisterStats(num_objects=4))
+        self.assertEqual(stats1.hit_rate, 0.0)
+        stats2 = object_store.get_preregister_stats(run_id=2)
+        self.assertEqual(stats2.num_objects, 6)
+        self.assertEqual(stats2.num_deduplicated, 5)
+        self.assertEqual(
+            stats2.bytes_deduplicated,
+            sum(len(content) for content in id_to_content.values())
+            - len(id_to_content[ids[4]])
+            + len(id_to_content[ids[2]]),
+        )
+        self.assertAlmostEqual(stats2.hit_rate, 5 / 6)
+        self.assertEqual(object_store.get_preregister_stats(run_id=3).num_objects, 0)
+
+        # Execute & Assert: Clearing the store resets the statistics
+        object_store.clear()
+        self.assertEqual(
+            object_store.get_preregister_stats(run_id=2), PreregisterStats()
+        )
+
+    def test_deep_object_tree(self) -> None:
+        """Test objects nested deeper than the recursion limit."""
+        # Prepare: Build a chain, computing the object IDs bottom-up
+        objects = [CustomDataClass(b"0")]
+        with no_object_id_recompute():
+            _ = objects[0].object_id
+            for i in range(1, 2 * sys.getrecursionlimit()):
+                objects.append(CustomDataClass(str(i).encode(), children=[objects[-1]]))
+                _ = objects[-1].object_id
+            object_tree = get_object_tree(objects[-1])
+            id_to_content = {obj.object_id: obj.deflate() for obj in objects}
+        root_id = object_tree.object_id
+        object_store = self.object_store_factory()
+
+        # Execute
+        object_store.preregister(self.run_id, object_tree)
+        for obj_id, content in id_to_content.items():
+            object_store.put(obj_id, content)
+        retrieved_tree = object_store.get_object_tree(root_id)
+        object_store.delete(root_id)
+
+        # Assert
+        self.assertEqual(retrieved_tree, object_tree)
+        self.assertEqual(len(object_store), 0)
+
     def test_get_object_tree(self) -> None:
         """Test get_object_tree method."""
         # Prepare
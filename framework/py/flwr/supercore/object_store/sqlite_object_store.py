@@ -0,0 +1,551 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Flower SQLite-based ObjectStore implementation."""
+
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from logging import DEBUG, ERROR
+from typing import Any, Optional, Union
+
+from flwr.common.inflatable import (
+    get_object_id,
+    is_valid_sha256_hash,
+    iterate_object_tree,
+)
+from flwr.common.inflatable_utils import validate_object_content
+from flwr.common.logger import log
+from flwr.proto.message_pb2 import ObjectTree  # pylint: disable=E0611
+
+from .object_store import NoObjectInStoreError, ObjectStore, PreregisterStats
+
+# Maximum number of host parameters in a single query (SQLite < 3.32 allows 999)
+MAX_QUERY_PARAMETERS = 900
+
+# Maximum number of objects deleted per transaction by the reaper thread
+GC_CHUNK_SIZE = 1000
+
+SQL_CREATE_TABLE_OBJECTS = """
+CREATE TABLE IF NOT EXISTS objects(
+    object_id       TEXT PRIMARY KEY,
+    content         BLOB,
+    is_available    INTEGER NOT NULL DEFAULT 0,
+    ref_count       INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+SQL_CREATE_TABLE_OBJECT_CHILDREN = """
+CREATE TABLE IF NOT EXISTS object_children(
+    parent_id       TEXT,
+    position        INTEGER,
+    child_id        TEXT,
+    PRIMARY KEY (parent_id, position)
+) WITHOUT ROWID;
+"""
+
+SQL_CREATE_INDEX_OBJECT_CHILDREN_CHILD = """
+CREATE INDEX IF NOT EXISTS idx_object_children_child
+ON object_children (child_id);
+"""
+
+SQL_CREATE_TABLE_RUN_OBJECTS = """
+CREATE TABLE IF NOT EXISTS run_objects(
+    run_id          INTEGER,
+    object_id       TEXT,
+    PRIMARY KEY (run_id, object_id)
+) WITHOUT ROWID;
+"""
+
+SQL_CREATE_INDEX_RUN_OBJECTS_OBJECT = """
+CREATE INDEX IF NOT EXISTS idx_run_objects_object ON run_objects (object_id);
+"""
+
+SQL_CREATE_TEMP_TABLE_GC_BATCH = """
+CREATE TEMP TABLE IF NOT EXISTS gc_batch(object_id TEXT PRIMARY KEY);
+"""
+
+SQL_CREATE_TEMP_TABLE_GC_PENDING = """
+CREATE TEMP TABLE IF NOT EXISTS gc_pending(object_id TEXT PRIMARY KEY);
+"""
+
+
+class SqliteObjectStore(ObjectStore):
+    """SQLite-based implementation of the ObjectStore interface.
+
+    Object contents and metadata (children, reference counts and run membership)
+    are kept in indexed tables. Objects of a run are reclaimed with set-based bulk
+    deletes, one statement per level of the object trees, instead of walking the
+    objects one by one. By default, `delete_objects_in_run` only schedules the
+    deletion, which is then carried out by a background reaper thread, so callers
+    are not blocked while a large run is cleaned up. For file-based databases, the
+    reaper uses its own connection and deletes at most `GC_CHUNK_SIZE` objects per
+    transaction, so other calls only wait for one chunk at a time.
+
+    Parameters
+    ----------
+    database_path : str
+        The path to the database file to be opened. Pass ":memory:" to open
+        a connection to a database that is in RAM, instead of on disk.
+    verify : bool (default: True)
+        Whether to verify that the content of an object matches its object ID
+        when it is put into the store.
+    background_gc : bool (default: True)
+        Whether to delete the objects of a run in a background reaper thread.
+        If False, `delete_objects_in_run` deletes the objects before returning.
+    """
+
+    def __init__(
+        self, database_path: str, verify: bool = True, background_gc: bool = True
+    ) -> None:
+        super().__init__()
+        self.database_path = database_path
+        self.verify = verify
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(database_path, check_same_thread=False)
+        if database_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL;")
+            self.conn.execute("PRAGMA synchronous = NORMAL;")
+        with self.conn:
+            self.conn.execute(SQL_CREATE_TABLE_OBJECTS)
+            self.conn.execute(SQL_CREATE_TABLE_OBJECT_CHILDREN)
+            self.conn.execute(SQL_CREATE_INDEX_OBJECT_CHILDREN_CHILD)
+            self.conn.execute(SQL_CREATE_TABLE_RUN_OBJECTS)
+            self.conn.execute(SQL_CREATE_INDEX_RUN_OBJECTS_OBJECT)
+            self.conn.execute(SQL_CREATE_TEMP_TABLE_GC_BATCH)
+            self.conn.execute(SQL_CREATE_TEMP_TABLE_GC_PENDING)
+
+        # Runs whose objects are scheduled for deletion
+        self.pending_runs: set[int] = set()
+        self.reaper_queue: queue.Queue[Optional[int]] = queue.Queue()
+        self.reaper: Optional[threading.Thread] = None
+        if background_gc:
+            self.reaper = threading.Thread(target=self._reap, daemon=True)
+            self.reaper.start()
+
+    def preregister(self, run_id: int, object_tree: ObjectTree) -> list[str]:
+        """Identify and preregister missing objects."""
+        new_objects = []
+        stats = PreregisterStats()
+        with self.lock, self.conn:
+            # Take the write lock before reading, so the reaper cannot delete the
+            # objects found in the store before they are referenced
+            self.conn.execute("BEGIN IMMEDIATE;")
+            for tree_node in iterate_object_tree(object_tree):
+                obj_id = tree_node.object_id
+                # Verify object ID format (must be a valid sha256 hash)
+                if not is_valid_sha256_hash(obj_id):
+                    raise ValueError(f"Invalid object ID format: {obj_id}")
+
+                stats.num_objects += 1
+                row = self.conn.execute(
+                    "SELECT is_available, length(content) FROM objects "
+                    "WHERE object_id = ?;",
+                    (obj_id,),
+                ).fetchone()
+                if row is None:
+                    child_ids = [child.object_id for child in tree_node.children]
+                    self.conn.execute(
+                        "INSERT INTO objects (object_id) VALUES (?);", (obj_id,)
+                    )
+                    self.conn.executemany(
+                        "INSERT INTO object_children (parent_id, position, child_id) "
+                        "VALUES (?, ?, ?);",
+                        [(obj_id, pos, child) for pos, child in enumerate(child_ids)],
+                    )
+                    # Increment the reference count for all its children
+                    # Post-order traversal ensures that children are registered
+                    # before parents
+                    self.conn.executemany(
+                        "UPDATE objects SET ref_count = ref_count + 1 "
+                        "WHERE object_id = ?;",
+                        [(child,) for child in child_ids],
+                    )
+                    new_objects.append(obj_id)
+                elif not row[0]:
+                    # Add to the list of new objects if not available
+                    new_objects.append(obj_id)
+                else:
+                    stats.num_deduplicated += 1
+                    stats.bytes_deduplicated += row[1]
+
+                # Add the object ID to the run's mapping
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO run_objects (run_id, object_id) "
+                    "VALUES (?, ?);",
+                    (run_id, obj_id),
+                )
+
+        self._record_preregister_stats(run_id, stats)
+        return new_objects
+
+    def get_object_tree(self, object_id: str) -> ObjectTree:
+        """Get the object tree for a given object ID."""
+        with self.lock:
+            if not self._exists(object_id):
+                raise NoObjectInStoreError(
+                    f"Object with ID '{object_id}' was not pre-registered."
+                )
+
+            # Fetch all edges of the tree in a single query
+            rows = self.conn.execute(
+                """
+                WITH RECURSIVE tree(object_id) AS (
+                    SELECT ?
+                    UNION
+                    SELECT c.child_id FROM object_children AS c
+                    JOIN tree AS t ON c.parent_id = t.object_id
+                )
+                SELECT c.parent_id, c.child_id, o.object_id IS NOT NULL
+                FROM object_children AS c
+                JOIN tree AS t ON c.parent_id = t.object_id
+                LEFT JOIN objects AS o ON o.object_id = c.child_id
+                ORDER BY c.parent_id, c.position;
+                """,
+                (object_id,),
+            ).fetchall()
+
+        children: dict[str, list[str]] = {}
+        for parent_id, child_id, child_exists in rows:
+            if not child_exists:
+                # This indicates an integrity issue
+                raise NoObjectInStoreError(
+                    f"Object tree for object ID '{parent_id}' contains missing "
+                    "children. This may indicate a corrupted object store."
+                )
+            children.setdefault(parent_id, []).append(child_id)
+
+        # Build the tree top-down, adding the children of each node in place
+        tree = ObjectTree(object_id=object_id)
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            for child_id in children.get(node.object_id, []):
+                stack.append(node.children.add(object_id=child_id))
+        return tree
+
+    def put(self, object_id: str, object_content: bytes) -> None:
+        """Put an object into the store."""
+        if self.verify:
+            # Verify object_id and object_content match
+            object_id_from_content = get_object_id(object_content)
+            if object_id != object_id_from_content:
+                raise ValueError(f"Object ID {object_id} does not match content hash")
+
+            # Validate object content
+            validate_object_content(content=object_content)
+
+        with self.lock, self.conn:
+            # Only allow adding the object if it has been preregistered
+            if not self._exists(object_id):
+                raise NoObjectInStoreError(
+                    f"Object with ID '{object_id}' was not pre-registered."
+                )
+
+            # Only update the content if the object is not yet available
+            self.conn.execute(
+                "UPDATE objects SET content = ?, is_available = 1 "
+                "WHERE object_id = ? AND is_available = 0;",
+                (object_content, object_id),
+            )
+        self._notify_change()
+
+    def get(self, object_id: str) -> Optional[Union[bytes, memoryview]]:
+        """Get an object from the store."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT content, is_available FROM objects WHERE object_id = ?;",
+                (object_id,),
+            ).fetchone()
+
+        # Check if the object ID is pre-registered
+        if row is None:
+            return None
+
+        # Return content (if not yet available, it will be b"")
+        content, is_available = row
+        return content if is_available else b""
+
+    def get_availability(self, object_ids: list[str]) -> dict[str, bool]:
+        """Get the availability of multiple objects in the store."""
+        availability: dict[str, bool] = {}
+        with self.lock:
+            # Query in batches to stay below SQLite's limit of host parameters
+            for i in range(0, len(object_ids), MAX_QUERY_PARAMETERS):
+                batch = object_ids[i : i + MAX_QUERY_PARAMETERS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self.conn.execute(
+                    "SELECT object_id, is_available FROM objects "
+                    f"WHERE object_id IN ({placeholders});",
+                    batch,
+                ).fetchall()
+                availability.update((obj_id, bool(avail)) for obj_id, avail in rows)
+        return availability
+
+    def delete(self, object_id: str) -> None:
+        """Delete an object and its unreferenced descendants from the store."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO gc_pending (object_id) "
+                "SELECT object_id FROM objects WHERE object_id = ? AND ref_count = 0;",
+                (object_id,),
+            )
+            self._delete_pending(self.conn)
+        self._notify_change()
+
+    def delete_objects_in_run(self, run_id: int) -> None:
+        """Delete all objects that were registered in a specific run.
+
+        If the store was created with `background_gc=True`, the deletion is scheduled
+        and carried out by the reaper thread.
+        """
+        if self.reaper is None:
+            with self.lock, self.conn:
+                self._collect_run_objects(self.conn, run_id)
+                num_deleted = self._delete_pending(self.conn)
+                self._delete_run_mapping(self.conn, run_id)
+            self._clear_preregister_stats(run_id)
+            self._notify_change()
+            log(DEBUG, "Deleted %s objects of run %s", num_deleted, run_id)
+            return
+
+        with self.lock:
+            if run_id in self.pending_runs:
+                return
+            self.pending_runs.add(run_id)
+        self.reaper_queue.put(run_id)
+
+    def wait_for_pending_deletions(self) -> None:
+        """Block until all scheduled run deletions have been carried out."""
+        self.reaper_queue.join()
+
+    def clear(self) -> None:
+        """Clear the store."""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM objects;")
+            self.conn.execute("DELETE FROM object_children;")
+            self.conn.execute("DELETE FROM run_objects;")
+            self.pending_runs.clear()
+        self._clear_preregister_stats()
+        self._notify_change()
+
+    def close(self) -> None:
+        """Stop the reaper thread and close the database connection."""
+        if self.reaper is not None:
+            self.reaper_queue.put(None)
+            self.reaper.join()
+            self.reaper = None
+        with self.lock:
+            self.conn.close()
+
+    def __contains__(self, object_id: str) -> bool:
+        """Check if an object_id is in the store."""
+        with self.lock:
+            return self._exists(object_id)
+
+    def __len__(self) -> int:
+        """Get the number of objects in the store."""
+        with self.lock:
+            row = self.conn.execute("SELECT COUNT(*) FROM objects;").fetchone()
+        return int(row[0])
+
+    def _exists(self, object_id: str) -> bool:
+        row = self.conn.execute(
+            "SELECT 1 FROM objects WHERE object_id = ?;", (object_id,)
+        ).fetchone()
+        return row is not None
+
+    def _connect_reaper(
+        self,
+    ) -> tuple[sqlite3.Connection, AbstractContextManager[Any]]:
+        """Return the connection of the reaper and the lock guarding it."""
+        if self.database_path == ":memory:":
+            # Another connection would open another database
+            return self.conn, self.lock
+        # Transactions are started explicitly, see `_reaper_transaction`
+        conn = sqlite3.connect(self.database_path, isolation_level=None)
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute(SQL_CREATE_TEMP_TABLE_GC_BATCH)
+        conn.execute(SQL_CREATE_TEMP_TABLE_GC_PENDING)
+        return conn, nullcontext()
+
+    def _reap(self) -> None:
+        """Carry out scheduled run deletions until `None` is received."""
+        conn, lock = self._connect_reaper()
+        while (run_id := self.reaper_queue.get()) is not None:
+            try:
+                self._delete_objects_in_run(run_id, conn, lock)
+            except sqlite3.Error as e:
+                log(ERROR, "Failed to delete objects of run %s: %s", run_id, e)
+            finally:
+                with self.lock:
+                    self.pending_runs.discard(run_id)
+                self.reaper_queue.task_done()
+        if conn is not self.conn:
+            conn.close()
+        self.reaper_queue.task_done()
+
+    def _delete_objects_in_run(
+        self,
+        run_id: int,
+        conn: sqlite3.Connection,
+        lock: AbstractContextManager[Any],
+    ) -> None:
+        """Delete the objects of a run in transactions of `GC_CHUNK_SIZE` objects."""
+        with _reaper_transaction(conn, lock):
+            conn.execute("DELETE FROM gc_pending;")
+            self._collect_run_objects(conn, run_id)
+
+        num_deleted = 0
+        while True:
+            with _reaper_transaction(conn, lock):
+                num_taken, num_chunk_deleted = self._delete_chunk(conn, GC_CHUNK_SIZE)
+            num_deleted += num_chunk_deleted
+            if num_taken == 0:
+                break
+
+        while True:
+            with _reaper_transaction(conn, lock):
+                num_removed = self._delete_run_mapping(conn, run_id, GC_CHUNK_SIZE)
+            if num_removed < GC_CHUNK_SIZE:
+                break
+        self._clear_preregister_stats(run_id)
+        log(DEBUG, "Deleted %s objects of run %s", num_deleted, run_id)
+
+    @staticmethod
+    def _collect_run_objects(conn: sqlite3.Connection, run_id: int) -> None:
+        """Add the unreferenced objects of a run to `gc_pending`."""
+        # Only message objects are allowed to have a `ref_count` of 0,
+        # and every message object must have a `ref_count` of 0
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO gc_pending (object_id)
+            SELECT o.object_id FROM run_objects AS r
+            JOIN objects AS o ON o.object_id = r.object_id
+            WHERE r.run_id = ? AND o.ref_count = 0;
+            """,
+            (run_id,),
+        )
+
+    @staticmethod
+    def _delete_run_mapping(
+        conn: sqlite3.Connection, run_id: int, limit: int = -1
+    ) -> int:
+        """Remove up to `limit` objects from the mapping of a run.
+
+        Return the number of removed objects. A negative `limit` removes all of them.
+        """
+        cursor = conn.execute(
+            """
+            DELETE FROM run_objects WHERE run_id = ? AND object_id IN (
+                SELECT object_id FROM run_objects WHERE run_id = ? LIMIT ?
+            );
+            """,
+            (run_id, run_id, limit),
+        )
+        return cursor.rowcount
+
+    def _delete_pending(self, conn: sqlite3.Connection) -> int:
+        """Delete the objects in `gc_pending` and their unreferenced descendants.
+
+        Objects are deleted level by level. Must be called within a transaction. Return
+        the number of deleted objects.
+        """
+        num_deleted = 0
+        while True:
+            num_taken, num_level_deleted = self._delete_chunk(conn, -1)
+            num_deleted += num_level_deleted
+            if num_taken == 0:
+                return num_deleted
+
+    @staticmethod
+    def _delete_chunk(conn: sqlite3.Connection, limit: int) -> tuple[int, int]:
+        """Delete up to `limit` objects of `gc_pending` if they are unreferenced.
+
+        The reference counts of the children of all deleted objects are decremented at
+        once, and the children whose reference count drops to zero are added to
+        `gc_pending`. A negative `limit` takes all objects of `gc_pending`. Must be
+        called within a transaction. Return the number of objects taken from
+        `gc_pending` and the number of deleted objects.
+        """
+        conn.execute(
+            "INSERT INTO gc_batch SELECT object_id FROM gc_pending LIMIT ?;", (limit,)
+        )
+        num_taken = conn.execute("SELECT COUNT(*) FROM gc_batch;").fetchone()[0]
+        if num_taken == 0:
+            return 0, 0
+        conn.execute(
+            "DELETE FROM gc_pending WHERE object_id IN "
+            "(SELECT object_id FROM gc_batch);"
+        )
+        # Objects may have been referenced again since they were added to `gc_pending`
+        conn.execute(
+            "DELETE FROM gc_batch WHERE object_id NOT IN "
+            "(SELECT object_id FROM objects WHERE ref_count = 0);"
+        )
+        num_deleted = conn.execute("SELECT COUNT(*) FROM gc_batch;").fetchone()[0]
+
+        # Decrease the reference count of the children
+        conn.execute(
+            """
+            UPDATE objects SET ref_count = ref_count - (
+                SELECT COUNT(*) FROM object_children AS c
+                JOIN gc_batch AS b ON c.parent_id = b.object_id
+                WHERE c.child_id = objects.object_id
+            )
+            WHERE object_id IN (
+                SELECT c.child_id FROM object_children AS c
+                JOIN gc_batch AS b ON c.parent_id = b.object_id
+            );
+            """
+        )
+
+        # Collect the children that are no longer referenced
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO gc_pending (object_id)
+            SELECT o.object_id FROM object_children AS c
+            JOIN gc_batch AS b ON c.parent_id = b.object_id
+            JOIN objects AS o ON o.object_id = c.child_id
+            WHERE o.ref_count = 0;
+            """
+        )
+
+        # Delete the objects of the chunk
+        for query in (
+            "DELETE FROM object_children WHERE parent_id IN "
+            "(SELECT object_id FROM gc_batch);",
+            "DELETE FROM run_objects WHERE object_id IN "
+            "(SELECT object_id FROM gc_batch);",
+            "DELETE FROM objects WHERE object_id IN "
+            "(SELECT object_id FROM gc_batch);",
+            "DELETE FROM gc_batch;",
+        ):
+            conn.execute(query)
+        return num_taken, num_deleted
+
+
+@contextmanager
+def _reaper_transaction(
+    conn: sqlite3.Connection, lock: AbstractContextManager[Any]
+) -> Iterator[None]:
+    """Run a transaction of the reaper, committed on exit."""
+    with lock, conn:
+        if conn.isolation_level is None:
+            # Take the write lock upfront, as the transaction reads before writing
+            conn.execute("BEGIN IMMEDIATE;")
+        yield
@@ -0,0 +1,164 @@
+# Copyright 2025 Flower Labs GmbH. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for SqliteObjectStore."""
+
+
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from flwr.common.inflatable import get_object_tree
+from flwr.common.inflatable_test import CustomDataClass
+
+from .object_store import ObjectStore
+from .object_store_test import ObjectStoreTest, _create_object_hierarchy
+from .sqlite_object_store import SqliteObjectStore
+
+
+class SqliteInMemoryObjectStoreTest(ObjectStoreTest):
+    """Test SqliteObjectStore implementation with in-memory database."""
+
+    __test__ = True
+
+    def object_store_factory(self) -> ObjectStore:
+        """Provide ObjectStore implementation to test."""
+        return SqliteObjectStore(":memory:", background_gc=False)
+
+    def test_delete_objects_in_run_with_reaper(self) -> None:
+        """Test deleting objects of a run in the background reaper thread."""
+        # Prepare
+        objects, id_to_content = _create_object_hierarchy()
+        ids = list(id_to_content.keys())
+        object_store = SqliteObjectStore(":memory:")
+        object_store.preregister(run_id=1, object_tree=get_object_tree(objects[3]))
+        object_store.preregister(run_id=2, object_tree=get_object_tree(objects[4]))
+        for obj_id, content in id_to_content.items():
+            object_store.put(obj_id, content)
+
+        # Execute
+        object_store.delete_objects_in_run(run_id=1)
+        object_store.wait_for_pending_deletions()
+
+        # Assert: Only parent2 and child2 should remain
+        self.assertEqual(len(object_store), 2)
+        self.assertTrue(ids[2] in object_store)
+        self.assertTrue(ids[4] in object_store)
+
+        # Execute: Delete objects in run 2
+        object_store.delete_objects_in_run(run_id=2)
+        object_store.wait_for_pending_deletions()
+
+        # Assert
+        self.assertEqual(len(object_store), 0)
+        object_store.close()
+
+    def test_delete_shared_child_twice_referenced(self) -> None:
+        """Test that a child listed twice by its parent is deleted with it."""
+        # Prepare
+        child = CustomDataClass(b"child")
+        parent = CustomDataClass(b"parent", children=[child, child])
+        object_store = self.object_store_factory()
+        object_store.preregister(self.run_id, get_object_tree(parent))
+        object_store.put(child.object_id, child.deflate())
+        object_store.put(parent.object_id, parent.deflate())
+
+        # Execute
+        object_store.delete(parent.object_id)
+
+        # Assert
+        self.assertEqual(len(object_store), 0)
+
+
+class SqliteFileBasedObjectStoreTest(ObjectStoreTest):
+    """Test SqliteObjectStore implementation with file-based database."""
+
+    __test__ = True
+
+    def setUp(self) -> None:
+        """Set up the test case."""
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+
+    def tearDown(self) -> None:
+        """Clean up the test case."""
+        self.temp_dir.cleanup()
+
+    def object_store_factory(self) -> ObjectStore:
+        """Provide ObjectStore implementation to test."""
+        database_path = Path(self.temp_dir.name) / "objects.db"
+        return SqliteObjectStore(str(database_path), background_gc=False)
+
+    def test_restart(self) -> None:
+        """Test that objects and references survive re-opening the store."""
+        # Prepare
+        objects, id_to_content = _create_object_hierarchy()
+        ids = list(id_to_content.keys())
+        object_store = self.object_store_factory()
+        object_store.preregister(run_id=1, object_tree=get_object_tree(objects[3]))
+        object_store.preregister(run_id=2, object_tree=get_object_tree(objects[4]))
+        for obj_id, content in id_to_content.items():
+            object_store.put(obj_id, content)
+        assert isinstance(object_store, SqliteObjectStore)
+        object_store.close()
+
+        # Execute
+        reopened = self.object_store_factory()
+        reopened.delete_objects_in_run(run_id=1)
+
+        # Assert
+        self.assertEqual(len(reopened), 2)
+        self.assertEqual(reopened.get(ids[4]), id_to_content[ids[4]])
+
+    def test_reaper_deletes_in_chunks_without_store_lock(self) -> None:
+        """Test that the reaper deletes objects while the store is in use."""
+        # Prepare
+        objects, id_to_content = _create_object_hierarchy()
+        ids = list(id_to_content.keys())
+        database_path = str(Path(self.temp_dir.name) / "objects.db")
+        object_store = SqliteObjectStore(database_path)
+        object_store.preregister(run_id=1, object_tree=get_object_tree(objects[3]))
+        object_store.preregister(run_id=2, object_tree=get_object_tree(objects[4]))
+        for obj_id, content in id_to_content.items():
+            object_store.put(obj_id, content)
+
+        # Execute: Delete run 1 one object per transaction while holding the lock
+        # of the store, as a concurrent call would
+        with patch(f"{SqliteObjectStore.__module__}.GC_CHUNK_SIZE", 1):
+            with object_store.lock:
+                object_store.delete_objects_in_run(run_id=1)
+                conn = sqlite3.connect(database_path)
+                deadline = time.monotonic() + 10
+                num_objects = len(id_to_content)
+                while num_objects > 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                    row = conn.execute("SELECT COUNT(*) FROM objects;").fetchone()
+                    num_objects = row[0]
+                conn.close()
+                # Assert: The objects were deleted before the lock was released
+                self.assertEqual(num_objects, 2)
+            object_store.wait_for_pending_deletions()
+
+        # Assert: Only parent2 and child2 should remain
+        self.assertEqual(len(object_store), 2)
+        self.assertTrue(ids[2] in object_store)
+        self.assertTrue(ids[4] in object_store)
+        object_store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,6 +33,7 @@ from flwr.common.config import parse_config_args
 from flwr.common.constant import (
     CLIENTAPPIO_API_DEFAULT_SERVER_ADDRESS,
     FLEET_API_GRPC_RERE_DEFAULT_ADDRESS,
+    FLWR_IN_MEMORY_OBJECT_STORE,
     ISOLATION_MODE_PROCESS,
     ISOLATION_MODE_SUBPROCESS,
     TRANSPORT_TYPE_GRPC_ADAPTER,
@@ -79,6 +80,7 @@ def flower_supernode() -> None:
         flwr_path=args.flwr_dir,
         isolation=args.isolation,
         clientappio_api_address=args.clientappio_api_address,
+        object_store=args.object_store,
     )
 
 
@@ -192,6 +194,16 @@ def _parse_args_common(parser: argparse.ArgumentParser) -> None:
         type=str,
         help="The SuperNode's public key (as a path str) to enable authentication.",
     )
+    parser.add_argument(
+        "--object-store",
+        type=str,
+        default=FLWR_IN_MEMORY_OBJECT_STORE,
+        help="Where the SuperNode's ObjectStore persists objects. Passing the "
+        "path to a SQLite database file (ending in `.db` or `.sqlite`) keeps "
+        "objects in SQLite. Any other path is used as a directory for "
+        "memory-mapped segment files. If nothing is provided, all objects are "
+        "kept in memory.",
+    )
     parser.add_argument(
         "--node-config",
         type=str,
@@ -20,6 +20,7 @@ import subprocess
 import time
 from collections.abc import Iterator
 from contextlib import contextmanager
+from functools import partial
 from logging import INFO, WARN
 from pathlib import Path
 from typing import Callable, Optional, Union
@@ -36,9 +37,13 @@ from flwr.common.config import get_flwr_dir, get_fused_config_from_fab
 from flwr.common.constant import (
     CLIENT_OCTET,
     CLIENTAPPIO_API_DEFAULT_SERVER_ADDRESS,
+    FLWR_IN_MEMORY_OBJECT_STORE,
     ISOLATION_MODE_SUBPROCESS,
     MAX_RETRY_DELAY,
+    PULL_MESSAGES_LONG_POLL_TIMEOUT,
     SERVER_OCTET,
+    SUPERNODE_MAX_PULL_INTERVAL,
+    SUPERNODE_MIN_PULL_INTERVAL,
     TRANSPORT_TYPE_GRPC_ADAPTER,
     TRANSPORT_TYPE_GRPC_RERE,
     TRANSPORT_TYPE_REST,
@@ -48,8 +53,7 @@ from flwr.common.exit import ExitCode, flwr_exit
 from flwr.common.exit_handlers import register_exit_handlers
 from flwr.common.grpc import generic_create_grpc_server
 from flwr.common.inflatable import (
-    get_all_nested_objects,
-    get_object_tree,
+    get_all_nested_objects_and_tree,
     no_object_id_recompute,
 )
 from flwr.common.logger import log
@@ -85,6 +89,7 @@ def start_client_internal(
     flwr_path: Optional[Path] = None,
     isolation: str = ISOLATION_MODE_SUBPROCESS,
     clientappio_api_address: str = CLIENTAPPIO_API_DEFAULT_SERVER_ADDRESS,
+    object_store: str = FLWR_IN_MEMORY_OBJECT_STORE,
 ) -> None:
     """Start a Flower client node which connects to a Flower server.
 
@@ -133,6 +138,9 @@ def start_client_internal(
     clientappio_api_address : str
         (default: `CLIENTAPPIO_API_DEFAULT_SERVER_ADDRESS`)
         The SuperNode gRPC server address.
+    object_store : str (default: `FLWR_IN_MEMORY_OBJECT_STORE`)
+        The path to the directory in which objects are persisted. By default,
+        all objects are kept in memory.
     """
     if insecure is None:
         insecure = root_certificates is None
@@ -140,7 +148,7 @@ def start_client_internal(
     # Initialize factories
     state_factory = NodeStateFactory()
     ffs_factory = FfsFactory(get_flwr_dir(flwr_path) / "supernode" / "ffs")  # type: ignore
-    object_store_factory = ObjectStoreFactory()
+    object_store_factory = ObjectStoreFactory(object_store)
 
     # Launch ClientAppIo API server
     clientappio_server = run_clientappio_api_grpc(
@@ -171,6 +179,13 @@ def start_client_internal(
         authentication_keys=authentication_keys,
         max_retries=max_retries,
         max_wait_time=max_wait_time,
+        # In `process` mode, replies are stored by the separately started
+        # ClientApp and only pushed between pulls, so hold pulls for shorter
+        pull_timeout=(
+            PULL_MESSAGES_LONG_POLL_TIMEOUT
+            if isolation == ISOLATION_MODE_SUBPROCESS
+            else SUPERNODE_MAX_PULL_INTERVAL
+        ),
     ) as conn:
         receive, send, create_node, _, get_run, get_fab = conn
 
@@ -180,8 +195,12 @@ def start_client_internal(
             raise ValueError("Failed to register SuperNode with the SuperLink")
         state.set_node_id(node_id)
 
+        pull_interval = SUPERNODE_MIN_PULL_INTERVAL
+
         # pylint: disable=too-many-nested-blocks
         while True:
+            pull_started_at = time.monotonic()
+
             # The signature of the function will change after
             # completing the transition to the `NodeState`-based SuperNode
             run_id = _pull_and_store_message(
@@ -225,8 +244,18 @@ def start_client_internal(
 
             _push_messages(state=state, send=send)
 
-            # Sleep for 3 seconds before the next iteration
-            time.sleep(3)
+            # Pull again right away after receiving a message
+            if run_id is not None:
+                pull_interval = SUPERNODE_MIN_PULL_INTERVAL
+                continue
+
+            # The SuperLink holds pulls of idle nodes until a message arrives if it
+            # supports long-polling. Otherwise (e.g., with the REST transport),
+            # pulls return immediately and the interval between them is increased
+            # exponentially up to `SUPERNODE_MAX_PULL_INTERVAL`
+            elapsed = time.monotonic() - pull_started_at
+            time.sleep(max(0.0, pull_interval - elapsed))
+            pull_interval = min(2 * pull_interval, SUPERNODE_MAX_PULL_INTERVAL)
 
 
 def _pull_and_store_message(  # pylint: disable=too-many-positional-arguments
@@ -300,8 +329,9 @@ def _pull_and_store_message(  # pylint: disable=too-many-positional-arguments
         # Store the message in ObjectStore
         # This is a temporary solution to store messages in ObjectStore
         with no_object_id_recompute():
-            object_store.preregister(run_id, get_object_tree(message))
-            for obj_id, obj in get_all_nested_objects(message).items():
+            all_objects, object_tree = get_all_nested_objects_and_tree(message)
+            object_store.preregister(run_id, object_tree)
+            for obj_id, obj in all_objects.items():
                 object_store.put(obj_id, obj.deflate())
 
     except RunNotRunningException:
@@ -381,6 +411,7 @@ def _init_connection(  # pylint: disable=too-many-positional-arguments
     ] = None,
     max_retries: Optional[int] = None,
     max_wait_time: Optional[float] = None,
+    pull_timeout: float = 0.0,
 ) -> Iterator[
     tuple[
         Callable[[], Optional[Message]],
@@ -429,6 +460,10 @@ def _init_connection(  # pylint: disable=too-many-positional-arguments
         connection_error_type=error_type,
     )
 
+    # Only the gRPC-based transports support long-polling
+    if transport != TRANSPORT_TYPE_REST:
+        connection = partial(connection, pull_timeout=pull_timeout)
+
     # Establish connection
     with connection(
         address,